@@ -4,7 +4,17 @@ from .commands import (
     SetupContainer,
     ConfigureContainer,
     DeployContainer,
-    RunContainer
+    RunContainer,
+    ProfileImportsContainer,
+    SlimContainer,
+    RollbackContainer,
+    ReloadContainer,
+    BuildContainer,
+    WatchContainer,
+    TuneContainer,
+    StatusContainer,
+    AutoscaleContainer,
+    ProfileLiveContainer,
 )
 from .core import AppContainer
 
@@ -22,17 +32,54 @@ def configure_command(database=False, settings=False, path=""):
     container = ConfigureContainer.create(app)
     container.configure_project(database=database, settings=settings)
     
-def deploy_command():
+def deploy_command(
+    health_path="/",
+    blue_green=False,
+    canary=0,
+    canary_duration=300,
+    artifact=None,
+    artifact_store="",
+    workers=None,
+    threads=None,
+    worker_class=None,
+    asgi=None,
+    activation=None,
+    instances=None,
+    pin_cpus=None,
+    weight=None,
+):
     """Implementation of deploy command logic."""
+    if instances and instances > 1 and (blue_green or canary):
+        print("--instances runs in place; it cannot be combined with --blue-green or --canary")
+        return False
     app = AppContainer.get_instance()
     container = DeployContainer.create(app)
+    container.set_worker_sizing(workers, threads, worker_class)
+    container.set_interface(asgi)
+    container.set_activation("" if activation == "none" else activation)
+    container.set_instances(instances, pin_cpus)
+    container.set_weight(weight)
     
     # If package verification fails, stop the deployment process
-    if not container.verify_packages():
+    if not container.verify_packages(require_venv=artifact is None):
+        return False
+
+    # If copying the project into the web root fails, stop the deployment process
+    reload_workers = not (blue_green or canary)
+    if artifact is not None:
+        if not container.install_artifact(artifact, artifact_store, reload_workers):
+            return False
+    elif not container.sync_files(reload_workers=reload_workers):
         return False
+
+    # Blue/green and canary run the new release beside the live one instead
+    if canary:
+        return container.canary(health_path, canary, canary_duration)
+    if blue_green:
+        return container.blue_green(health_path)
     
     # If setting up socket file fails, stop the deployment process
-    if not container.set_up_socket_file():
+    if not container.set_up_socket_file(health_path):
         return False
     
     # If setting up server configuration fails, stop the deployment process
@@ -47,6 +94,70 @@ def run_command(path=""):
     container = RunContainer.create(app)
     container.run_django_setup(path)
 
+def profile_imports_command(runs=3, top=15, update_baseline=False):
+    """Implementation of profile-imports command logic."""
+    app = AppContainer.get_instance()
+    container = ProfileImportsContainer.create(app)
+    return container.manager.profile(runs=runs, top=top, update_baseline=update_baseline)
+
+def slim_command(write=False, keep=(), output=""):
+    """Implementation of slim command logic."""
+    app = AppContainer.get_instance()
+    container = SlimContainer.create(app)
+    return container.manager.analyze(write=write, keep=keep, output=output)
+
+def rollback_command(release="", list_only=False):
+    """Implementation of rollback command logic."""
+    app = AppContainer.get_instance()
+    container = RollbackContainer.create(app)
+    if list_only:
+        return container.manager.list_releases()
+    return container.manager.rollback(release or None)
+
+def reload_command(upgrade=False, nginx=True):
+    """Implementation of reload command logic."""
+    app = AppContainer.get_instance()
+    container = ReloadContainer.create(app)
+    return container.manager.reload(upgrade=upgrade, nginx=nginx)
+
+def build_command(static=True, store=""):
+    """Implementation of build command logic."""
+    app = AppContainer.get_instance()
+    container = BuildContainer.create(app)
+    return container.manager.build(static=static, store=store)
+
+def watch_command(debounce=0.5):
+    """Implementation of watch command logic."""
+    app = AppContainer.get_instance()
+    container = WatchContainer.create(app)
+    return container.manager.watch(debounce=debounce)
+
+def tune_command(assignments=(), unset=(), apply=False, memory=False):
+    """Implementation of tune command logic."""
+    app = AppContainer.get_instance()
+    container = TuneContainer.create(app)
+    return container.manager.tune(
+        assignments=assignments, unset=unset, apply=apply, memory=memory
+    )
+
+def status_command(project=""):
+    """Implementation of status command logic."""
+    app = AppContainer.get_instance()
+    container = StatusContainer.create(app)
+    return container.manager.status(project or None)
+
+def autoscale_command(project="", min_workers=None, max_workers=None, interval=2.0, install=False):
+    """Implementation of autoscale command logic."""
+    app = AppContainer.get_instance()
+    container = AutoscaleContainer.create(app)
+    return container.manager.autoscale(project, min_workers, max_workers, interval, install)
+
+def profile_live_command(project="", duration=10.0, rate=100, top=20, output=""):
+    """Implementation of profile-live command logic."""
+    app = AppContainer.get_instance()
+    container = ProfileLiveContainer.create(app)
+    return container.manager.profile(project, duration, rate, top, output)
+
 
 # Click CLI commands that call the implementation functions
 @click.group()
@@ -113,9 +224,26 @@ def configure( settings: bool, database: bool, path: str):
 
 
 @cli.command()
-def deploy():
+@click.option("--health-path", default="/", show_default=True, help="Path that must answer without a server error before the deploy continues")
+@click.option("--blue-green", is_flag=True, help="Start the release on the idle colour and switch Nginx to it")
+@click.option("--canary", type=click.IntRange(1, 99), default=None, help="Percent of traffic to send to the new release before promoting it")
+@click.option("--canary-duration", default=300, show_default=True, help="Seconds to compare the canary with the live release")
+@click.option("--artifact", default=None, help="Deploy a built artifact (id, id prefix, manifest path or 'latest') instead of the project tree")
+@click.option("--artifact-store", default="", help="Artifact store to read from (default: ~/.cache/djanbee/artifacts)")
+@click.option("--workers", type=click.IntRange(1), default=None, help="Gunicorn workers (default: sized from CPUs and memory)")
+@click.option("--threads", type=click.IntRange(1), default=None, help="Threads per worker; more than one uses gthread workers")
+@click.option("--worker-class", type=click.Choice(["sync", "gthread"]), default=None, help="Gunicorn worker class")
+@click.option("--asgi/--wsgi", default=None, help="Serve over ASGI with uvicorn workers, or WSGI (default: ask when async code is found)")
+@click.option("--activation", type=click.Choice(["socket", "lazy", "none"]), default=None, help="Let systemd own the socket, also start the service on first request, or let Gunicorn bind it (default: socket)")
+@click.option("--instances", type=click.IntRange(1), default=None, help="Gunicorn instances behind Nginx, sharing the workers (default: keep the current number)")
+@click.option("--pin-cpus/--no-pin-cpus", default=None, help="Pin each instance to its own cores (default: keep the current pinning)")
+@click.option("--weight", type=click.IntRange(1, 10000), default=None, help="Share of the host's CPU, IO, memory and tasks against other projects (default: keep the current weight, 100 at first)")
+def deploy(health_path: str, blue_green: bool, canary: int, canary_duration: int, artifact: str, artifact_store: str, workers: int, threads: int, worker_class: str, asgi: bool, activation: str, instances: int, pin_cpus: bool, weight: int):
     try:
-        deploy_command()
+        deploy_command(
+            health_path, blue_green, canary or 0, canary_duration, artifact, artifact_store,
+            workers, threads, worker_class, asgi, activation, instances, pin_cpus, weight,
+        )
     except Exception as e:
         print(f"Error {e}")
 
@@ -129,5 +257,123 @@ def run(path: str):
         print(f"Error {e}")
 
 
+@cli.command("profile-imports")
+@click.option("--runs", default=3, show_default=True, help="Runs to take the fastest time from")
+@click.option("--top", default=15, show_default=True, help="Rows to show per table")
+@click.option("--update-baseline", is_flag=True, help="Replace the stored baseline with this run")
+def profile_imports(runs: int, top: int, update_baseline: bool):
+    """Profile import time of the Django project"""
+    try:
+        profile_imports_command(runs, top, update_baseline)
+    except Exception as e:
+        print(f"Error {e}")
+
+
+@cli.command()
+@click.option("-w", "--write", is_flag=True, help="Write a slimmed requirements-prod.txt")
+@click.option("-k", "--keep", multiple=True, help="Distribution to keep even if never imported")
+@click.option("-o", "--output", default="", help="Path of the slimmed requirements file")
+def slim(write: bool, keep, output: str):
+    """Find requirements the project never imports"""
+    try:
+        slim_command(write, keep, output)
+    except Exception as e:
+        print(f"Error {e}")
+
+
+@cli.command()
+@click.argument("release", default="")
+@click.option("-l", "--list", "list_only", is_flag=True, help="List releases and exit")
+def rollback(release: str, list_only: bool):
+    """Switch back to the previous (or given) release"""
+    try:
+        rollback_command(release, list_only)
+    except Exception as e:
+        print(f"Error {e}")
+
+
+@cli.command()
+@click.option("-u", "--upgrade", is_flag=True, help="Start a new Gunicorn master (USR2) instead of replacing workers (HUP)")
+@click.option("--skip-nginx", is_flag=True, help="Only reload Gunicorn")
+def reload(upgrade: bool, skip_nginx: bool):
+    """Reload Gunicorn and Nginx without dropping requests"""
+    try:
+        reload_command(upgrade, not skip_nginx)
+    except Exception as e:
+        print(f"Error {e}")
+
+
+@cli.command()
+@click.option("--no-static", is_flag=True, help="Do not run collectstatic into the artifact")
+@click.option("--store", default="", help="Artifact store to write to (default: ~/.cache/djanbee/artifacts)")
+def build(no_static: bool, store: str):
+    """Build a deployable artifact of the project and its environment"""
+    try:
+        build_command(not no_static, store)
+    except Exception as e:
+        print(f"Error {e}")
+
+
+@cli.command()
+@click.option("--debounce", default=0.5, show_default=True, help="Seconds without changes before redeploying")
+def watch(debounce: float):
+    """Redeploy incrementally whenever project files change"""
+    try:
+        watch_command(debounce)
+    except Exception as e:
+        print(f"Error {e}")
+
+
+@cli.command()
+@click.argument("assignments", nargs=-1)
+@click.option("--unset", multiple=True, help="Stop pinning a setting (repeatable)")
+@click.option("--apply", is_flag=True, help="Install the settings tuned from the current profile")
+@click.option("--memory", is_flag=True, help="Show shared and private memory of the master and each worker")
+def tune(assignments, unset, apply: bool, memory: bool):
+    """Show or change the Gunicorn settings and runtime environment, e.g. `djanbee tune timeout=60 MALLOC_ARENA_MAX=4`"""
+    try:
+        tune_command(assignments, unset, apply, memory)
+    except Exception as e:
+        print(f"Error {e}")
+
+
+@cli.command()
+@click.argument("project", default="")
+def status(project: str):
+    """Show what each project uses of its CPU, memory and task limits"""
+    try:
+        status_command(project)
+    except Exception as e:
+        print(f"Error {e}")
+
+
+@cli.command()
+@click.argument("project", default="")
+@click.option("--min", "min_workers", type=click.IntRange(1), default=None, help="Fewest workers per service (default: half the deployed count)")
+@click.option("--max", "max_workers", type=click.IntRange(1), default=None, help="Most workers per service (default: twice the deployed count)")
+@click.option("--interval", type=click.FloatRange(0.5), default=2.0, show_default=True, help="Seconds between samples")
+@click.option("--install", is_flag=True, help="Run the autoscaler as its own systemd unit")
+def autoscale(project: str, min_workers: int, max_workers: int, interval: float, install: bool):
+    """Add and retire Gunicorn workers (TTIN/TTOU) as requests queue or idle"""
+    try:
+        autoscale_command(project, min_workers, max_workers, interval, install)
+    except Exception as e:
+        print(f"Error {e}")
+
+
+@cli.command("profile-live")
+@click.argument("project", default="")
+@click.option("--duration", type=click.FloatRange(1), default=10.0, show_default=True, help="Seconds to sample for")
+@click.option("--rate", type=click.IntRange(1, 1000), default=100, show_default=True, help="Samples per second in each worker")
+@click.option("--top", default=20, show_default=True, help="Functions to show")
+@click.option("--output", default="", help="File for the collapsed stacks (default: ./profile-PROJECT-TIME.folded)")
+def profile_live(project: str, duration: float, rate: int, top: int, output: str):
+    """Sample the stacks of running Gunicorn workers into a flamegraph file"""
+    try:
+        profile_live_command(project, duration, rate, top, output)
+    except Exception as e:
+        print(f"Error {e}")
+
+
 if __name__ == "__main__":
     cli()
\ No newline at end of file
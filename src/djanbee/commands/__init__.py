@@ -3,6 +3,24 @@ from .setup import SetupContainer
 from .configure import ConfigureContainer
 from .deploy import DeployContainer
 from .run import RunContainer
+from .profile_imports import ProfileImportsContainer
+from .slim import SlimContainer
+from .rollback import RollbackContainer
+from .reload import ReloadContainer
+from .build import BuildContainer
+from .watch import WatchContainer
+from .tune import TuneContainer
+from .status import StatusContainer
+from .autoscale import AutoscaleContainer
+from .profile_live import ProfileLiveContainer
 
 __all__ = ["LaunchContainer", "SetupContainer", "ConfigureContainer", "DeployContainer", 
-           "RunContainer"]
+           "RunContainer", "ProfileImportsContainer", "SlimContainer",
+           "RollbackContainer",
+           "ReloadContainer",
+           "BuildContainer",
+           "WatchContainer",
+           "TuneContainer",
+           "StatusContainer",
+           "AutoscaleContainer",
+           "ProfileLiveContainer"]
@@ -0,0 +1,3 @@
+from .container import AutoscaleContainer
+
+__all__ = ["AutoscaleContainer"]
@@ -0,0 +1,20 @@
+from dataclasses import dataclass
+
+from .display import AutoscaleDisplay
+from .manager import AutoscaleManager
+from ...core import AppContainer
+
+
+@dataclass
+class AutoscaleContainer:
+    """Container for scaling a project's Gunicorn workers with its load."""
+
+    display: AutoscaleDisplay
+    manager: AutoscaleManager
+
+    @classmethod
+    def create(cls, app: AppContainer) -> "AutoscaleContainer":
+        """Factory method to create a configured AutoscaleContainer instance."""
+        display = AutoscaleDisplay(console_manager=app.console_manager)
+        manager = AutoscaleManager(display=display, app=app)
+        return cls(display=display, manager=manager)
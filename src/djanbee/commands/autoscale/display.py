@@ -0,0 +1,49 @@
+from ...managers import ConsoleManager
+from ...managers.autoscale_manager import AutoscalePolicy
+
+
+class AutoscaleDisplay:
+    def __init__(self, console_manager: "ConsoleManager"):
+        self.console_manager = console_manager
+
+    def error_no_project(self):
+        self.console_manager.print_error("No Django project found")
+
+    def error_not_deployed(self, project_name: str):
+        self.console_manager.print_error(
+            f"'{project_name}' has no gunicorn.conf.py; deploy it with `djanbee deploy` first"
+        )
+
+    def error_invalid(self, error: Exception):
+        self.console_manager.print_error(str(error))
+
+    def autoscaling(self, project_name: str, policy: AutoscalePolicy, interval: float):
+        self.console_manager.print_step_progress(
+            "Autoscale",
+            f"Keeping each service of '{project_name}' between {policy.min_workers} and "
+            f"{policy.max_workers} workers, sampling every {interval:g}s (Ctrl+C to stop)",
+        )
+
+    def scaled(self, instance: str, workers: int, delta: int, reason: str):
+        action = "Added" if delta > 0 else "Retired"
+        self.console_manager.print_step_progress(
+            f"gunicorn-{instance}",
+            f"{action} {abs(delta)} worker{'s' if abs(delta) > 1 else ''}, "
+            f"{workers} -> {workers + delta} ({reason})",
+        )
+
+    def scale_failure(self, instance: str):
+        self.console_manager.print_step_failure(
+            f"gunicorn-{instance}", "Could not signal the Gunicorn master"
+        )
+
+    def stopped(self):
+        self.console_manager.print_info("Stopped autoscaling")
+
+    def unit_installed(self, unit: str, path):
+        self.console_manager.print_success(
+            f"{unit} runs the autoscaler from {path}; stop it with `systemctl disable --now {unit}`"
+        )
+
+    def unit_failure(self, unit: str, message: str):
+        self.console_manager.print_step_failure(unit, message or "Could not install the unit")
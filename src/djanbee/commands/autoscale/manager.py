@@ -0,0 +1,131 @@
+import math
+import time
+from collections import deque
+from typing import Deque, Dict, Optional
+
+from .display import AutoscaleDisplay
+from ...core import AppContainer
+from ...managers.autoscale_manager import AutoscalePolicy, LoadSample, decide
+from ...managers.convergence_manager import FileResource
+from ...managers.socket_manager import UVICORN_WORKER
+from ...managers.tuning_manager import read_config
+
+
+class AutoscaleManager:
+    """Grows and shrinks the Gunicorn worker pools of a project with its load."""
+
+    def __init__(self, display: AutoscaleDisplay, app: "AppContainer"):
+        self.display = display
+        self.app = app
+        # instance -> recent samples, and when its pool was last changed
+        self.history: Dict[str, Deque[LoadSample]] = {}
+        self.last_change: Dict[str, float] = {}
+
+    def autoscale(
+        self,
+        project_name: str = "",
+        min_workers: Optional[int] = None,
+        max_workers: Optional[int] = None,
+        interval: float = 2.0,
+        install: bool = False,
+    ) -> bool:
+        """
+        Sample every running service of the project each `interval`
+        seconds and add or retire workers within the bounds, which default
+        to half and twice the deployed worker count. `install` runs this
+        as its own systemd unit instead.
+        """
+        if not project_name:
+            project_path = self.app.django_manager.project_service.resolve_project()
+            if not project_path:
+                self.display.error_no_project()
+                return False
+            project_name = project_path.name
+        config = read_config(self.app.tuning_manager.read_config(project_name))
+        if not config:
+            self.display.error_not_deployed(project_name)
+            return False
+
+        workers = config.get("workers", 3)
+        policy = AutoscalePolicy(
+            min_workers or max(int(math.ceil(workers / 2)), 1),
+            max_workers or max(workers * 2, min_workers or 1),
+        )
+        try:
+            policy.validate()
+        except ValueError as e:
+            self.display.error_invalid(e)
+            return False
+        if install:
+            return self._install(project_name, policy, interval)
+
+        self.display.autoscaling(project_name, policy, interval)
+        try:
+            while True:
+                self.tick(project_name, policy)
+                time.sleep(interval)
+        except KeyboardInterrupt:
+            self.display.stopped()
+        return True
+
+    def tick(self, project_name: str, policy: AutoscalePolicy) -> None:
+        """Take one sample of each running service and act on the decisions"""
+        autoscaler = self.app.autoscale_manager
+        for instance in self.app.socket_manager.get_project_services(project_name):
+            # Numbered instances share their project's config
+            config = read_config(self.app.tuning_manager.read_config(instance.partition("@")[0]))
+            worker_class = config.get("worker_class", "sync")
+            sample = autoscaler.sample(
+                instance,
+                project_name,
+                config.get("threads", 1) if worker_class == "gthread" else 1,
+                worker_class == UVICORN_WORKER,
+            )
+            samples = self.history.setdefault(
+                instance, deque(maxlen=max(policy.up_samples, policy.down_samples))
+            )
+            if sample is None:
+                samples.clear()
+                continue
+            if samples and samples[-1].master != sample.master:
+                # A new master starts from the worker count in its config
+                samples.clear()
+                self.last_change.pop(instance, None)
+            samples.append(sample)
+
+            decision = decide(policy, list(samples), self.last_change.get(instance))
+            if not decision.delta:
+                continue
+            if not autoscaler.scale(sample.master, decision.delta):
+                self.display.scale_failure(instance)
+                continue
+            self.display.scaled(instance, sample.workers, decision.delta, decision.reason)
+            self.last_change[instance] = sample.at
+            # Only samples of the changed pool count from now on
+            samples.clear()
+
+    def _install(self, project_name: str, policy: AutoscalePolicy, interval: float) -> bool:
+        """Write the autoscaler's unit for the project and (re)start it"""
+        autoscaler = self.app.autoscale_manager
+        os_manager = self.app.os_manager
+        unit = autoscaler.get_unit_name(project_name)
+        path, content = autoscaler.render_unit(
+            project_name,
+            [
+                "--min", str(policy.min_workers),
+                "--max", str(policy.max_workers),
+                "--interval", f"{interval:g}",
+            ],
+        )
+        report = self.app.convergence_manager.converge([FileResource(str(path), content, sudo=True)])
+        if not report.success:
+            self.display.unit_failure(unit, f"Could not write {path}")
+            return False
+        os_manager.reload_daemon()
+        os_manager.enable_service(unit)
+        result = os_manager.restart_service(unit)
+        if not result.success:
+            self.display.unit_failure(unit, result.stderr)
+            return False
+        self.display.unit_installed(unit, path)
+        return True
@@ -0,0 +1,3 @@
+from .container import BuildContainer
+
+__all__ = ["BuildContainer"]
@@ -0,0 +1,20 @@
+from dataclasses import dataclass
+
+from .display import BuildDisplay
+from .manager import BuildManager
+from ...core import AppContainer
+
+
+@dataclass
+class BuildContainer:
+    """Container for building deployable release artifacts."""
+
+    display: BuildDisplay
+    manager: BuildManager
+
+    @classmethod
+    def create(cls, app: AppContainer) -> "BuildContainer":
+        """Factory method to create a configured BuildContainer instance."""
+        display = BuildDisplay(console_manager=app.console_manager)
+        manager = BuildManager(display=display, app=app)
+        return cls(display=display, manager=manager)
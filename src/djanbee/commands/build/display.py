@@ -0,0 +1,51 @@
+from pathlib import Path
+
+from ...managers import ConsoleManager
+from ...managers.artifact_manager import BuildReport
+
+
+class BuildDisplay:
+    def __init__(self, console_manager: "ConsoleManager"):
+        self.console_manager = console_manager
+
+    def error_no_project(self):
+        self.console_manager.print_error("No Django project found")
+
+    def error_no_venv(self):
+        self.console_manager.print_error(
+            "No virtual environment found, run `djanbee setup` first"
+        )
+
+    def progress_build(self, project_path: Path, store: Path):
+        self.console_manager.print_progress(f"Building an artifact of {project_path} in {store}")
+
+    def error_build(self, error: Exception):
+        self.console_manager.print_step_failure("Build", "Failed to build the artifact")
+        self.console_manager.print_error(str(error))
+
+    def report(self, report: BuildReport):
+        if report.bytecode:
+            self.console_manager.print_step_progress(
+                "Bytecode",
+                f"{report.bytecode.compiled} of {report.bytecode.total} files compiled",
+            )
+        if report.static_error:
+            self.console_manager.print_warning(
+                f"Static files were not collected: {report.static_error}"
+            )
+        self.console_manager.print_table(
+            "Artifact contents",
+            ["Section", "Files"],
+            [[name, str(count)] for name, count in report.files.items()],
+        )
+        size = report.size / (1024 * 1024)
+        stored = report.new_bytes / (1024 * 1024)
+        self.console_manager.print_step_progress(
+            "Chunks",
+            f"{report.new_chunks} of {report.chunks} new ({stored:.1f} MB stored for "
+            f"{size:.1f} MB of files, {report.reused:.0%} reused) in {report.duration:.2f}s",
+        )
+        self.console_manager.print_success(f"Artifact {report.artifact_id[:12]} built")
+        self.console_manager.print_info(
+            f"Deploy it with `djanbee deploy --artifact {report.artifact_id[:12]}`"
+        )
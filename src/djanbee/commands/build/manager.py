@@ -0,0 +1,43 @@
+from .display import BuildDisplay
+from ...core import AppContainer
+
+
+class BuildManager:
+    """Builds a relocatable release artifact of the project."""
+
+    def __init__(self, display: BuildDisplay, app: "AppContainer"):
+        self.display = display
+        self.app = app
+
+    def build(self, static: bool = True, store: str = "") -> bool:
+        """
+        Build an artifact of the project, its bytecode, venv and static
+        files into the content-addressed store.
+
+        Args:
+            static: Run collectstatic into the artifact
+            store: Store directory (default: ~/.cache/djanbee/artifacts)
+        """
+        project_path = self.app.django_manager.project_service.resolve_project()
+        if not project_path:
+            self.display.error_no_project()
+            return False
+
+        venv_path = self.app.django_manager.environment_service.resolve_venv_path(project_path)
+        if not venv_path:
+            self.display.error_no_venv()
+            return False
+
+        artifacts = self.app.artifact_manager
+        if store:
+            artifacts.set_store(store)
+
+        self.display.progress_build(project_path, artifacts.root)
+        try:
+            report = artifacts.build(project_path, venv_path, collect_static=static)
+        except Exception as e:
+            self.display.error_build(e)
+            return False
+
+        self.display.report(report)
+        return True
@@ -19,19 +19,63 @@ class DeployContainer:
         manager = DeployManager(display=display, app=app)
         return cls(display=display, manager=manager)
 
-    def verify_packages(self) -> bool:
+    def verify_packages(self, require_venv: bool = True) -> bool:
         """Verify required packages are installed in the virtual environment."""
-        return self.manager.verify_packages()
+        return self.manager.verify_packages(require_venv)
 
-    def set_up_socket_file(self) -> bool:
+    def sync_files(self, reload_workers: bool = True) -> bool:
+        """Copy the project files into the web root."""
+        return self.manager.sync_project_files(reload_workers)
+
+    def install_artifact(
+        self, reference: str = "", store: str = "", reload_workers: bool = True
+    ) -> bool:
+        """Unpack a built artifact into the web root."""
+        return self.manager.install_artifact(reference, store, reload_workers)
+
+    def set_worker_sizing(
+        self, workers: int = None, threads: int = None, worker_class: str = None
+    ) -> None:
+        """Override the Gunicorn worker sizing picked for this host."""
+        self.manager.set_worker_overrides(workers, threads, worker_class)
+
+    def set_interface(self, asgi: bool = None) -> None:
+        """Force ASGI or WSGI instead of deciding from the project."""
+        self.manager.set_interface(asgi)
+
+    def set_activation(self, activation: str = None) -> None:
+        """Choose between a self-bound, socket-activated or lazy service."""
+        self.manager.set_activation(activation)
+
+    def set_instances(self, count: int = None, pin_cpus: bool = None) -> None:
+        """Run the project as several Gunicorn instances behind Nginx."""
+        self.manager.set_instances(count, pin_cpus)
+
+    def set_weight(self, weight: int = None) -> None:
+        """Set the project's share of the host's CPU, IO, memory and tasks."""
+        self.manager.set_weight(weight)
+
+    def blue_green(self, health_path: str = "/") -> bool:
+        """Start the new release on the idle colour and switch traffic to it."""
+        return self.manager.deploy_blue_green(health_path)
+
+    def canary(self, health_path: str = "/", percent: int = 10, duration: float = 300) -> bool:
+        """Split traffic with the new release and promote or abort it."""
+        return self.manager.deploy_canary(health_path, percent, duration)
+
+    def set_up_socket_file(self, health_path: str = "/") -> bool:
         """Set up the socket file for the Django application."""            
         if self.manager.find_and_create_socket_file():
-            return self.manager.launch_socketfile()
+            return self.manager.launch_socketfile(health_path)
             
         return False
 
     def set_up_server(self) -> bool:
         """Set up the server configuration."""
         if self.manager.find_and_create_server_file():
-            return self.manager.manage_nginx_configuration()
+            if not self.manager.manage_nginx_configuration():
+                return False
+            # Nginx no longer proxies to them
+            self.manager.retire_unused_services()
+            return True
         return False
\ No newline at end of file
@@ -1,4 +1,5 @@
 from ...managers import ConsoleManager
+from ...managers.sizing_manager import format_mib
 from ...widgets.question_selector import QuestionSelector
 
 
@@ -80,6 +81,74 @@ class DeployDisplay:
         )
         return selector.select()
 
+    def sync_progress(self, source, destination):
+        self.console_manager.print_progress(f"Syncing {source} to {destination}")
+
+    def sync_success(self, report):
+        """Summarize a file sync"""
+        size = report.bytes_copied / (1024 * 1024)
+        self.console_manager.print_step_progress(
+            "Sync",
+            f"{len(report.copied)} copied ({size:.1f} MB), {len(report.deleted)} deleted, "
+            f"{report.unchanged} unchanged in {report.duration:.2f}s",
+        )
+
+    def release_activated(self, name):
+        self.console_manager.print_step_progress("Release", f"{name} is now current")
+
+    def release_unchanged(self, name):
+        self.console_manager.print_step_progress(
+            "Release", f"Nothing changed, {name} stays current"
+        )
+
+    def releases_pruned(self, names):
+        self.console_manager.print_info(f"Removed old releases: {', '.join(names)}")
+
+    def workers_reloaded(self, report):
+        self.console_manager.print_step_progress("Gunicorn", report.summary())
+        self._warn_lost_requests(report)
+
+    def workers_reload_failed(self, report):
+        self.console_manager.print_warning(f"Could not reload workers: {report.summary()}")
+
+    def _warn_lost_requests(self, report):
+        if report.lost:
+            errors = ", ".join(f"{name} x{count}" for name, count in report.probe.errors.items())
+            self.console_manager.print_warning(
+                f"{report.lost} requests were lost during the switch: {errors}"
+            )
+
+    def artifact_progress(self, manifest, destination):
+        self.console_manager.print_progress(
+            f"Unpacking artifact {manifest['id'][:12]} of {manifest['project']} into {destination}"
+        )
+
+    def artifact_extracted(self, report):
+        size = report.bytes_written / (1024 * 1024)
+        self.console_manager.print_step_progress(
+            "Artifact",
+            f"{report.written} written ({size:.1f} MB), {report.linked} linked, "
+            f"{report.unchanged} static unchanged in {report.duration:.2f}s",
+        )
+        if report.changed_sections:
+            self.console_manager.print_info(f"Changed: {', '.join(report.changed_sections)}")
+
+    def artifact_not_found(self, reference, error):
+        self.console_manager.print_error(f"Could not load artifact {reference}: {error}")
+
+    def artifact_python_missing(self, version):
+        self.console_manager.print_error(
+            f"The artifact's venv needs Python {version or '(unknown version)'}, "
+            "which is not installed here"
+        )
+
+    def sync_directory_failure(self, path):
+        self.console_manager.print_error(f"Could not create a writable directory at {path}")
+
+    def sync_failure(self, error):
+        self.console_manager.print_step_failure("Sync", "Failed to copy project files")
+        self.console_manager.print_error(str(error))
+
     def success_create_socketservice(self, path):
         self.console_manager.print_success(f"Socket service created at {path}")
         
@@ -135,9 +204,309 @@ class DeployDisplay:
         """Display that socket service was successfully launched"""
         self.console_manager.print_success(f"Gunicorn socket service for '{project_name}' launched successfully")
         
+    def asgi_detected(self, usage):
+        """Show what in the project would run better under ASGI"""
+        found = []
+        if usage.async_views:
+            found.append(f"{len(usage.async_views)} async views")
+        if usage.consumers:
+            found.append(f"{len(usage.consumers)} websocket consumers")
+        self.console_manager.print_info(
+            f"Found {' and '.join(found)} and an ASGI entry point ({usage.asgi_app})"
+        )
+        for name in (usage.async_views + usage.consumers)[:5]:
+            self.console_manager.print_info(f"  {name}")
+
+    def prompt_asgi(self):
+        selector = QuestionSelector(
+            "Serve the project over ASGI with uvicorn workers?",
+            self.console_manager,
+            "yes",
+            "no",
+            "Async views stop holding a worker per request and websockets work",
+        )
+        return selector.select()
+
+    def asgi_enabled(self, usage):
+        detail = " with websocket upgrades" if usage.websockets else ""
+        self.console_manager.print_step_progress("ASGI", f"Serving {usage.asgi_app}{detail}")
+
+    def asgi_kept(self, asgi_app):
+        self.console_manager.print_info(f"The service already runs uvicorn workers, keeping {asgi_app}")
+
+    def asgi_entrypoint_missing(self, project_name):
+        self.console_manager.print_warning(
+            f"No asgi.py found in '{project_name}', deploying with WSGI"
+        )
+
+    def asgi_packages_missing(self, packages):
+        self.console_manager.print_warning(
+            f"The artifact's venv lacks {', '.join(packages)}; add them to the "
+            f"requirements and rebuild to use ASGI. Deploying with WSGI"
+        )
+
+    def asgi_install_failed(self, message):
+        self.console_manager.print_warning(f"Could not install uvicorn ({message}), deploying with WSGI")
+
+    def worker_measuring(self, project_name):
+        self.console_manager.print_progress(
+            f"Booting one worker of '{project_name}' to measure its memory"
+        )
+
+    def worker_plan(self, plan, worker_rss, source):
+        """Show the worker sizing and how it was reached"""
+        self.console_manager.print_step_progress("Workers", plan.summary())
+        if worker_rss:
+            self.console_manager.print_info(
+                f"Worker RSS {worker_rss / (1024 * 1024):.0f} MiB, from {source}"
+            )
+        elif source:
+            self.console_manager.print_warning("Could not measure worker memory")
+        for reason in plan.reasons:
+            self.console_manager.print_info(f"  {reason}")
+
+    def gunicorn_config_written(self, installed, settings):
+        """Show a new gunicorn.conf.py version and why each setting has its value"""
+        self.console_manager.print_step_progress(
+            "Gunicorn config", f"{installed.path} is now version {installed.version}"
+        )
+        for name, value in settings.values().items():
+            reason = settings.reasons.get(name)
+            if value is not None and reason:
+                self.console_manager.print_info(f"  {name} = {value}: {reason}")
+
+    def gunicorn_config_unchanged(self, installed):
+        self.console_manager.print_step_progress(
+            "Unchanged", f"{installed.path} (version {installed.version}) is up to date"
+        )
+
+    def gunicorn_config_failure(self, path, error):
+        self.console_manager.print_step_failure("Gunicorn config", f"Could not write {path}")
+        self.console_manager.print_error(str(error))
+
+    def runtime_environment_written(self, path, environment):
+        """Show the new runtime environment and why each variable is or is not set"""
+        self.console_manager.print_step_progress("Runtime environment", f"Wrote {path}")
+        for name, reason in environment.reasons.items():
+            value = environment.values.get(name)
+            shown = f"{name}={value}" if value is not None else f"{name} not set"
+            self.console_manager.print_info(f"  {shown}: {reason}")
+
+    def runtime_environment_unchanged(self, path):
+        self.console_manager.print_step_progress("Unchanged", f"{path} is up to date")
+
+    def runtime_environment_failure(self, path, error):
+        self.console_manager.print_step_failure("Runtime environment", f"Could not write {path}")
+        self.console_manager.print_error(str(error))
+
+    def runtime_comparison(self, instance, before, after):
+        """Memory and latency of the service before and after its environment changed"""
+        self.console_manager.print_table(
+            f"gunicorn-{instance} with the new runtime environment",
+            ["", "Before", "After"],
+            runtime_comparison_rows(before, after),
+        )
+
+    def socket_service_unchanged(self, project_name):
+        """Display that a running service was left alone"""
+        self.console_manager.print_step_progress(
+            "Socket service", f"'{project_name}' is running an unchanged unit, not restarted"
+        )
+
+    def socket_handover(self, project_name, activation):
+        if activation:
+            self.console_manager.print_progress(
+                f"Moving the socket of '{project_name}' to systemd socket activation"
+            )
+        else:
+            self.console_manager.print_progress(
+                f"Letting the service of '{project_name}' bind its own socket again"
+            )
+
+    def socket_service_idle(self, project_name):
+        self.console_manager.print_step_progress(
+            "Socket service",
+            f"'{project_name}' answered and was stopped; its next request starts it again",
+        )
+
     def socket_service_launch_failure(self, project_name, message):
         """Display that socket service launch failed"""
         self.console_manager.print_error(f"Failed to launch Gunicorn socket service for '{project_name}': {message}")
+
+    def resource_limits(self, project_name, limits):
+        """Display the limits written to the project's slice"""
+        self.console_manager.print_table(
+            f"Limits of {project_name}",
+            ["Directive", "Why"],
+            [
+                (directive, limits.reasons.get(name, ""))
+                for name, directive in limits.named_directives()
+            ]
+            + [(f"LimitNOFILE={limits.limit_nofile}", limits.reasons.get("limit_nofile", ""))],
+        )
+
+    def resource_limits_failure(self, path):
+        """Display that a slice could not be written"""
+        self.console_manager.print_step_failure("Limits", f"Could not write {path}")
+
+    def instances_plan(self, project_name, instances, cpus):
+        """Display how many instances serve the project and where they run"""
+        if len(instances) == 1:
+            return
+        message = f"{len(instances)} instances of gunicorn-{project_name}@ behind Nginx (least_conn)"
+        if any(cpus):
+            message += ", pinned to CPUs " + " | ".join(cpus)
+        self.console_manager.print_step_progress("Instances", message)
+
+    def instances_cpus_too_few(self, count):
+        """Display that the host has fewer CPUs than instances to pin"""
+        self.console_manager.print_warning(
+            f"Fewer usable CPUs than {count} instances; running them unpinned"
+        )
+
+    def instances_with_colours(self):
+        """Display that numbered instances and blue/green colours do not mix"""
+        self.console_manager.print_error(
+            "Traffic is split between blue/green colours; several instances only run in place"
+        )
+        self.console_manager.print_info("Deploy with --instances 1 or without --instances")
+
+    def colours_with_instances(self, project_name):
+        """Display that a blue/green deploy needs the project on one service"""
+        self.console_manager.print_error(
+            f"{project_name} runs several instances; blue/green and canary deploys need one"
+        )
+        self.console_manager.print_info("Deploy once with --instances 1 first")
+
+    def instance_draining(self, instance):
+        """Display that an instance no longer in use is draining"""
+        self.console_manager.print_progress(f"Waiting for gunicorn-{instance} connections to finish")
+
+    def instance_retired(self, instance, remaining, success, message):
+        """Display that an instance no longer in use was stopped"""
+        if not success:
+            self.console_manager.print_warning(f"Could not stop gunicorn-{instance}: {message}")
+        elif remaining:
+            self.console_manager.print_warning(
+                f"Stopped gunicorn-{instance} with {remaining} connections still open"
+            )
+        else:
+            self.console_manager.print_step_progress("Instances", f"gunicorn-{instance} drained and stopped")
+
+    def blue_green_plan(self, live, target, release):
+        """Display which colour the release starts on"""
+        source = f"{live} is live" if live else "no colour is live yet"
+        self.console_manager.print_step_progress(
+            "Blue/green", f"{source}, starting {release} on {target}"
+        )
+
+    def blue_green_aborted(self, live):
+        """Display that the new colour failed and traffic was not moved"""
+        if live:
+            self.console_manager.print_warning(f"Traffic stays on {live}; the new colour was stopped")
+        else:
+            self.console_manager.print_warning("The new colour was stopped before receiving traffic")
+
+    def blue_green_draining(self, instance):
+        """Display that the old colour is draining"""
+        self.console_manager.print_progress(f"Waiting for gunicorn-{instance} connections to finish")
+
+    def blue_green_retired(self, instance, remaining, success, message):
+        """Display that the old colour was stopped"""
+        if not success:
+            self.console_manager.print_warning(f"Could not stop gunicorn-{instance}: {message}")
+        elif remaining:
+            self.console_manager.print_warning(
+                f"Stopped gunicorn-{instance} with {remaining} connections still open"
+            )
+        else:
+            self.console_manager.print_step_progress("Blue/green", f"gunicorn-{instance} drained and stopped")
+
+    def blue_green_switched(self, target, release):
+        """Display that traffic moved to the new colour"""
+        self.console_manager.print_success(f"Traffic now served by {target} ({release})")
+
+    def canary_requires_live_colour(self):
+        """Display that a canary needs a running release to compare with"""
+        self.console_manager.print_error(
+            "A canary needs a live blue/green colour to compare with, run `djanbee deploy --blue-green` first"
+        )
+
+    def canary_started(self, percent, release, baseline, duration):
+        """Display that traffic is being split"""
+        self.console_manager.print_step_progress(
+            "Canary", f"{percent}% of traffic to {release}, the rest to {baseline}, for up to {duration:.0f}s"
+        )
+
+    def canary_progress(self, stats, baseline, release):
+        """Display the request counts collected so far"""
+        counts = ", ".join(
+            f"{name}: {stats[name].requests} requests" if name in stats else f"{name}: no requests"
+            for name in (baseline, release)
+        )
+        self.console_manager.print_progress(f"Canary traffic so far, {counts}")
+
+    def canary_verdict(self, verdict, stats, baseline, release):
+        """Display the latency comparison and the decision"""
+        rows = []
+        for role, name in (("baseline", baseline), ("canary", release)):
+            release_stats = stats.get(name)
+            if not release_stats:
+                rows.append((role, name, "0", "-", "-", "-", "-"))
+                continue
+            rows.append((
+                role,
+                name,
+                str(release_stats.requests),
+                *(f"{release_stats.percentile(pct) * 1000:.0f} ms" for pct in (50, 95, 99)),
+                f"{release_stats.error_rate:.2%}",
+            ))
+        self.console_manager.print_table(
+            "Canary comparison",
+            ["Role", "Release", "Requests", "p50", "p95", "p99", "Errors"],
+            rows,
+        )
+        if verdict.promote:
+            self.console_manager.print_success(f"Canary {release} is within thresholds, promoting")
+        else:
+            self.console_manager.print_warning(
+                f"Aborting canary {release}: {'; '.join(verdict.reasons)}"
+            )
+
+    def readiness_waiting(self, socket_path, health_path):
+        """Display that the deploy waits for a healthy response"""
+        self.console_manager.print_progress(f"Waiting for {health_path} to answer on {socket_path}")
+
+    def readiness_success(self, result):
+        """Display that the application answered"""
+        self.console_manager.print_step_progress(
+            "Readiness",
+            f"HTTP {result.status} after {result.waited:.2f}s and {result.attempts} attempts",
+        )
+
+    def readiness_failure(self, project_name, result):
+        """Display that the application never answered"""
+        self.console_manager.print_step_failure(
+            "Readiness", f"No healthy response after {result.waited:.1f}s: {result.error}"
+        )
+        self.console_manager.print_info(
+            f"Check `journalctl -u gunicorn-{project_name}` and "
+            f"/var/log/gunicorn/{project_name.partition('@')[0]}-error.log"
+        )
+
+    def cold_start_recorded(self, seconds, history, regression):
+        """Display the cold start time and how it compares with earlier deploys"""
+        previous = [entry["seconds"] for entry in history[-6:-1]]
+        trend = ", ".join(f"{value:.2f}s" for value in previous)
+        message = f"Cold start {seconds:.2f}s"
+        if trend:
+            message += f" (previous: {trend})"
+        self.console_manager.print_step_progress("Cold start", message)
+        if regression:
+            self.console_manager.print_warning(
+                f"Cold start regressed: {regression.seconds:.2f}s against a median "
+                f"of {regression.median:.2f}s, see `djanbee profile-imports`"
+            )
         
 
     def nginx_default_site_found(self):
@@ -175,6 +544,49 @@ class DeployDisplay:
         """Display that Nginx reload failed."""
         self.console_manager.print_error(f"Failed to reload Nginx: {error_message}")
         
-    def nginx_reload_success(self):
+    def nginx_reload_success(self, report):
         """Display that Nginx was successfully reloaded."""
-        self.console_manager.print_success("Nginx configuration reloaded successfully")
\ No newline at end of file
+        self.console_manager.print_success(
+            f"Nginx configuration reloaded successfully: {report.summary()}"
+        )
+        self._warn_lost_requests(report)
+
+    def nginx_unchanged(self):
+        """Display that Nginx was left alone"""
+        self.console_manager.print_step_progress("Nginx", "Configuration unchanged, not reloaded")
+
+    def resource_unchanged(self, name):
+        self.console_manager.print_step_progress("Unchanged", f"{name} is up to date")
+
+    def resource_differs(self, name, reason):
+        self.console_manager.print_info(f"{name} differs from the desired state: {reason}")
+
+    def convergence_summary(self, report):
+        """Summarize what a convergence run changed"""
+        for name, reason in report.changed:
+            self.console_manager.print_step_progress("Changed", f"{name} ({reason})")
+        for name, error in report.failed:
+            self.console_manager.print_step_failure(name, error)
+        if report.unchanged:
+            self.console_manager.print_info(
+                f"{len(report.unchanged)} resources already up to date "
+                f"(checked in {report.duration:.2f}s)"
+            )
+
+
+def runtime_comparison_rows(before, after):
+    """Rows comparing two samples of a service's memory and latency"""
+    def memory(sample, attribute):
+        return format_mib(getattr(sample.memory, attribute)) if sample.memory else "-"
+
+    def latency(sample, pct):
+        value = sample.percentile(pct)
+        return f"{value * 1000:.1f} ms" if value is not None else "-"
+
+    rows = [
+        ("Service total (PSS)", memory(before, "total"), memory(after, "total")),
+        ("Private per worker", memory(before, "worker_private"), memory(after, "worker_private")),
+    ]
+    rows += [(f"p{pct} latency", latency(before, pct), latency(after, pct)) for pct in (50, 95, 99)]
+    rows.append(("Requests answered", len(before.latencies), len(after.latencies)))
+    return rows
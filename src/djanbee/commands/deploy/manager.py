@@ -1,20 +1,356 @@
+import math
+import shutil
+import time
+from dataclasses import replace
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
 from .display import DeployDisplay
 from ...core import AppContainer
+from ...managers.canary_manager import CanaryThresholds
+from ...managers.convergence_manager import (
+    ConvergenceReport,
+    DirectoryResource,
+    FileResource,
+    SymlinkResource,
+    ValueResource,
+)
+from ...managers.resource_manager import ResourceLimits
+from ...managers.server_manager import UpstreamBackend
+from ...managers.sizing_manager import WorkerPlan
+from ...managers.socket_manager import UVICORN_WORKER, AsgiUsage
+from ...managers.tuning_manager import read_config, render_config, render_environment
 
 
 class DeployManager:
     """Manages deployment operations for Django projects."""
     
+    WEB_ROOT = Path("/var/www")
+
     def __init__(self, display: DeployDisplay, app: "AppContainer"):
         self.display = display
         self.app = app
+        # Set once the project has been copied into the web root
+        self.deployed_path = None
+        # Reloads and restarts required by what this deploy changed
+        self.triggers: List[str] = []
+        # Gunicorn sizing given on the command line, and the plan once made
+        self.worker_overrides: Dict[str, Any] = {}
+        self.worker_plan: Optional[WorkerPlan] = None
+        # True/False forces ASGI/WSGI; None decides from the project
+        self.asgi_override: Optional[bool] = None
+        self.asgi: Optional[AsgiUsage] = None
+        self.interface_selected = False
+        # None picks a mode; '' binds in Gunicorn, 'socket' or 'lazy' use a .socket unit
+        self.activation_override: Optional[str] = None
+        self.activation: Optional[str] = None
+        # Numbered Gunicorn instances; None keeps what the project runs
+        self.instances_override: Optional[int] = None
+        self.pin_override: Optional[bool] = None
+        self.instances: List[str] = []
+        # cgroup weight given on the command line, the limits it gives and
+        # the [Service] lines putting a service into the project's slice
+        self.weight_override: Optional[int] = None
+        self.limits: Optional[ResourceLimits] = None
+        self.service_directives: Optional[List[str]] = None
+        # Whether this deploy changed the runtime environment of the project
+        self.runtime_changed = False
+        # Host header of the readiness probes, one ALLOWED_HOSTS accepts
+        self.probe_host: Optional[str] = None
     
     # Public methods
+
+    def set_interface(self, asgi: Optional[bool] = None) -> None:
+        """Force ASGI (True) or WSGI (False) instead of deciding from the project"""
+        self.asgi_override = asgi
+        self.interface_selected = False
+        self.worker_plan = None
+
+    def set_activation(self, activation: Optional[str] = None) -> None:
+        """
+        Choose how the Gunicorn socket is owned: '' lets the service bind
+        it, 'socket' hands it to a systemd .socket unit and 'lazy' also
+        starts the service only on the first connection.
+        """
+        self.activation_override = activation
+
+    def select_activation(self, project_name: str) -> Optional[str]:
+        """
+        Socket activation mode of the project's service. Without an explicit
+        choice, a lazy service stays lazy and everything else is
+        socket-activated, so restarts queue connections instead of failing.
+        """
+        if self.activation_override is not None:
+            self.activation = self.activation_override or None
+            return self.activation
+
+        current = self.app.socket_manager.get_service_instances(project_name)[0]
+        socket_path, _ = self.app.socket_manager.render_socket_unit(
+            project_name, template="@" in current
+        )
+        _, service_path, _ = self.app.socket_manager.check_socket_service_exists(current)
+        if socket_path.exists() and "[Install]" not in self._read_text(service_path):
+            self.activation = "lazy"
+        else:
+            self.activation = "socket"
+        return self.activation
+
+    def set_instances(self, count: Optional[int] = None, pin_cpus: Optional[bool] = None) -> None:
+        """
+        Run the project as `count` Gunicorn instances behind one Nginx
+        upstream group, each pinned to its own CPUs if `pin_cpus`.
+        None keeps what the project currently runs.
+        """
+        self.instances_override = count
+        self.pin_override = pin_cpus
+        self.instances = []
+
+    def select_instances(self, project_name: str) -> List[str]:
+        """
+        Services serving the project after this deploy: '<project>@1' to
+        '<project>@N' for several instances, else the single service.
+        """
+        if self.instances:
+            return self.instances
+        count = self.instances_override or len(
+            self.app.socket_manager.get_service_instances(project_name)
+        )
+        if count > 1:
+            self.instances = [f"{project_name}@{index}" for index in range(1, count + 1)]
+        else:
+            self.instances = [project_name]
+        return self.instances
+
+    def set_weight(self, weight: Optional[int] = None) -> None:
+        """Share of the host the project gets under contention, relative to 100"""
+        self.weight_override = weight
+        self.limits = None
+        self.service_directives = None
+
+    def resource_limits(self) -> ResourceLimits:
+        """
+        cgroup limits of the project from the host budget and its weight
+        against the other projects on the host. A weight given on the
+        command line is kept in .djanbee/resources.json for later deploys.
+        """
+        if self.limits:
+            return self.limits
+        project_path = self.app.django_manager.state.current_project_path
+        resources = self.app.resource_manager
+        if self.weight_override is not None:
+            settings = resources.load_settings(project_path)
+            settings["weight"] = self.weight_override
+            resources.save_settings(project_path, settings)
+        self.limits = resources.limits_for(project_path.name, project_path)
+        return self.limits
+
+    def select_interface(self, project_path: Path) -> Optional[AsgiUsage]:
+        """
+        Decide whether the project runs under ASGI with uvicorn workers.
+
+        Projects with an asgi.py and async views or consumers are offered
+        ASGI; a unit already running uvicorn workers keeps them.
+
+        Returns:
+            The detected usage in ASGI mode, None for WSGI
+        """
+        if self.interface_selected:
+            return self.asgi
+        self.interface_selected = True
+        self.asgi = None
+        if self.asgi_override is False:
+            return None
+
+        project_name = self.app.django_manager.state.current_project_path.name
+        usage = self.app.socket_manager.detect_asgi(project_path, project_name)
+        if not usage.asgi_app:
+            if self.asgi_override:
+                self.display.asgi_entrypoint_missing(project_name)
+            return None
+
+        if self.asgi_override is None:
+            exists, service_path, _ = self.app.socket_manager.check_socket_service_exists(
+                self.app.socket_manager.get_service_instances(project_name)[0]
+            )
+            if exists and UVICORN_WORKER in self._read_text(service_path):
+                self.display.asgi_kept(usage.asgi_app)
+            elif usage.recommended:
+                self.display.asgi_detected(usage)
+                if not self.display.prompt_asgi():
+                    return None
+            else:
+                return None
+
+        if not self._ensure_asgi_packages(project_path, usage):
+            return None
+        self.asgi = usage
+        self.display.asgi_enabled(usage)
+        return usage
+
+    def set_worker_overrides(
+        self, workers: int = None, threads: int = None, worker_class: str = None
+    ) -> None:
+        """Override parts of the worker sizing picked for this host"""
+        self.worker_overrides = {
+            "workers": workers,
+            "threads": threads,
+            "worker_class": worker_class,
+        }
+        self.worker_plan = None
+
+    def size_workers(self, project_path: Path) -> WorkerPlan:
+        """
+        Pick workers, threads and worker class from the host's CPUs and
+        memory and the RSS of one application worker. The RSS comes from
+        the project's running workers, or from booting a single worker.
+        """
+        if self.worker_plan:
+            return self.worker_plan
+        project_name = self.app.django_manager.state.current_project_path.name
+        sizing = self.app.sizing_manager
+        host = sizing.detect_host()
+        asgi = self.select_interface(project_path)
+        overrides = dict(self.worker_overrides)
+        if asgi:
+            # The worker class is what makes it ASGI
+            overrides.pop("worker_class", None)
+
+        running, private = [], []
+        for instance in self.app.socket_manager.get_project_services(project_name):
+            pid = self.app.os_manager.get_service_main_pid(f"gunicorn-{instance}")
+            running += sizing.worker_rss(pid)
+            if pid and self.app.reload_manager.is_preloaded(instance):
+                report = sizing.memory_report(pid)
+                private += [worker.private for worker in report.workers] if report else []
+
+        if private:
+            # Forked from a preloading master, a worker only adds what it
+            # does not share with it
+            worker_rss, source = max(private), "private memory of preloaded workers"
+            host = replace(host, memory_available=host.memory_available + sum(private))
+        elif running:
+            worker_rss, source = max(running), "running workers"
+            # The new workers replace these, so their memory is available too
+            host = replace(host, memory_available=host.memory_available + sum(running))
+        elif self.worker_overrides.get("workers"):
+            worker_rss, source = None, None
+        else:
+            self.display.worker_measuring(project_name)
+            gunicorn = self.app.socket_manager.get_gunicorn_command(project_path)
+            worker_rss = sizing.measure_worker_rss(
+                gunicorn + (["--worker-class", UVICORN_WORKER] if asgi else []),
+                project_path,
+                asgi.asgi_app if asgi else f"{project_name}.wsgi:application",
+            )
+            source = "a worker booted to measure it"
+
+        limits = self.resource_limits()
+        if limits.memory_high:
+            # Workers beyond the slice's MemoryHigh would only be reclaimed and throttled
+            memory_limit = min(host.memory_limit or limits.memory_high, limits.memory_high)
+            host = replace(host, memory_limit=memory_limit)
+
+        self.worker_plan = sizing.plan(
+            host, worker_rss, async_worker=UVICORN_WORKER if asgi else None, **overrides
+        )
+        self.display.worker_plan(self.worker_plan, worker_rss, source)
+        return self.worker_plan
     
-    def verify_packages(self) -> bool:
-        """Verify and install necessary packages for deployment."""
+    def write_gunicorn_config(self, release_path: Path, colour: str = None) -> Optional[Path]:
+        """
+        Render the gunicorn.conf.py of the project or a colour from the
+        worker plan, the cold starts and request latencies recorded for the
+        project and its `djanbee tune` settings; a differing config is
+        installed as a new version.
+
+        Returns:
+            Path the unit passes to --config, None if it could not be written
+        """
+        project_path = self.app.django_manager.state.current_project_path
+        project_name = project_path.name
+        instance = f"{project_name}-{colour}" if colour else project_name
+        tuning = self.app.tuning_manager
+
+        profile = tuning.load_profile(
+            project_path, self.app.server_manager.get_release_log_path(project_name)
+        )
+        plan = self.size_workers(release_path)
+        # Numbered instances share the config, and the workers between them
+        count = 1 if colour else len(self.select_instances(project_name))
+        if count > 1:
+            plan = replace(plan, workers=max(int(math.ceil(plan.workers / count)), 1))
+        overrides = tuning.load_overrides(project_path)
+        settings = tuning.settings_for(plan, profile, overrides)
+        if count > 1 and "workers" not in overrides:
+            settings.reasons["workers"] = f"{plan.summary()} in each of {count} instances"
+        preloaded = read_config(tuning.read_config(instance)).get("preload_app", False)
+        try:
+            installed = tuning.install_config(instance, render_config(settings, instance))
+        except OSError as e:
+            self.display.gunicorn_config_failure(tuning.get_config_path(instance), e)
+            return None
+
+        if installed.changed:
+            # Gunicorn reads its config again on HUP, but whether the master
+            # loads the application only changes with a new master
+            trigger = "restart" if preloaded != settings.preload_app else "reload-config"
+            if trigger not in self.triggers:
+                self.triggers.append(trigger)
+            self.display.gunicorn_config_written(installed, settings)
+        else:
+            self.display.gunicorn_config_unchanged(installed)
+        return installed.path
+
+    def write_runtime_environment(
+        self, release_path: Path, colour: str = None
+    ) -> Optional[List[str]]:
+        """
+        Write the EnvironmentFile of the project or a colour: allocator,
+        malloc arenas, hash seed, bytecode cache and optimization, derived
+        for the release and the worker plan, with the variables pinned
+        with `djanbee tune` on top.
+
+        Returns:
+            [Service] lines that load it, None if it could not be written
+        """
+        project_path = self.app.django_manager.state.current_project_path
+        project_name = project_path.name
+        instance = f"{project_name}-{colour}" if colour else project_name
+        tuning = self.app.tuning_manager
+
+        environment = tuning.runtime_for(
+            self.size_workers(release_path),
+            release_path,
+            project_name,
+            tuning.load_overrides(project_path),
+        )
+        path = tuning.get_environment_path(instance)
+        try:
+            changed = tuning.install_environment(instance, render_environment(environment, instance))
+        except OSError as e:
+            self.display.runtime_environment_failure(path, e)
+            return None
+
+        if changed:
+            # The environment is read when the master is executed: neither a
+            # HUP nor a USR2 upgrade, which inherits the old master's, sees it
+            if "restart" not in self.triggers:
+                self.triggers.append("restart")
+            self.runtime_changed = True
+            self.display.runtime_environment_written(path, environment)
+        else:
+            self.display.runtime_environment_unchanged(path)
+        return tuning.runtime_directives(project_name, instance, environment)
+
+    def verify_packages(self, require_venv: bool = True) -> bool:
+        """
+        Verify and install necessary packages for deployment.
+
+        Args:
+            require_venv: Whether a local venv is needed; artifacts bring their own
+        """
         # First check if nginx is installed
-        if not self._verify_venv():
+        if require_venv and not self._verify_venv():
             return False
         
         nginx_installed = self.app.server_manager.check_server_installed()
@@ -57,6 +393,128 @@ class DeployManager:
         self.display.success_verify_dep()
         return True
     
+    def sync_project_files(self, reload_workers: bool = True, watch: bool = False) -> bool:
+        """
+        Copy the project into a new release under /var/www/<project>,
+        point `current` at it and reload running workers. `watch` marks
+        the release as one pruning does not keep.
+        """
+        if not self._verify_django_project():
+            return False
+
+        project_path = self.app.django_manager.state.current_project_path
+        project_name = project_path.name
+        base = self.WEB_ROOT / project_name
+        user = self.app.os_manager.get_username()
+        releases = self.app.release_manager
+
+        if not self._ensure_writable_directory(base, user):
+            self.display.sync_directory_failure(base)
+            return False
+
+        self.display.sync_progress(project_path, base / releases.RELEASES_DIR)
+        try:
+            release, report = releases.create_release(
+                project_path,
+                base,
+                owner=f"{user}:{self.app.server_manager.get_web_user()}",
+                suffix=releases.WATCH_SUFFIX if watch else "",
+            )
+            self.display.sync_success(report)
+            active = releases.get_active_release(base)
+            if active and not report.copied and not report.deleted:
+                # Identical to the running release: keep it and its workers
+                shutil.rmtree(release.path, ignore_errors=True)
+                self.deployed_path = releases.get_current_path(base)
+                self.display.release_unchanged(active)
+                return True
+            releases.activate(base, release.name)
+        except Exception as e:
+            self.display.sync_failure(e)
+            return False
+
+        self.display.release_activated(release.name)
+        pruned = releases.prune(base)
+        if pruned:
+            self.display.releases_pruned(pruned)
+
+        self.deployed_path = releases.get_current_path(base)
+        if reload_workers:
+            self._reload_workers(project_name)
+        return True
+
+    def install_artifact(
+        self, reference: str = "", store: str = "", reload_workers: bool = True
+    ) -> bool:
+        """
+        Unpack a built artifact into a new release instead of syncing the
+        project tree, point `current` at it and reload running workers.
+
+        Unchanged files are hardlinked from the active release, so only
+        files whose chunks changed are written.
+        """
+        artifacts = self.app.artifact_manager
+        releases = self.app.release_manager
+        state = self.app.django_manager.state
+        if store:
+            artifacts.set_store(store)
+
+        project_name = state.current_project_path.name if state.current_project_path else None
+        try:
+            manifest = artifacts.load(reference, project_name)
+        except (OSError, ValueError) as e:
+            self.display.artifact_not_found(reference or "latest", e)
+            return False
+
+        project_name = manifest["project"]
+        base = self.WEB_ROOT / project_name
+        user = self.app.os_manager.get_username()
+        static_root = base / artifacts.STATIC_DIR
+        if not self._ensure_writable_directory(base, user) or not self._ensure_writable_directory(
+            static_root, user
+        ):
+            self.display.sync_directory_failure(base)
+            return False
+
+        def populate(staging: Path, final: Path, active: Optional[Path]):
+            return artifacts.extract(
+                manifest,
+                staging,
+                venv_prefix=final / artifacts.VENV_DIR,
+                static_root=static_root,
+                previous=active,
+            )
+
+        self.display.artifact_progress(manifest, base / releases.RELEASES_DIR)
+        try:
+            release, report = releases.build_release(base, populate)
+        except Exception as e:
+            self.display.sync_failure(e)
+            return False
+        self.display.artifact_extracted(report)
+
+        if not (release.path / artifacts.VENV_DIR / "bin" / "python").exists():
+            # The venv links to the interpreter of the build machine
+            self.display.artifact_python_missing(manifest.get("python"))
+            shutil.rmtree(release.path, ignore_errors=True)
+            return False
+
+        releases.activate(base, release.name)
+        self.display.release_activated(release.name)
+        pruned = releases.prune(base)
+        if pruned:
+            self.display.releases_pruned(pruned)
+
+        self.deployed_path = releases.get_current_path(base)
+        if not state.current_project_path or state.current_project_path.name != project_name:
+            # Nothing to deploy from but the release itself
+            state.current_project_path = self.deployed_path
+
+        if reload_workers:
+            # A changed venv needs a new master, HUP only replaces workers
+            self._reload_workers(project_name, upgrade="venv" in report.changed_sections)
+        return True
+
     def find_and_create_socket_file(self) -> bool:
         """Set up the socket file for the Django application."""
         if not self._verify_django_project():
@@ -74,76 +532,682 @@ class DeployManager:
         self.display.socket_directory_success(dir_message)
         
         self.display.socket_service_verifying(project_name)
-        
-        socket_exists, service_path, socket_message = (
-            self.app.socket_manager.check_socket_service_exists(project_name)
+        release_path = self.deployed_path or project_path
+        instances = self.select_instances(project_name)
+        template = len(instances) > 1
+        if template and self.get_live_colour(project_name):
+            self.display.instances_with_colours()
+            return False
+        asgi = self.select_interface(release_path)
+        activation = self.select_activation(project_name)
+        sockets = self.app.socket_manager
+        if activation:
+            socket_path, socket_content = sockets.render_socket_unit(
+                project_name,
+                socket_group=self.app.server_manager.get_web_user(),
+                template=template,
+            )
+            socket_unit = FileResource(
+                str(socket_path), socket_content, sudo=True,
+                triggers=("daemon-reload", "restart-socket"),
+            )
+            report = self.app.convergence_manager.converge([socket_unit])
+            self._record(report)
+            if not report.success:
+                self.display.socket_service_failure(socket_path)
+                return False
+
+        directives = self._converge_limits(project_name)
+        if directives is None:
+            return False
+        config_path = self.write_gunicorn_config(release_path)
+        if not config_path:
+            return False
+        runtime = self.write_runtime_environment(release_path)
+        if runtime is None:
+            return False
+
+        service_path, content = sockets.render_socket_service(
+            release_path,
+            project_name,
+            wsgi_app=asgi.asgi_app if asgi else None,
+            activation=activation,
+            config_path=config_path,
+            template=template,
+            service_directives=directives + runtime,
         )
-        if socket_exists:
-            self.display.socket_service_exists(project_name, service_path)
-            
-            # Ask to override if exists
-            if not self.display.prompt_override_socket(service_path, service_path.name):
-                return True
-        else:
-            if service_path is None:
-                self.display.socket_service_not_found(project_name)
-            else:
-                self.display.socket_service_error(socket_message)
-        
-        # Create socket service (either it doesn't exist or user wants to override)
-        self.display.socket_service_creating(project_name, service_path)
-        result, service_root, path = self.app.socket_manager.create_socket_service(
-            project_path, project_name, use_sudo=True
+        unit = FileResource(
+            str(service_path), content, sudo=True, triggers=("daemon-reload", "restart")
         )
-        
-        if result:
-            self.display.success_create_socketservice(service_root)
-            return True
-        else:
-            self.display.socket_service_failure(path)
+        if not self._converge_resource(
+            unit,
+            lambda: self.display.socket_service_exists(project_name, service_path),
+            lambda: self.display.prompt_override_socket(service_path, service_path.name),
+        ):
+            self.display.socket_service_failure(service_path)
             return False
+        if template and not self._converge_instances(project_name, instances):
+            return False
+        if "restart" in self.triggers:
+            self.display.success_create_socketservice(service_path)
+        return True
 
-    def launch_socketfile(self) -> bool:
-        """Launch the socket file service."""
+    def launch_socketfile(self, health_path: str = "/") -> bool:
+        """
+        Launch the project's services one after another, each once the one
+        before it serves requests, so restarted instances never all stop
+        answering at the same time.
+        """
         project_name = self.app.django_manager.state.current_project_path.name
+        for index, instance in enumerate(self.select_instances(project_name)):
+            if not self._launch_instance(instance, health_path, record=index == 0):
+                return False
+        return True
 
-        start_success, start_message = self.app.socket_manager.launch_socket_service(project_name)
-        
-        if start_success:
-            self.display.socket_service_launch_success(project_name)
-        else:
-            self.display.socket_service_launch_failure(project_name, start_message)
-            
-        return start_success
+    def wait_for_readiness(
+        self,
+        health_path: str = "/",
+        launched_at: float = None,
+        colour: str = None,
+        instance: str = None,
+        record: bool = True,
+    ) -> bool:
+        """
+        Gate the deploy on a healthy response from the Gunicorn socket and
+        record the cold start time if the service was started by this deploy.
+
+        Args:
+            instance: Numbered instance ('<project>@<n>') to wait for
+            record: Whether a cold start goes into the history; instances
+                boot the same release, so only the first one is recorded
+        """
+        project_path = self.app.django_manager.state.current_project_path
+        project_name = project_path.name
+        name = instance or (f"{project_name}-{colour}" if colour else project_name)
+        service = f"gunicorn-{name}"
+        readiness = self.app.readiness_manager
+
+        started_at = self.app.os_manager.get_service_start_time(service)
+        if started_at is not None and launched_at is not None and started_at < launched_at:
+            # Running since before this deploy, so there is no cold start to time
+            started_at = None
+        # A lazy service is started by the first request, the one sent now
+        lazy = self.activation == "lazy" and not colour
+        if lazy and not self.app.os_manager.check_service_status(service):
+            started_at = time.monotonic()
+
+        socket_path = self.app.socket_manager.get_socket_path(name)
+        self.display.readiness_waiting(socket_path, health_path)
+        if self.probe_host is None:
+            allowed_hosts = self.app.django_manager.settings_service.find_in_settings(
+                "ALLOWED_HOSTS", []
+            )
+            self.probe_host = readiness.probe_host(allowed_hosts)
+        result = readiness.wait_until_ready(
+            socket_path,
+            health_path,
+            self.probe_host,
+            service=None if lazy else service,
+            started_at=started_at,
+        )
+        if not result.ready:
+            self.display.readiness_failure(name, result)
+            return False
+
+        self.display.readiness_success(result)
+        if record and result.cold_start is not None:
+            release = self.app.release_manager.get_active_release(self.WEB_ROOT / project_name)
+            history = readiness.record_cold_start(project_path, result.cold_start, release)
+            self.display.cold_start_recorded(
+                result.cold_start, history, readiness.find_regression(history)
+            )
+        return True
+
+    def deploy_blue_green(self, health_path: str = "/") -> bool:
+        """
+        Release the current release on the idle colour.
+
+        The idle colour's service starts from its own release link next to
+        the live one and must answer before the Nginx upstream is switched
+        to it. The old colour is stopped once its connections drained, so a
+        release that fails to boot never receives traffic.
+        """
+        project_name = self.app.django_manager.state.current_project_path.name
+        started = self._start_idle_colour(health_path)
+        if not started:
+            return False
+        live, target, release = started
+
+        if not self._route_traffic(project_name, [self._backend(project_name, target, release)]):
+            return False
+        self._retire_colour(project_name, live)
+        self.display.blue_green_switched(target, release)
+        return True
+
+    def deploy_canary(
+        self,
+        health_path: str = "/",
+        percent: int = 10,
+        duration: float = 300,
+        interval: float = 15,
+        thresholds: CanaryThresholds = None,
+    ) -> bool:
+        """
+        Send a share of the traffic to the current release on the idle
+        colour, compare its latency and errors with the live release on the
+        same traffic, then promote it or move all traffic back.
+
+        Returns:
+            True if the canary was promoted
+        """
+        project_name = self.app.django_manager.state.current_project_path.name
+        base = self.WEB_ROOT / project_name
+        canary = self.app.canary_manager
+        live = self.get_live_colour(project_name)
+        if not live:
+            self.display.canary_requires_live_colour()
+            return False
+        live_release = self.app.release_manager.get_active_release(base, live)
+
+        started = self._start_idle_colour(health_path)
+        if not started:
+            return False
+        live, target, release = started
+
+        log_path = self.app.server_manager.get_release_log_path(project_name)
+        offset = canary.get_log_offset(log_path)
+        since = time.time()
+        backends = [
+            self._backend(project_name, live, live_release, 100 - percent),
+            self._backend(project_name, target, release, percent),
+        ]
+        if not self._route_traffic(project_name, backends):
+            self._abort_colour(project_name, target, live_release)
+            return False
+
+        self.display.canary_started(percent, release, live_release, duration)
+        deadline = time.monotonic() + duration
+        while True:
+            final = time.monotonic() >= deadline
+            stats = canary.collect(log_path, offset, since)
+            verdict = canary.evaluate(stats, live_release, release, thresholds, final)
+            self.display.canary_progress(stats, live_release, release)
+            if verdict.decided:
+                break
+            time.sleep(max(min(interval, deadline - time.monotonic()), 0))
+
+        self.display.canary_verdict(verdict, stats, live_release, release)
+        if not verdict.promote:
+            backends = [self._backend(project_name, live, live_release)]
+            if self._route_traffic(project_name, backends):
+                self._abort_colour(project_name, target, live_release)
+            return False
+
+        if not self._route_traffic(project_name, [self._backend(project_name, target, release)]):
+            return False
+        self._retire_colour(project_name, live)
+        self.display.blue_green_switched(target, release)
+        return True
 
     def find_and_create_server_file(self) -> bool:
-        """Set up the server configuration file."""
-        project_path =  self.app.django_manager.state.current_project_path
-        
+        """
+        Bring the site, its directories and the static settings to their
+        desired state, writing only what differs.
+        """
+        project_path = self.app.django_manager.state.current_project_path
         project_name = project_path.name
+        server = self.app.server_manager
+        settings = self.app.django_manager.settings_service
+        instances = self.select_instances(project_name)
+        backends = server.get_upstream_backends(project_name)
+
+        servers = []
+        if len(instances) > 1 or any(backend.servers for backend in backends):
+            # One group balancing the instances, or back to the single socket
+            if len(instances) > 1:
+                servers = [str(self.app.socket_manager.get_socket_path(i)) for i in instances]
+            release = self.app.release_manager.get_active_release(self.WEB_ROOT / project_name)
+            backend = UpstreamBackend(
+                str(self.app.socket_manager.get_socket_path(project_name)),
+                release or "",
+                servers=servers,
+            )
+            upstream_path, upstream_content = server.render_upstream(project_name, [backend])
+            groups = FileResource(
+                str(upstream_path), upstream_content, sudo=True, triggers=("nginx-reload",)
+            )
+            report = self.app.convergence_manager.converge([groups])
+            self._record(report)
+            if not report.success:
+                self.display.server_config_failure(upstream_path)
+                return False
+            backends = [backend]
 
-        # Check if server configuration exists
-        server_exists, config_path = self.app.server_manager.check_server_config_exists(
-            project_name
+        # Keep proxying through upstream groups once a blue/green switch added them
+        upstream = server.get_backend_variable(project_name) if backends else None
+        config_path, content = server.render_server_config(
+            project_name,
+            upstream=upstream,
+            websockets=bool(self.select_interface(self.deployed_path or project_path)),
+            next_upstream_tries=len(servers),
         )
+        site = FileResource(str(config_path), content, sudo=True, triggers=("nginx-reload",))
+        if not self._converge_resource(
+            site,
+            lambda: None,
+            lambda: self.display.prompt_override_server(config_path, config_path.name),
+        ):
+            self.display.server_config_failure(config_path)
+            return False
 
-        if server_exists and not self.display.prompt_override_server(config_path, config_path.name):
-            return True
-            
-        # Create server configuration (either it doesn't exist or user wants to override)
-        result, path = self.app.server_manager.create_server_config(
-            project_path, project_name, use_sudo=True
+        owner = f"{self.app.os_manager.get_username()}:{server.get_web_user()}"
+        web_root = self.WEB_ROOT / project_name
+        resources = [
+            DirectoryResource(str(web_root / name), owner, sudo=True)
+            for name in ("static", "media")
+        ]
+        resources.append(
+            SymlinkResource(
+                str(server.get_enabled_path(project_name)),
+                str(config_path),
+                sudo=True,
+                triggers=("nginx-reload",),
+            )
         )
+        if not self.get_live_colour(project_name):
+            resources += [self._socket_access_resource(i, owner) for i in instances]
+        for key, value in server.get_static_settings(project_name).items():
+            resources.append(
+                ValueResource(
+                    key,
+                    value,
+                    read=lambda key=key: str(settings.find_in_settings(key)),
+                    write=lambda key=key, value=value: settings.edit_settings(key, value),
+                )
+            )
+
+        report = self.app.convergence_manager.converge(resources)
+        self._record(report)
+        if not report.success:
+            return False
+        if "nginx-reload" in self.triggers:
+            self.display.success_create_serverconfig(config_path)
+        return True
+    
+    def get_live_colour(self, project_name: str) -> Optional[str]:
+        """Colour receiving the largest share of the project's traffic, if any"""
+        backends = self.app.server_manager.get_upstream_backends(project_name)
+        if not backends:
+            return None
+        main = max(backends, key=lambda backend: backend.weight)
+        for colour in self.app.socket_manager.COLOURS:
+            if str(self.app.socket_manager.get_socket_path(project_name, colour)) == main.socket_path:
+                return colour
+        return None
+
+    # Private methods
+
+    def _launch_instance(self, instance: str, health_path: str, record: bool) -> bool:
+        """Launch one service of the project and wait until it serves requests."""
+        sockets = self.app.socket_manager
+        os_manager = self.app.os_manager
+        service = f"gunicorn-{instance}"
+        socket_unit = sockets.get_socket_unit_name(instance)
+
+        launched_at = time.monotonic()
+        running = os_manager.check_service_status(service)
+        listening = os_manager.check_service_status(socket_unit)
+        # The listening socket moves between the service and systemd
+        handover = bool(self.activation) != listening or "restart-socket" in self.triggers
+
+        if running and not handover and "restart" not in self.triggers:
+            # Same unit, and the code was already reloaded after the sync
+            self.display.socket_service_unchanged(instance)
+            if "reload-config" in self.triggers:
+                report = self.app.reload_manager.reload_gunicorn(instance)
+                if not report.success:
+                    self.display.workers_reload_failed(report)
+                    return False
+                self.display.workers_reloaded(report)
+            return self._verify_launch(health_path, launched_at, instance, record)
+
+        before = None
+        if running and record and self.runtime_changed and self.activation != "lazy":
+            # Compared with the restarted service once it answers again
+            before = self.app.tuning_manager.sample_service(
+                instance, sockets.get_socket_path(instance), health_path
+            )
+
+        if handover:
+            self.display.socket_handover(instance, self.activation)
+            if running:
+                os_manager.stop_service(service)
+            if listening:
+                os_manager.stop_service(socket_unit)
+                os_manager.disable_service(socket_unit)
+            start_success, start_message = sockets.launch_socket_service(
+                instance, self.activation
+            )
+        elif running:
+            # A HUP keeps the old command line, a changed unit needs a restart;
+            # with socket activation the connections queue meanwhile
+            sockets.reload_daemon()
+            result = os_manager.restart_service(service)
+            start_success, start_message = result.success, result.stderr
+        else:
+            start_success, start_message = sockets.launch_socket_service(
+                instance, self.activation
+            )
         
-        if result:
-            self.display.success_create_serverconfig(path)
+        if not start_success:
+            self.display.socket_service_launch_failure(instance, start_message)
+            return False
+
+        self.display.socket_service_launch_success(instance)
+        if not self._verify_launch(health_path, launched_at, instance, record):
+            return False
+        if before:
+            after = self.app.tuning_manager.sample_service(
+                instance, sockets.get_socket_path(instance), health_path
+            )
+            self.display.runtime_comparison(instance, before, after)
+        return True
+
+    def _verify_launch(
+        self, health_path: str, launched_at: float, instance: str, record: bool = True
+    ) -> bool:
+        """Wait for the service to answer; a lazy one is stopped again afterwards"""
+        if not self.wait_for_readiness(health_path, launched_at, instance=instance, record=record):
+            return False
+        if self.activation == "lazy":
+            self.app.os_manager.stop_service(f"gunicorn-{instance}")
+            self.display.socket_service_idle(instance)
+        return True
+
+    def _converge_instances(self, project_name: str, instances: List[str]) -> bool:
+        """
+        Write the drop-in of each numbered instance, pinning them to their
+        own cores when asked to or when they were pinned before.
+        """
+        sockets = self.app.socket_manager
+        current = sockets.get_service_instances(project_name)
+        pin = self.pin_override
+        if pin is None:
+            pin = any(sockets.get_instance_affinity(i) for i in current if "@" in i)
+        cpus = self.app.sizing_manager.partition_cpus(len(instances)) if pin else []
+        if pin and not cpus:
+            self.display.instances_cpus_too_few(len(instances))
+        cpus = cpus or [None] * len(instances)
+        self.display.instances_plan(project_name, instances, [c for c in cpus if c])
+
+        resources = []
+        for index, (instance, group) in enumerate(zip(instances, cpus), 1):
+            path, content = sockets.render_instance_dropin(project_name, index, group)
+            # A running instance only takes new CPUs when restarted
+            running = self.app.os_manager.check_service_status(f"gunicorn-{instance}")
+            triggers = ("daemon-reload", "restart") if running else ("daemon-reload",)
+            resources.append(FileResource(str(path), content, sudo=True, triggers=triggers))
+        report = self.app.convergence_manager.converge(resources)
+        self._record(report)
+        return report.success
+
+    def _converge_limits(self, project_name: str) -> Optional[List[str]]:
+        """
+        Write djanbee.slice, which holds all projects to the host budget,
+        and the project's slice with its limits.
+
+        Returns:
+            [Service] lines that put a service into the slice, None if the
+            slices could not be written
+        """
+        if self.service_directives is not None:
+            return self.service_directives
+        resources = self.app.resource_manager
+        budget = resources.load_budget()
+        limits = self.resource_limits()
+        slices = [
+            resources.render_budget_slice(budget),
+            resources.render_project_slice(project_name, limits),
+        ]
+        report = self.app.convergence_manager.converge(
+            FileResource(str(path), content, sudo=True, triggers=("daemon-reload",))
+            for path, content in slices
+        )
+        self._record(report)
+        if not report.success:
+            self.display.resource_limits_failure(slices[-1][0])
+            return None
+        if report.changed:
+            self.display.resource_limits(project_name, limits)
+            # systemd applies a changed slice to its running cgroup on reload,
+            # so limits change without restarting anything
+            self.app.socket_manager.reload_daemon()
+
+        self.service_directives = [
+            f"Slice={resources.get_slice_name(project_name)}",
+            f"LimitNOFILE={limits.limit_nofile}",
+        ]
+        return self.service_directives
+
+    def _reload_workers(self, project_name: str, upgrade: bool = False) -> None:
+        """Reload the workers of each running service of the project"""
+        for instance in self.app.socket_manager.get_service_instances(project_name):
+            if not self.app.os_manager.check_service_status(f"gunicorn-{instance}"):
+                continue
+            report = self.app.reload_manager.reload_gunicorn(instance, upgrade=upgrade)
+            if report.success:
+                self.display.workers_reloaded(report)
+            else:
+                self.display.workers_reload_failed(report)
+
+    def _converge_resource(self, resource, on_differs, confirm) -> bool:
+        """
+        Apply one resource a user may have edited by hand. Only a file that
+        exists and differs asks before it is replaced.
+
+        Returns:
+            False if applying it failed
+        """
+        reason = resource.check(self.app.os_manager)
+        if reason is None:
+            self.display.resource_unchanged(resource.name)
             return True
+        if reason != "missing":
+            on_differs()
+            self.display.resource_differs(resource.name, reason)
+            if not confirm():
+                return True
+        report = self.app.convergence_manager.converge([resource])
+        self._record(report)
+        return report.success
+
+    def _ensure_asgi_packages(self, project_path: Path, usage: AsgiUsage) -> bool:
+        """Install uvicorn (and websockets for consumers) into the service's venv"""
+        packages = ["uvicorn"] + (["websockets"] if usage.websockets else [])
+        env = self.app.env_manager
+        release_venv = Path(project_path) / ".venv"
+        if (release_venv / "bin" / "python").exists():
+            # An artifact's venv is immutable; the packages belong in the build
+            missing = env.get_missing_packages(release_venv, packages)
+            if missing:
+                self.display.asgi_packages_missing(missing)
+                return False
+            return True
+
+        success, message, _ = env.ensure_dependencies(
+            self.app.django_manager.state.active_venv_path,
+            packages,
+            "Install uvicorn to serve the project over ASGI?",
+        )
+        if not success:
+            self.display.asgi_install_failed(message)
+        return success
+
+    @staticmethod
+    def _read_text(path: Optional[Path]) -> str:
+        try:
+            return Path(path).read_text() if path else ""
+        except OSError:
+            return ""
+
+    def _record(self, report: ConvergenceReport) -> None:
+        self.triggers += [t for t in report.triggers if t not in self.triggers]
+        self.display.convergence_summary(report)
+
+    def _socket_access_resource(self, instance: str, owner: str) -> ValueResource:
+        """Nginx may connect to the Gunicorn socket, nobody else may"""
+        socket_path = str(self.app.socket_manager.get_socket_path(instance))
+        os_manager = self.app.os_manager
+
+        def read():
+            result = os_manager.run_command(["stat", "-c", "%a %U:%G", socket_path])
+            # Gunicorn creates the socket once it runs; there is nothing to fix before
+            return result.stdout.strip() if result.success else f"660 {owner}"
+
+        def write():
+            for command in (["chmod", "660", socket_path], ["chown", owner, socket_path]):
+                result = os_manager.run_command(command, sudo=True)
+                if not result.success:
+                    return False, result.stderr
+            return True, ""
+
+        return ValueResource(socket_path, f"660 {owner}", read=read, write=write)
+
+    def _backend(
+        self, project_name: str, colour: str, release: str, weight: int = 100
+    ) -> UpstreamBackend:
+        socket_path = self.app.socket_manager.get_socket_path(project_name, colour)
+        return UpstreamBackend(str(socket_path), release, weight)
+
+    def _start_idle_colour(self, health_path: str) -> Optional[Tuple[str, str, str]]:
+        """
+        Start the current release on the colour that receives no traffic
+        and wait until it answers.
+
+        Returns:
+            Tuple of (live colour or None, started colour, release), or
+            None if the colour could not be started
+        """
+        project_name = self.app.django_manager.state.current_project_path.name
+        base = self.WEB_ROOT / project_name
+        sockets = self.app.socket_manager
+        if len(sockets.get_service_instances(project_name)) > 1:
+            self.display.colours_with_instances(project_name)
+            return None
+
+        live = self.get_live_colour(project_name)
+        colours = sockets.COLOURS
+        target = colours[1] if live == colours[0] else colours[0]
+        release = self.app.release_manager.get_active_release(base)
+        live_release = self.app.release_manager.get_active_release(base, live) if live else None
+        self.display.blue_green_plan(live, target, release)
+
+        try:
+            self.app.release_manager.activate(base, release, link_name=target)
+        except (OSError, TypeError) as e:
+            self.display.sync_failure(e)
+            return None
+
+        asgi = self.select_interface(base / target)
+        # A colour takes traffic right away, so it never starts lazily
+        activation = "socket" if self.select_activation(project_name) else None
+        directives = self._converge_limits(project_name)
+        if directives is None:
+            return None
+        config_path = self.write_gunicorn_config(base / target, colour=target)
+        if not config_path:
+            return None
+        runtime = self.write_runtime_environment(base / target, colour=target)
+        if runtime is None:
+            return None
+        result, service_path, message = sockets.create_socket_service(
+            base / target,
+            project_name,
+            wsgi_app=asgi.asgi_app if asgi else None,
+            use_sudo=True,
+            colour=target,
+            activation=activation,
+            socket_group=self.app.server_manager.get_web_user(),
+            config_path=config_path,
+            service_directives=directives + runtime,
+        )
+        if not result:
+            self.display.socket_service_failure(message)
+            return None
+
+        instance = f"{project_name}-{target}"
+        launched_at = time.monotonic()
+        if self.app.os_manager.check_service_status(f"gunicorn-{instance}"):
+            # Left over from an aborted switch; it is not live, so restart it
+            sockets.reload_daemon()
+            result = self.app.os_manager.restart_service(f"gunicorn-{instance}")
+            success, message = result.success, result.stderr
         else:
-            self.display.server_config_failure(path)
+            success, message = sockets.launch_socket_service(instance, activation)
+        if not success:
+            self.display.socket_service_launch_failure(instance, message)
+            return None
+
+        if not self.wait_for_readiness(health_path, launched_at, colour=target):
+            self._abort_colour(project_name, target, live_release)
+            self.display.blue_green_aborted(live)
+            return None
+        return live, target, release
+
+    def _route_traffic(self, project_name: str, backends: List[UpstreamBackend]) -> bool:
+        """Point the project's upstream groups at the backends and reload Nginx"""
+        project_path = self.app.django_manager.state.current_project_path
+        server = self.app.server_manager
+        upstream_exists = bool(server.get_upstream_backends(project_name))
+
+        success, message = server.write_upstream(project_name, backends)
+        if not success:
+            self.display.server_config_failure(message)
             return False
-    
-    # Private methods
-    
+
+        if not upstream_exists:
+            # First switch: point the site at the upstream groups
+            result, path = server.create_server_config(
+                project_path, project_name, use_sudo=True,
+                upstream=server.get_backend_variable(project_name),
+                websockets=bool(self.asgi),
+            )
+            if not result:
+                self.display.server_config_failure(path)
+                return False
+            self.display.success_create_serverconfig(path)
+            return True
+
+        test_success, test_message = server.test_configuration()
+        if not test_success:
+            self.display.nginx_config_test_failed(test_message)
+            return False
+        report = self.app.reload_manager.reload_nginx()
+        if not report.success:
+            self.display.nginx_reload_failed(report.message)
+            return False
+        self.display.nginx_reload_success(report)
+        return True
+
+    def _retire_colour(self, project_name: str, colour: Optional[str]) -> None:
+        """Stop a colour's service once Nginx stopped using its socket"""
+        # Before the first switch the project ran as a single service
+        instance = f"{project_name}-{colour}" if colour else project_name
+        if not self.app.os_manager.check_service_status(f"gunicorn-{instance}"):
+            return
+        self.display.blue_green_draining(instance)
+        remaining = self.app.reload_manager.wait_for_drain(
+            self.app.socket_manager.get_socket_path(project_name, colour)
+        )
+        success, message = self.app.socket_manager.retire_socket_service(instance)
+        self.display.blue_green_retired(instance, remaining, success, message)
+
+    def _abort_colour(self, project_name: str, colour: str, live_release: Optional[str]) -> None:
+        """Stop a colour that will not take traffic and restore `current`"""
+        self._retire_colour(project_name, colour)
+        if live_release:
+            self.app.release_manager.activate(self.WEB_ROOT / project_name, live_release)
+
     def _verify_venv(self) -> bool:
         """Internal check for virtual environment."""
         if not self.app.django_manager.state.active_venv_path:
@@ -152,6 +1216,18 @@ class DeployManager:
                 return False
         return True
 
+    def _ensure_writable_directory(self, path: Path, user: str) -> bool:
+        """Create a directory under the web root owned by the deploying user."""
+        if path.is_dir() and self.app.os_manager.run_command(["test", "-w", str(path)]).success:
+            return True
+        mkdir = self.app.os_manager.run_command(["mkdir", "-p", str(path)], sudo=True)
+        if not mkdir.success:
+            return False
+        chown = self.app.os_manager.run_command(
+            ["chown", f"{user}:{user}", str(path)], sudo=True
+        )
+        return chown.success
+
     def _verify_django_project(self) -> bool:
         """Internal check for Django project."""
         if not self.app.django_manager.project_service.state.current_project_path:
@@ -159,6 +1235,40 @@ class DeployManager:
                 return False
         return True
     
+    def retire_unused_services(self) -> None:
+        """
+        Stop the services Nginx no longer sends traffic to: the single
+        service after a move to numbered instances, or the instances beyond
+        the selected count. Each is stopped once its connections drained.
+        """
+        project_name = self.app.django_manager.state.current_project_path.name
+        sockets = self.app.socket_manager
+        os_manager = self.app.os_manager
+        selected = self.select_instances(project_name)
+        numbered = [i for i in sockets.get_service_instances(project_name) if "@" in i]
+
+        retired = False
+        for instance in [project_name] + numbered:
+            if instance in selected:
+                continue
+            running = os_manager.check_service_status(f"gunicorn-{instance}")
+            if running or os_manager.check_service_status(sockets.get_socket_unit_name(instance)):
+                self.display.instance_draining(instance)
+                remaining = (
+                    self.app.reload_manager.wait_for_drain(sockets.get_socket_path(instance))
+                    if running
+                    else 0
+                )
+                success, message = sockets.retire_socket_service(instance)
+                self.display.instance_retired(instance, remaining, success, message)
+            if "@" in instance:
+                index = int(instance.split("@")[1])
+                dropin, _ = sockets.render_instance_dropin(project_name, index)
+                os_manager.run_command(["rm", "-rf", str(dropin.parent)], sudo=True)
+                retired = True
+        if retired:
+            sockets.reload_daemon()
+
     def manage_nginx_configuration(self) -> bool:
         """Check for default site and manage Nginx configuration."""
         # Check if default site exists
@@ -175,8 +1285,13 @@ class DeployManager:
                     return False
                     
                 self.display.nginx_default_removed()
+                self.triggers.append("nginx-reload")
             else:
                 self.display.nginx_default_kept_warning()
+
+        if "nginx-reload" not in self.triggers and self.app.server_manager.check_server_status():
+            self.display.nginx_unchanged()
+            return True
         
         # Test Nginx configuration
         test_success, test_message = self.app.server_manager.test_configuration()
@@ -185,12 +1300,12 @@ class DeployManager:
             self.display.nginx_config_test_failed(test_message)
             return False
             
-        # Reload Nginx to apply changes
-        reload_success, reload_message = self.app.server_manager.restart_server()
-        
-        if not reload_success:
-            self.display.nginx_reload_failed(reload_message)
+        # Reload Nginx gracefully; a restart would drop open connections
+        report = self.app.reload_manager.reload_nginx()
+
+        if not report.success:
+            self.display.nginx_reload_failed(report.message)
             return False
-            
-        self.display.nginx_reload_success()
+
+        self.display.nginx_reload_success(report)
         return True
\ No newline at end of file
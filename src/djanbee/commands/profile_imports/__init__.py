@@ -0,0 +1,3 @@
+from .container import ProfileImportsContainer
+
+__all__ = ["ProfileImportsContainer"]
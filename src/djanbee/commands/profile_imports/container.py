@@ -0,0 +1,20 @@
+from dataclasses import dataclass
+
+from .display import ProfileImportsDisplay
+from .manager import ProfileImportsManager
+from ...core import AppContainer
+
+
+@dataclass
+class ProfileImportsContainer:
+    """Container for the import-time profiler command."""
+
+    display: ProfileImportsDisplay
+    manager: ProfileImportsManager
+
+    @classmethod
+    def create(cls, app: AppContainer) -> "ProfileImportsContainer":
+        """Factory method to create a configured ProfileImportsContainer instance."""
+        display = ProfileImportsDisplay(console_manager=app.console_manager)
+        manager = ProfileImportsManager(display=display, app=app)
+        return cls(display=display, manager=manager)
@@ -0,0 +1,77 @@
+from pathlib import Path
+from typing import List
+
+from ...managers import ConsoleManager
+from ...managers.profile_manager import ImportGroup, ImportRecord, ImportRegression
+
+
+def _ms(microseconds: int) -> str:
+    return f"{microseconds / 1000:.1f}"
+
+
+class ProfileImportsDisplay:
+    def __init__(self, console_manager: "ConsoleManager"):
+        self.console_manager = console_manager
+
+    def progress_profile(self, project_path: Path, runs: int):
+        self.console_manager.print_progress(
+            f"Profiling imports of {project_path} ({runs} runs of manage.py check)"
+        )
+
+    def error_no_project(self):
+        self.console_manager.print_error("No Django project found")
+
+    def error_no_venv(self):
+        self.console_manager.print_error(
+            "No virtual environment found, run `djanbee setup` first"
+        )
+
+    def error_profile(self, error: Exception):
+        self.console_manager.print_step_failure("Imports", "Failed to profile imports")
+        self.console_manager.print_error(str(error))
+
+    def print_total(self, total_us: int, modules: int):
+        self.console_manager.print_step_progress(
+            "Imports", f"{modules} modules imported in {_ms(total_us)} ms"
+        )
+
+    def print_top_modules(self, title: str, records: List[ImportRecord]):
+        self.console_manager.print_table(
+            title,
+            ["Module", "Self (ms)", "Cumulative (ms)"],
+            [(r.module, _ms(r.self_us), _ms(r.cumulative_us)) for r in records],
+        )
+
+    def print_groups(self, title: str, groups: List[ImportGroup], total_us: int):
+        self.console_manager.print_table(
+            title,
+            ["Name", "Modules", "Self (ms)", "Share (%)"],
+            [
+                (g.name, g.modules, _ms(g.self_us), f"{100 * g.self_us / max(total_us, 1):.1f}")
+                for g in groups
+            ],
+        )
+
+    def warning_no_installed_apps(self):
+        self.console_manager.print_warning(
+            "Could not read INSTALLED_APPS, skipping the per-app breakdown"
+        )
+
+    def print_regressions(self, regressions: List[ImportRegression]):
+        self.console_manager.print_warning_critical(
+            f"{len(regressions)} import regressions compared to the baseline"
+        )
+        self.console_manager.print_table(
+            "Regressions",
+            ["Name", "Baseline (ms)", "Now (ms)", "Change (ms)"],
+            [
+                (r.name, _ms(r.baseline_us), _ms(r.current_us), "+" + _ms(r.delta_us))
+                for r in regressions
+            ],
+        )
+
+    def success_no_regressions(self):
+        self.console_manager.print_success("No import regressions compared to the baseline")
+
+    def success_baseline_saved(self, path: Path):
+        self.console_manager.print_info(f"Import baseline saved to {path}")
@@ -0,0 +1,78 @@
+from .display import ProfileImportsDisplay
+from ...core import AppContainer
+
+
+class ProfileImportsManager:
+    """Profiles the import time of the deployed Django application."""
+
+    def __init__(self, display: ProfileImportsDisplay, app: "AppContainer"):
+        self.display = display
+        self.app = app
+
+    def profile(self, runs: int = 3, top: int = 15, update_baseline: bool = False) -> bool:
+        """
+        Profile the project's imports, report the costliest ones and compare
+        them with the stored baseline.
+
+        The first run stores the baseline; later runs only replace it when
+        update_baseline is set.
+        """
+        project_path = self.app.django_manager.project_service.resolve_project()
+        if not project_path:
+            self.display.error_no_project()
+            return False
+
+        venv_path = self.app.django_manager.environment_service.resolve_venv_path(
+            project_path
+        )
+        if not venv_path:
+            self.display.error_no_venv()
+            return False
+
+        self.display.progress_profile(project_path, runs)
+        profiler = self.app.profile_manager
+        try:
+            profile = profiler.profile_imports(project_path, venv_path, runs)
+        except Exception as e:
+            self.display.error_profile(e)
+            return False
+
+        records = profile.records()
+        self.display.print_total(profile.total_us, len(records))
+        self.display.print_top_modules("Slowest modules (self)", profile.top_self(top))
+        self.display.print_top_modules(
+            "Slowest modules (cumulative)", profile.top_cumulative(top)
+        )
+        self.display.print_groups(
+            "By top-level package", profile.by_package()[:top], profile.total_us
+        )
+
+        installed_apps = self._installed_apps()
+        if installed_apps:
+            self.display.print_groups(
+                "By installed app", profile.by_app(installed_apps), profile.total_us
+            )
+        else:
+            self.display.warning_no_installed_apps()
+
+        baseline = profiler.load_baseline(project_path)
+        if baseline is not None:
+            regressions = profiler.find_regressions(profile, baseline)
+            if regressions:
+                self.display.print_regressions(regressions)
+            else:
+                self.display.success_no_regressions()
+
+        if baseline is None or update_baseline:
+            path = profiler.save_baseline(project_path, profile)
+            self.display.success_baseline_saved(path)
+        return True
+
+    def _installed_apps(self):
+        try:
+            apps = self.app.django_manager.settings_service.find_in_settings(
+                "INSTALLED_APPS", []
+            )
+        except Exception:
+            return []
+        return [app for app in apps or [] if isinstance(app, str)]
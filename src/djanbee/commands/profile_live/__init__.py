@@ -0,0 +1,3 @@
+from .container import ProfileLiveContainer
+
+__all__ = ["ProfileLiveContainer"]
@@ -0,0 +1,20 @@
+from dataclasses import dataclass
+
+from .display import ProfileLiveDisplay
+from .manager import ProfileLiveManager
+from ...core import AppContainer
+
+
+@dataclass
+class ProfileLiveContainer:
+    """Container for sampling the stacks of a project's running workers."""
+
+    display: ProfileLiveDisplay
+    manager: ProfileLiveManager
+
+    @classmethod
+    def create(cls, app: AppContainer) -> "ProfileLiveContainer":
+        """Factory method to create a configured ProfileLiveContainer instance."""
+        display = ProfileLiveDisplay(console_manager=app.console_manager)
+        manager = ProfileLiveManager(display=display, app=app)
+        return cls(display=display, manager=manager)
@@ -0,0 +1,68 @@
+from pathlib import Path
+from typing import List
+
+from ...managers import ConsoleManager
+from ...managers.profile_manager import FunctionSamples, LiveProfile
+
+
+def _share(samples: int, total: int) -> str:
+    return f"{100 * samples / max(total, 1):.1f}"
+
+
+class ProfileLiveDisplay:
+    def __init__(self, console_manager: "ConsoleManager"):
+        self.console_manager = console_manager
+
+    def error_no_project(self):
+        self.console_manager.print_error("No Django project found")
+
+    def error_not_running(self, project_name: str):
+        self.console_manager.print_error(f"No Gunicorn service of '{project_name}' is running")
+
+    def error_not_enabled(self, project_name: str):
+        self.console_manager.print_error(
+            f"The live profiler is off for '{project_name}'; turn it on with "
+            "`djanbee tune live_profiler=true`"
+        )
+
+    def error_start(self, config_name: str, error: Exception):
+        self.console_manager.print_step_failure(config_name, "Could not start the profiler")
+        self.console_manager.print_error(str(error))
+
+    def sampling(self, workers: int, duration: float, rate: int):
+        self.console_manager.print_progress(
+            f"Sampling {workers} worker{'s' if workers != 1 else ''} "
+            f"{rate} times a second for {duration:g}s"
+        )
+
+    def warning_missing(self, answered: int, signalled: int):
+        self.console_manager.print_warning(
+            f"Only {answered} of {signalled} workers wrote their stacks; "
+            "workers that restarted meanwhile are left out"
+        )
+
+    def error_no_samples(self):
+        self.console_manager.print_error("No worker wrote any stacks")
+
+    def print_summary(self, profile: LiveProfile):
+        busy = profile.samples - profile.idle_samples
+        self.console_manager.print_step_progress(
+            "Profile",
+            f"{profile.samples} samples from {profile.workers} workers, "
+            f"{_share(busy, profile.samples)}% busy",
+        )
+
+    def print_top_functions(self, functions: List[FunctionSamples], total: int):
+        self.console_manager.print_table(
+            "Busiest functions (idle waits left out)",
+            ["Function", "Location", "Self (%)", "Total (%)"],
+            [
+                (f.function, f.location, _share(f.self_samples, total), _share(f.total_samples, total))
+                for f in functions
+            ],
+        )
+
+    def success_written(self, path: Path):
+        self.console_manager.print_success(
+            f"Collapsed stacks written to {path}; open them in speedscope or run flamegraph.pl on them"
+        )
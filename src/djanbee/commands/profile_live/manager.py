@@ -0,0 +1,94 @@
+import time
+from pathlib import Path
+from typing import Dict, List
+
+from .display import ProfileLiveDisplay
+from ...core import AppContainer
+from ...managers.profile_manager import render_collapsed
+from ...managers.reload_manager.main import child_pids
+from ...managers.tuning_manager import read_config
+
+
+class ProfileLiveManager:
+    """Samples where the running Gunicorn workers of a project spend their time."""
+
+    def __init__(self, display: ProfileLiveDisplay, app: "AppContainer"):
+        self.display = display
+        self.app = app
+
+    def profile(
+        self,
+        project_name: str = "",
+        duration: float = 10.0,
+        rate: int = 100,
+        top: int = 20,
+        output: str = "",
+    ) -> bool:
+        """
+        Have every worker of the project's running services sample its
+        stacks, merge them into one collapsed-stack file and report the
+        functions busy workers spent the most samples in.
+        """
+        if not project_name:
+            project_path = self.app.django_manager.project_service.resolve_project()
+            if not project_path:
+                self.display.error_no_project()
+                return False
+            project_name = project_path.name
+
+        # Config name -> PIDs of the workers of its running services
+        workers = self._running_workers(project_name)
+        if not workers:
+            self.display.error_not_running(project_name)
+            return False
+        tuning = self.app.tuning_manager
+        workers = {
+            name: pids
+            for name, pids in workers.items()
+            if read_config(tuning.read_config(name)).get("live_profiler", False)
+        }
+        if not workers:
+            self.display.error_not_enabled(project_name)
+            return False
+
+        profiler = self.app.profile_manager
+        signalled = {}
+        try:
+            for name, pids in workers.items():
+                signalled[name] = profiler.start_live_profile(name, pids, duration, rate)
+            self.display.sampling(sum(signalled.values()), duration, rate)
+            profile = profiler.collect_live_profile(signalled, duration)
+        except RuntimeError as e:
+            self.display.error_start(name, e)
+            return False
+        finally:
+            for name in signalled:
+                profiler.cleanup_live_profile(name)
+
+        if profile.workers < sum(signalled.values()):
+            self.display.warning_missing(profile.workers, sum(signalled.values()))
+        if not profile.samples:
+            self.display.error_no_samples()
+            return False
+
+        self.display.print_summary(profile)
+        busy = profile.samples - profile.idle_samples
+        self.display.print_top_functions(profile.top_functions(top), busy)
+
+        path = Path(output) if output else Path.cwd() / (
+            f"profile-{project_name}-{time.strftime('%Y%m%d-%H%M%S')}.folded"
+        )
+        path.write_text(render_collapsed(profile.stacks), encoding="utf-8")
+        self.display.success_written(path)
+        return True
+
+    def _running_workers(self, project_name: str) -> Dict[str, List[int]]:
+        """Worker PIDs of the project's running services, by the config they use"""
+        workers: Dict[str, List[int]] = {}
+        for instance in self.app.socket_manager.get_project_services(project_name):
+            master = self.app.os_manager.get_service_main_pid(f"gunicorn-{instance}")
+            pids = child_pids(master) if master else []
+            if pids:
+                # Numbered instances share their project's config
+                workers.setdefault(instance.partition("@")[0], []).extend(pids)
+        return workers
@@ -0,0 +1,3 @@
+from .container import ReloadContainer
+
+__all__ = ["ReloadContainer"]
@@ -0,0 +1,20 @@
+from dataclasses import dataclass
+
+from .display import ReloadDisplay
+from .manager import ReloadManager
+from ...core import AppContainer
+
+
+@dataclass
+class ReloadContainer:
+    """Container for reloading the running services of a project."""
+
+    display: ReloadDisplay
+    manager: ReloadManager
+
+    @classmethod
+    def create(cls, app: AppContainer) -> "ReloadContainer":
+        """Factory method to create a configured ReloadContainer instance."""
+        display = ReloadDisplay(console_manager=app.console_manager)
+        manager = ReloadManager(display=display, app=app)
+        return cls(display=display, manager=manager)
@@ -0,0 +1,24 @@
+from ...managers import ConsoleManager
+from ...managers.reload_manager import ReloadReport
+
+
+class ReloadDisplay:
+    def __init__(self, console_manager: "ConsoleManager"):
+        self.console_manager = console_manager
+
+    def error_no_project(self):
+        self.console_manager.print_error("No Django project found")
+
+    def progress_reload(self, service: str, mode: str):
+        self.console_manager.print_progress(f"Reloading {service} ({mode})")
+
+    def report(self, report: ReloadReport):
+        if not report.success:
+            self.console_manager.print_step_failure(report.service, report.summary())
+            return
+        self.console_manager.print_step_progress(report.service, report.summary())
+        if report.lost:
+            errors = ", ".join(f"{name} x{count}" for name, count in report.probe.errors.items())
+            self.console_manager.print_warning(
+                f"{report.lost} requests were lost during the switch: {errors}"
+            )
@@ -0,0 +1,41 @@
+from .display import ReloadDisplay
+from ...core import AppContainer
+
+
+class ReloadManager:
+    """Reloads Gunicorn and Nginx for a project without dropping connections."""
+
+    def __init__(self, display: ReloadDisplay, app: "AppContainer"):
+        self.display = display
+        self.app = app
+
+    def reload(self, upgrade: bool = False, nginx: bool = True) -> bool:
+        """
+        Replace the Gunicorn workers, then reload Nginx.
+
+        Args:
+            upgrade: Start a new Gunicorn master (USR2) instead of a HUP,
+                needed after the virtual environment or Gunicorn changed
+            nginx: Also reload Nginx
+        """
+        project_path = self.app.django_manager.project_service.resolve_project()
+        if not project_path:
+            self.display.error_no_project()
+            return False
+        project_name = project_path.name
+
+        success = True
+        for instance in self.app.socket_manager.get_project_services(project_name):
+            if not self.app.os_manager.check_service_status(f"gunicorn-{instance}"):
+                continue
+            self.display.progress_reload(f"gunicorn-{instance}", "upgrade" if upgrade else "hup")
+            report = self.app.reload_manager.reload_gunicorn(instance, upgrade=upgrade)
+            self.display.report(report)
+            success = success and report.success
+
+        if nginx:
+            self.display.progress_reload("nginx", "reload")
+            report = self.app.reload_manager.reload_nginx()
+            self.display.report(report)
+            success = success and report.success
+        return success
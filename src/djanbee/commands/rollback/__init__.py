@@ -0,0 +1,3 @@
+from .container import RollbackContainer
+
+__all__ = ["RollbackContainer"]
@@ -0,0 +1,20 @@
+from dataclasses import dataclass
+
+from .display import RollbackDisplay
+from .manager import RollbackManager
+from ...core import AppContainer
+
+
+@dataclass
+class RollbackContainer:
+    """Container for switching between deployed releases."""
+
+    display: RollbackDisplay
+    manager: RollbackManager
+
+    @classmethod
+    def create(cls, app: AppContainer) -> "RollbackContainer":
+        """Factory method to create a configured RollbackContainer instance."""
+        display = RollbackDisplay(console_manager=app.console_manager)
+        manager = RollbackManager(display=display, app=app)
+        return cls(display=display, manager=manager)
@@ -0,0 +1,43 @@
+from typing import List
+
+from ...managers import ConsoleManager
+from ...managers.release_manager import Release
+from ...managers.reload_manager import ReloadReport
+
+
+class RollbackDisplay:
+    def __init__(self, console_manager: "ConsoleManager"):
+        self.console_manager = console_manager
+
+    def error_no_project(self):
+        self.console_manager.print_error("No Django project found")
+
+    def error_no_releases(self, base):
+        self.console_manager.print_error(
+            f"No releases found in {base}, run `djanbee deploy` first"
+        )
+
+    def print_releases(self, releases: List[Release]):
+        self.console_manager.print_table(
+            "Releases",
+            ["Release", "Active"],
+            [(r.name, "*" if r.active else "") for r in releases],
+        )
+
+    def rollback_failure(self, error: Exception):
+        self.console_manager.print_step_failure("Rollback", "Failed to switch release")
+        self.console_manager.print_error(str(error))
+
+    def rollback_success(self, name: str, seconds: float, colour: str = None):
+        links = f"current and {colour}" if colour else "current"
+        self.console_manager.print_step_progress(
+            "Rollback", f"{links} -> {name} ({seconds * 1000:.0f} ms)"
+        )
+
+    def workers_reloaded(self, report: ReloadReport):
+        self.console_manager.print_success(report.summary())
+
+    def workers_reload_failed(self, report: ReloadReport):
+        self.console_manager.print_warning(
+            f"Release switched but workers were not reloaded: {report.summary()}"
+        )
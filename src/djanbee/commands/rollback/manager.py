@@ -0,0 +1,72 @@
+import time
+from pathlib import Path
+from typing import Optional
+
+from .display import RollbackDisplay
+from ..deploy import DeployContainer
+from ...core import AppContainer
+
+
+class RollbackManager:
+    """Repoints the release symlinks the services run from and reloads the workers."""
+
+    WEB_ROOT = Path("/var/www")
+
+    def __init__(self, display: RollbackDisplay, app: "AppContainer"):
+        self.display = display
+        self.app = app
+        self.deploy = DeployContainer.create(app).manager
+
+    def list_releases(self) -> bool:
+        base = self._resolve_base()
+        if not base:
+            return False
+        releases = self.app.release_manager.list_releases(base)
+        if not releases:
+            self.display.error_no_releases(base)
+            return False
+        self.display.print_releases(releases)
+        return True
+
+    def rollback(self, release: Optional[str] = None) -> bool:
+        """
+        Switch to the given release, or the one before the active release.
+        After a blue/green deploy the live colour serves from its own link,
+        so that link moves along with `current`.
+        """
+        base = self._resolve_base()
+        if not base:
+            return False
+        releases = self.app.release_manager
+        if not releases.list_releases(base):
+            self.display.error_no_releases(base)
+            return False
+
+        live = self.deploy.get_live_colour(base.name)
+        started = time.perf_counter()
+        try:
+            activated = releases.rollback(base, release, link_name=live)
+            if live:
+                releases.activate(base, activated.name)
+        except (ValueError, OSError) as e:
+            self.display.rollback_failure(e)
+            return False
+
+        self.display.rollback_success(activated.name, time.perf_counter() - started, live)
+        # One after another, so instances never all reload at once
+        for instance in self.app.socket_manager.get_project_services(base.name):
+            if not self.app.os_manager.check_service_status(f"gunicorn-{instance}"):
+                continue
+            report = self.app.reload_manager.reload_gunicorn(instance)
+            if report.success:
+                self.display.workers_reloaded(report)
+            else:
+                self.display.workers_reload_failed(report)
+        return True
+
+    def _resolve_base(self) -> Optional[Path]:
+        project_path = self.app.django_manager.project_service.resolve_project()
+        if not project_path:
+            self.display.error_no_project()
+            return None
+        return self.WEB_ROOT / project_path.name
@@ -21,4 +21,5 @@ class RunContainer:
     def run_django_setup(self, path):
         self.manager.initialize_project(path)
         self.manager.migrate_database()
-        self.manager.collect_static_files()
\ No newline at end of file
+        self.manager.collect_static_files()
+        self.manager.precompile_bytecode()
\ No newline at end of file
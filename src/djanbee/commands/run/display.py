@@ -51,6 +51,34 @@ class RunDisplay:
         self.console_manager.print_step_failure("Static Files", "Failed to collect static files")
         self.console_manager.print_error(str(error))
 
+    def show_precompile_start(self):
+        """Show bytecode precompilation start message"""
+        self.console_manager.print_progress("Precompiling bytecode")
+
+    def show_precompile_complete(self, report):
+        """Show bytecode precompilation summary"""
+        self.console_manager.print_step_progress(
+            "Bytecode",
+            f"{report.compiled} of {report.total} files compiled in {report.duration:.1f}s",
+        )
+
+    def show_precompile_unwritable(self, directory):
+        """Warn about a directory where .pyc files cannot be written"""
+        self.console_manager.print_warning(
+            f"{directory} is not writable; its modules will be recompiled on every start"
+        )
+
+    def show_precompile_failures(self, count: int):
+        """Warn about files that could not be compiled"""
+        self.console_manager.print_warning(
+            f"{count} files could not be compiled (syntax errors or unreadable files)"
+        )
+
+    def show_precompile_failed(self, error: Exception):
+        """Show bytecode precompilation failed message"""
+        self.console_manager.print_step_failure("Bytecode", "Failed to precompile bytecode")
+        self.console_manager.print_error(str(error))
+
     def show_critical_warning(self, message: str):
         """Show critical warning message"""
         self.console_manager.print_warning_critical(message)
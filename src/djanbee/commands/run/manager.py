@@ -10,7 +10,8 @@ class RunManager:
         self.operation_results = {
             "Project Initialization": False,
             "Database Migrations": False,
-            "Static Files Collection": False
+            "Static Files Collection": False,
+            "Bytecode Precompilation": False,
         }
     
     def initialize_project(self, path: str = "") -> bool:
@@ -86,6 +87,38 @@ class RunManager:
             self.operation_results["Static Files Collection"] = False
             return False
     
+    def precompile_bytecode(self) -> bool:
+        """
+        Precompile the project and its virtual environment to bytecode
+
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        try:
+            self.display.show_precompile_start()
+            project_path = (
+                self.app.django_manager.state.current_project_path
+                or self.app.os_manager.get_current_directory()
+            )
+            venv_path = self.app.django_manager.environment_service.resolve_venv_path(
+                project_path
+            )
+            if not venv_path:
+                raise Exception("No virtual environment found")
+
+            report = self.app.bytecode_manager.precompile(venv_path, project_path)
+            for directory in report.unwritable:
+                self.display.show_precompile_unwritable(directory)
+            if report.failed:
+                self.display.show_precompile_failures(report.failed)
+            self.display.show_precompile_complete(report)
+            self.operation_results["Bytecode Precompilation"] = not report.unwritable
+            return self.operation_results["Bytecode Precompilation"]
+        except Exception as e:
+            self.display.show_precompile_failed(e)
+            self.operation_results["Bytecode Precompilation"] = False
+            return False
+
     def run_all_operations(self, path: str = "") -> Dict[str, bool]:
         """
         Run all operations in sequence
@@ -107,6 +140,10 @@ class RunManager:
         # Collect static files
         if not self.collect_static_files():
             self.display.show_warning("Static file collection failed. The application may not display correctly.")        
+
+        # Precompile bytecode
+        if not self.precompile_bytecode():
+            self.display.show_warning("Bytecode precompilation failed. The first requests after start will be slower.")
         
         # Show overall status
         if all(self.operation_results.values()):
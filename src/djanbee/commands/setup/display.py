@@ -5,3 +5,22 @@ from ...managers import ConsoleManager
 class SetupDisplay:
     def __init__(self, console_manager: "ConsoleManager"):
         self.console_manager = console_manager
+
+    def precompile_start(self):
+        self.console_manager.print_progress("Precompiling bytecode")
+
+    def precompile_complete(self, report):
+        self.console_manager.print_step_progress(
+            "Bytecode",
+            f"{report.compiled} of {report.total} files compiled in {report.duration:.1f}s"
+            + (f", {report.failed} failed" if report.failed else ""),
+        )
+
+    def precompile_unwritable(self, directory):
+        self.console_manager.print_warning(
+            f"{directory} is not writable; its modules will be recompiled on every start"
+        )
+
+    def precompile_failed(self, error: Exception):
+        self.console_manager.print_step_failure("Bytecode", "Failed to precompile bytecode")
+        self.console_manager.print_error(str(error))
@@ -10,6 +10,8 @@ class SetupManager:
 
     def setup_project(self):
         """Main setup flow for the project"""
+        # Locate requirements early so a new venv can be cloned from the venv store
+        self.app.django_manager.requirements_service.find_requirements()
         env = self._handle_virtual_environment()
         self.app.django_manager.environment_service.state.active_venv_path = env[
             "virtual_env"
@@ -18,7 +20,8 @@ class SetupManager:
         if not env:
             return
 
-        self._handle_requirements(env)
+        if self._handle_requirements(env):
+            self._handle_bytecode(env)
 
     def handle_requirements_setup(self, venv_path=None):
         """Coordinate the complete requirements setup flow"""
@@ -49,3 +52,22 @@ class SetupManager:
 
         if not success:
             print(f"Setup cancelled: {message}")
+        return success
+
+    def _handle_bytecode(self, env_path):
+        """Precompile the project and installed packages so workers start warm"""
+        project_path = (
+            self.app.django_manager.state.current_project_path
+            or self.app.os_manager.get_current_directory()
+        )
+        self.display.precompile_start()
+        try:
+            report = self.app.bytecode_manager.precompile(
+                env_path["virtual_env"], project_path
+            )
+        except Exception as e:
+            self.display.precompile_failed(e)
+            return
+        for directory in report.unwritable:
+            self.display.precompile_unwritable(directory)
+        self.display.precompile_complete(report)
@@ -0,0 +1,3 @@
+from .container import SlimContainer
+
+__all__ = ["SlimContainer"]
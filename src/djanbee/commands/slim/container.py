@@ -0,0 +1,20 @@
+from dataclasses import dataclass
+
+from .display import SlimDisplay
+from .manager import SlimManager
+from ...core import AppContainer
+
+
+@dataclass
+class SlimContainer:
+    """Container for the unused-dependency analyzer command."""
+
+    display: SlimDisplay
+    manager: SlimManager
+
+    @classmethod
+    def create(cls, app: AppContainer) -> "SlimContainer":
+        """Factory method to create a configured SlimContainer instance."""
+        display = SlimDisplay(console_manager=app.console_manager)
+        manager = SlimManager(display=display, app=app)
+        return cls(display=display, manager=manager)
@@ -0,0 +1,55 @@
+from pathlib import Path
+
+from ...managers import ConsoleManager
+from ...managers.pip_manager import SlimReport
+
+
+class SlimDisplay:
+    def __init__(self, console_manager: "ConsoleManager"):
+        self.console_manager = console_manager
+
+    def progress_analyze(self, requirements_path: Path):
+        self.console_manager.print_progress(
+            f"Analyzing which requirements in {requirements_path} the project uses"
+        )
+
+    def error_no_project(self):
+        self.console_manager.print_error("No Django project found")
+
+    def error_no_requirements(self):
+        self.console_manager.print_error("No requirements file found")
+
+    def error_no_venv(self):
+        self.console_manager.print_error(
+            "No virtual environment found, run `djanbee setup` first"
+        )
+
+    def error_analyze(self, error: Exception):
+        self.console_manager.print_step_failure("Slim", "Failed to analyze requirements")
+        self.console_manager.print_error(str(error))
+
+    def print_report(self, report: SlimReport, total: int):
+        self.console_manager.print_step_progress(
+            "Slim",
+            f"{total - len(report.unused)} of {total} requirements reachable from "
+            f"{len(report.roots)} directly used distributions",
+        )
+        for requirement in report.unresolved:
+            self.console_manager.print_warning(
+                f"{requirement.name} is not installed in the venv and was not analyzed"
+            )
+        if not report.unused:
+            self.console_manager.print_success("Every requirement is used by the project")
+            return
+        self.console_manager.print_table(
+            "Unused requirements",
+            ["Requirement", "Declared in"],
+            [(r.raw, r.source.name) for r in report.unused],
+        )
+        self.console_manager.print_info(
+            "Packages used only through plugins, entry points or the command line "
+            "can be kept with --keep NAME"
+        )
+
+    def success_written(self, path: Path):
+        self.console_manager.print_success(f"Production requirements written to {path}")
@@ -0,0 +1,58 @@
+from pathlib import Path
+from typing import Iterable
+
+from .display import SlimDisplay
+from ...core import AppContainer
+
+
+class SlimManager:
+    """Finds requirements the deployed project never imports."""
+
+    def __init__(self, display: SlimDisplay, app: "AppContainer"):
+        self.display = display
+        self.app = app
+
+    def analyze(self, write: bool = False, keep: Iterable[str] = (), output: str = "") -> bool:
+        """
+        Report unused requirements and optionally write a slimmed
+        production requirements file.
+        """
+        django_manager = self.app.django_manager
+        project_path = self.app.django_manager.project_service.resolve_project()
+        if not project_path:
+            self.display.error_no_project()
+            return False
+
+        requirements_path = django_manager.state.current_requirements_path
+        if not requirements_path:
+            found = django_manager.requirements_service.find_requirements()
+            requirements_path = found.object if found else None
+        if not requirements_path or not Path(requirements_path).exists():
+            self.display.error_no_requirements()
+            return False
+
+        venv_path = django_manager.environment_service.resolve_venv_path(project_path)
+        if not venv_path:
+            self.display.error_no_venv()
+            return False
+
+        self.display.progress_analyze(requirements_path)
+        service = django_manager.requirements_service
+        try:
+            report = service.analyze_unused_requirements(
+                venv_path, requirements_path, project_path, keep
+            )
+            total = len(
+                [r for r in service.parser.parse(requirements_path).requirements if r.key]
+            )
+        except Exception as e:
+            self.display.error_analyze(e)
+            return False
+
+        self.display.print_report(report, total)
+        if write:
+            path = service.write_production_requirements(
+                requirements_path, report, Path(output) if output else None
+            )
+            self.display.success_written(path)
+        return True
@@ -0,0 +1,3 @@
+from .container import StatusContainer
+
+__all__ = ["StatusContainer"]
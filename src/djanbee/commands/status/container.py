@@ -0,0 +1,20 @@
+from dataclasses import dataclass
+
+from .display import StatusDisplay
+from .manager import StatusManager
+from ...core import AppContainer
+
+
+@dataclass
+class StatusContainer:
+    """Container for showing what each project uses of its cgroup limits."""
+
+    display: StatusDisplay
+    manager: StatusManager
+
+    @classmethod
+    def create(cls, app: AppContainer) -> "StatusContainer":
+        """Factory method to create a configured StatusContainer instance."""
+        display = StatusDisplay(console_manager=app.console_manager)
+        manager = StatusManager(display=display, app=app)
+        return cls(display=display, manager=manager)
@@ -0,0 +1,104 @@
+from typing import Dict, Optional, Tuple
+
+from ...managers import ConsoleManager
+from ...managers.resource_manager import CgroupUsage, HostBudget
+from ...managers.sizing_manager import format_mib
+
+
+class StatusDisplay:
+    def __init__(self, console_manager: "ConsoleManager"):
+        self.console_manager = console_manager
+
+    def error_no_cgroup_v2(self):
+        self.console_manager.print_error(
+            "/sys/fs/cgroup is not the unified (v2) hierarchy; limits and usage are unavailable"
+        )
+
+    def error_unknown_project(self, project_name: str):
+        self.console_manager.print_error(f"'{project_name}' has no slice on this host")
+
+    def no_projects(self):
+        self.console_manager.print_info("No project has been deployed with limits yet")
+
+    def print_budget(self, budget: HostBudget, usage: Optional[CgroupUsage]):
+        """What all projects use of the host budget"""
+        cpus = f"{budget.cpus:g}" if budget.cpus else "all"
+        rows = [
+            ("Memory", _used(usage.memory_current if usage else 0, budget.memory), budget.reasons.get("memory", "")),
+            ("CPUs", cpus, budget.reasons.get("cpus", "")),
+            ("Tasks", f"{usage.tasks_current if usage else 0} / {budget.tasks}", budget.reasons.get("tasks", "")),
+            ("Open files", f"{budget.nofile} per process", budget.reasons.get("nofile", "")),
+        ]
+        self.console_manager.print_table("Host budget", ["", "Used", "Why"], rows)
+
+    def print_projects(self, projects: Dict[str, Tuple[int, Optional[CgroupUsage]]]):
+        """Usage of each project's slice against its limits"""
+        rows = []
+        for name, (weight, usage) in projects.items():
+            if usage is None:
+                rows.append((name, weight, "not running", "", "", "", "", ""))
+                continue
+            rows.append(
+                (
+                    name,
+                    weight,
+                    _used(usage.memory_current, usage.memory_high),
+                    _limit(usage.memory_max),
+                    f"{usage.cpu_usage:.0f}s ({usage.cpu_throttled:.1f}s throttled)",
+                    f"{usage.tasks_current} / {usage.tasks_max or 'max'}",
+                    f"{usage.oom_kills} / {usage.high_events}",
+                    _pressure(usage),
+                )
+            )
+        self.console_manager.print_table(
+            "Projects",
+            ["Project", "Weight", "Memory / high", "Memory max", "CPU", "Tasks",
+             "OOM kills / over high", "Pressure cpu/mem/io"],
+            rows,
+        )
+
+    def print_services(self, project_name: str, services: Dict[str, CgroupUsage]):
+        """Usage of each service in a project's slice"""
+        rows = [
+            (
+                name,
+                format_mib(usage.memory_current),
+                f"{usage.cpu_usage:.0f}s",
+                usage.tasks_current,
+                _pressure(usage),
+            )
+            for name, usage in services.items()
+        ]
+        self.console_manager.print_table(
+            f"Services of {project_name}",
+            ["Service", "Memory", "CPU", "Tasks", "Pressure cpu/mem/io"],
+            rows,
+        )
+
+    def warning_oom(self, project_name: str, kills: int):
+        self.console_manager.print_warning(
+            f"The OOM killer ended {kills} processes of '{project_name}'; "
+            "raise its weight or memory_max, or run fewer workers"
+        )
+
+    def warning_memory_high(self, project_name: str, events: int):
+        self.console_manager.print_warning(
+            f"'{project_name}' went over MemoryHigh {events} times and was throttled "
+            "while the kernel reclaimed its memory"
+        )
+
+
+def _used(current: int, limit: Optional[int]) -> str:
+    return f"{format_mib(current)} / {_limit(limit)}"
+
+
+def _limit(limit: Optional[int]) -> str:
+    return format_mib(limit) if limit else "max"
+
+
+def _pressure(usage: CgroupUsage) -> str:
+    """'some avg10' of each resource, in percent"""
+    return " / ".join(
+        f"{usage.pressure[resource]:.1f}%" if resource in usage.pressure else "-"
+        for resource in ("cpu", "memory", "io")
+    )
@@ -0,0 +1,48 @@
+from typing import Optional
+
+from .display import StatusDisplay
+from ...core import AppContainer
+
+
+class StatusManager:
+    """Shows what the projects on this host use of their cgroup limits."""
+
+    def __init__(self, display: StatusDisplay, app: "AppContainer"):
+        self.display = display
+        self.app = app
+
+    def status(self, project_name: Optional[str] = None) -> bool:
+        """
+        Show the host budget and each project's usage, read from
+        /sys/fs/cgroup. With a project, also show each of its services.
+        """
+        resources = self.app.resource_manager
+        if not resources.cgroup_v2():
+            self.display.error_no_cgroup_v2()
+            return False
+
+        projects = resources.list_projects()
+        if project_name:
+            project_name = resources.get_slice_id(project_name)
+            if project_name not in projects:
+                self.display.error_unknown_project(project_name)
+                return False
+            projects = [project_name]
+        if not projects:
+            self.display.no_projects()
+            return True
+
+        self.display.print_budget(resources.load_budget(), resources.read_budget_usage())
+        usages = {name: resources.read_usage(name) for name in projects}
+        self.display.print_projects(
+            {name: (resources.read_weight(name), usage) for name, usage in usages.items()}
+        )
+        for name, usage in usages.items():
+            if usage and usage.oom_kills:
+                self.display.warning_oom(name, usage.oom_kills)
+            elif usage and usage.high_events:
+                self.display.warning_memory_high(name, usage.high_events)
+
+        if project_name:
+            self.display.print_services(project_name, resources.read_service_usage(project_name))
+        return True
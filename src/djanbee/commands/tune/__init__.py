@@ -0,0 +1,3 @@
+from .container import TuneContainer
+
+__all__ = ["TuneContainer"]
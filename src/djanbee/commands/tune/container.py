@@ -0,0 +1,20 @@
+from dataclasses import dataclass
+
+from .display import TuneDisplay
+from .manager import TuneManager
+from ...core import AppContainer
+
+
+@dataclass
+class TuneContainer:
+    """Container for showing and changing a project's Gunicorn settings."""
+
+    display: TuneDisplay
+    manager: TuneManager
+
+    @classmethod
+    def create(cls, app: AppContainer) -> "TuneContainer":
+        """Factory method to create a configured TuneContainer instance."""
+        display = TuneDisplay(console_manager=app.console_manager)
+        manager = TuneManager(display=display, app=app)
+        return cls(display=display, manager=manager)
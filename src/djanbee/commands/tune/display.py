@@ -0,0 +1,155 @@
+from typing import Dict
+
+from ...managers import ConsoleManager
+from ...managers.reload_manager import ReloadReport
+from ...managers.sizing_manager import MemoryReport, format_mib
+from ...managers.tuning_manager import ConfigVersion, GunicornSettings, RuntimeEnvironment
+from ..deploy.display import runtime_comparison_rows
+
+
+class TuneDisplay:
+    def __init__(self, console_manager: "ConsoleManager"):
+        self.console_manager = console_manager
+
+    def error_no_project(self):
+        self.console_manager.print_error("No Django project found")
+
+    def error_invalid(self, error: Exception):
+        self.console_manager.print_error(str(error))
+
+    def warning_not_deployed(self, project_name: str):
+        self.console_manager.print_warning(
+            f"'{project_name}' has no gunicorn.conf.py yet; "
+            "the settings apply on its next `djanbee deploy`"
+        )
+
+    def print_settings(
+        self, instance: str, installed: Dict[str, object], settings: GunicornSettings
+    ):
+        """Installed values next to the ones the current profile gives"""
+        rows = []
+        for name, value in settings.values().items():
+            current = installed.get(name)
+            rows.append(
+                (
+                    name,
+                    "-" if current is None else current,
+                    "-" if value is None else value,
+                    settings.reasons.get(name, ""),
+                )
+            )
+        self.console_manager.print_table(
+            f"Gunicorn settings of {instance}", ["Setting", "Installed", "Tuned", "Why"], rows
+        )
+
+    def print_environment(
+        self, instance: str, installed: Dict[str, str], environment: RuntimeEnvironment
+    ):
+        """Installed runtime variables next to the ones derived now"""
+        rows = [
+            (
+                name,
+                installed.get(name, "-"),
+                environment.values.get(name, "-"),
+                environment.reasons.get(name, ""),
+            )
+            for name in environment.reasons
+        ]
+        self.console_manager.print_table(
+            f"Runtime environment of {instance}", ["Variable", "Installed", "Tuned", "Why"], rows
+        )
+
+    def hint_apply(self):
+        self.console_manager.print_info(
+            "Run `djanbee tune --apply` to install the tuned values, "
+            "or `djanbee tune NAME=VALUE` to pin one"
+        )
+
+    def hint_sizing(self):
+        self.console_manager.print_info(
+            "Workers, threads and worker class are sized again on the next deploy"
+        )
+
+    def config_installed(self, installed: ConfigVersion):
+        if installed.changed:
+            self.console_manager.print_step_progress(
+                "Gunicorn config", f"{installed.path} is now version {installed.version}"
+            )
+        else:
+            self.console_manager.print_step_progress(
+                "Unchanged", f"{installed.path} (version {installed.version}) is up to date"
+            )
+
+    def config_failure(self, instance: str, error: Exception):
+        self.console_manager.print_step_failure(instance, "Could not write gunicorn.conf.py")
+        self.console_manager.print_error(str(error))
+
+    def print_memory(self, instance: str, report: MemoryReport, usable: int):
+        """Shared and private memory of the master and each worker"""
+        rows = [
+            (role, process.pid, format_mib(process.rss), format_mib(process.shared),
+             format_mib(process.private), format_mib(process.pss))
+            for role, process in [("master", report.master)]
+            + [("worker", worker) for worker in report.workers]
+        ]
+        self.console_manager.print_table(
+            f"Memory of gunicorn-{instance}",
+            ["Process", "PID", "RSS", "Shared", "Private", "PSS"],
+            rows,
+        )
+        self.console_manager.print_info(
+            f"Each worker adds {format_mib(report.worker_private)}; "
+            f"{report.workers_fitting(usable)} fit in {format_mib(usable)}"
+        )
+
+    def memory_unavailable(self, instance: str):
+        self.console_manager.print_warning(
+            f"gunicorn-{instance} is not running or its /proc entries are not readable"
+        )
+
+    def memory_comparison(
+        self, instance: str, before: MemoryReport, after: MemoryReport, usable: int
+    ):
+        """Worker memory before and after preloading was switched"""
+        rows = [
+            ("Shared per worker", format_mib(before.worker_shared), format_mib(after.worker_shared)),
+            ("Private per worker", format_mib(before.worker_private), format_mib(after.worker_private)),
+            ("Service total (PSS)", format_mib(before.total), format_mib(after.total)),
+            ("Workers fitting", before.workers_fitting(usable), after.workers_fitting(usable)),
+        ]
+        self.console_manager.print_table(
+            f"Memory of gunicorn-{instance}", ["", "Before", "After"], rows
+        )
+        self.console_manager.print_info(
+            "Private memory grows as workers touch shared pages; check again under load"
+        )
+
+    def report(self, report: ReloadReport):
+        if report.success:
+            self.console_manager.print_step_progress(report.service, report.summary())
+        else:
+            self.console_manager.print_step_failure(report.service, report.summary())
+
+    def environment_installed(self, path):
+        self.console_manager.print_step_progress("Runtime environment", f"Wrote {path}")
+
+    def environment_failure(self, path, error: Exception):
+        self.console_manager.print_step_failure("Runtime environment", f"Could not write {path}")
+        self.console_manager.print_error(str(error))
+
+    def hint_environment_deploy(self, instance: str):
+        self.console_manager.print_warning(
+            f"The unit of {instance} does not load the runtime environment yet; "
+            "it applies after the next `djanbee deploy`"
+        )
+
+    def restart_failure(self, instance: str, message: str):
+        self.console_manager.print_step_failure(f"gunicorn-{instance}", f"Restart failed: {message}")
+
+    def runtime_comparison(self, instance: str, before, after):
+        """Memory and latency before and after the restart"""
+        self.console_manager.print_table(
+            f"gunicorn-{instance} with the new runtime environment",
+            ["", "Before", "After"],
+            runtime_comparison_rows(before, after),
+        )
@@ -0,0 +1,239 @@
+from pathlib import Path
+from typing import Iterable, List, Optional
+
+from .display import TuneDisplay
+from ...core import AppContainer
+from ...managers.sizing_manager import WorkerPlan
+from ...managers.tuning_manager import (
+    RUNTIME_TUNABLE,
+    parse_assignment,
+    parse_runtime_assignment,
+    read_config,
+    render_config,
+    render_environment,
+)
+
+
+class TuneManager:
+    """Shows and changes the Gunicorn settings of a deployed project."""
+
+    WEB_ROOT = Path("/var/www")
+
+    def __init__(self, display: TuneDisplay, app: "AppContainer"):
+        self.display = display
+        self.app = app
+
+    def tune(
+        self,
+        assignments: Iterable[str] = (),
+        unset: Iterable[str] = (),
+        apply: bool = False,
+        memory: bool = False,
+    ) -> bool:
+        """
+        Pin settings with NAME=VALUE, release pinned ones with `unset`, and
+        install the result on every deployed instance of the project.
+        Upper-case names such as MALLOC_ARENA_MAX are variables of the
+        runtime environment; changing it restarts the services and compares
+        their memory and latency before and after.
+
+        Without changes the installed settings are shown next to the ones
+        the project's current profile gives; `apply` installs those.
+        `memory` also shows how much memory the workers share.
+        """
+        project_path = self.app.django_manager.project_service.resolve_project()
+        if not project_path:
+            self.display.error_no_project()
+            return False
+        project_name = project_path.name
+        tuning = self.app.tuning_manager
+
+        overrides = tuning.load_overrides(project_path)
+        try:
+            for assignment in assignments:
+                if assignment.partition("=")[0].strip() in RUNTIME_TUNABLE:
+                    name, value = parse_runtime_assignment(assignment)
+                else:
+                    name, value = parse_assignment(assignment)
+                overrides[name] = value
+            for name in unset:
+                overrides.pop(name.replace("-", "_"), None)
+        except ValueError as e:
+            self.display.error_invalid(e)
+            return False
+        changed = bool(assignments or unset)
+        if changed:
+            tuning.save_overrides(project_path, overrides)
+
+        instances = [
+            instance
+            for instance in [project_name] + self.app.socket_manager.get_colour_services(project_name)
+            if tuning.current_version(instance) is not None
+        ]
+        if not instances:
+            self.display.warning_not_deployed(project_name)
+            return True
+
+        profile = tuning.load_profile(
+            project_path, self.app.server_manager.get_release_log_path(project_name)
+        )
+        success = True
+        for instance in instances:
+            installed = read_config(tuning.read_config(instance))
+            # Sizing needs a measured worker; keep what the last deploy picked
+            plan = WorkerPlan(
+                installed.get("workers", 3),
+                installed.get("threads", 1),
+                installed.get("worker_class", "sync"),
+            )
+            settings = tuning.settings_for(plan, profile, overrides)
+            for name in ("workers", "threads", "worker_class"):
+                if name not in overrides:
+                    settings.reasons[name] = "sized at the last deploy"
+
+            self.display.print_settings(instance, installed, settings)
+            environment = tuning.runtime_for(
+                plan, self._release_path(project_name, instance), project_name, overrides
+            )
+            self.display.print_environment(instance, tuning.read_environment(instance), environment)
+            if memory:
+                self._show_memory(instance)
+            if not (changed or apply):
+                continue
+            restart = self._install_environment(instance, render_environment(environment, instance))
+            if restart is None:
+                success = False
+                continue
+            preload_changed = installed.get("preload_app", False) != settings.preload_app
+            success = (
+                self._install(
+                    instance, render_config(settings, instance), preload_changed, restart
+                )
+                and success
+            )
+
+        if not (changed or apply):
+            self.display.hint_apply()
+        elif any(name in ("workers", "threads", "worker_class") for name in unset):
+            self.display.hint_sizing()
+        return success
+
+    def _install(
+        self, instance: str, content: str, preload_changed: bool = False, restart: bool = False
+    ) -> bool:
+        """
+        Install a config and let the running services read it again.
+        Turning preloading on or off needs a new master; the memory of the
+        workers is compared before and after it. A changed environment
+        needs a restart, which also reads the config.
+        """
+        try:
+            installed = self.app.tuning_manager.install_config(instance, content)
+        except OSError as e:
+            self.display.config_failure(instance, e)
+            return False
+        self.display.config_installed(installed)
+        if not (installed.changed or restart):
+            return True
+
+        success = True
+        for service_instance in self._service_instances(instance):
+            if not self.app.os_manager.check_service_status(f"gunicorn-{service_instance}"):
+                continue
+            if restart:
+                success = self._restart(service_instance) and success
+            else:
+                success = self._reload(service_instance, preload_changed) and success
+        return success
+
+    def _reload(self, instance: str, preload_changed: bool) -> bool:
+        """HUP a service, or start a new master when preloading was switched"""
+        service = f"gunicorn-{instance}"
+        sizing = self.app.sizing_manager
+        before = None
+        if preload_changed:
+            before = sizing.memory_report(self.app.os_manager.get_service_main_pid(service))
+        report = self.app.reload_manager.reload_gunicorn(instance, upgrade=preload_changed)
+        self.display.report(report)
+        if before and report.success:
+            after = sizing.memory_report(self.app.os_manager.get_service_main_pid(service))
+            if after:
+                # Memory the service gives back when its workers are replaced counts too
+                usable = sizing.detect_host().usable_memory + before.total
+                self.display.memory_comparison(instance, before, after, usable)
+        return report.success
+
+    def _install_environment(self, instance: str, content: str) -> Optional[bool]:
+        """
+        Install the runtime environment of a project or colour.
+
+        Returns:
+            Whether its services need a restart, None if it could not be written
+        """
+        tuning = self.app.tuning_manager
+        try:
+            changed = tuning.install_environment(instance, content)
+        except OSError as e:
+            self.display.environment_failure(tuning.get_environment_path(instance), e)
+            return None
+        if not changed:
+            return False
+        self.display.environment_installed(tuning.get_environment_path(instance))
+        # Units written before runtime environments existed do not load it
+        _, unit_path, _ = self.app.socket_manager.check_socket_service_exists(
+            self._service_instances(instance)[0]
+        )
+        try:
+            unit = unit_path.read_text() if unit_path else ""
+        except OSError:
+            unit = ""
+        if str(tuning.get_environment_path(instance)) not in unit:
+            self.display.hint_environment_deploy(instance)
+            return False
+        return True
+
+    def _restart(self, instance: str) -> bool:
+        """
+        Restart a service so it starts with its new environment, comparing
+        its memory and latency before and after. With socket activation
+        requests queue in the kernel meanwhile.
+        """
+        tuning = self.app.tuning_manager
+        service = f"gunicorn-{instance}"
+        socket_path = self.app.socket_manager.get_socket_path(instance)
+        before = tuning.sample_service(instance, socket_path)
+        result = self.app.os_manager.restart_service(service)
+        if not result.success:
+            self.display.restart_failure(instance, result.stderr)
+            return False
+        readiness = self.app.readiness_manager
+        host = readiness.probe_host(
+            self.app.django_manager.settings_service.find_in_settings("ALLOWED_HOSTS", [])
+        )
+        result = readiness.wait_until_ready(socket_path, host=host, service=service)
+        if not result.ready:
+            self.display.restart_failure(instance, result.error or "did not answer")
+            return False
+        after = tuning.sample_service(instance, socket_path)
+        self.display.runtime_comparison(instance, before, after)
+        return True
+
+    def _service_instances(self, instance: str) -> List[str]:
+        """Services running a project's or colour's config"""
+        if instance.rpartition("-")[2] in self.app.socket_manager.COLOURS:
+            return [instance]
+        return self.app.socket_manager.get_service_instances(instance)
+
+    def _release_path(self, project_name: str, instance: str) -> Path:
+        """Release a project or colour runs"""
+        colour = instance[len(project_name) + 1 :]
+        return self.WEB_ROOT / project_name / (colour or "current")
+
+    def _show_memory(self, instance: str) -> None:
+        pid = self.app.os_manager.get_service_main_pid(f"gunicorn-{instance}")
+        report = self.app.sizing_manager.memory_report(pid)
+        if report is None:
+            self.display.memory_unavailable(instance)
+            return
+        usable = self.app.sizing_manager.detect_host().usable_memory + report.total
+        self.display.print_memory(instance, report, usable)
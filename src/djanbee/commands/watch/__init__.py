@@ -0,0 +1,3 @@
+from .container import WatchContainer
+
+__all__ = ["WatchContainer"]
@@ -0,0 +1,20 @@
+from dataclasses import dataclass
+
+from .display import WatchDisplay
+from .manager import WatchManager
+from ...core import AppContainer
+
+
+@dataclass
+class WatchContainer:
+    """Container for redeploying a project whenever its files change."""
+
+    display: WatchDisplay
+    manager: WatchManager
+
+    @classmethod
+    def create(cls, app: AppContainer) -> "WatchContainer":
+        """Factory method to create a configured WatchContainer instance."""
+        display = WatchDisplay(console_manager=app.console_manager)
+        manager = WatchManager(display=display, app=app)
+        return cls(display=display, manager=manager)
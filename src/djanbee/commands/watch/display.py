@@ -0,0 +1,61 @@
+from pathlib import Path
+from typing import List
+
+from ...managers import ConsoleManager
+from ...managers.reload_manager import ReloadReport
+from ...managers.watch_manager import ChangeSet
+
+
+class WatchDisplay:
+    # Changed files listed per burst before the rest are summarized
+    MAX_LISTED = 5
+
+    def __init__(self, console_manager: "ConsoleManager"):
+        self.console_manager = console_manager
+
+    def error_no_project(self):
+        self.console_manager.print_error("No Django project found")
+
+    def error_not_deployed(self, path: Path):
+        self.console_manager.print_error(
+            f"Nothing is deployed at {path} yet, run `djanbee deploy` first"
+        )
+
+    def error_watch(self, error: Exception):
+        self.console_manager.print_error(f"Cannot watch the project: {error}")
+
+    def watching(self, path: Path, directories: int):
+        self.console_manager.print_progress(
+            f"Watching {directories} directories under {path}, press Ctrl+C to stop"
+        )
+
+    def changes_detected(self, changes: ChangeSet):
+        if changes.overflow:
+            self.console_manager.print_warning(
+                "Too many changes at once to track, redeploying everything"
+            )
+            return
+        listed = ", ".join(changes.paths[: self.MAX_LISTED])
+        more = len(changes.paths) - self.MAX_LISTED
+        if more > 0:
+            listed += f" and {more} more"
+        self.console_manager.print_info(f"Changed: {listed}")
+
+    def error_colour_link(self, colour: str, error: Exception):
+        self.console_manager.print_error(f"Could not point {colour} at the new release: {error}")
+
+    def workers_reloaded(self, report: ReloadReport):
+        self.console_manager.print_step_progress("Gunicorn", report.summary())
+
+    def workers_reload_failed(self, report: ReloadReport):
+        self.console_manager.print_warning(f"Could not reload workers: {report.summary()}")
+
+    def cycle_complete(self, performed: List[str], skipped: List[str], duration: float):
+        self.console_manager.print_success(
+            f"Redeployed in {duration:.1f}s ({', '.join(performed) or 'sync only'})"
+        )
+        if skipped:
+            self.console_manager.print_info(f"Skipped: {', '.join(skipped)}")
+
+    def stopped(self):
+        self.console_manager.print_info("Stopped watching")
@@ -0,0 +1,106 @@
+import time
+
+from .display import WatchDisplay
+from ..deploy import DeployContainer
+from ..run import RunContainer
+from ...core import AppContainer
+from ...managers.watch_manager import ChangeSet
+
+
+class WatchManager:
+    """Redeploys a project incrementally whenever its source files change."""
+
+    def __init__(self, display: WatchDisplay, app: "AppContainer"):
+        self.display = display
+        self.app = app
+        self.deploy = DeployContainer.create(app).manager
+        self.run = RunContainer.create(app).manager
+        self.project_name = None
+
+    def watch(self, debounce: float = 0.5, max_delay: float = 10.0) -> bool:
+        """
+        Wait for bursts of changes and redeploy after each one.
+
+        Args:
+            debounce: Seconds without changes that end a burst
+            max_delay: Longest a burst may delay the redeploy
+        """
+        project_path = self.app.django_manager.project_service.resolve_project()
+        if not project_path:
+            self.display.error_no_project()
+            return False
+
+        self.project_name = project_path.name
+        base = self.deploy.WEB_ROOT / self.project_name
+        if not self.app.release_manager.get_active_release(base):
+            self.display.error_not_deployed(base)
+            return False
+
+        # The run operations work on the current directory
+        self.run.initialize_project(str(project_path))
+        try:
+            watcher = self.app.watch_manager.watch(project_path)
+        except OSError as e:
+            self.display.error_watch(e)
+            return False
+
+        self.display.watching(project_path, len(watcher.directories))
+        try:
+            while True:
+                changes = watcher.wait(debounce, max_delay)
+                if changes and (changes.paths or changes.overflow):
+                    self.redeploy(changes)
+        except KeyboardInterrupt:
+            self.display.stopped()
+        finally:
+            watcher.close()
+        return True
+
+    def redeploy(self, changes: ChangeSet) -> bool:
+        """
+        Sync the changes into a new release, then run only the steps the
+        kind of change calls for.
+        """
+        started = time.perf_counter()
+        self.display.changes_detected(changes)
+        if not self.deploy.sync_project_files(reload_workers=False, watch=True):
+            return False
+        live = self.deploy.get_live_colour(self.project_name)
+        if live:
+            # Blue/green services run from their colour's link, not `current`
+            releases = self.app.release_manager
+            base = self.deploy.WEB_ROOT / self.project_name
+            try:
+                releases.activate(base, releases.get_active_release(base), link_name=live)
+            except OSError as e:
+                self.display.error_colour_link(live, e)
+                return False
+
+        performed, skipped = ["sync"], []
+        steps = (
+            ("collectstatic", changes.static, self.run.collect_static_files),
+            ("migrate", changes.migrations, self.run.migrate_database),
+            ("reload", changes.code, self._reload_workers),
+        )
+        for name, needed, step in steps:
+            if not needed:
+                skipped.append(name)
+            elif step():
+                performed.append(name)
+
+        self.display.cycle_complete(performed, skipped, time.perf_counter() - started)
+        return True
+
+    def _reload_workers(self) -> bool:
+        """HUP the workers so they import the new code"""
+        results = []
+        for instance in self.app.socket_manager.get_project_services(self.project_name):
+            if not self.app.os_manager.check_service_status(f"gunicorn-{instance}"):
+                continue
+            report = self.app.reload_manager.reload_gunicorn(instance)
+            if report.success:
+                self.display.workers_reloaded(report)
+            else:
+                self.display.workers_reload_failed(report)
+            results.append(report.success)
+        return bool(results) and all(results)
@@ -9,6 +9,22 @@ from ..managers import (
     SocketManager,
     EnvManager,
     DotenvManager,
+    WheelhouseManager,
+    VenvStoreManager,
+    BytecodeManager,
+    ProfileManager,
+    SyncManager,
+    ReleaseManager,
+    ArtifactManager,
+    WatchManager,
+    ConvergenceManager,
+    SizingManager,
+    ReloadManager,
+    ReadinessManager,
+    CanaryManager,
+    TuningManager,
+    ResourceManager,
+    AutoscaleManager,
 )
 
 
@@ -24,6 +40,22 @@ class AppContainer:
     socket_manager: "SocketManager"
     env_manager: "EnvManager"
     dotenv_manager: "DotenvManager"
+    wheelhouse_manager: "WheelhouseManager"
+    venv_store_manager: "VenvStoreManager"
+    bytecode_manager: "BytecodeManager"
+    profile_manager: "ProfileManager"
+    sync_manager: "SyncManager"
+    release_manager: "ReleaseManager"
+    artifact_manager: "ArtifactManager"
+    watch_manager: "WatchManager"
+    convergence_manager: "ConvergenceManager"
+    sizing_manager: "SizingManager"
+    reload_manager: "ReloadManager"
+    readiness_manager: "ReadinessManager"
+    canary_manager: "CanaryManager"
+    tuning_manager: "TuningManager"
+    resource_manager: "ResourceManager"
+    autoscale_manager: "AutoscaleManager"
 
     _instance: Optional["AppContainer"] = None
 
@@ -32,28 +64,67 @@ class AppContainer:
         if cls._instance is None:
             os_manager = OSManager()
             console_manager = ConsoleManager()
+
+            sync_manager = SyncManager(os_manager)
+            bytecode_manager = BytecodeManager(os_manager)
+
+            # Shared wheelhouse so every install path reuses the same wheels
+            wheelhouse_manager = WheelhouseManager(os_manager)
+            venv_store_manager = VenvStoreManager(os_manager, wheelhouse_manager)
             
             # Create the environment manager first
-            env_manager = EnvManager(os_manager, console_manager)
+            env_manager = EnvManager(
+                os_manager, console_manager, wheelhouse_manager, venv_store_manager
+            )
             
             # Create dotenv manager
             dotenv_manager = DotenvManager(os_manager, console_manager)
             
             # Pass env_manager and dotenv_manager to django_manager
-            django_manager = DjangoManager(os_manager, console_manager, env_manager, dotenv_manager)
+            django_manager = DjangoManager(
+                os_manager,
+                console_manager,
+                env_manager,
+                dotenv_manager,
+                wheelhouse_manager=wheelhouse_manager,
+                venv_store_manager=venv_store_manager,
+            )
             
+            readiness_manager = ReadinessManager(os_manager)
+            canary_manager = CanaryManager(os_manager)
+            sizing_manager = SizingManager(os_manager)
+            resource_manager = ResourceManager(os_manager, sizing_manager)
+
             cls._instance = cls(
                 os_manager=os_manager,
                 console_manager=console_manager,
                 django_manager=django_manager,
                 database_manager=DatabaseManager(os_manager, console_manager, env_manager),
                 server_manager=ServerManager(
-                    os_manager, console_manager, django_manager
+                    os_manager, django_manager.fs_manager, console_manager, django_manager
                 ),
                 socket_manager=SocketManager(
                     os_manager, console_manager, django_manager
                 ),
                 env_manager=env_manager,
                 dotenv_manager=dotenv_manager,
+                wheelhouse_manager=wheelhouse_manager,
+                venv_store_manager=venv_store_manager,
+                bytecode_manager=bytecode_manager,
+                profile_manager=ProfileManager(os_manager),
+                sync_manager=sync_manager,
+                release_manager=ReleaseManager(os_manager, sync_manager),
+                artifact_manager=ArtifactManager(os_manager, sync_manager, bytecode_manager),
+                watch_manager=WatchManager(os_manager, sync_manager),
+                convergence_manager=ConvergenceManager(os_manager),
+                sizing_manager=sizing_manager,
+                reload_manager=ReloadManager(os_manager),
+                readiness_manager=readiness_manager,
+                canary_manager=canary_manager,
+                tuning_manager=TuningManager(
+                    os_manager, readiness_manager, canary_manager, sizing_manager
+                ),
+                resource_manager=resource_manager,
+                autoscale_manager=AutoscaleManager(os_manager, sizing_manager, resource_manager),
             )
         return cls._instance
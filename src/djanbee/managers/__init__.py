@@ -1,5 +1,21 @@
 from .console_manager import ConsoleManager
 from .os_manager import OSManager
+from .wheelhouse_manager import WheelhouseManager
+from .venv_store_manager import VenvStoreManager
+from .bytecode_manager import BytecodeManager
+from .profile_manager import ProfileManager
+from .sync_manager import SyncManager
+from .release_manager import ReleaseManager
+from .artifact_manager import ArtifactManager
+from .watch_manager import WatchManager
+from .convergence_manager import ConvergenceManager
+from .sizing_manager import SizingManager
+from .reload_manager import ReloadManager
+from .readiness_manager import ReadinessManager
+from .canary_manager import CanaryManager
+from .tuning_manager import TuningManager
+from .resource_manager import ResourceManager
+from .autoscale_manager import AutoscaleManager
 from .env_manager import EnvManager
 from .django_manager import DjangoManager
 from .database_manager import DatabaseManager
@@ -16,4 +32,20 @@ __all__ = [
     "SocketManager",
     "EnvManager",
     "DotenvManager",
+    "WheelhouseManager",
+    "VenvStoreManager",
+    "BytecodeManager",
+    "ProfileManager",
+    "SyncManager",
+    "ReleaseManager",
+    "ArtifactManager",
+    "WatchManager",
+    "ConvergenceManager",
+    "SizingManager",
+    "ReloadManager",
+    "ReadinessManager",
+    "CanaryManager",
+    "TuningManager",
+    "ResourceManager",
+    "AutoscaleManager",
 ]
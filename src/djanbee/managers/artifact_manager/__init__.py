@@ -0,0 +1,3 @@
+from .main import ArtifactManager, BuildReport, ExtractReport
+
+__all__ = ["ArtifactManager", "BuildReport", "ExtractReport"]
@@ -0,0 +1,489 @@
+import hashlib
+import json
+import os
+import re
+import shutil
+import stat
+import threading
+import time
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Union
+
+from ..bytecode_manager import BytecodeManager, PrecompileReport
+from ..os_manager import OSManager
+from ..sync_manager import SyncManager
+
+
+# Runs inside the project's venv so collectstatic sees the project's
+# settings, with STATIC_ROOT pointed into the build directory
+COLLECTSTATIC_SCRIPT = r"""
+import os, sys
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", sys.argv[1])
+import django
+from django.conf import settings
+django.setup()
+settings.STATIC_ROOT = sys.argv[2]
+from django.core.management import call_command
+call_command("collectstatic", interactive=False, verbosity=0)
+"""
+
+
+@dataclass
+class BuildReport:
+    """Outcome of building an artifact"""
+
+    artifact_id: str = ""
+    manifest_path: Optional[Path] = None
+    files: Dict[str, int] = field(default_factory=dict)
+    size: int = 0
+    chunks: int = 0
+    new_chunks: int = 0
+    new_bytes: int = 0
+    duration: float = 0.0
+    bytecode: Optional[PrecompileReport] = None
+    static_error: str = ""
+
+    @property
+    def reused(self) -> float:
+        """Share of the chunks that an earlier build already stored"""
+        return 1 - self.new_chunks / self.chunks if self.chunks else 0.0
+
+
+@dataclass
+class ExtractReport:
+    """Outcome of unpacking an artifact"""
+
+    written: int = 0
+    linked: int = 0
+    unchanged: int = 0
+    bytes_written: int = 0
+    duration: float = 0.0
+    # Sections whose content differs from the previous release
+    changed_sections: List[str] = field(default_factory=list)
+
+
+class ArtifactManager:
+    """
+    Manager responsible for build-once release artifacts.
+
+    An artifact is everything a release needs to run: the project source
+    with its bytecode, the virtual environment it was built in, and its
+    collected static files. File contents are split into chunks stored
+    under their SHA-256, and a manifest lists the chunks of every file:
+
+        ~/.cache/djanbee/artifacts/
+            chunks/3f/3f9a...       zlib-compressed chunk
+            manifests/<id>.json     the artifact id hashes its manifest
+            refs/<project>          id of the project's latest build
+
+    Consecutive builds share every unchanged chunk, so building, copying
+    the store to a server (rsync only sends new chunk files) and unpacking
+    all cost time proportional to what changed.
+    """
+
+    CHUNK_SIZE = 1024 * 1024
+    FORMAT = 1
+    SECTIONS = ("app", "venv", "static")
+    VENV_DIR = ".venv"
+    STATIC_DIR = "static"
+    # Manifest of the artifact a release was unpacked from
+    RELEASE_MANIFEST = ".djanbee-artifact.json"
+
+    def __init__(
+        self,
+        os_manager: OSManager,
+        sync_manager: SyncManager,
+        bytecode_manager: BytecodeManager,
+        cache_root: Union[str, Path] = None,
+        workers: int = None,
+    ):
+        """
+        Initialize with references to other managers.
+
+        Args:
+            os_manager: OSManager instance for OS operations
+            sync_manager: SyncManager deciding which project files are deployed
+            bytecode_manager: BytecodeManager precompiling the artifact
+            cache_root: Directory holding djanbee caches (default: ~/.cache/djanbee)
+            workers: Hashing and extraction threads (default: scaled to the CPU count)
+        """
+        self.os_manager = os_manager
+        self.sync_manager = sync_manager
+        self.bytecode_manager = bytecode_manager
+        cache_root = Path(cache_root) if cache_root else Path.home() / ".cache" / "djanbee"
+        self.root = cache_root / "artifacts"
+        self.workers = workers or min(32, (os.cpu_count() or 1) * 4)
+
+    def set_store(self, root: Union[str, Path]) -> None:
+        """Use another store, e.g. one synced from the build machine"""
+        self.root = Path(root)
+
+    def build(
+        self,
+        project_path: Union[str, Path],
+        venv_path: Union[str, Path],
+        collect_static: bool = True,
+    ) -> BuildReport:
+        """
+        Build an artifact of a project and its virtual environment.
+
+        The deployable part of the project is copied to a build directory
+        in the store and precompiled there together with the venv's
+        site-packages. Hash based .pyc files are used, so bytecode stays
+        valid wherever the artifact is unpacked.
+
+        Args:
+            project_path: Django project directory (the one with manage.py)
+            venv_path: Virtual environment the project runs in
+            collect_static: Also run collectstatic into the artifact
+
+        Returns:
+            BuildReport describing the artifact
+
+        Raises:
+            RuntimeError: If the bytecode could not be compiled
+        """
+        started = time.perf_counter()
+        project_path = Path(project_path).resolve()
+        venv_path = Path(venv_path).resolve()
+        report = BuildReport()
+
+        # Kept between builds: the copy and the bytecode are then only
+        # refreshed where the project changed, and .pyc files, which embed
+        # their source path, come out byte-identical
+        build_dir = self.root / "build" / project_path.name
+        app_dir = build_dir / "app"
+        static_dir = build_dir / "static"
+        self.sync_manager.sync(project_path, app_dir)
+        (app_dir / self.sync_manager.MANIFEST_NAME).unlink(missing_ok=True)
+        self._remove_orphan_bytecode(app_dir)
+        report.bytecode = self.bytecode_manager.precompile(venv_path, app_dir)
+
+        shutil.rmtree(static_dir, ignore_errors=True)
+        if collect_static:
+            report.static_error = self._collect_static(venv_path, app_dir, static_dir)
+
+        sections = {
+            "app": self._store_tree(app_dir, report),
+            "venv": self._store_tree(venv_path, report, prefix=venv_path),
+            "static": self._store_tree(static_dir, report) if static_dir.is_dir() else {},
+        }
+
+        manifest = {
+            "format": self.FORMAT,
+            "project": project_path.name,
+            "python": self._python_version(venv_path),
+            "venv_prefix": str(venv_path),
+            "sections": sections,
+        }
+        report.artifact_id = self.compute_id(manifest)
+        manifest["id"] = report.artifact_id
+        manifest["created"] = time.time()
+        report.manifest_path = self._save_manifest(manifest)
+        report.files = {name: len(entries) for name, entries in sections.items()}
+        report.duration = time.perf_counter() - started
+        return report
+
+    def compute_id(self, manifest: dict) -> str:
+        """Hash of everything an artifact contains, independent of build time"""
+        keys = ("format", "project", "python", "venv_prefix", "sections")
+        content = {key: manifest[key] for key in keys}
+        return hashlib.sha256(
+            json.dumps(content, sort_keys=True, separators=(",", ":")).encode("utf-8")
+        ).hexdigest()
+
+    def load(self, reference: str = "", project_name: str = None) -> dict:
+        """
+        Find an artifact manifest.
+
+        Args:
+            reference: Path of a manifest file, an artifact id or a unique
+                prefix of one, or '' / 'latest' for the latest build of
+                project_name (of any project without one)
+
+        Raises:
+            FileNotFoundError: If no such artifact exists
+            ValueError: If an id prefix is ambiguous
+        """
+        path = Path(reference) if reference else None
+        if path and path.suffix == ".json" and path.is_file():
+            return json.loads(path.read_text(encoding="utf-8"))
+
+        manifests = self.root / "manifests"
+        if reference in ("", "latest"):
+            ref_file = self.root / "refs" / project_name if project_name else None
+            if ref_file and ref_file.is_file():
+                reference = ref_file.read_text().strip()
+            else:
+                built = sorted(manifests.glob("*.json"), key=lambda p: p.stat().st_mtime)
+                if not built:
+                    raise FileNotFoundError(f"No artifacts in {self.root}")
+                reference = built[-1].stem
+
+        matches = []
+        if re.fullmatch(r"[0-9a-f]+", reference):
+            matches = list(manifests.glob(f"{reference}*.json"))
+        if not matches:
+            raise FileNotFoundError(f"Artifact not found: {reference}")
+        if len(matches) > 1:
+            raise ValueError(f"Artifact id {reference} is ambiguous")
+        return json.loads(matches[0].read_text(encoding="utf-8"))
+
+    def missing_chunks(self, manifest: dict) -> List[str]:
+        """Chunks the manifest needs that the store does not have"""
+        return sorted(
+            {
+                digest
+                for entries in manifest["sections"].values()
+                for entry in entries.values()
+                for digest in entry.get("chunks", ())
+                if not self._chunk_path(digest).exists()
+            }
+        )
+
+    def extract(
+        self,
+        manifest: dict,
+        destination: Union[str, Path],
+        venv_prefix: Union[str, Path] = None,
+        static_root: Union[str, Path] = None,
+        previous: Union[str, Path] = None,
+    ) -> ExtractReport:
+        """
+        Unpack an artifact into a release directory, writing files in parallel.
+
+        The source goes to the destination itself and the venv to its .venv
+        directory. Files identical in the previous release are hardlinked
+        instead of written, and static files identical to the previous
+        release's are left alone in the shared static root.
+
+        Args:
+            manifest: Manifest returned by load()
+            destination: Empty release directory
+            venv_prefix: Final path of the venv, if the destination is
+                renamed afterwards; scripts and configuration embedding
+                the build path are rewritten to it
+            static_root: Shared static directory (default: inside the release)
+            previous: Release unpacked from an earlier artifact
+
+        Raises:
+            FileNotFoundError: If the store lacks some of the chunks
+        """
+        started = time.perf_counter()
+        missing = self.missing_chunks(manifest)
+        if missing:
+            raise FileNotFoundError(
+                f"{len(missing)} chunks of artifact {manifest['id'][:12]} are missing from {self.root}"
+            )
+
+        destination = Path(destination)
+        roots = {
+            "app": destination,
+            "venv": destination / self.VENV_DIR,
+            "static": Path(static_root) if static_root else destination / self.STATIC_DIR,
+        }
+        old_prefix = manifest["venv_prefix"].encode("utf-8")
+        new_prefix = str(venv_prefix or roots["venv"]).encode("utf-8")
+        before = self._load_release_manifest(previous)
+        report = ExtractReport()
+
+        jobs = []
+        for section in self.SECTIONS:
+            entries = manifest["sections"].get(section, {})
+            old_entries = before.get("sections", {}).get(section, {})
+            if entries != old_entries:
+                report.changed_sections.append(section)
+            root = roots[section]
+            shared = section == "static" and static_root is not None
+            for relative, entry in sorted(entries.items()):
+                target = root / relative
+                target.parent.mkdir(parents=True, exist_ok=True)
+                if "link" in entry:
+                    link = entry["link"].replace(old_prefix.decode("utf-8"), new_prefix.decode("utf-8"))
+                    if target.is_symlink() or target.exists():
+                        target.unlink()
+                    os.symlink(link, target)
+                    continue
+                reusable = old_entries.get(relative) == entry and not entry.get("relocate")
+                if reusable and shared and target.exists():
+                    report.unchanged += 1
+                elif reusable and not shared and previous:
+                    jobs.append((target, entry, Path(previous) / target.relative_to(destination)))
+                else:
+                    jobs.append((target, entry, None))
+
+        def unpack(job: Tuple[Path, dict, Optional[Path]]) -> Tuple[bool, int]:
+            target, entry, original = job
+            if original is not None:
+                try:
+                    os.link(original, target)
+                    return True, 0
+                except OSError:
+                    pass
+            return False, self._write_file(target, entry, old_prefix, new_prefix)
+
+        with ThreadPoolExecutor(self.workers) as executor:
+            for linked, written in executor.map(unpack, jobs):
+                if linked:
+                    report.linked += 1
+                else:
+                    report.written += 1
+                    report.bytes_written += written
+
+        (destination / self.RELEASE_MANIFEST).write_text(json.dumps(manifest), encoding="utf-8")
+        report.duration = time.perf_counter() - started
+        return report
+
+    # Private methods
+
+    def _collect_static(self, venv_path: Path, app_dir: Path, static_dir: Path) -> str:
+        """Run collectstatic into the build; returns an error message or ''"""
+        manage = app_dir / "manage.py"
+        match = re.search(
+            r'DJANGO_SETTINGS_MODULE["\']?\s*,\s*["\']([^"\']+)["\']',
+            manage.read_text(encoding="utf-8") if manage.is_file() else "",
+        )
+        if not match:
+            return "DJANGO_SETTINGS_MODULE not found in manage.py"
+        result = self.os_manager.run_command(
+            [
+                str(self.os_manager.get_python_path(venv_path)),
+                "-c",
+                COLLECTSTATIC_SCRIPT,
+                match.group(1),
+                str(static_dir),
+            ],
+            cwd=app_dir,
+        )
+        if not result.success:
+            shutil.rmtree(static_dir, ignore_errors=True)
+            lines = (result.stderr or "collectstatic failed").strip().splitlines()
+            return lines[-1] if lines else "collectstatic failed"
+        return ""
+
+    def _remove_orphan_bytecode(self, app_dir: Path) -> None:
+        """Delete .pyc files of modules removed from the project since the last build"""
+        for cache_dir in app_dir.rglob("__pycache__"):
+            for pyc in cache_dir.glob("*.pyc"):
+                if not (cache_dir.parent / f"{pyc.name.split('.', 1)[0]}.py").exists():
+                    pyc.unlink()
+
+    def _store_tree(
+        self, root: Path, report: BuildReport, prefix: Optional[Path] = None
+    ) -> Dict[str, dict]:
+        """
+        Store every file under root and describe it.
+
+        Small text files embedding `prefix` are marked for relocation, as
+        venv scripts and configuration carry the venv's absolute path.
+        Bytecode is not rewritten; Python corrects a code object's file
+        name when it loads the .pyc.
+        """
+        entries: Dict[str, dict] = {}
+        files = []
+        for current, dirs, names in os.walk(root):
+            current = Path(current)
+            for name in list(dirs):
+                if (current / name).is_symlink():
+                    dirs.remove(name)
+                    names.append(name)
+            for name in names:
+                path = current / name
+                relative = path.relative_to(root).as_posix()
+                info = path.lstat()
+                if stat.S_ISLNK(info.st_mode):
+                    entries[relative] = {"link": os.readlink(path)}
+                elif stat.S_ISREG(info.st_mode):
+                    entries[relative] = {"mode": stat.S_IMODE(info.st_mode), "size": info.st_size}
+                    files.append(relative)
+
+        marker = str(prefix).encode("utf-8") if prefix else None
+        with ThreadPoolExecutor(self.workers) as executor:
+            stored = executor.map(lambda rel: self._store_file(root / rel, marker), files)
+            for relative, (chunks, new_chunks, new_bytes, relocate) in zip(files, stored):
+                entry = entries[relative]
+                entry["chunks"] = chunks
+                if relocate:
+                    entry["relocate"] = True
+                report.size += entry["size"]
+                report.chunks += len(chunks)
+                report.new_chunks += new_chunks
+                report.new_bytes += new_bytes
+        return entries
+
+    def _store_file(self, path: Path, marker: Optional[bytes]) -> Tuple[List[str], int, int, bool]:
+        """Store the chunks of one file; returns (digests, new chunks, new bytes, relocate)"""
+        chunks = []
+        new_chunks = new_bytes = 0
+        relocate = False
+        with open(path, "rb") as f:
+            while True:
+                data = f.read(self.CHUNK_SIZE)
+                if not data and chunks:
+                    break
+                digest = hashlib.sha256(data).hexdigest()
+                chunks.append(digest)
+                if marker and len(chunks) == 1 and len(data) < self.CHUNK_SIZE:
+                    relocate = marker in data and b"\0" not in data
+                chunk_path = self._chunk_path(digest)
+                if not chunk_path.exists():
+                    compressed = zlib.compress(data)
+                    chunk_path.parent.mkdir(parents=True, exist_ok=True)
+                    temporary = chunk_path.with_name(f".{digest}.{os.getpid()}.{threading.get_ident()}")
+                    temporary.write_bytes(compressed)
+                    os.replace(temporary, chunk_path)
+                    new_chunks += 1
+                    new_bytes += len(compressed)
+                if len(data) < self.CHUNK_SIZE:
+                    break
+        return chunks, new_chunks, new_bytes, relocate
+
+    def _write_file(self, target: Path, entry: dict, old_prefix: bytes, new_prefix: bytes) -> int:
+        """Write a file from its chunks, replacing any existing file atomically"""
+        temporary = target.with_name(f".{target.name}.djanbee-tmp")
+        written = 0
+        with open(temporary, "wb") as f:
+            for digest in entry["chunks"]:
+                data = zlib.decompress(self._chunk_path(digest).read_bytes())
+                if entry.get("relocate"):
+                    data = data.replace(old_prefix, new_prefix)
+                f.write(data)
+                written += len(data)
+        os.chmod(temporary, entry["mode"])
+        os.replace(temporary, target)
+        return written
+
+    def _python_version(self, venv_path: Path) -> str:
+        """Interpreter version recorded in pyvenv.cfg; the target needs the same one"""
+        try:
+            lines = (venv_path / "pyvenv.cfg").read_text(encoding="utf-8").splitlines()
+        except OSError:
+            return ""
+        for line in lines:
+            key, _, value = line.partition("=")
+            if key.strip() in ("version", "version_info"):
+                return value.strip()
+        return ""
+
+    def _chunk_path(self, digest: str) -> Path:
+        return self.root / "chunks" / digest[:2] / digest
+
+    def _save_manifest(self, manifest: dict) -> Path:
+        path = self.root / "manifests" / f"{manifest['id']}.json"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(manifest), encoding="utf-8")
+        ref = self.root / "refs" / manifest["project"]
+        ref.parent.mkdir(parents=True, exist_ok=True)
+        ref.write_text(manifest["id"] + "\n")
+        return path
+
+    def _load_release_manifest(self, release: Optional[Union[str, Path]]) -> dict:
+        if not release:
+            return {}
+        try:
+            return json.loads((Path(release) / self.RELEASE_MANIFEST).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
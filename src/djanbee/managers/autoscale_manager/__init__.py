@@ -0,0 +1,13 @@
+from .main import AutoscaleManager
+from .policy import AutoscalePolicy, LoadSample, ScaleDecision, decide
+from .sampling import parse_listen_backlog, read_cpu_seconds
+
+__all__ = [
+    "AutoscaleManager",
+    "AutoscalePolicy",
+    "LoadSample",
+    "ScaleDecision",
+    "decide",
+    "parse_listen_backlog",
+    "read_cpu_seconds",
+]
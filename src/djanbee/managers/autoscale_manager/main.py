@@ -0,0 +1,163 @@
+import sys
+import textwrap
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from ..os_manager import OSManager
+from ..reload_manager.main import UNIX_ACCEPTED, UNIX_QUEUED, child_pids, count_unix_connections
+from ..resource_manager import ResourceManager
+from ..sizing_manager import SizingManager
+from .policy import LoadSample
+from .sampling import parse_listen_backlog, read_cpu_seconds
+
+
+class AutoscaleManager:
+    """
+    Manager responsible for growing and shrinking the worker pool of a
+    running Gunicorn service with its load.
+
+    Gunicorn's master adds a worker on TTIN and retires its oldest one on
+    TTOU, so the pool changes without a reload. A HUP, e.g. from a deploy,
+    reads the config again and returns the pool to the configured count.
+    """
+
+    SYSTEMD_DIR = Path("/etc/systemd/system")
+    RUN_DIR = Path("/run/gunicorn")
+
+    def __init__(
+        self,
+        os_manager: OSManager,
+        sizing_manager: SizingManager,
+        resource_manager: ResourceManager,
+    ):
+        """
+        Initialize with references to other managers.
+
+        Args:
+            os_manager: OSManager instance for OS operations
+            sizing_manager: SizingManager reading the host's memory and worker RSS
+            resource_manager: ResourceManager reading the project's slice
+        """
+        self.os_manager = os_manager
+        self.sizing_manager = sizing_manager
+        self.resource_manager = resource_manager
+        # instance -> (time, CPU seconds of its workers) at the last sample
+        self._cpu: Dict[str, Tuple[float, float]] = {}
+
+    def get_unit_name(self, project_name: str) -> str:
+        return f"djanbee-autoscale-{project_name}.service"
+
+    def read_listen_backlog(self, socket_path: Path) -> Optional[int]:
+        """Connections waiting in a socket's accept queue, None if `ss` is unavailable"""
+        result = self.os_manager.run_command(["ss", "-lxH"])
+        if not result.success:
+            return None
+        return parse_listen_backlog(result.stdout, socket_path)
+
+    def sample(
+        self,
+        instance: str,
+        project_name: str,
+        threads: int = 1,
+        async_workers: bool = False,
+    ) -> Optional[LoadSample]:
+        """
+        Look at a running service: its workers, the connections queued on
+        its socket, how busy the workers are and how many more fit.
+
+        Sync and gthread workers hold one connection per request, so the
+        connections they accepted are busy slots. An async worker holds
+        many idle connections, so its busy share is the CPU time it used
+        since the last sample.
+
+        Returns:
+            None if the service is not running
+        """
+        master = self.os_manager.get_service_main_pid(f"gunicorn-{instance}")
+        workers = child_pids(master)
+        if not master or not workers:
+            self._cpu.pop(instance, None)
+            return None
+
+        now = time.monotonic()
+        socket_path = self.RUN_DIR / f"{instance}.sock"
+        capacity = len(workers) * max(threads, 1)
+        accepted = count_unix_connections(socket_path, (UNIX_ACCEPTED,))
+        queued = self.read_listen_backlog(socket_path)
+        if queued is None:
+            # Without ss: connections not accepted yet are in the accept queue
+            queued = count_unix_connections(socket_path, (UNIX_QUEUED,))
+
+        cpu = sum(read_cpu_seconds(pid) for pid in workers)
+        previous = self._cpu.get(instance)
+        self._cpu[instance] = (now, cpu)
+        if async_workers:
+            elapsed = now - previous[0] if previous else 0
+            busy = (cpu - previous[1]) / (elapsed * len(workers)) if elapsed > 0 else 0.0
+        else:
+            busy = min(accepted, capacity) / capacity
+        return LoadSample(
+            now,
+            master,
+            len(workers),
+            capacity,
+            queued,
+            min(max(busy, 0.0), 1.0),
+            self.memory_room(project_name, master),
+        )
+
+    def memory_room(self, project_name: str, master: int) -> int:
+        """
+        Workers of the size of the largest running one that fit into the
+        memory left, keeping the sizing headroom free. The project's slice
+        counts too: workers above its MemoryHigh would only be throttled.
+        """
+        sizes = self.sizing_manager.worker_rss(master)
+        if not sizes:
+            return 0
+        available = self.sizing_manager.detect_host().usable_memory
+        usage = self.resource_manager.read_usage(project_name)
+        if usage and usage.memory_high:
+            available = min(available, usage.memory_high - usage.memory_current)
+        usable = available * (1 - self.sizing_manager.MEMORY_HEADROOM)
+        return max(int(usable // max(sizes)), 0)
+
+    def scale(self, master: int, delta: int) -> bool:
+        """Add (TTIN) or retire (TTOU) `delta` workers of a Gunicorn master"""
+        signal_name = "TTIN" if delta > 0 else "TTOU"
+        for _ in range(abs(delta)):
+            if not self.os_manager.send_signal(master, signal_name).success:
+                return False
+        return True
+
+    def render_unit(self, project_name: str, arguments: List[str]) -> Tuple[Path, str]:
+        """
+        Render the unit running the autoscaler for a project.
+
+        Returns:
+            Tuple of (unit_path, content)
+        """
+        user = self.os_manager.get_username()
+        command = " ".join(
+            [sys.executable, "-m", "djanbee.cli", "autoscale", project_name] + arguments
+        )
+        content = textwrap.dedent(
+            f"""
+            [Unit]
+            Description=djanbee worker autoscaler for {project_name}
+            After=network.target
+
+            [Service]
+            Type=simple
+            User={user}
+            Group={user}
+            ExecStart={command}
+            Restart=always
+            RestartSec=5
+
+            [Install]
+            WantedBy=multi-user.target
+            """
+        ).lstrip()
+        return self.SYSTEMD_DIR / self.get_unit_name(project_name), content
@@ -0,0 +1,127 @@
+# djanbee/managers/autoscale_manager/policy.py
+
+import math
+from dataclasses import dataclass
+from typing import List, Optional
+
+
+@dataclass
+class LoadSample:
+    """One look at a running Gunicorn service"""
+
+    # time.monotonic() the sample was taken at
+    at: float
+    master: int
+    workers: int
+    # Requests the workers serve at once: workers x threads
+    capacity: int
+    # Connections waiting in the listen backlog for a free worker
+    queued: int
+    # Share of the capacity in use, 0 to 1
+    busy: float
+    # Further workers that fit into the memory left on the host and in
+    # the project's slice
+    memory_room: int
+
+
+@dataclass
+class AutoscalePolicy:
+    """Bounds and thresholds the autoscaler keeps a service within"""
+
+    min_workers: int = 1
+    max_workers: int = 8
+    # Add workers once requests queue or workers are this busy, remove one
+    # once they are this idle; the gap keeps the count from flapping
+    busy_high: float = 0.85
+    busy_low: float = 0.3
+    # Consecutive samples a condition has to hold
+    up_samples: int = 2
+    down_samples: int = 15
+    # Seconds after a change before adding (new workers need to boot) or
+    # removing workers again
+    up_cooldown: float = 10.0
+    down_cooldown: float = 60.0
+    max_step: int = 4
+
+    def validate(self) -> None:
+        """
+        Raises:
+            ValueError: For bounds or thresholds that cannot be kept
+        """
+        if self.min_workers < 1 or self.max_workers < self.min_workers:
+            raise ValueError(
+                f"Expected 1 <= min <= max workers, not {self.min_workers} and {self.max_workers}"
+            )
+        if not 0 <= self.busy_low < self.busy_high <= 1:
+            raise ValueError("Expected 0 <= busy_low < busy_high <= 1")
+
+
+@dataclass
+class ScaleDecision:
+    """Workers to add (positive) or remove (negative), and why"""
+
+    delta: int
+    reason: str
+
+
+def decide(
+    policy: AutoscalePolicy,
+    samples: List[LoadSample],
+    last_change: Optional[float] = None,
+    now: Optional[float] = None,
+) -> ScaleDecision:
+    """
+    Pick the change in workers from the recent samples of one service,
+    oldest first.
+
+    Requests queueing, or workers near their capacity, for `up_samples`
+    samples in a row add workers: one per thread's worth of queued
+    connections, up to `max_step` and what memory allows. Workers mostly
+    idle for `down_samples` samples are removed one at a time, so a
+    quiet minute gives back one worker and the pool shrinks slowly after
+    a peak.
+    """
+    latest = samples[-1]
+    workers = latest.workers
+    now = latest.at if now is None else now
+    since = math.inf if last_change is None else now - last_change
+
+    if workers != min(max(workers, policy.min_workers), policy.max_workers):
+        if since < policy.up_cooldown:
+            # Workers signalled for are still starting or finishing requests
+            return ScaleDecision(0, "waiting for the last change to take effect")
+        if workers < policy.min_workers:
+            return ScaleDecision(
+                policy.min_workers - workers, f"below the minimum of {policy.min_workers}"
+            )
+        return ScaleDecision(
+            policy.max_workers - workers, f"above the maximum of {policy.max_workers}"
+        )
+
+    recent = samples[-policy.up_samples :]
+    if len(recent) == policy.up_samples and all(
+        s.queued > 0 or s.busy >= policy.busy_high for s in recent
+    ):
+        load = f"{latest.queued} queued, {latest.busy:.0%} busy"
+        if workers >= policy.max_workers:
+            return ScaleDecision(0, f"{load}, at the maximum of {policy.max_workers}")
+        if since < policy.up_cooldown:
+            return ScaleDecision(0, f"{load}, waiting for the last workers to boot")
+        if latest.memory_room < 1:
+            return ScaleDecision(0, f"{load}, no memory for another worker")
+        threads = max(latest.capacity // max(workers, 1), 1)
+        wanted = max(int(math.ceil(latest.queued / threads)), 1)
+        delta = min(wanted, policy.max_step, policy.max_workers - workers, latest.memory_room)
+        return ScaleDecision(delta, load)
+
+    quiet = samples[-policy.down_samples :]
+    if (
+        workers > policy.min_workers
+        and since >= policy.down_cooldown
+        and len(quiet) == policy.down_samples
+        and all(s.queued == 0 and s.busy <= policy.busy_low for s in quiet)
+    ):
+        return ScaleDecision(
+            -1, f"at most {max(s.busy for s in quiet):.0%} busy for {len(quiet)} samples"
+        )
+    return ScaleDecision(0, "steady")
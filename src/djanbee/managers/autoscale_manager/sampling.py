@@ -0,0 +1,37 @@
+# djanbee/managers/autoscale_manager/sampling.py
+
+import os
+from pathlib import Path
+from typing import Optional, Union
+
+
+def parse_listen_backlog(output: str, socket_path: Union[str, Path]) -> Optional[int]:
+    """
+    Connections waiting to be accepted on a listening unix socket, from the
+    output of `ss -lxH`: for listeners, Recv-Q is the accept queue.
+    """
+    socket_path = str(socket_path)
+    for line in output.splitlines():
+        fields = line.split()
+        # Netid State Recv-Q Send-Q Local-Address Port Peer-Address Port
+        if len(fields) >= 5 and fields[1] == "LISTEN" and fields[4] == socket_path:
+            try:
+                return int(fields[2])
+            except ValueError:
+                return None
+    return None
+
+
+def read_cpu_seconds(pid: int, proc_root: Path = Path("/proc")) -> float:
+    """User and system CPU time a process has used, 0 if it is gone"""
+    try:
+        stat = (proc_root / str(pid) / "stat").read_bytes()
+    except OSError:
+        return 0.0
+    # The command name may contain spaces; fields resume after its ')'
+    fields = stat[stat.rfind(b")") + 2 :].split()
+    try:
+        ticks = int(fields[11]) + int(fields[12])
+    except (IndexError, ValueError):
+        return 0.0
+    return ticks / os.sysconf("SC_CLK_TCK")
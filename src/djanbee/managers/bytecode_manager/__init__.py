@@ -0,0 +1,3 @@
+from .main import BytecodeManager, PrecompileReport
+
+__all__ = ["BytecodeManager", "PrecompileReport"]
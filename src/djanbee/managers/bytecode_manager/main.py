@@ -0,0 +1,180 @@
+import json
+import os
+import re
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import List, Optional, Union
+
+from ..os_manager import OSManager
+from ..pip_manager import find_site_packages
+
+
+# Runs inside the target venv's interpreter so the .pyc files get that
+# interpreter's cache tag and magic number. compileall cannot tell whether a
+# hash based .pyc is current and would rewrite all of them on every run, so
+# stale files are selected here and compiled in a process pool.
+PRECOMPILE_SCRIPT = r"""
+import concurrent.futures, functools, importlib.util, json, os, py_compile, re, sys
+
+mode = py_compile.PycInvalidationMode[sys.argv[1]]
+workers = int(sys.argv[2]) or os.cpu_count() or 1
+targets = json.loads(sys.argv[3])
+FLAGS = {"TIMESTAMP": 0, "CHECKED_HASH": 3, "UNCHECKED_HASH": 1}[mode.name]
+
+def is_current(source):
+    try:
+        with open(importlib.util.cache_from_source(source), "rb") as handle:
+            header = handle.read(16)
+        if header[:4] != importlib.util.MAGIC_NUMBER:
+            return False
+        if int.from_bytes(header[4:8], "little") != FLAGS:
+            return False
+        if not FLAGS:
+            stat = os.stat(source)
+            return header[8:16] == (
+                (int(stat.st_mtime) & 0xFFFFFFFF).to_bytes(4, "little")
+                + (stat.st_size & 0xFFFFFFFF).to_bytes(4, "little")
+            )
+        with open(source, "rb") as handle:
+            return header[8:16] == importlib.util.source_hash(handle.read())
+    except OSError:
+        return False
+
+sources = []
+for directory, exclude in targets:
+    exclude = re.compile(exclude) if exclude else None
+    for root, dirs, files in os.walk(directory):
+        if exclude and exclude.search(root + os.sep):
+            dirs[:] = []
+            continue
+        sources.extend(os.path.join(root, f) for f in files if f.endswith(".py"))
+
+stale = [source for source in sources if not is_current(source)]
+compile_one = functools.partial(py_compile.compile, doraise=True, invalidation_mode=mode)
+failed = 0
+if workers > 1 and len(stale) > 1:
+    with concurrent.futures.ProcessPoolExecutor(workers) as executor:
+        futures = [executor.submit(compile_one, source) for source in stale]
+        failed = sum(1 for future in futures if future.exception() is not None)
+else:
+    for source in stale:
+        try:
+            compile_one(source)
+        except Exception:
+            failed += 1
+
+print(json.dumps({"total": len(sources), "compiled": len(stale) - failed, "failed": failed}))
+"""
+
+
+@dataclass
+class PrecompileReport:
+    """Outcome of a bytecode precompilation run"""
+
+    total: int = 0
+    compiled: int = 0
+    failed: int = 0
+    duration: float = 0.0
+    directories: List[Path] = field(default_factory=list)
+    unwritable: List[Path] = field(default_factory=list)
+
+
+class BytecodeManager:
+    """
+    Manager responsible for precompiling deployed code to bytecode.
+
+    Compiling ahead of time moves the cost of writing .pyc files out of the
+    first requests after a deploy, and surfaces directories the service user
+    cannot write to instead of silently recompiling on every start.
+    """
+
+    INVALIDATION_MODES = {
+        "timestamp": "TIMESTAMP",
+        "checked-hash": "CHECKED_HASH",
+        "unchecked-hash": "UNCHECKED_HASH",
+    }
+    # Directory names that never contain deployable code
+    EXCLUDED_DIRECTORIES = (".git", ".hg", "node_modules", "__pycache__", ".tox", ".djanbee")
+
+    def __init__(self, os_manager: OSManager):
+        """
+        Initialize with references to other managers.
+
+        Args:
+            os_manager: OSManager instance for OS operations
+        """
+        self.os_manager = os_manager
+
+    def precompile(
+        self,
+        venv_path: Union[str, Path],
+        project_path: Optional[Union[str, Path]] = None,
+        workers: int = 0,
+        invalidation_mode: str = "checked-hash",
+    ) -> PrecompileReport:
+        """
+        Compile the project tree and the venv's site-packages in parallel.
+
+        Args:
+            venv_path: Virtual environment whose interpreter compiles the code
+            project_path: Project tree to compile (optional)
+            workers: Number of worker processes, 0 for one per CPU
+            invalidation_mode: 'timestamp', 'checked-hash' or 'unchecked-hash';
+                hash based .pyc files do not depend on file mtimes, which
+                keeps builds reproducible
+
+        Returns:
+            PrecompileReport with counts and timing
+
+        Raises:
+            ValueError: If invalidation_mode is unknown
+            RuntimeError: If the compiler could not be run
+        """
+        if invalidation_mode not in self.INVALIDATION_MODES:
+            raise ValueError(f"Unknown invalidation mode: {invalidation_mode}")
+
+        venv_path = Path(venv_path).resolve()
+        directories = list(find_site_packages(venv_path))
+        if project_path:
+            directories.insert(0, Path(project_path).resolve())
+
+        report = PrecompileReport(directories=directories)
+        report.unwritable = [d for d in directories if not os.access(d, os.W_OK)]
+        writable = [d for d in directories if d not in report.unwritable]
+        if not writable:
+            return report
+
+        started = time.perf_counter()
+        result = self.os_manager.run_command(
+            [
+                str(self.os_manager.get_python_path(venv_path)),
+                "-c",
+                PRECOMPILE_SCRIPT,
+                self.INVALIDATION_MODES[invalidation_mode],
+                str(workers),
+                json.dumps(
+                    [[str(d), self._exclude_pattern(d, venv_path)] for d in writable]
+                ),
+            ]
+        )
+        report.duration = time.perf_counter() - started
+
+        if not result.success:
+            raise RuntimeError(result.stderr or "Bytecode compilation failed")
+
+        counts = json.loads(result.stdout.splitlines()[-1])
+        report.total = counts["total"]
+        report.compiled = counts["compiled"]
+        report.failed = counts["failed"]
+        return report
+
+    def _exclude_pattern(self, directory: Path, venv_path: Path) -> str:
+        """Regex of paths to skip: tooling dirs, and the venv when it sits inside the project"""
+        separator = re.escape(os.sep)
+        names = "|".join(re.escape(name) for name in self.EXCLUDED_DIRECTORIES)
+        patterns = [f"{separator}(?:{names}){separator}"]
+        if venv_path != directory and directory in venv_path.parents:
+            # Its site-packages are compiled as a target of their own
+            patterns.append(f"^{re.escape(str(venv_path) + os.sep)}")
+        return "|".join(patterns)
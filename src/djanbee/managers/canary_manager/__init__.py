@@ -0,0 +1,17 @@
+from .main import (
+    CanaryManager,
+    CanaryThresholds,
+    CanaryVerdict,
+    ReleaseStats,
+    compare_releases,
+    parse_timing_lines,
+)
+
+__all__ = [
+    "CanaryManager",
+    "CanaryThresholds",
+    "CanaryVerdict",
+    "ReleaseStats",
+    "compare_releases",
+    "parse_timing_lines",
+]
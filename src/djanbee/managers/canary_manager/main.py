@@ -0,0 +1,188 @@
+import math
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Union
+
+from ..os_manager import OSManager
+
+
+@dataclass
+class ReleaseStats:
+    """Latency and errors of the requests one release served"""
+
+    release: str
+    durations: List[float] = field(default_factory=list)
+    errors: int = 0
+
+    @property
+    def requests(self) -> int:
+        return len(self.durations)
+
+    @property
+    def error_rate(self) -> float:
+        return self.errors / self.requests if self.requests else 0.0
+
+    def percentile(self, pct: float) -> float:
+        """Nearest-rank percentile of the request durations, in seconds"""
+        if not self.durations:
+            return 0.0
+        ordered = sorted(self.durations)
+        rank = max(math.ceil(pct / 100 * len(ordered)), 1)
+        return ordered[rank - 1]
+
+
+@dataclass
+class CanaryThresholds:
+    """How much worse a canary may be before it is aborted"""
+
+    # Canary percentile may exceed the baseline by this ratio...
+    latency_ratio: float = 1.2
+    # ...unless the difference is below this many seconds
+    latency_slack: float = 0.01
+    # Absolute increase of the error rate, 0.01 is one percentage point
+    error_rate_increase: float = 0.01
+    # Requests each release needs before a verdict is trusted
+    min_requests: int = 100
+    percentiles: tuple = (50, 95, 99)
+
+
+@dataclass
+class CanaryVerdict:
+    """Result of comparing the canary with the baseline"""
+
+    decided: bool
+    promote: bool = False
+    reasons: List[str] = field(default_factory=list)
+
+
+def parse_timing_lines(lines: Iterable[str], since: float = 0.0) -> Dict[str, ReleaseStats]:
+    """
+    Group the lines of a release log by release.
+
+    Lines look like `<msec> <release> <status> <request_time>`; statuses of
+    500 and above count as errors. Lines from before `since` and from
+    requests no release answered ('-') are skipped.
+    """
+    stats: Dict[str, ReleaseStats] = {}
+    for line in lines:
+        fields = line.split()
+        if len(fields) != 4 or fields[1] == "-":
+            continue
+        try:
+            timestamp, status, duration = float(fields[0]), int(fields[2]), float(fields[3])
+        except ValueError:
+            continue
+        if timestamp < since:
+            continue
+        release = stats.setdefault(fields[1], ReleaseStats(fields[1]))
+        release.durations.append(duration)
+        if status >= 500:
+            release.errors += 1
+    return stats
+
+
+def compare_releases(
+    baseline: ReleaseStats,
+    canary: ReleaseStats,
+    thresholds: CanaryThresholds,
+    final: bool = False,
+) -> CanaryVerdict:
+    """
+    Decide whether the canary is healthy.
+
+    A canary that is clearly worse is aborted as soon as both sides have
+    enough requests. Promotion waits for the final comparison, and without
+    enough traffic by then the canary is aborted, since nothing shows it
+    is safe.
+    """
+    if min(baseline.requests, canary.requests) < thresholds.min_requests:
+        if not final:
+            return CanaryVerdict(False)
+        return CanaryVerdict(
+            True,
+            False,
+            [
+                f"not enough traffic to compare ({baseline.requests} baseline, "
+                f"{canary.requests} canary requests, {thresholds.min_requests} needed)"
+            ],
+        )
+
+    reasons = []
+    if canary.error_rate - baseline.error_rate > thresholds.error_rate_increase:
+        reasons.append(
+            f"error rate {canary.error_rate:.2%} against {baseline.error_rate:.2%}"
+        )
+    for pct in thresholds.percentiles:
+        before, after = baseline.percentile(pct), canary.percentile(pct)
+        if after > before * thresholds.latency_ratio and after - before > thresholds.latency_slack:
+            reasons.append(f"p{pct} {after * 1000:.0f} ms against {before * 1000:.0f} ms")
+
+    if reasons:
+        return CanaryVerdict(True, False, reasons)
+    if final:
+        return CanaryVerdict(True, True)
+    return CanaryVerdict(False)
+
+
+class CanaryManager:
+    """
+    Manager responsible for judging a release from the traffic it served.
+
+    Nginx tags each line of the project's release log with the release
+    that answered, so both releases are measured on the same traffic mix
+    at the same time.
+    """
+
+    def __init__(self, os_manager: OSManager):
+        """
+        Initialize with references to other managers.
+
+        Args:
+            os_manager: OSManager instance for OS operations
+        """
+        self.os_manager = os_manager
+
+    def get_log_offset(self, log_path: Union[str, Path]) -> int:
+        """Current size of the log, where reading starts for a new canary"""
+        try:
+            return os.path.getsize(log_path)
+        except OSError:
+            return 0
+
+    def read_log(self, log_path: Union[str, Path], offset: int = 0) -> List[str]:
+        """Lines written to the log after `offset`"""
+        try:
+            with open(log_path, "rb") as f:
+                f.seek(offset)
+                return f.read().decode("utf-8", "replace").splitlines()
+        except FileNotFoundError:
+            return []
+        except PermissionError:
+            # Nginx logs are usually readable by root and the adm group only
+            result = self.os_manager.run_command(
+                ["tail", "-c", f"+{offset + 1}", str(log_path)], sudo=True
+            )
+            return result.stdout.splitlines() if result.success else []
+
+    def collect(
+        self, log_path: Union[str, Path], offset: int = 0, since: float = 0.0
+    ) -> Dict[str, ReleaseStats]:
+        """Per-release statistics of the requests logged since a point in time"""
+        return parse_timing_lines(self.read_log(log_path, offset), since)
+
+    def evaluate(
+        self,
+        stats: Dict[str, ReleaseStats],
+        baseline: str,
+        canary: str,
+        thresholds: Optional[CanaryThresholds] = None,
+        final: bool = False,
+    ) -> CanaryVerdict:
+        """Compare two releases found in collected statistics"""
+        return compare_releases(
+            stats.get(baseline, ReleaseStats(baseline)),
+            stats.get(canary, ReleaseStats(canary)),
+            thresholds or CanaryThresholds(),
+            final,
+        )
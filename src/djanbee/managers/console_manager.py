@@ -1,6 +1,7 @@
 from rich.console import Console
 from rich.text import Text
 from rich.panel import Panel
+from rich.table import Table
 from rich import box
 from getpass import getpass
 
@@ -173,8 +174,15 @@ class ConsoleManager:
         text.append(message, style="blue")
         self.console.print(text)
 
-
-
-
-
-
+    def print_table(self, title: str, columns, rows):
+        """Print rows as a table; numeric-looking columns are right aligned"""
+        table = Table(title=title, box=box.SIMPLE, title_justify="left")
+        for index, column in enumerate(columns):
+            numeric = rows and all(
+                str(row[index]).replace(".", "").replace(",", "").lstrip("+-").isdigit()
+                for row in rows
+            )
+            table.add_column(column, justify="right" if numeric else "left")
+        for row in rows:
+            table.add_row(*(str(value) for value in row))
+        self.console.print(table)
@@ -0,0 +1,18 @@
+from .main import ConvergenceManager, ConvergenceReport
+from .resources import (
+    Resource,
+    FileResource,
+    DirectoryResource,
+    SymlinkResource,
+    ValueResource,
+)
+
+__all__ = [
+    "ConvergenceManager",
+    "ConvergenceReport",
+    "Resource",
+    "FileResource",
+    "DirectoryResource",
+    "SymlinkResource",
+    "ValueResource",
+]
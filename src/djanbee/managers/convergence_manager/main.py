@@ -0,0 +1,94 @@
+import time
+from dataclasses import dataclass, field
+from typing import Iterable, List, Tuple
+
+from ..os_manager import OSManager
+from .resources import Resource
+
+
+@dataclass
+class ConvergenceReport:
+    """What a convergence run found and changed"""
+
+    # (resource name, why it differed)
+    changed: List[Tuple[str, str]] = field(default_factory=list)
+    unchanged: List[str] = field(default_factory=list)
+    # (resource name, error)
+    failed: List[Tuple[str, str]] = field(default_factory=list)
+    # Reloads required by the resources that changed, in first-seen order
+    triggers: List[str] = field(default_factory=list)
+    duration: float = 0.0
+
+    @property
+    def success(self) -> bool:
+        return not self.failed
+
+    def merge(self, other: "ConvergenceReport") -> "ConvergenceReport":
+        self.changed += other.changed
+        self.unchanged += other.unchanged
+        self.failed += other.failed
+        self.triggers += [t for t in other.triggers if t not in self.triggers]
+        self.duration += other.duration
+        return self
+
+
+class ConvergenceManager:
+    """
+    Manager responsible for bringing managed artifacts to their desired state.
+
+    Callers render what every unit file, site, directory or setting should
+    look like; each one is compared with the live system and only the ones
+    that differ are written. The reloads a resource triggers are collected
+    only from resources that changed, so an unchanged deploy writes nothing
+    and restarts nothing.
+    """
+
+    def __init__(self, os_manager: OSManager):
+        """
+        Initialize with references to other managers.
+
+        Args:
+            os_manager: OSManager instance for OS operations
+        """
+        self.os_manager = os_manager
+
+    def converge(self, resources: Iterable[Resource], dry_run: bool = False) -> ConvergenceReport:
+        """
+        Apply the resources that differ from the live state.
+
+        Args:
+            resources: Desired state, applied in order
+            dry_run: Only report the differences
+
+        Returns:
+            ConvergenceReport; triggers are listed for applied changes only
+            (for every difference when dry_run is set)
+        """
+        started = time.perf_counter()
+        report = ConvergenceReport()
+        for resource in resources:
+            try:
+                reason = resource.check(self.os_manager)
+            except OSError as e:
+                report.failed.append((resource.name, str(e)))
+                continue
+            if reason is None:
+                report.unchanged.append(resource.name)
+                continue
+
+            if not dry_run:
+                try:
+                    success, message = resource.apply(self.os_manager)
+                except OSError as e:
+                    success, message = False, str(e)
+                if not success:
+                    report.failed.append((resource.name, message))
+                    continue
+            report.changed.append((resource.name, reason))
+            report.triggers += [t for t in resource.triggers if t not in report.triggers]
+        report.duration = time.perf_counter() - started
+        return report
+
+    def diff(self, resources: Iterable[Resource]) -> ConvergenceReport:
+        """Report what converge() would change without changing it"""
+        return self.converge(resources, dry_run=True)
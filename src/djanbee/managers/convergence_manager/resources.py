@@ -0,0 +1,169 @@
+# djanbee/managers/convergence_manager/resources.py
+
+import difflib
+import os
+import stat
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Optional, Tuple
+
+from ..os_manager import OSManager
+
+try:
+    import grp
+    import pwd
+except ImportError:  # Windows
+    grp = pwd = None
+
+
+@dataclass
+class Resource(ABC):
+    """
+    Desired state of one managed artifact.
+
+    Every kind has a `triggers` field naming the reloads a change to it
+    requires, e.g. 'daemon-reload' or 'nginx-reload'; they only run when
+    the resource actually changed. It follows the kind's own fields, which
+    have no defaults.
+    """
+
+    name: str
+
+    @abstractmethod
+    def check(self, os_manager: OSManager) -> Optional[str]:
+        """Why the live state differs from the desired one, None if it does not"""
+        pass
+
+    @abstractmethod
+    def apply(self, os_manager: OSManager) -> Tuple[bool, str]:
+        """Bring the live state to the desired one; returns (success, message)"""
+        pass
+
+
+@dataclass
+class FileResource(Resource):
+    """A text file with fixed content, e.g. a systemd unit or an Nginx site"""
+
+    content: str
+    mode: int = 0o644
+    sudo: bool = False
+    triggers: Tuple[str, ...] = ()
+
+    def check(self, os_manager: OSManager) -> Optional[str]:
+        path = Path(self.name)
+        try:
+            current = path.read_text(encoding="utf-8")
+        except FileNotFoundError:
+            return "missing"
+        except PermissionError:
+            result = os_manager.run_command(["cat", str(path)], sudo=True)
+            if not result.success:
+                return "missing"
+            current = result.stdout + "\n"
+
+        if current.rstrip("\n") != self.content.rstrip("\n"):
+            diff = list(
+                difflib.unified_diff(
+                    current.splitlines(), self.content.splitlines(), lineterm="", n=0
+                )
+            )
+            added = sum(1 for line in diff if line.startswith("+") and not line.startswith("+++"))
+            removed = sum(1 for line in diff if line.startswith("-") and not line.startswith("---"))
+            return f"content differs (+{added} -{removed} lines)"
+        current_mode = stat.S_IMODE(path.stat().st_mode)
+        if current_mode != self.mode:
+            return f"mode {current_mode:o} -> {self.mode:o}"
+        return None
+
+    def apply(self, os_manager: OSManager) -> Tuple[bool, str]:
+        path = Path(self.name)
+        result = os_manager.write_text_file(path, self.content, sudo=self.sudo)
+        if not result.success:
+            return False, result.stderr
+        result = os_manager.run_command(["chmod", f"{self.mode:o}", str(path)], sudo=self.sudo)
+        return result.success, result.stdout or result.stderr
+
+
+@dataclass
+class DirectoryResource(Resource):
+    """A directory with an owner ('user:group') and mode"""
+
+    owner: Optional[str] = None
+    mode: int = 0o755
+    sudo: bool = False
+    triggers: Tuple[str, ...] = ()
+
+    def check(self, os_manager: OSManager) -> Optional[str]:
+        try:
+            info = os.stat(self.name)
+        except FileNotFoundError:
+            return "missing"
+        if not stat.S_ISDIR(info.st_mode):
+            return "not a directory"
+        if stat.S_IMODE(info.st_mode) != self.mode:
+            return f"mode {stat.S_IMODE(info.st_mode):o} -> {self.mode:o}"
+        if self.owner and pwd and self._owner_of(info) != self.owner:
+            return f"owner {self._owner_of(info)} -> {self.owner}"
+        return None
+
+    def apply(self, os_manager: OSManager) -> Tuple[bool, str]:
+        commands = [["mkdir", "-p", self.name]]
+        if self.owner:
+            commands.append(["chown", self.owner, self.name])
+        commands.append(["chmod", f"{self.mode:o}", self.name])
+        for command in commands:
+            result = os_manager.run_command(command, sudo=self.sudo)
+            if not result.success:
+                return False, result.stderr
+        return True, ""
+
+    @staticmethod
+    def _owner_of(info: os.stat_result) -> str:
+        try:
+            return f"{pwd.getpwuid(info.st_uid).pw_name}:{grp.getgrgid(info.st_gid).gr_name}"
+        except KeyError:
+            return f"{info.st_uid}:{info.st_gid}"
+
+
+@dataclass
+class SymlinkResource(Resource):
+    """A symlink pointing at a fixed target, e.g. a site in sites-enabled"""
+
+    target: str
+    sudo: bool = False
+    triggers: Tuple[str, ...] = ()
+
+    def check(self, os_manager: OSManager) -> Optional[str]:
+        path = Path(self.name)
+        if not path.is_symlink():
+            return "exists but is not a link" if path.exists() else "missing"
+        current = os.readlink(path)
+        return None if current == self.target else f"points to {current}"
+
+    def apply(self, os_manager: OSManager) -> Tuple[bool, str]:
+        result = os_manager.run_command(["ln", "-sfn", self.target, self.name], sudo=self.sudo)
+        return result.success, result.stdout or result.stderr
+
+
+@dataclass
+class ValueResource(Resource):
+    """
+    A single value kept by another manager, e.g. a Django setting or a
+    .env key, read and written through that manager's own functions.
+    """
+
+    value: Any
+    read: Callable[[], Any]
+    write: Callable[[], Any]
+    triggers: Tuple[str, ...] = ()
+
+    def check(self, os_manager: OSManager) -> Optional[str]:
+        current = self.read()
+        return None if current == self.value else f"{current!r} -> {self.value!r}"
+
+    def apply(self, os_manager: OSManager) -> Tuple[bool, str]:
+        result = self.write()
+        if isinstance(result, tuple):
+            return bool(result[0]), str(result[1]) if len(result) > 1 else ""
+        return bool(result), ""
@@ -1,5 +1,7 @@
 from ..os_manager import OSManager
 from ..file_system_manager import FileSystemManager
+from ..wheelhouse_manager import WheelhouseManager
+from ..venv_store_manager import VenvStoreManager
 
 from ..console_manager import ConsoleManager
 from ..dotenv_manager import DotenvManager
@@ -38,13 +40,17 @@ from .state import DjangoManagerState
 class DjangoManager:
     """Container for Django-related services with lazy loading"""
 
-    def __init__(self, os_manager: OSManager, console_manager: ConsoleManager, env_manager=None, dotenv_manager=None, fs_manager: FileSystemManager = None):
+    def __init__(self, os_manager: OSManager, console_manager: ConsoleManager, env_manager=None, dotenv_manager=None, fs_manager: FileSystemManager = None, wheelhouse_manager: WheelhouseManager = None, venv_store_manager: VenvStoreManager = None):
         """Initialize the Django manager with dependencies but not services"""
         self.os_manager = os_manager
         self.console_manager = console_manager
         self.env_manager = env_manager
         self.dotenv_manager = dotenv_manager
         self.fs_manager = fs_manager or FileSystemManager()
+        self.wheelhouse_manager = wheelhouse_manager or WheelhouseManager(os_manager)
+        self.venv_store_manager = venv_store_manager or VenvStoreManager(
+            os_manager, self.wheelhouse_manager
+        )
 
         # Initialize service placeholders
         self._project_service = None
@@ -87,7 +93,8 @@ class DjangoManager:
         """Lazy load the project service when first accessed"""
         if self._environment_service is None:
             self._environment_service = DjangoEnvironmentService(
-                self.os_manager, DjangoEnvironmentServiceDisplay(self.console_manager), self.fs_manager
+                self.os_manager, DjangoEnvironmentServiceDisplay(self.console_manager), self.fs_manager,
+                self.venv_store_manager,
             )
         return self._environment_service
 
@@ -97,7 +104,8 @@ class DjangoManager:
         if self._requirements_service is None:
             self._requirements_service = DjangoRequirementsService(
                 self.os_manager,
-                DjangoRequirementsServiceDisplay(self.console_manager), self.fs_manager
+                DjangoRequirementsServiceDisplay(self.console_manager), self.fs_manager,
+                self.wheelhouse_manager,
             )
         return self._requirements_service
 
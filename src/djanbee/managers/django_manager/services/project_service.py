@@ -26,6 +26,13 @@ class DjangoProjectService:
         self.display = display
         self.state = DjangoManagerState.get_instance()
 
+    def resolve_project(self) -> Optional[Path]:
+        """The project commands work on: the current one, else the one selected"""
+        if self.state.current_project_path:
+            return Path(self.state.current_project_path)
+        project = self.select_project()
+        return Path(project.object) if project else None
+
     def select_project(self) -> Optional[Result]:
         self.display.lookup_django_project()
         projects = self.find_django_project()
@@ -1,11 +1,26 @@
 # djanbee/services/requirements_service.py
 
+import hashlib
+import json
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Dict, Iterable, Optional, Tuple
 from collections import namedtuple
 
 from ....managers.os_manager import OSManager
 from ....managers.file_system_manager import FileSystemManager
+from ....managers.wheelhouse_manager import WheelhouseManager
+from ....managers.pip_manager import (
+    InstallPlan,
+    ParsedRequirements,
+    RequirementsParser,
+    SlimReport,
+    build_install_plan,
+    find_unused_requirements,
+    read_distributions,
+    read_installed_versions,
+    scan_imports,
+    write_slim_requirements,
+)
 from ..state import DjangoManagerState
 from .requirements_service_display import DjangoRequirementsServiceDisplay
 
@@ -15,14 +30,21 @@ Result = namedtuple("Result", ["valid", "object"])
 class DjangoRequirementsService:
     """Service for managing virtual environment requirements"""
 
+    # Written into the venv after every successful install
+    INSTALL_STATE_FILE = ".djanbee-requirements.json"
+    PRODUCTION_REQUIREMENTS_FILE = "requirements-prod.txt"
+
     def __init__(
         self,
         os_manager: OSManager,
         display: DjangoRequirementsServiceDisplay,
         fs_manager: FileSystemManager,
+        wheelhouse_manager: WheelhouseManager = None,
     ):
         self.os_manager = os_manager
         self.fs_manager = fs_manager
+        self.wheelhouse_manager = wheelhouse_manager or WheelhouseManager(os_manager)
+        self.parser = RequirementsParser()
         self.state = DjangoManagerState.get_instance()
         self.display = display
 
@@ -110,21 +132,160 @@ class DjangoRequirementsService:
     def install_requirements(
         self, venv_path: str | Path, requirements_path: str | Path
     ) -> Tuple[bool, str]:
-        """Installs pip requirements into a virtual environment"""
+        """
+        Installs pip requirements into a virtual environment.
+
+        The parsed requirements and the venv's installed set are fingerprinted;
+        when the fingerprint matches the last install nothing is run. Otherwise
+        only the add/upgrade/remove delta is applied.
+        """
         venv_path = Path(venv_path)
         requirements_path = Path(requirements_path)
 
         if not requirements_path.exists():
             return False, f"Requirements file not found: {requirements_path}"
 
-        success, output = self.os_manager.run_pip_command(
-            venv_path, ["install", "-r", str(requirements_path)]
+        try:
+            parsed = self.parser.parse(requirements_path)
+        except (OSError, UnicodeDecodeError) as e:
+            return False, f"Failed to read requirements: {e}"
+
+        installed = read_installed_versions(venv_path)
+        state = self._load_install_state(venv_path)
+        if state.get("fingerprint") == self.compute_fingerprint(parsed, installed):
+            self.display.success_requirements_unchanged()
+            return True, "Requirements already up to date"
+
+        plan = build_install_plan(parsed, installed, state.get("requirements", []))
+        if not plan.is_empty:
+            self.display.print_install_plan(plan)
+            success, message = self.apply_install_plan(
+                venv_path, requirements_path, parsed, plan
+            )
+            if not success:
+                return False, message
+
+        installed = read_installed_versions(venv_path)
+        self._save_install_state(
+            venv_path, self.compute_fingerprint(parsed, installed), parsed
         )
+        return True, "Requirements installed successfully"
 
-        if success:
+    def compute_fingerprint(
+        self, parsed: ParsedRequirements, installed: Dict[str, str]
+    ) -> str:
+        """Hash the parsed requirements together with the venv's installed set"""
+        digest = hashlib.sha256()
+        for line in parsed.canonical_lines():
+            digest.update(line.encode("utf-8") + b"\n")
+        digest.update(b"--\n")
+        for name, version in sorted(installed.items()):
+            digest.update(f"{name}=={version}\n".encode("utf-8"))
+        return digest.hexdigest()
+
+    def apply_install_plan(
+        self,
+        venv_path: Path,
+        requirements_path: Path,
+        parsed: ParsedRequirements,
+        plan: InstallPlan,
+    ) -> Tuple[bool, str]:
+        """Apply an install plan with one pip install (and one uninstall if needed)"""
+        if plan.to_remove:
+            result = self.os_manager.run_pip_command(
+                venv_path, ["uninstall", "-y"] + plan.to_remove
+            )
+            if not result.success:
+                return False, result.stderr or result.stdout
+
+        install_args = plan.install_args()
+        if not install_args:
             return True, "Requirements installed successfully"
+
+        for constraints_file in sorted({str(c.source) for c in parsed.constraints}):
+            install_args += ["-c", constraints_file]
+
+        # Prefer the offline wheelhouse, fall back to the package index
+        success, wheelhouse = self.wheelhouse_manager.ensure_wheelhouse(
+            venv_path, requirements_path
+        )
+        if success:
+            if wheelhouse.built_from_sdist:
+                self.display.success_build_wheelhouse(
+                    wheelhouse.path, wheelhouse.built_from_sdist
+                )
+            result = self.os_manager.run_pip_command(
+                venv_path,
+                ["install"]
+                + self.wheelhouse_manager.get_install_args(wheelhouse)
+                + install_args,
+            )
+            if result.success:
+                return True, f"Requirements installed from wheelhouse {wheelhouse.path}"
+            self.display.warning_wheelhouse_fallback(
+                f"Offline install failed: {result.stderr}"
+            )
         else:
-            return False, output
+            self.display.warning_wheelhouse_fallback(wheelhouse)
+
+        index_options = [arg for option in parsed.options for arg in option.split()]
+        result = self.os_manager.run_pip_command(
+            venv_path, ["install"] + index_options + install_args
+        )
+        if result.success:
+            return True, "Requirements installed successfully"
+        return False, result.stderr or result.stdout
+
+    def analyze_unused_requirements(
+        self,
+        venv_path: str | Path,
+        requirements_path: str | Path,
+        project_path: str | Path,
+        keep: Iterable[str] = (),
+    ) -> SlimReport:
+        """
+        Report requirements that the project's imports can never reach.
+
+        Imports are found statically, mapped to the venv's installed
+        distributions and expanded through their declared dependencies.
+        """
+        venv_path = Path(venv_path)
+        parsed = self.parser.parse(requirements_path)
+        imported = scan_imports(project_path, exclude=[venv_path])
+        return find_unused_requirements(
+            parsed, read_distributions(venv_path), imported, keep
+        )
+
+    def write_production_requirements(
+        self, requirements_path: str | Path, report: SlimReport, output_path=None
+    ) -> Path:
+        """Write requirements-prod.txt next to the requirements without unused entries"""
+        requirements_path = Path(requirements_path)
+        output_path = output_path or (
+            requirements_path.parent / self.PRODUCTION_REQUIREMENTS_FILE
+        )
+        return write_slim_requirements(
+            requirements_path, report.unused_names, output_path
+        )
+
+    def _load_install_state(self, venv_path: Path) -> dict:
+        state_file = venv_path / self.INSTALL_STATE_FILE
+        try:
+            return json.loads(state_file.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+
+    def _save_install_state(
+        self, venv_path: Path, fingerprint: str, parsed: ParsedRequirements
+    ) -> None:
+        state = {"fingerprint": fingerprint, "requirements": sorted(parsed.names())}
+        try:
+            (venv_path / self.INSTALL_STATE_FILE).write_text(
+                json.dumps(state, indent=2), encoding="utf-8"
+            )
+        except OSError:
+            # A missing state file only costs a full comparison next time
+            pass
 
     def has_requirements(self, path: Path) -> bool:
         """
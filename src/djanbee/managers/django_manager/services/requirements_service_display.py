@@ -35,3 +35,30 @@ class DjangoRequirementsServiceDisplay:
         self.console_manager.print_success(
             f"Requirements {requirements} installed ito {env}"
         )
+
+    def success_build_wheelhouse(self, path, built_from_sdist):
+        self.console_manager.print_step_progress("Wheelhouse", path)
+        if built_from_sdist:
+            self.console_manager.print_info(
+                f"Built from source: {', '.join(built_from_sdist)}"
+            )
+
+    def warning_wheelhouse_fallback(self, message):
+        self.console_manager.print_warning(
+            f"{message} - falling back to the package index"
+        )
+
+    def success_requirements_unchanged(self):
+        self.console_manager.print_step_progress(
+            "Requirements", "unchanged since last install, skipping pip"
+        )
+
+    def print_install_plan(self, plan):
+        for requirement in plan.to_install:
+            self.console_manager.print_info(f"Install {requirement.to_pip_arg()}")
+        for requirement, installed_version in plan.to_upgrade:
+            self.console_manager.print_info(
+                f"Upgrade {requirement.name} {installed_version} -> {requirement.specifier}"
+            )
+        for name in plan.to_remove:
+            self.console_manager.print_info(f"Remove {name}")
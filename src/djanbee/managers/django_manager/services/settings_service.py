@@ -131,6 +131,10 @@ class DjangoSettingsService:
             tuple: (bool success, str message)
         """
         try:
+            # Leave the file (and its mtime) alone when nothing changes, so
+            # runserver and file watchers do not restart for nothing
+            if settings_path.exists() and settings_path.read_text() == content:
+                return True, "Settings already up to date"
             settings_path.write_text(content)
             return True, "Settings updated successfully"
         except Exception as e:
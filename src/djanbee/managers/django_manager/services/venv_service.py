@@ -1,5 +1,6 @@
 # djanbee/services/venv_service.py
 
+import os
 from pathlib import Path
 import sys
 import venv
@@ -8,6 +9,7 @@ from collections import namedtuple
 
 from ....managers.os_manager import OSManager
 from ....managers.file_system_manager import FileSystemManager
+from ....managers.venv_store_manager import VenvStoreManager
 from ..state import DjangoManagerState
 from .venv_service_display import DjangoEnvironmentServiceDisplay
 
@@ -22,11 +24,13 @@ class DjangoEnvironmentService:
         os_manager: OSManager,
         display: DjangoEnvironmentServiceDisplay,
         fs_manager: FileSystemManager,
+        venv_store_manager: VenvStoreManager = None,
     ):
         self.os_manager = os_manager
         self.display = display
         self.state = DjangoManagerState.get_instance()
         self.fs_manager = fs_manager
+        self.venv_store_manager = venv_store_manager or VenvStoreManager(os_manager)
 
     def get_active_venv(self) -> Optional[Result]:
         """Detects the currently active venv via VIRTUAL_ENV + sys.prefix check."""
@@ -46,6 +50,29 @@ class DjangoEnvironmentService:
             )
         return None
 
+    def resolve_venv_path(self, project_path: Union[str, Path] = None) -> Optional[Path]:
+        """
+        Non-interactive lookup of the project's venv: the one selected earlier,
+        the active one, or the first venv directly inside the project.
+        """
+        if self.state.active_venv_path:
+            return self.state.active_venv_path
+
+        virtual_env = os.environ.get("VIRTUAL_ENV")
+        if virtual_env and self.is_venv(virtual_env):
+            return Path(virtual_env)
+
+        project_path = Path(
+            project_path
+            or self.state.current_project_path
+            or self.os_manager.get_current_directory()
+        )
+        if project_path.is_dir():
+            for child in sorted(project_path.iterdir()):
+                if child.is_dir() and self.is_venv(child):
+                    return child
+        return None
+
     def is_venv(self, path: Union[str, Path]) -> bool:
         """Validator: True if `path` looks like a Python virtualenv."""
         path = Path(path)
@@ -57,15 +84,30 @@ class DjangoEnvironmentService:
         paths = self.fs_manager.search_subfolders(cwd, self.is_venv)
         return [Result(True, p) for p in paths]
 
-    def create_environment(self, path: Union[str, Path] = ".venv") -> Optional[Result]:
+    def create_environment(
+        self, path: Union[str, Path] = ".venv", requirements_path: Union[str, Path] = None
+    ) -> Optional[Result]:
         """
         Create a new virtual environment on-demand.
+        When the project's requirements are known the environment is cloned
+        from the shared venv store instead of being built from scratch.
         Returns Result(valid, {"virtual_env": Path, "virtual_env_name": str})
         or None on failure.
         """
         try:
             self.display.print_progress(f"Creating virtual environment at {path}...")
             venv_path = Path(path)
+            requirements_path = requirements_path or self.state.current_requirements_path
+            if requirements_path and Path(requirements_path).exists():
+                success, message = self.venv_store_manager.create_from_store(
+                    venv_path, requirements_path
+                )
+                if success:
+                    self.display.print_success(message)
+                    env_info = {"virtual_env": venv_path, "virtual_env_name": venv_path.name}
+                    return Result(True, env_info)
+                self.display.warning_store_fallback(message)
+
             venv.create(venv_path, with_pip=True)
             self.display.print_success(f"Virtual environment created at {venv_path}")
             env_info = {"virtual_env": venv_path, "virtual_env_name": venv_path.name}
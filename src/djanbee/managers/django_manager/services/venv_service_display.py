@@ -29,3 +29,17 @@ class DjangoEnvironmentServiceDisplay:
         self.console_manager.print_step_progress(
             f"Found virtual environment {env_name}", env_path
         )
+
+    def print_progress(self, message):
+        self.console_manager.print_progress(message)
+
+    def print_success(self, message):
+        self.console_manager.print_success(message)
+
+    def print_error(self, message):
+        self.console_manager.print_error(message)
+
+    def warning_store_fallback(self, message):
+        self.console_manager.print_warning(
+            f"{message} - creating a fresh environment instead"
+        )
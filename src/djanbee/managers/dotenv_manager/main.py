@@ -122,6 +122,10 @@ class DotenvManager:
             file_path = Path(file_path)
             if not file_path.exists():
                 return False, f"File not found: {file_path}"
+
+            # Rewriting an unchanged key would only bump the file's mtime
+            if dotenv_values(file_path).get(key) == value:
+                return True, f"Environment variable '{key}' already up to date in {file_path}"
             
             # Use dotenv to set the key
             set_key(file_path, key, value)
@@ -7,6 +7,8 @@ from typing import List, Tuple, Optional, Union
 
 from ..console_manager import ConsoleManager
 from ..os_manager import OSManager
+from ..wheelhouse_manager import WheelhouseManager
+from ..venv_store_manager import VenvStoreManager
 
 
 class EnvManager:
@@ -15,16 +17,28 @@ class EnvManager:
     especially centralized package dependency management.
     """
 
-    def __init__(self, os_manager: OSManager, console_manager: ConsoleManager = None):
+    def __init__(
+        self,
+        os_manager: OSManager,
+        console_manager: ConsoleManager = None,
+        wheelhouse_manager: WheelhouseManager = None,
+        venv_store_manager: VenvStoreManager = None,
+    ):
         """
         Initialize with references to other managers.
 
         Args:
             os_manager: OSManager instance for OS operations
             console_manager: Optional ConsoleManager for user interaction
+            wheelhouse_manager: Optional WheelhouseManager for offline installs
+            venv_store_manager: Optional VenvStoreManager for cloned environments
         """
         self.os_manager = os_manager
         self.console_manager = console_manager
+        self.wheelhouse_manager = wheelhouse_manager or WheelhouseManager(os_manager)
+        self.venv_store_manager = venv_store_manager or VenvStoreManager(
+            os_manager, self.wheelhouse_manager
+        )
 
     def check_package_installed(
         self, venv_path: Union[str, Path], package: str
@@ -375,7 +389,10 @@ class EnvManager:
         return found_venvs
 
     def create_venv(
-        self, path: Union[str, Path] = ".venv", with_pip: bool = True
+        self,
+        path: Union[str, Path] = ".venv",
+        with_pip: bool = True,
+        requirements_path: Optional[Union[str, Path]] = None,
     ) -> Tuple[bool, str]:
         """
         Create a new virtual environment.
@@ -383,6 +400,8 @@ class EnvManager:
         Args:
             path: Path where to create the environment
             with_pip: Whether to include pip in the new environment
+            requirements_path: Optional requirements file; when given, the
+                environment is cloned from the shared venv store
 
         Returns:
             Tuple[bool, str]: Success flag and message
@@ -395,6 +414,19 @@ class EnvManager:
 
             venv_path = Path(path)
 
+            if requirements_path and with_pip:
+                success, message = self.venv_store_manager.create_from_store(
+                    venv_path, requirements_path
+                )
+                if success:
+                    if self.console_manager:
+                        self.console_manager.print_success(message)
+                    return True, message
+                if self.console_manager:
+                    self.console_manager.print_warning(
+                        f"{message} - creating a fresh environment instead"
+                    )
+
             # Create the virtual environment
             venv.create(venv_path, with_pip=with_pip)
 
@@ -448,6 +480,20 @@ class EnvManager:
             if not requirements_path.exists():
                 return False, f"Requirements file not found: {requirements_path}"
 
+            # Prefer an offline install from the local wheelhouse
+            success, message = self._install_requirements_from_wheelhouse(
+                venv_path, requirements_path
+            )
+            if success:
+                if self.console_manager:
+                    self.console_manager.print_success(message)
+                return True, message
+
+            if self.console_manager:
+                self.console_manager.print_warning(
+                    f"{message} - falling back to the package index"
+                )
+
             pip_path = self.get_pip_path(venv_path)
 
             result = subprocess.run(
@@ -473,6 +519,39 @@ class EnvManager:
                 self.console_manager.print_error(error_msg)
             return False, error_msg
 
+    def _install_requirements_from_wheelhouse(
+        self, venv_path: Path, requirements_path: Path
+    ) -> Tuple[bool, str]:
+        """
+        Build (once) and install from the wheelhouse for a requirements file.
+
+        Args:
+            venv_path: Path to the virtual environment
+            requirements_path: Path to the requirements.txt file
+
+        Returns:
+            Tuple[bool, str]: Success flag and message
+        """
+        if self.console_manager:
+            self.console_manager.print_progress("Preparing wheelhouse for offline installs...")
+        success, wheelhouse = self.wheelhouse_manager.ensure_wheelhouse(
+            venv_path, requirements_path
+        )
+        if not success:
+            return False, wheelhouse
+        if self.console_manager and wheelhouse.built_from_sdist:
+            self.console_manager.print_info(
+                "Built from source: " + ", ".join(wheelhouse.built_from_sdist)
+            )
+
+        result = self.wheelhouse_manager.install_from_wheelhouse(
+            venv_path, requirements_path, wheelhouse
+        )
+        if not result.success:
+            return False, f"Offline install from {wheelhouse.path} failed: {result.stderr}"
+
+        return True, f"Requirements installed from wheelhouse {wheelhouse.path}"
+
     def extract_requirements(
         self,
         venv_path: Union[str, Path],
@@ -22,9 +22,14 @@ class BaseOSManager(ABC):
     @abstractmethod
     def run_python_command(
             self,
-            command_args: List[str]
+            command_args: List[str],
+            venv_path: Optional[Path] = None,
+            cwd: Optional[Path] = None
     ) -> CommandResult:
-        """Run a Python interpreter command (e.g. `python -m venv …`)."""
+        """
+        Run a Python interpreter command (e.g. `python -m venv …`).
+        Uses the venv's interpreter when venv_path is given.
+        """
 
     @abstractmethod
     def get_current_directory(self) -> Path:
@@ -42,6 +47,10 @@ class BaseOSManager(ABC):
     def get_pip_path(self, venv_path: Path) -> Path:
         """Return the pip executable inside a virtualenv."""
 
+    @abstractmethod
+    def get_python_path(self, venv_path: Path) -> Path:
+        """Return the python interpreter inside a virtualenv."""
+
     @abstractmethod
     def check_package_installed(self, name: str) -> bool:
         """Check if a system package/binary is available in PATH."""
@@ -74,10 +83,30 @@ class BaseOSManager(ABC):
     def restart_service(self, service: str) -> CommandResult:
         """Restart a system service."""
 
+    @abstractmethod
+    def reload_service(self, service: str) -> CommandResult:
+        """Ask a running service to reload without stopping it."""
+
+    @abstractmethod
+    def get_service_main_pid(self, service: str) -> int:
+        """Return the main process id of a running service, 0 if unknown."""
+
+    @abstractmethod
+    def get_service_start_time(self, service: str) -> Optional[float]:
+        """Return when a service last began starting, as time.monotonic() seconds."""
+
+    @abstractmethod
+    def send_signal(self, pid: int, signal_name: str) -> CommandResult:
+        """Send a signal such as HUP or USR2 to a process."""
+
     @abstractmethod
     def enable_service(self, service: str) -> CommandResult:
         """Enable a service to start on boot."""
 
+    @abstractmethod
+    def disable_service(self, service: str) -> CommandResult:
+        """Stop a service from starting on boot."""
+
     @abstractmethod
     def reload_daemon(self) -> CommandResult:
         """Reload the OS’s service daemon (e.g. systemd)."""
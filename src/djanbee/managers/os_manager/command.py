@@ -8,7 +8,12 @@ class CommandResult:
     success: bool
     stdout: str
     stderr: str
-    exit_code: int
+    exit_code: int = 0
+
+    def __iter__(self):
+        # Supports `success, message = result`: stdout on success, else the error
+        yield self.success
+        yield self.stdout if self.success else (self.stderr or self.stdout)
 
 class CommandRunner:
     def run(
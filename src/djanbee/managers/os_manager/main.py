@@ -57,6 +57,14 @@ class OSManager:
     def get_pip_path(self, venv_path: Path) -> Path:
         return self._impl.get_pip_path(venv_path)
 
+    def get_python_path(self, venv_path: Path) -> Path:
+        return self._impl.get_python_path(venv_path)
+
+    def run_pip_command(self, venv_path: Path, args: List[str]) -> CommandResult:
+        """Run pip from the given virtual environment with the given arguments"""
+        pip_path = self.get_pip_path(Path(venv_path))
+        return self.run_command([str(pip_path)] + args)
+
     def file_exists(self, path: Path) -> bool:
         return self._impl.file_exists(path)
 
@@ -75,6 +83,18 @@ class OSManager:
     def restart_service(self, service_name: str) -> CommandResult:
         return self._impl.restart_service(service_name)
 
+    def reload_service(self, service_name: str) -> CommandResult:
+        return self._impl.reload_service(service_name)
+
+    def get_service_main_pid(self, service_name: str) -> int:
+        return self._impl.get_service_main_pid(service_name)
+
+    def get_service_start_time(self, service_name: str) -> Optional[float]:
+        return self._impl.get_service_start_time(service_name)
+
+    def send_signal(self, pid: int, signal_name: str) -> CommandResult:
+        return self._impl.send_signal(pid, signal_name)
+
     def enable_service(self, service_name: str) -> CommandResult:
         return self._impl.enable_service(service_name)
 
@@ -90,11 +110,19 @@ class OSManager:
     def user_exists(self, username: str) -> bool:
         return self._impl.user_exists(username)
 
+    def disable_service(self, service_name: str) -> CommandResult:
+        return self._impl.disable_service(service_name)
+
     def reload_daemon(self) -> CommandResult:
         return self._impl.reload_daemon()
 
-    def run_python_command(self, args: List[str]) -> CommandResult:
-        return self._impl.run_python_command(args)
+    def run_python_command(
+        self,
+        args: List[str],
+        venv_path: Optional[Path] = None,
+        cwd: Optional[Path] = None
+    ) -> CommandResult:
+        return self._impl.run_python_command(args, venv_path, cwd)
 
     def write_text_file(
             self,
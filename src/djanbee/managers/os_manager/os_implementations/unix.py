@@ -18,6 +18,9 @@ class UnixOSManager(BaseOSManager):
     def get_pip_path(self, venv_path: Path) -> Path:
         return venv_path / "bin" / "pip"
 
+    def get_python_path(self, venv_path: Path) -> Path:
+        return venv_path / "bin" / "python"
+
     def run_command(
         self,
         args: List[str],
@@ -28,8 +31,14 @@ class UnixOSManager(BaseOSManager):
 
     def run_python_command(
         self,
-        command_args: List[str]
+        command_args: List[str],
+        venv_path: Optional[Path] = None,
+        cwd: Optional[Path] = None
     ) -> CommandResult:
+        if venv_path:
+            python_exec = str(self.get_python_path(Path(venv_path)))
+            return self.run_command([python_exec] + command_args, cwd)
+
         which3 = self._runner.run(["which", "python3"])
         python_exec = which3.stdout if which3.success else None
 
@@ -40,7 +49,7 @@ class UnixOSManager(BaseOSManager):
         if not python_exec:
             return CommandResult(False, "", "Could not find any python executable")
 
-        return self.run_command([python_exec] + command_args)
+        return self.run_command([python_exec] + command_args, cwd)
 
     def check_pip_package_installed(self, package_name: str) -> bool:
         res = self.run_command(
@@ -81,9 +90,35 @@ class UnixOSManager(BaseOSManager):
     def restart_service(self, service_name: str) -> CommandResult:
         return self.run_command(["systemctl", "restart", service_name], sudo=True)
 
+    def reload_service(self, service_name: str) -> CommandResult:
+        return self.run_command(["systemctl", "reload", service_name], sudo=True)
+
+    def get_service_main_pid(self, service_name: str) -> int:
+        res = self.run_command(["systemctl", "show", "-p", "MainPID", "--value", service_name])
+        return int(res.stdout) if res.success and res.stdout.isdigit() else 0
+
+    def get_service_start_time(self, service_name: str) -> Optional[float]:
+        # systemd's monotonic timestamps share CLOCK_MONOTONIC with time.monotonic()
+        res = self.run_command(
+            ["systemctl", "show", "-p", "InactiveExitTimestampMonotonic", "--value", service_name]
+        )
+        if not res.success or not res.stdout.isdigit() or res.stdout == "0":
+            return None
+        return int(res.stdout) / 1_000_000
+
+    def send_signal(self, pid: int, signal_name: str) -> CommandResult:
+        res = self.run_command(["kill", "-s", signal_name, str(pid)])
+        if res.success:
+            return res
+        # Services may run as another user
+        return self.run_command(["kill", "-s", signal_name, str(pid)], sudo=True)
+
     def enable_service(self, service_name: str) -> CommandResult:
         return self.run_command(["systemctl", "enable", service_name], sudo=True)
 
+    def disable_service(self, service_name: str) -> CommandResult:
+        return self.run_command(["systemctl", "disable", service_name], sudo=True)
+
     def reload_daemon(self) -> CommandResult:
         return self.run_command(["systemctl", "daemon-reload"], sudo=True)
 
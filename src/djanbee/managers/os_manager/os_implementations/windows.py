@@ -18,6 +18,9 @@ class WindowsOSManager(BaseOSManager):
     def get_pip_path(self, venv_path: Path) -> Path:
         return venv_path / "Scripts" / "pip.exe"
 
+    def get_python_path(self, venv_path: Path) -> Path:
+        return venv_path / "Scripts" / "python.exe"
+
     def run_command(
         self,
         args: List[str],
@@ -28,9 +31,14 @@ class WindowsOSManager(BaseOSManager):
 
     def run_python_command(
         self,
-        command_args: List[str]
+        command_args: List[str],
+        venv_path: Optional[Path] = None,
+        cwd: Optional[Path] = None
     ) -> CommandResult:
-        return self.run_command(["python"] + command_args)
+        python_exec = (
+            str(self.get_python_path(Path(venv_path))) if venv_path else "python"
+        )
+        return self.run_command([python_exec] + command_args, cwd)
 
     def check_pip_package_installed(self, package_name: str) -> bool:
         res = self.run_command([str(self.get_pip_path(Path("."))), "show", package_name])
@@ -65,9 +73,31 @@ class WindowsOSManager(BaseOSManager):
             return stop
         return self.start_service(service_name)
 
+    def reload_service(self, service_name: str) -> CommandResult:
+        # Windows services have no generic reload control
+        return self.restart_service(service_name)
+
+    def get_service_main_pid(self, service_name: str) -> int:
+        res = self.run_command(["sc", "queryex", service_name])
+        for line in res.stdout.splitlines():
+            key, _, value = line.partition(":")
+            if key.strip() == "PID" and value.strip().isdigit():
+                return int(value.strip())
+        return 0
+
+    def get_service_start_time(self, service_name: str) -> Optional[float]:
+        return None
+
+    def send_signal(self, pid: int, signal_name: str) -> CommandResult:
+        # Windows has no POSIX signals to deliver to a service
+        return CommandResult(False, "", f"Signal {signal_name} is not supported on Windows")
+
     def enable_service(self, service_name: str) -> CommandResult:
         return self.run_command(["sc", "config", service_name, "start=auto"])
 
+    def disable_service(self, service_name: str) -> CommandResult:
+        return self.run_command(["sc", "config", service_name, "start=demand"])
+
     def reload_daemon(self) -> CommandResult:
         return CommandResult(True, "", "")
 
@@ -1,10 +1,50 @@
 # djanbee/managers/pip_manager/__init__.py
 
 from pathlib import Path
-from typing import List
 
 from ..os_manager.main import OSManager
 from ..os_manager.command import CommandResult
+from .requirements_parser import (
+    Requirement,
+    ParsedRequirements,
+    RequirementsParser,
+    canonicalize_name,
+)
+from .metadata import (
+    InstalledDistribution,
+    find_site_packages,
+    read_distributions,
+    read_installed_versions,
+)
+from .install_plan import InstallPlan, build_install_plan, version_satisfies
+from .dependency_analysis import (
+    SlimReport,
+    dependency_closure,
+    find_unused_requirements,
+    scan_imports,
+    write_slim_requirements,
+)
+
+__all__ = [
+    "PipManager",
+    "Requirement",
+    "ParsedRequirements",
+    "RequirementsParser",
+    "canonicalize_name",
+    "InstalledDistribution",
+    "find_site_packages",
+    "read_distributions",
+    "read_installed_versions",
+    "InstallPlan",
+    "build_install_plan",
+    "version_satisfies",
+    "SlimReport",
+    "dependency_closure",
+    "find_unused_requirements",
+    "scan_imports",
+    "write_slim_requirements",
+]
+
 
 class PipManager:
     """High-level interface for pip in any venv or system Python."""
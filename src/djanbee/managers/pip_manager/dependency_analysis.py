@@ -0,0 +1,240 @@
+# djanbee/managers/pip_manager/dependency_analysis.py
+
+import ast
+import os
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, List, Set, Union
+
+from .metadata import InstalledDistribution
+from .requirements_parser import (
+    ParsedRequirements,
+    Requirement,
+    RequirementsParser,
+    canonicalize_name,
+)
+
+# Directories that never hold code the deployed application imports
+SKIPPED_DIRECTORIES = {
+    ".git", ".hg", ".tox", ".djanbee", "node_modules", "__pycache__",
+    "static", "media", "staticfiles",
+}
+# Module names in string literals, as used by INSTALLED_APPS, MIDDLEWARE,
+# database ENGINE and other settings that Django imports by name. Plain
+# words match too; they only keep a distribution if one provides that name
+DOTTED_NAME_PATTERN = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*(\.[A-Za-z_][A-Za-z0-9_]*)*$")
+# Distributions that Django loads indirectly from a settings string
+IMPLIED_BY_MODULE = {
+    "django.db.backends.postgresql": ["psycopg", "psycopg2", "psycopg2-binary", "psycopg-binary"],
+    "django.db.backends.mysql": ["mysqlclient"],
+    "django.db.backends.oracle": ["oracledb", "cx-oracle"],
+    "django.core.cache.backends.redis": ["redis", "hiredis"],
+    "django.core.cache.backends.memcached": ["pymemcache", "pylibmc"],
+}
+# Distributions run as programs rather than imported by the project
+DEFAULT_KEEP = {"gunicorn", "uvicorn", "setproctitle"}
+REQUIRES_DIST_PATTERN = re.compile(
+    r"^\s*([A-Za-z0-9][A-Za-z0-9._-]*)\s*(\[[^\]]*\])?[^;]*(?:;(.*))?$"
+)
+EXTRA_MARKER_PATTERN = re.compile(r"""extra\s*==\s*["']([^"']+)["']""")
+
+
+@dataclass
+class SlimReport:
+    """Which requirements the project can reach and which it cannot."""
+
+    imported_modules: Set[str] = field(default_factory=set)
+    roots: Set[str] = field(default_factory=set)
+    reachable: Set[str] = field(default_factory=set)
+    unused: List[Requirement] = field(default_factory=list)
+    unresolved: List[Requirement] = field(default_factory=list)
+
+    @property
+    def unused_names(self) -> Set[str]:
+        return {requirement.key for requirement in self.unused}
+
+
+def scan_imports(
+    project_path: Union[str, Path], exclude: Iterable[Union[str, Path]] = ()
+) -> Set[str]:
+    """
+    Collect the dotted module names a project refers to.
+
+    Covers `import` and `from ... import` statements and string literals
+    that look like module paths, since Django settings name most
+    apps, middleware and backends as strings. Relative imports are local
+    and skipped. Files that do not parse are ignored.
+    """
+    project_path = Path(project_path)
+    excluded = {Path(p).resolve() for p in exclude}
+    modules: Set[str] = set()
+
+    for root, dirs, files in os.walk(project_path):
+        root_path = Path(root)
+        dirs[:] = [
+            d for d in dirs
+            if d not in SKIPPED_DIRECTORIES
+            and (root_path / d).resolve() not in excluded
+            and not (root_path / d / "pyvenv.cfg").exists()
+        ]
+        for name in files:
+            if not name.endswith(".py"):
+                continue
+            try:
+                tree = ast.parse((root_path / name).read_bytes())
+            except (SyntaxError, ValueError, OSError):
+                continue
+            modules.update(_modules_in_tree(tree))
+    return modules
+
+
+def _modules_in_tree(tree: ast.AST) -> Set[str]:
+    modules = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            modules.update(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom):
+            if node.level == 0 and node.module:
+                modules.add(node.module)
+        elif isinstance(node, ast.Constant) and isinstance(node.value, str):
+            if len(node.value) < 200 and DOTTED_NAME_PATTERN.match(node.value):
+                modules.add(node.value)
+    return modules
+
+
+def map_modules_to_distributions(
+    distributions: Dict[str, InstalledDistribution]
+) -> Dict[str, Set[str]]:
+    """
+    Map importable top-level names to the distributions that provide them.
+
+    Namespace packages (e.g. `google`) map to every distribution sharing
+    them, so all of them are kept rather than guessing.
+    """
+    mapping: Dict[str, Set[str]] = {}
+    for key, distribution in distributions.items():
+        names = distribution.top_level or [distribution.name.replace("-", "_")]
+        for name in names:
+            mapping.setdefault(name, set()).add(key)
+    return mapping
+
+
+def dependency_closure(
+    roots: Dict[str, Set[str]], distributions: Dict[str, InstalledDistribution]
+) -> Set[str]:
+    """
+    Resolve every distribution reachable from the roots.
+
+    Args:
+        roots: Canonical distribution name -> extras requested for it
+        distributions: Installed distributions by canonical name
+
+    Environment markers other than extras are kept, so the closure may be
+    larger than strictly needed on this platform but never smaller.
+    """
+    reachable: Dict[str, Set[str]] = {}
+    queue = [(key, set(extras)) for key, extras in roots.items()]
+    while queue:
+        key, extras = queue.pop()
+        seen_extras = reachable.get(key)
+        if seen_extras is not None and extras <= seen_extras:
+            continue
+        reachable[key] = (seen_extras or set()) | extras
+
+        distribution = distributions.get(key)
+        if not distribution:
+            continue
+        for line in distribution.requires:
+            match = REQUIRES_DIST_PATTERN.match(line)
+            if not match:
+                continue
+            name, dep_extras, marker = match.groups()
+            extra = EXTRA_MARKER_PATTERN.search(marker or "")
+            if extra and canonicalize_name(extra.group(1)) not in reachable[key]:
+                continue
+            requested = (dep_extras or "[]")[1:-1].split(",")
+            queue.append(
+                (canonicalize_name(name), {canonicalize_name(e) for e in requested if e.strip()})
+            )
+    return set(reachable)
+
+
+def find_unused_requirements(
+    parsed: ParsedRequirements,
+    distributions: Dict[str, InstalledDistribution],
+    imported_modules: Set[str],
+    keep: Iterable[str] = (),
+) -> SlimReport:
+    """
+    Find requirements that no import of the project can reach.
+
+    Roots are the distributions providing an imported module, those
+    implied by Django settings strings, and the `keep` names. Requirements
+    that are not installed cannot be analysed and are reported as unresolved.
+    """
+    report = SlimReport(imported_modules=set(imported_modules))
+    providers = map_modules_to_distributions(distributions)
+    requested_extras = {
+        r.key: {canonicalize_name(e) for e in r.extras} for r in parsed.requirements if r.key
+    }
+
+    roots: Dict[str, Set[str]] = {}
+    for module in imported_modules:
+        for key in providers.get(module.split(".", 1)[0], ()):
+            roots.setdefault(key, set())
+        for prefix, implied in IMPLIED_BY_MODULE.items():
+            if module == prefix or module.startswith(prefix + "."):
+                for name in implied:
+                    roots.setdefault(canonicalize_name(name), set())
+    for name in set(DEFAULT_KEEP) | set(keep):
+        roots.setdefault(canonicalize_name(name), set())
+    for key in roots:
+        roots[key] |= requested_extras.get(key, set())
+
+    report.roots = {key for key in roots if key in distributions}
+    report.reachable = dependency_closure(roots, distributions)
+
+    for requirement in parsed.requirements:
+        if requirement.key is None or requirement.editable:
+            # Local and VCS requirements are usually the project itself
+            continue
+        if requirement.key not in distributions:
+            report.unresolved.append(requirement)
+        elif requirement.key not in report.reachable:
+            report.unused.append(requirement)
+    return report
+
+
+def write_slim_requirements(
+    requirements_path: Union[str, Path],
+    unused: Iterable[str],
+    output_path: Union[str, Path],
+) -> Path:
+    """
+    Write a copy of a requirements file without the unused requirements.
+
+    Comments, options and includes are copied unchanged; removed lines are
+    listed in a header comment so the change is easy to review. Only the
+    given file is rewritten, requirements in included files stay as they are.
+    """
+    unused = {canonicalize_name(name) for name in unused}
+    requirements_path = Path(requirements_path)
+    parser = RequirementsParser()
+    kept, removed = [], []
+    for line in requirements_path.read_text(encoding="utf-8").splitlines():
+        stripped = re.sub(r"(^|\s)#.*$", "", line).strip()
+        requirement = parser.parse_line(stripped, requirements_path) if stripped else None
+        if requirement and requirement.key in unused:
+            removed.append(stripped)
+        else:
+            kept.append(line)
+
+    header = [f"# Generated by djanbee from {requirements_path.name}"]
+    if removed:
+        header.append("# Removed as unreachable from the project's imports:")
+        header += [f"#   {line}" for line in removed]
+
+    output_path = Path(output_path)
+    output_path.write_text("\n".join(header + kept) + "\n", encoding="utf-8")
+    return output_path
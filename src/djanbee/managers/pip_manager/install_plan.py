@@ -0,0 +1,137 @@
+# djanbee/managers/pip_manager/install_plan.py
+
+import re
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Tuple
+
+from .requirements_parser import ParsedRequirements, Requirement
+
+
+@dataclass
+class InstallPlan:
+    """The difference between a requirements file and a virtual environment."""
+
+    to_install: List[Requirement] = field(default_factory=list)
+    to_upgrade: List[Tuple[Requirement, str]] = field(default_factory=list)
+    to_remove: List[str] = field(default_factory=list)
+
+    @property
+    def is_empty(self) -> bool:
+        return not (self.to_install or self.to_upgrade or self.to_remove)
+
+    def install_args(self) -> List[str]:
+        """Requirement arguments for the single `pip install` invocation"""
+        return [r.to_pip_arg() for r in self.to_install] + [
+            r.to_pip_arg() for r, _ in self.to_upgrade
+        ]
+
+
+def _version_key(version: str) -> Tuple:
+    """
+    Approximate PEP 440 ordering: release numbers compare numerically and
+    pre-releases (a, b, rc, dev) sort before the matching final release.
+    """
+    version = version.strip().lower().split("+", 1)[0]
+    release_part = re.match(r"^v?(\d+(?:\.\d+)*)", version)
+    if not release_part:
+        return ((), 0, version)
+    release = tuple(int(p) for p in release_part.group(1).split("."))
+    while release and release[-1] == 0:
+        release = release[:-1]
+    rest = version[release_part.end():]
+    if re.search(r"(a|b|c|rc|alpha|beta|pre|preview|dev)\d*", rest):
+        stage = -1
+    elif rest.lstrip(".-_").startswith(("post", "r", "rev")):
+        stage = 1
+    else:
+        stage = 0
+    return (release, stage, rest)
+
+
+def version_satisfies(version: str, specifier: str) -> bool:
+    """Check an installed version against a comma separated specifier set"""
+    for clause in filter(None, (c.strip() for c in specifier.split(","))):
+        match = re.match(r"^(===|==|!=|~=|>=|<=|>|<)\s*(.+)$", clause)
+        if not match:
+            return False
+        op, wanted = match.groups()
+
+        if op == "===":
+            if version != wanted:
+                return False
+            continue
+
+        if wanted.endswith(".*") and op in ("==", "!="):
+            prefix = wanted[:-2]
+            matches = version == prefix or version.startswith(prefix + ".")
+            if matches != (op == "=="):
+                return False
+            continue
+
+        have, want = _version_key(version), _version_key(wanted)
+        if op == "==" and have != want:
+            return False
+        if op == "!=" and have == want:
+            return False
+        if op == ">=" and have < want:
+            return False
+        if op == "<=" and have > want:
+            return False
+        if op == ">" and have <= want:
+            return False
+        if op == "<" and have >= want:
+            return False
+        if op == "~=":
+            parts = wanted.split(".")
+            upper = ".".join(parts[:-1]) + ".*" if len(parts) > 1 else wanted
+            if have < want or not version_satisfies(version, f"=={upper}"):
+                return False
+    return True
+
+
+def build_install_plan(
+    parsed: ParsedRequirements,
+    installed: Dict[str, str],
+    previously_required: Iterable[str] = (),
+) -> InstallPlan:
+    """
+    Compute the add/upgrade/remove delta between requirements and a venv.
+
+    Args:
+        parsed: Requirements parsed from the requirements file
+        installed: Canonical name -> installed version of the venv
+        previously_required: Requirement names recorded by the previous install;
+            only these are candidates for removal, so transitive dependencies
+            and manually installed tools are never uninstalled
+
+    Returns:
+        InstallPlan describing the changes to apply
+    """
+    plan = InstallPlan()
+    constraints = {c.key: c for c in parsed.constraints if c.key}
+
+    for requirement in parsed.requirements:
+        key = requirement.key
+        if key is None or requirement.editable:
+            # URL, VCS and editable requirements cannot be compared by version
+            plan.to_install.append(requirement)
+            continue
+
+        if key not in installed:
+            # Requirements with markers are passed on as well; pip evaluates
+            # the marker against the venv's interpreter and skips if needed
+            plan.to_install.append(requirement)
+            continue
+
+        constraint = constraints.get(key)
+        specifier = ",".join(
+            s for s in (requirement.specifier, constraint.specifier if constraint else "") if s
+        )
+        if specifier and not version_satisfies(installed[key], specifier):
+            plan.to_upgrade.append((requirement, installed[key]))
+
+    required = parsed.names()
+    plan.to_remove = sorted(
+        name for name in set(previously_required) - required if name in installed
+    )
+    return plan
@@ -0,0 +1,119 @@
+# djanbee/managers/pip_manager/metadata.py
+
+from dataclasses import dataclass, field
+from email.parser import HeaderParser
+from pathlib import Path
+from typing import Dict, List, Optional, Union
+
+from .requirements_parser import canonicalize_name
+
+
+@dataclass
+class InstalledDistribution:
+    """A distribution found in a virtual environment's site-packages."""
+
+    name: str
+    version: str
+    path: Path
+    requires: List[str] = field(default_factory=list)
+    top_level: List[str] = field(default_factory=list)
+
+    @property
+    def key(self) -> str:
+        return canonicalize_name(self.name)
+
+
+def find_site_packages(venv_path: Union[str, Path]) -> List[Path]:
+    """Return the site-packages directories of a virtual environment."""
+    venv_path = Path(venv_path)
+    candidates = list(venv_path.glob("lib/python*/site-packages"))
+    candidates += list(venv_path.glob("lib64/python*/site-packages"))
+    windows = venv_path / "Lib" / "site-packages"
+    if windows.is_dir():
+        candidates.append(windows)
+
+    unique = []
+    for path in candidates:
+        resolved = path.resolve()
+        if resolved.is_dir() and resolved not in unique:
+            unique.append(resolved)
+    return unique
+
+
+def read_installed_versions(venv_path: Union[str, Path]) -> Dict[str, str]:
+    """
+    Map canonical distribution names to installed versions.
+
+    Reads the `.dist-info` directory names directly, which is much faster
+    than asking pip and needs no interpreter start-up.
+    """
+    installed = {}
+    for site_packages in find_site_packages(venv_path):
+        for entry in site_packages.glob("*.dist-info"):
+            name, _, version = entry.name[: -len(".dist-info")].partition("-")
+            if name and version:
+                installed[canonicalize_name(name)] = version
+    return installed
+
+
+def read_distributions(venv_path: Union[str, Path]) -> Dict[str, InstalledDistribution]:
+    """Read name, version, dependencies and top-level modules of every distribution."""
+    distributions = {}
+    for site_packages in find_site_packages(venv_path):
+        for entry in site_packages.glob("*.dist-info"):
+            distribution = _read_dist_info(entry)
+            if distribution:
+                distributions[distribution.key] = distribution
+    return distributions
+
+
+def _read_dist_info(path: Path) -> Optional[InstalledDistribution]:
+    metadata_file = path / "METADATA"
+    if not metadata_file.is_file():
+        return None
+
+    headers = HeaderParser().parsestr(
+        metadata_file.read_text(encoding="utf-8", errors="replace")
+    )
+    name = headers.get("Name")
+    if not name:
+        return None
+
+    top_level_file = path / "top_level.txt"
+    if top_level_file.is_file():
+        top_level = [
+            line.strip()
+            for line in top_level_file.read_text(encoding="utf-8").splitlines()
+            if line.strip()
+        ]
+    else:
+        top_level = _top_level_from_record(path / "RECORD")
+
+    return InstalledDistribution(
+        name=name,
+        version=headers.get("Version", ""),
+        path=path,
+        requires=headers.get_all("Requires-Dist") or [],
+        top_level=top_level,
+    )
+
+
+def _top_level_from_record(record: Path) -> List[str]:
+    """Derive importable top-level names from RECORD when top_level.txt is missing"""
+    if not record.is_file():
+        return []
+    names = set()
+    for line in record.read_text(encoding="utf-8").splitlines():
+        file_path = line.split(",", 1)[0]
+        first = file_path.split("/", 1)[0]
+        if not first or first.endswith((".dist-info", ".data")) or first.startswith(".."):
+            continue
+        if first == "__pycache__":
+            continue
+        if "/" in file_path:
+            names.add(first)
+        elif first.endswith(".py"):
+            names.add(first[:-3])
+        elif first.endswith((".so", ".pyd")):
+            names.add(first.split(".", 1)[0])
+    return sorted(names)
@@ -0,0 +1,190 @@
+# djanbee/managers/pip_manager/requirements_parser.py
+
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import List, Optional, Set, Union
+
+
+def canonicalize_name(name: str) -> str:
+    """Normalize a distribution name the way pip compares them (PEP 503)."""
+    return re.sub(r"[-_.]+", "-", name).lower()
+
+
+@dataclass
+class Requirement:
+    """One requirement line from a requirements file."""
+
+    raw: str
+    source: Path
+    name: Optional[str] = None
+    extras: List[str] = field(default_factory=list)
+    specifier: str = ""
+    marker: str = ""
+    editable: bool = False
+    constraint: bool = False
+
+    @property
+    def key(self) -> Optional[str]:
+        """Canonical name used for comparisons, None for URL/path requirements"""
+        return canonicalize_name(self.name) if self.name else None
+
+    @property
+    def pinned_version(self) -> Optional[str]:
+        """Version for `==`/`===` pins without wildcards, else None"""
+        match = re.fullmatch(r"===?\s*([^,*\s]+)", self.specifier.strip())
+        return match.group(1) if match else None
+
+    def to_pip_arg(self) -> str:
+        """Requirement as a single pip install argument"""
+        if not self.name:
+            return self.raw
+        arg = self.name
+        if self.extras:
+            arg += f"[{','.join(self.extras)}]"
+        arg += self.specifier
+        if self.marker:
+            arg += f"; {self.marker}"
+        return arg
+
+
+@dataclass
+class ParsedRequirements:
+    """Requirements and constraints collected from a file and its includes."""
+
+    requirements: List[Requirement] = field(default_factory=list)
+    constraints: List[Requirement] = field(default_factory=list)
+    files: List[Path] = field(default_factory=list)
+    options: List[str] = field(default_factory=list)
+
+    def names(self) -> Set[str]:
+        return {r.key for r in self.requirements if r.key}
+
+    def canonical_lines(self) -> List[str]:
+        """Stable textual form used for fingerprinting"""
+        lines = [f"req:{r.to_pip_arg()}" for r in self.requirements]
+        lines += [f"con:{c.to_pip_arg()}" for c in self.constraints]
+        lines += [f"opt:{o}" for o in self.options]
+        return sorted(lines)
+
+
+class RequirementsParser:
+    """
+    Parser for pip requirements files.
+
+    Follows `-r`/`--requirement` and `-c`/`--constraint` includes relative to
+    the including file, keeps markers, extras and version specifiers, and
+    records index options so they can take part in fingerprints.
+    """
+
+    REQUIREMENT_PATTERN = re.compile(
+        r"^(?P<name>[A-Za-z0-9][A-Za-z0-9._-]*)"
+        r"\s*(?:\[(?P<extras>[^\]]*)\])?"
+        r"\s*(?P<spec>[<>=!~][^;]*)?"
+        r"\s*(?:;\s*(?P<marker>.*))?$"
+    )
+    INCLUDE_OPTIONS = {"-r": False, "--requirement": False, "-c": True, "--constraint": True}
+    INDEX_OPTIONS = ("-i", "--index-url", "--extra-index-url", "-f", "--find-links", "--pre")
+
+    def parse(self, path: Union[str, Path]) -> ParsedRequirements:
+        """Parse a requirements file and everything it includes"""
+        parsed = ParsedRequirements()
+        self._parse_file(Path(path), parsed, constraint=False, seen=set())
+        return parsed
+
+    def collect_files(self, path: Union[str, Path]) -> List[Path]:
+        """Return the requirements file and every file it includes"""
+        return self.parse(path).files
+
+    def _parse_file(
+        self, path: Path, parsed: ParsedRequirements, constraint: bool, seen: Set[Path]
+    ) -> None:
+        path = path.resolve()
+        if path in seen:
+            return
+        seen.add(path)
+        parsed.files.append(path)
+
+        for line in self._logical_lines(path.read_text(encoding="utf-8")):
+            include = self._split_include(line)
+            if include:
+                option, target = include
+                self._parse_file(
+                    path.parent / target,
+                    parsed,
+                    constraint=constraint or self.INCLUDE_OPTIONS[option],
+                    seen=seen,
+                )
+                continue
+
+            if line.startswith(self.INDEX_OPTIONS):
+                parsed.options.append(" ".join(line.split()))
+                continue
+
+            requirement = self.parse_line(line, path)
+            if requirement is None:
+                continue
+            requirement.constraint = constraint
+            if constraint:
+                parsed.constraints.append(requirement)
+            else:
+                parsed.requirements.append(requirement)
+
+    def parse_line(self, line: str, source: Path) -> Optional[Requirement]:
+        """Parse a single logical requirement line, None for unsupported options"""
+        editable = False
+        if line.startswith(("-e ", "--editable ")):
+            editable = True
+            line = line.split(None, 1)[1].strip()
+        elif line.startswith("-"):
+            # Other global options (--hash, --no-binary, ...) do not name packages
+            return None
+
+        # Drop per-requirement options such as --hash=...
+        line = re.split(r"\s+--", line, maxsplit=1)[0].strip()
+
+        match = self.REQUIREMENT_PATTERN.match(line)
+        if editable or not match:
+            # URL, VCS or local path requirement; `name @ url` still has a name
+            name_match = re.match(r"^([A-Za-z0-9][A-Za-z0-9._-]*)\s*@", line)
+            return Requirement(
+                raw=line,
+                source=source,
+                name=name_match.group(1) if name_match else None,
+                editable=editable,
+            )
+
+        extras = [e.strip() for e in (match.group("extras") or "").split(",") if e.strip()]
+        return Requirement(
+            raw=line,
+            source=source,
+            name=match.group("name"),
+            extras=extras,
+            specifier=(match.group("spec") or "").replace(" ", ""),
+            marker=(match.group("marker") or "").strip(),
+        )
+
+    @staticmethod
+    def _logical_lines(content: str) -> List[str]:
+        """Join continuation lines and strip comments and blank lines"""
+        lines = []
+        buffer = ""
+        for raw in content.splitlines():
+            if raw.endswith("\\"):
+                buffer += raw[:-1] + " "
+                continue
+            line = buffer + raw
+            buffer = ""
+            line = re.sub(r"(^|\s)#.*$", "", line).strip()
+            if line:
+                lines.append(line)
+        if buffer.strip():
+            lines.append(buffer.strip())
+        return lines
+
+    def _split_include(self, line: str):
+        for option in self.INCLUDE_OPTIONS:
+            if line.startswith(option + "=") or line.startswith(option + " "):
+                target = line[len(option) + 1:].strip()
+                return option, target
+        return None
@@ -0,0 +1,25 @@
+from .main import ProfileManager, ImportRegression
+from .import_time import ImportGroup, ImportProfile, ImportRecord, parse_importtime
+from .live import (
+    FunctionSamples,
+    LiveProfile,
+    merge_collapsed,
+    parse_collapsed,
+    render_collapsed,
+    top_functions,
+)
+
+__all__ = [
+    "ProfileManager",
+    "ImportRegression",
+    "ImportGroup",
+    "ImportProfile",
+    "ImportRecord",
+    "parse_importtime",
+    "FunctionSamples",
+    "LiveProfile",
+    "merge_collapsed",
+    "parse_collapsed",
+    "render_collapsed",
+    "top_functions",
+]
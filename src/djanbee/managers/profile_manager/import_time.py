@@ -0,0 +1,158 @@
+# djanbee/managers/profile_manager/import_time.py
+
+import re
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, Iterator, List, Optional
+
+IMPORT_TIME_PATTERN = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|( *)(\S+)\s*$")
+
+
+@dataclass
+class ImportRecord:
+    """One module from `python -X importtime`, times in microseconds."""
+
+    module: str
+    self_us: int
+    cumulative_us: int
+    children: List["ImportRecord"] = field(default_factory=list)
+
+    @property
+    def package(self) -> str:
+        return self.module.split(".", 1)[0]
+
+    def walk(self) -> Iterator["ImportRecord"]:
+        yield self
+        for child in self.children:
+            yield from child.walk()
+
+
+@dataclass
+class ImportGroup:
+    """Import cost attributed to a package or an installed app."""
+
+    name: str
+    self_us: int = 0
+    modules: int = 0
+
+
+@dataclass
+class ImportProfile:
+    """Parsed import tree of one process."""
+
+    roots: List[ImportRecord] = field(default_factory=list)
+
+    @property
+    def total_us(self) -> int:
+        return sum(root.cumulative_us for root in self.roots)
+
+    def records(self) -> List[ImportRecord]:
+        return [record for root in self.roots for record in root.walk()]
+
+    def top_self(self, limit: int = 15) -> List[ImportRecord]:
+        return sorted(self.records(), key=lambda r: r.self_us, reverse=True)[:limit]
+
+    def top_cumulative(self, limit: int = 15) -> List[ImportRecord]:
+        return sorted(self.records(), key=lambda r: r.cumulative_us, reverse=True)[:limit]
+
+    def by_package(self) -> List[ImportGroup]:
+        """Self time summed per top-level package"""
+        groups: Dict[str, ImportGroup] = {}
+        for record in self.records():
+            group = groups.setdefault(record.package, ImportGroup(record.package))
+            group.self_us += record.self_us
+            group.modules += 1
+        return sorted(groups.values(), key=lambda g: g.self_us, reverse=True)
+
+    def by_app(self, installed_apps: Iterable[str]) -> List[ImportGroup]:
+        """
+        Self time summed per INSTALLED_APPS entry.
+
+        Each module counts towards the app with the longest matching module
+        prefix; modules that belong to no app are left out.
+        """
+        prefixes = {app_module(app): app for app in installed_apps}
+        groups: Dict[str, ImportGroup] = {}
+        for record in self.records():
+            prefix = _longest_prefix(record.module, prefixes)
+            if prefix is None:
+                continue
+            app = prefixes[prefix]
+            group = groups.setdefault(app, ImportGroup(app))
+            group.self_us += record.self_us
+            group.modules += 1
+        return sorted(groups.values(), key=lambda g: g.self_us, reverse=True)
+
+    @classmethod
+    def merge_min(cls, profiles: List["ImportProfile"]) -> "ImportProfile":
+        """
+        Combine repeated runs, keeping each module's fastest time.
+
+        The tree shape of the first run is kept; the minimum filters out
+        noise from page cache misses and other processes.
+        """
+        if not profiles:
+            return cls()
+        best: Dict[str, ImportRecord] = {}
+        for profile in profiles:
+            for record in profile.records():
+                current = best.get(record.module)
+                if current is None:
+                    best[record.module] = ImportRecord(
+                        record.module, record.self_us, record.cumulative_us
+                    )
+                else:
+                    current.self_us = min(current.self_us, record.self_us)
+                    current.cumulative_us = min(current.cumulative_us, record.cumulative_us)
+
+        def rebuild(record: ImportRecord) -> ImportRecord:
+            merged = best[record.module]
+            return ImportRecord(
+                record.module,
+                merged.self_us,
+                merged.cumulative_us,
+                [rebuild(child) for child in record.children],
+            )
+
+        return cls([rebuild(root) for root in profiles[0].roots])
+
+
+def app_module(app: str) -> str:
+    """Module path of an INSTALLED_APPS entry, e.g. 'shop.apps.ShopConfig' -> 'shop'"""
+    parts = app.split(".")
+    if len(parts) > 1 and parts[-1][:1].isupper():
+        parts = parts[:-1]
+        if len(parts) > 1 and parts[-1] == "apps":
+            parts = parts[:-1]
+    return ".".join(parts)
+
+
+def _longest_prefix(module: str, prefixes: Iterable[str]) -> Optional[str]:
+    matches = [p for p in prefixes if module == p or module.startswith(p + ".")]
+    return max(matches, key=len) if matches else None
+
+
+def parse_importtime(output: str) -> ImportProfile:
+    """
+    Parse the stderr of `python -X importtime` into a tree.
+
+    CPython prints a module after everything it imported, indented two
+    spaces per nesting level, so children are collected per depth until
+    their parent's line appears.
+    """
+    pending: Dict[int, List[ImportRecord]] = {}
+    for line in output.splitlines():
+        match = IMPORT_TIME_PATTERN.match(line)
+        if not match:
+            continue
+        self_us, cumulative_us, indent, module = match.groups()
+        depth = max(len(indent) - 1, 0) // 2
+        record = ImportRecord(module, int(self_us), int(cumulative_us))
+        record.children = pending.pop(depth + 1, [])
+        pending.setdefault(depth, []).append(record)
+
+    # Anything left deeper than the top level belongs to an import that
+    # never finished (e.g. the process failed part way through)
+    roots = []
+    for depth in sorted(pending):
+        roots.extend(pending[depth])
+    return ImportProfile(roots)
@@ -0,0 +1,113 @@
+# djanbee/managers/profile_manager/live.py
+
+import re
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Iterable, List, Tuple
+
+# "stack count", frames root first and joined with ';' as flamegraph.pl reads them
+COLLAPSED_LINE = re.compile(r"^(.*\S)\s+(\d+)$")
+FRAME_PATTERN = re.compile(r"^(.*) \((.*):(\d+)\)$")
+
+# (function, file) of the innermost Python frames of threads that wait for
+# work: Gunicorn's sync worker in select, selector-based event loops, the
+# gthread pool and threads waiting on a condition
+IDLE_FRAMES = (
+    ("wait", "gunicorn/workers/sync.py"),
+    ("select", "selectors.py"),
+    ("_worker", "concurrent/futures/thread.py"),
+    ("wait", "threading.py"),
+)
+
+
+@dataclass
+class FunctionSamples:
+    """Samples a function was seen in: running itself, or anywhere on the stack"""
+
+    frame: str
+    self_samples: int = 0
+    total_samples: int = 0
+
+    @property
+    def function(self) -> str:
+        match = FRAME_PATTERN.match(self.frame)
+        return match.group(1) if match else self.frame
+
+    @property
+    def location(self) -> str:
+        match = FRAME_PATTERN.match(self.frame)
+        return f"{match.group(2)}:{match.group(3)}" if match else ""
+
+
+@dataclass
+class LiveProfile:
+    """Collapsed stacks sampled from the workers of running services"""
+
+    stacks: Counter = field(default_factory=Counter)
+    workers: int = 0
+
+    @property
+    def samples(self) -> int:
+        return sum(self.stacks.values())
+
+    @property
+    def idle_samples(self) -> int:
+        return sum(count for stack, count in self.stacks.items() if is_idle(stack))
+
+    def busy_stacks(self) -> Counter:
+        return Counter({stack: count for stack, count in self.stacks.items() if not is_idle(stack)})
+
+    def top_functions(self, limit: int = 20) -> List[FunctionSamples]:
+        return top_functions(self.busy_stacks(), limit)
+
+
+def parse_collapsed(text: str) -> Counter:
+    """Stacks and their sample counts from collapsed-stack output"""
+    stacks = Counter()
+    for line in text.splitlines():
+        match = COLLAPSED_LINE.match(line.strip())
+        if match:
+            stacks[match.group(1)] += int(match.group(2))
+    return stacks
+
+
+def merge_collapsed(profiles: Iterable[Counter]) -> Counter:
+    merged = Counter()
+    for stacks in profiles:
+        merged.update(stacks)
+    return merged
+
+
+def render_collapsed(stacks: Counter) -> str:
+    """Collapsed stacks, most sampled first, for flamegraph.pl or speedscope"""
+    ordered: List[Tuple[str, int]] = sorted(stacks.items(), key=lambda item: (-item[1], item[0]))
+    return "".join(f"{stack} {count}\n" for stack, count in ordered)
+
+
+def is_idle(stack: str) -> bool:
+    """Whether a stack's innermost frame waits for work"""
+    match = FRAME_PATTERN.match(stack.rsplit(";", 1)[-1])
+    if not match:
+        return False
+    function, filename = match.group(1), match.group(2)
+    return any(
+        function == idle_function and filename.endswith(idle_file)
+        for idle_function, idle_file in IDLE_FRAMES
+    )
+
+
+def top_functions(stacks: Counter, limit: int = 20) -> List[FunctionSamples]:
+    """
+    Functions by the samples they were on the stack in. A recursive
+    function counts once per sample.
+    """
+    functions = {}
+    for stack, count in stacks.items():
+        frames = stack.split(";")
+        for frame in set(frames):
+            functions.setdefault(frame, FunctionSamples(frame)).total_samples += count
+        functions.setdefault(frames[-1], FunctionSamples(frames[-1])).self_samples += count
+    ordered = sorted(
+        functions.values(), key=lambda f: (-f.total_samples, -f.self_samples, f.frame)
+    )
+    return ordered[:limit]
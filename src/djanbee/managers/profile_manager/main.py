@@ -0,0 +1,213 @@
+import json
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Union
+
+from ..os_manager import OSManager
+from .import_time import ImportProfile, parse_importtime
+from .live import LiveProfile, merge_collapsed, parse_collapsed
+
+
+@dataclass
+class ImportRegression:
+    """A package whose import cost grew compared to the baseline"""
+
+    name: str
+    baseline_us: int
+    current_us: int
+
+    @property
+    def delta_us(self) -> int:
+        return self.current_us - self.baseline_us
+
+
+class ProfileManager:
+    """
+    Manager responsible for measuring where the deployed application spends
+    its start-up time.
+
+    Gunicorn imports the whole project in every worker (or once with
+    preload), so import cost sets restart and scale-up latency. Where
+    running workers spend their time is sampled by the live profiler hook
+    of their Gunicorn config.
+    """
+
+    BASELINE_FILE = Path(".djanbee") / "import_baseline.json"
+    # A package regresses when it got this much slower, relatively and absolutely
+    REGRESSION_RATIO = 0.2
+    REGRESSION_MIN_US = 5000
+    RUN_DIR = Path("/run/gunicorn")
+    # Ignored by Gunicorn and by default; the live profiler hook samples on it
+    LIVE_SIGNAL = "URG"
+    # Seconds the workers get to write their stacks once sampling is over
+    LIVE_GRACE = 5.0
+
+    def __init__(self, os_manager: OSManager):
+        """
+        Initialize with references to other managers.
+
+        Args:
+            os_manager: OSManager instance for OS operations
+        """
+        self.os_manager = os_manager
+
+    def profile_imports(
+        self,
+        project_path: Union[str, Path],
+        venv_path: Union[str, Path],
+        runs: int = 3,
+    ) -> ImportProfile:
+        """
+        Run `manage.py check` under `-X importtime` and parse the import tree.
+
+        Args:
+            project_path: Directory containing manage.py
+            venv_path: Virtual environment of the project
+            runs: Number of runs; each module keeps its fastest time
+
+        Raises:
+            RuntimeError: If no import timings could be collected
+        """
+        project_path = Path(project_path)
+        profiles = []
+        for _ in range(max(runs, 1)):
+            result = self.os_manager.run_python_command(
+                ["-X", "importtime", "manage.py", "check"],
+                venv_path=Path(venv_path),
+                cwd=project_path,
+            )
+            # System check errors still import the whole project, so a
+            # failed check is only fatal when nothing was measured
+            profile = parse_importtime(result.stderr)
+            if not profile.roots:
+                raise RuntimeError(result.stderr or "manage.py check produced no import timings")
+            profiles.append(profile)
+        return ImportProfile.merge_min(profiles)
+
+    def get_baseline_path(self, project_path: Union[str, Path]) -> Path:
+        return Path(project_path) / self.BASELINE_FILE
+
+    def load_baseline(self, project_path: Union[str, Path]) -> Optional[dict]:
+        """Return the stored baseline of the project, if any"""
+        path = self.get_baseline_path(project_path)
+        try:
+            return json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+
+    def save_baseline(self, project_path: Union[str, Path], profile: ImportProfile) -> Path:
+        """Store the profile's per-package totals as the new baseline"""
+        path = self.get_baseline_path(project_path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        baseline = {
+            "created": time.time(),
+            "total_us": profile.total_us,
+            "packages": {group.name: group.self_us for group in profile.by_package()},
+        }
+        path.write_text(json.dumps(baseline, indent=2), encoding="utf-8")
+        return path
+
+    def find_regressions(
+        self, profile: ImportProfile, baseline: dict
+    ) -> List[ImportRegression]:
+        """
+        Compare a profile with a baseline.
+
+        Packages that are new since the baseline count from zero, so a newly
+        added heavy dependency is reported too.
+        """
+        regressions = []
+        candidates = [("total", baseline.get("total_us", 0), profile.total_us)]
+        previous = baseline.get("packages", {})
+        candidates += [
+            (group.name, previous.get(group.name, 0), group.self_us)
+            for group in profile.by_package()
+        ]
+        for name, before, after in candidates:
+            if (
+                after - before >= self.REGRESSION_MIN_US
+                and after > before * (1 + self.REGRESSION_RATIO)
+            ):
+                regressions.append(ImportRegression(name, before, after))
+        return sorted(regressions, key=lambda r: r.delta_us, reverse=True)
+
+    def get_live_control_path(self, config_name: str) -> Path:
+        # Must match LIVE_PROFILE_CONTROL in the rendered Gunicorn config
+        return self.RUN_DIR / f"{config_name}.profile"
+
+    def get_live_output_dir(self, config_name: str) -> Path:
+        return self.RUN_DIR / f"{config_name}-profile"
+
+    def start_live_profile(
+        self, config_name: str, workers: List[int], duration: float, rate: int
+    ) -> int:
+        """
+        Ask the workers of services using a Gunicorn config to sample their
+        stacks `rate` times a second for `duration` seconds.
+
+        Returns:
+            Number of workers signalled
+
+        Raises:
+            RuntimeError: If the control file cannot be written
+        """
+        self.cleanup_live_profile(config_name)
+        request = {
+            "duration": duration,
+            "rate": rate,
+            "output": str(self.get_live_output_dir(config_name)),
+        }
+        result = self.os_manager.write_text_file(
+            self.get_live_control_path(config_name), json.dumps(request), sudo=True
+        )
+        if not result.success:
+            raise RuntimeError(result.stderr)
+        return sum(
+            1 for pid in workers if self.os_manager.send_signal(pid, self.LIVE_SIGNAL).success
+        )
+
+    def collect_live_profile(
+        self, expected: Dict[str, int], duration: float, poll: float = 0.5
+    ) -> LiveProfile:
+        """
+        Wait for the stacks of the signalled workers and merge them.
+
+        Args:
+            expected: Config name -> workers signalled for it
+            duration: Seconds the workers sample for
+            poll: Seconds between looks at the output directories
+
+        Returns:
+            The stacks of the workers that answered in time
+        """
+        deadline = time.monotonic() + duration + self.LIVE_GRACE
+        while True:
+            files = {
+                name: sorted(self.get_live_output_dir(name).glob("*.folded")) for name in expected
+            }
+            done = all(len(files[name]) >= count for name, count in expected.items())
+            if done or time.monotonic() >= deadline:
+                break
+            time.sleep(poll)
+
+        stacks = []
+        for paths in files.values():
+            for path in paths:
+                try:
+                    stacks.append(parse_collapsed(path.read_text(encoding="utf-8")))
+                except OSError:
+                    continue
+        return LiveProfile(merge_collapsed(stacks), len(stacks))
+
+    def cleanup_live_profile(self, config_name: str) -> None:
+        """Remove the control file and the stacks of a previous run"""
+        self.os_manager.run_command(
+            [
+                "rm",
+                "-rf",
+                str(self.get_live_control_path(config_name)),
+                str(self.get_live_output_dir(config_name)),
+            ],
+            sudo=True,
+        )
@@ -0,0 +1,3 @@
+from .main import ReadinessManager, ReadinessResult, ColdStartRegression
+
+__all__ = ["ReadinessManager", "ReadinessResult", "ColdStartRegression"]
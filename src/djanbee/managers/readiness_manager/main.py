@@ -0,0 +1,166 @@
+import http.client
+import json
+import statistics
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable, List, Optional, Union
+
+from ..os_manager import OSManager
+from ..reload_manager import RequestProbe
+
+
+@dataclass
+class ReadinessResult:
+    """Outcome of waiting for a service to serve a healthy response"""
+
+    ready: bool
+    status: Optional[int] = None
+    attempts: int = 0
+    waited: float = 0.0
+    # Seconds from the unit starting to the first healthy response, when
+    # the service was started by this deploy
+    cold_start: Optional[float] = None
+    error: str = ""
+
+
+@dataclass
+class ColdStartRegression:
+    """A cold start noticeably slower than the recent ones"""
+
+    seconds: float
+    median: float
+
+
+class ReadinessManager:
+    """
+    Manager responsible for deciding when a started service can take traffic.
+
+    `systemctl start` returns once Gunicorn has forked, before any worker
+    has imported the application, so an import error only shows up later.
+    Sending real HTTP requests over the socket is the only reliable signal.
+    """
+
+    HISTORY_FILE = Path(".djanbee") / "cold_starts.json"
+    HISTORY_LIMIT = 50
+    TIMEOUT = 60.0
+    INITIAL_DELAY = 0.05
+    MAX_DELAY = 2.0
+    # A cold start regresses when it is this much slower than the median of
+    # the previous ones, relatively and absolutely
+    REGRESSION_WINDOW = 10
+    REGRESSION_RATIO = 0.25
+    REGRESSION_MIN = 0.5
+
+    def __init__(self, os_manager: OSManager):
+        """
+        Initialize with references to other managers.
+
+        Args:
+            os_manager: OSManager instance for OS operations
+        """
+        self.os_manager = os_manager
+
+    def wait_until_ready(
+        self,
+        socket_path: Union[str, Path],
+        health_path: str = "/",
+        host: str = "localhost",
+        service: Optional[str] = None,
+        started_at: Optional[float] = None,
+        timeout: float = None,
+    ) -> ReadinessResult:
+        """
+        Poll a unix socket with exponential backoff until the application
+        answers. Any status below 500 means a worker has loaded it: a 404
+        for a site without a view at `/` or a 400 for a host outside
+        ALLOWED_HOSTS comes from Django itself.
+
+        Args:
+            socket_path: Socket the application server binds
+            health_path: Path to request, e.g. a dedicated /healthz view
+            host: Host header, e.g. from probe_host()
+            service: Unit to watch, so a crashed service fails fast
+            started_at: time.monotonic() value the unit started at, used
+                for the cold start time
+            timeout: Seconds to wait before giving up
+        """
+        timeout = self.TIMEOUT if timeout is None else timeout
+        probe = RequestProbe(socket_path=str(socket_path), host_header=host, path=health_path)
+        began = time.monotonic()
+        deadline = began + timeout
+        delay = self.INITIAL_DELAY
+        result = ReadinessResult(ready=False)
+
+        while True:
+            result.attempts += 1
+            try:
+                result.status = probe.request()
+                result.error = ""
+            except (OSError, http.client.HTTPException) as e:
+                result.status = None
+                result.error = f"{type(e).__name__}: {e}"
+
+            now = time.monotonic()
+            if result.status is not None and result.status < 500:
+                result.ready = True
+                result.waited = now - began
+                if started_at is not None:
+                    result.cold_start = now - started_at
+                return result
+
+            if service and not self.os_manager.check_service_status(service):
+                result.error = f"{service} is not running"
+                break
+            if now + delay > deadline:
+                break
+            time.sleep(delay)
+            delay = min(delay * 2, self.MAX_DELAY)
+
+        result.waited = time.monotonic() - began
+        if not result.error and result.status is not None:
+            result.error = f"{health_path} answered HTTP {result.status}"
+        return result
+
+    def probe_host(self, allowed_hosts: Optional[Iterable[str]]) -> str:
+        """Host header Django accepts: the first concrete ALLOWED_HOSTS entry"""
+        for host in allowed_hosts or ():
+            # '.example.com' matches example.com and its subdomains
+            host = str(host).lstrip(".")
+            if host and host != "*":
+                return host
+        return "localhost"
+
+    def get_history_path(self, project_path: Union[str, Path]) -> Path:
+        return Path(project_path) / self.HISTORY_FILE
+
+    def load_history(self, project_path: Union[str, Path]) -> List[dict]:
+        """Recorded cold starts of a project, oldest first"""
+        try:
+            history = json.loads(self.get_history_path(project_path).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return []
+        return history if isinstance(history, list) else []
+
+    def record_cold_start(
+        self, project_path: Union[str, Path], seconds: float, release: Optional[str] = None
+    ) -> List[dict]:
+        """Append a cold start to the project's history and return the history"""
+        history = self.load_history(project_path)
+        history.append({"time": time.time(), "seconds": round(seconds, 3), "release": release})
+        history = history[-self.HISTORY_LIMIT:]
+        path = self.get_history_path(project_path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(history, indent=2), encoding="utf-8")
+        return history
+
+    def find_regression(self, history: List[dict]) -> Optional[ColdStartRegression]:
+        """Compare the latest cold start with the median of the ones before it"""
+        if len(history) < 2:
+            return None
+        latest = history[-1]["seconds"]
+        previous = [entry["seconds"] for entry in history[-self.REGRESSION_WINDOW - 1:-1]]
+        median = statistics.median(previous)
+        if latest - median >= self.REGRESSION_MIN and latest > median * (1 + self.REGRESSION_RATIO):
+            return ColdStartRegression(latest, median)
+        return None
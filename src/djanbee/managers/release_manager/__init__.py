@@ -0,0 +1,3 @@
+from .main import ReleaseManager, Release
+
+__all__ = ["ReleaseManager", "Release"]
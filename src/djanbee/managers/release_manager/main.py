@@ -0,0 +1,249 @@
+import os
+import shutil
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, List, Optional, Tuple, TypeVar, Union
+
+from ..os_manager import OSManager
+from ..sync_manager import SyncManager, SyncReport
+
+T = TypeVar("T")
+
+
+@dataclass
+class Release:
+    """One directory under releases/"""
+
+    name: str
+    path: Path
+    active: bool = False
+
+
+class ReleaseManager:
+    """
+    Manager responsible for the release layout of a deployed project.
+
+        /var/www/<project>/
+            releases/20240101120000/
+            releases/20240102093000/
+            current -> releases/20240102093000
+
+    A new release starts as a hardlinked copy of the active one, so only
+    changed files take new space and copy time. Switching releases renames
+    a prepared symlink over `current`, which is atomic: every process sees
+    either the old or the new release, never a mix.
+    """
+
+    RELEASES_DIR = "releases"
+    CURRENT_LINK = "current"
+    TIMESTAMP_FORMAT = "%Y%m%d%H%M%S"
+    KEEP_RELEASES = 5
+    # Marks releases `djanbee watch` made, which pruning does not keep
+    WATCH_SUFFIX = "-watch"
+
+    def __init__(self, os_manager: OSManager, sync_manager: SyncManager):
+        """
+        Initialize with references to other managers.
+
+        Args:
+            os_manager: OSManager instance for OS operations
+            sync_manager: SyncManager used to copy the project into a release
+        """
+        self.os_manager = os_manager
+        self.sync_manager = sync_manager
+
+    def get_current_path(self, base: Union[str, Path]) -> Path:
+        """Path of the `current` symlink, the stable path services run from"""
+        return Path(base) / self.CURRENT_LINK
+
+    def list_releases(self, base: Union[str, Path]) -> List[Release]:
+        """Releases of a project, oldest first"""
+        releases_dir = Path(base) / self.RELEASES_DIR
+        if not releases_dir.is_dir():
+            return []
+        active = self.get_active_release(base)
+        return [
+            Release(path.name, path, path.name == active)
+            for path in sorted(releases_dir.iterdir())
+            if path.is_dir() and not path.name.startswith(".")
+        ]
+
+    def get_active_release(
+        self, base: Union[str, Path], link_name: str = None
+    ) -> Optional[str]:
+        """Name of the release `current` (or another link) points to"""
+        current = Path(base) / (link_name or self.CURRENT_LINK)
+        if not current.is_symlink():
+            return None
+        return Path(os.readlink(current)).name
+
+    def create_release(
+        self,
+        source: Union[str, Path],
+        base: Union[str, Path],
+        owner: Optional[str] = None,
+        suffix: str = "",
+    ) -> Tuple[Release, SyncReport]:
+        """
+        Build a new release from the project tree without activating it.
+
+        Args:
+            source: Project tree to deploy
+            base: Project directory in the web root
+            owner: 'user:group' for copied files
+            suffix: Appended to the release name, e.g. WATCH_SUFFIX
+
+        Returns:
+            Tuple of (new release, sync report)
+        """
+
+        def populate(staging: Path, final: Path, active: Optional[Path]) -> SyncReport:
+            if active:
+                self.link_tree(active, staging)
+            return self.sync_manager.sync(source, staging, owner=owner)
+
+        return self.build_release(base, populate, suffix)
+
+    def build_release(
+        self,
+        base: Union[str, Path],
+        populate: Callable[[Path, Path, Optional[Path]], T],
+        suffix: str = "",
+    ) -> Tuple[Release, T]:
+        """
+        Create a release from a staging directory filled by `populate`.
+
+        populate(staging, final_path, active_release_path) runs against a
+        hidden directory that is renamed into place only once it returns,
+        so a failed build never leaves a half-written release behind.
+
+        Returns:
+            Tuple of (new release, whatever populate returned)
+        """
+        base = Path(base)
+        releases_dir = base / self.RELEASES_DIR
+        releases_dir.mkdir(parents=True, exist_ok=True)
+
+        name = time.strftime(self.TIMESTAMP_FORMAT, time.gmtime()) + suffix
+        attempt = 1
+        while (releases_dir / name).exists():
+            name = f"{time.strftime(self.TIMESTAMP_FORMAT, time.gmtime())}{suffix}-{attempt}"
+            attempt += 1
+
+        staging = releases_dir / f".{name}.partial"
+        shutil.rmtree(staging, ignore_errors=True)
+        active = self.get_active_release(base)
+        active_path = releases_dir / active if active and (releases_dir / active).is_dir() else None
+        try:
+            staging.mkdir()
+            result = populate(staging, releases_dir / name, active_path)
+            os.rename(staging, releases_dir / name)
+        except Exception:
+            shutil.rmtree(staging, ignore_errors=True)
+            raise
+        return Release(name, releases_dir / name), result
+
+    def activate(self, base: Union[str, Path], name: str, link_name: str = None) -> Release:
+        """
+        Point `current` (or another link, e.g. a blue/green colour) at a
+        release by renaming a new symlink over it.
+
+        Raises:
+            FileNotFoundError: If the release does not exist
+        """
+        base = Path(base)
+        target = base / self.RELEASES_DIR / name
+        if not target.is_dir():
+            raise FileNotFoundError(f"Release not found: {name}")
+
+        link_name = link_name or self.CURRENT_LINK
+        current = base / link_name
+        if current.exists() and not current.is_symlink():
+            raise FileExistsError(
+                f"{current} is a directory, move it away to switch to releases"
+            )
+
+        temporary = base / f".{link_name}.{os.getpid()}"
+        if temporary.is_symlink():
+            temporary.unlink()
+        # Relative target keeps the layout valid if the base directory moves
+        os.symlink(Path(self.RELEASES_DIR) / name, temporary)
+        os.replace(temporary, current)
+        return Release(name, target, link_name == self.CURRENT_LINK)
+
+    def rollback(
+        self, base: Union[str, Path], name: Optional[str] = None, link_name: str = None
+    ) -> Release:
+        """
+        Activate the given release, or the one before the active release,
+        on `current` or another link.
+
+        Raises:
+            ValueError: If there is no earlier release to roll back to
+        """
+        if name:
+            return self.activate(base, name, link_name)
+
+        releases = self.list_releases(base)
+        names = [release.name for release in releases]
+        active = self.get_active_release(base, link_name)
+        if active not in names:
+            raise ValueError("No active release to roll back from")
+        index = names.index(active)
+        if index == 0:
+            raise ValueError(f"{active} is the oldest release, nothing to roll back to")
+        return self.activate(base, names[index - 1], link_name)
+
+    def prune(self, base: Union[str, Path], keep: int = None) -> List[str]:
+        """
+        Delete the oldest releases beyond `keep`, never one a link points to.
+        Watch releases do not count towards `keep` and are deleted as soon
+        as no link points to them, so a watch session never pushes out the
+        deploys `rollback` returns to.
+        """
+        keep = self.KEEP_RELEASES if keep is None else keep
+        releases = self.list_releases(base)
+        deployed = [r for r in releases if self.WATCH_SUFFIX not in r.name]
+        watched = [r for r in releases if self.WATCH_SUFFIX in r.name]
+        if len(deployed) <= keep and not watched:
+            return []
+        linked = {
+            Path(os.readlink(path)).name for path in Path(base).iterdir() if path.is_symlink()
+        }
+        removable = sorted(
+            (r for r in deployed[: max(len(deployed) - keep, 0)] + watched if r.name not in linked),
+            key=lambda r: r.name,
+        )
+        for release in removable:
+            shutil.rmtree(release.path, ignore_errors=True)
+        return [release.name for release in removable]
+
+    def link_tree(self, source: Path, destination: Path) -> None:
+        """
+        Recreate a tree with every regular file hardlinked to the original.
+
+        Safe because the sync replaces changed files by renaming a new copy
+        into place, which gives the new release its own inode.
+        """
+        for current, dirs, files in os.walk(source):
+            current = Path(current)
+            target_dir = destination / current.relative_to(source)
+            target_dir.mkdir(parents=True, exist_ok=True)
+            shutil.copymode(current, target_dir)
+
+            for name in list(dirs):
+                if (current / name).is_symlink():
+                    dirs.remove(name)
+                    files.append(name)
+
+            for name in files:
+                src = current / name
+                dst = target_dir / name
+                if src.is_symlink():
+                    os.symlink(os.readlink(src), dst)
+                    continue
+                try:
+                    os.link(src, dst)
+                except OSError:
+                    shutil.copy2(src, dst)
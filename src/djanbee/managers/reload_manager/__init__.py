@@ -0,0 +1,4 @@
+from .main import ReloadManager, ReloadReport
+from .probe import ProbeResult, RequestProbe
+
+__all__ = ["ReloadManager", "ReloadReport", "ProbeResult", "RequestProbe"]
@@ -0,0 +1,367 @@
+import os
+import re
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, List, Optional, Tuple, Union
+
+from ..os_manager import OSManager
+from .probe import ProbeResult, RequestProbe
+
+PRELOAD_SETTING = re.compile(r"^preload_app\s*=\s*True\s*$", re.MULTILINE)
+
+# States of the sockets in /proc/net/unix sharing a listener's path
+UNIX_QUEUED = "02"
+UNIX_ACCEPTED = "03"
+
+
+@dataclass
+class ReloadReport:
+    """Outcome of reloading one service"""
+
+    service: str
+    mode: str
+    success: bool
+    message: str = ""
+    old_pids: List[int] = field(default_factory=list)
+    new_pids: List[int] = field(default_factory=list)
+    duration: float = 0.0
+    probe: Optional[ProbeResult] = None
+
+    @property
+    def lost(self) -> Optional[int]:
+        return self.probe.lost if self.probe else None
+
+    def summary(self) -> str:
+        text = (
+            f"{self.service} {self.mode} in {self.duration:.1f}s, "
+            f"workers {len(self.old_pids)} -> {len(self.new_pids)}"
+        )
+        if self.probe:
+            text += f", {self.probe.lost} of {self.probe.sent} probe requests lost"
+        else:
+            text += ", not probed"
+        if self.message:
+            text += f" ({self.message})"
+        return text
+
+
+def child_pids(pid: int) -> List[int]:
+    """Direct children of a process, read from /proc"""
+    if not pid:
+        return []
+    children = []
+    for entry in os.scandir("/proc"):
+        if not entry.name.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry.name}/stat", "rb") as f:
+                stat = f.read()
+        except OSError:
+            continue
+        # The command name may contain spaces; fields resume after its ')'
+        fields = stat[stat.rfind(b")") + 2:].split()
+        if len(fields) > 1 and int(fields[1]) == pid:
+            children.append(int(entry.name))
+    return sorted(children)
+
+
+def pid_alive(pid: int) -> bool:
+    return bool(pid) and Path(f"/proc/{pid}").exists()
+
+
+def count_unix_connections(
+    socket_path: Union[str, Path], states: Tuple[str, ...] = (UNIX_QUEUED, UNIX_ACCEPTED)
+) -> int:
+    """
+    Open connections to a listening unix socket, queued and accepted.
+
+    Both carry the listener's path in /proc/net/unix. A connection still
+    waiting in the accept queue is in state 02 and one a worker accepted
+    in state 03, as opposed to the listener itself (01).
+    """
+    socket_path = str(socket_path)
+    try:
+        with open("/proc/net/unix") as f:
+            lines = f.read().splitlines()[1:]
+    except OSError:
+        return 0
+    count = 0
+    for line in lines:
+        fields = line.split()
+        if len(fields) >= 8 and fields[7] == socket_path and fields[5] in states:
+            count += 1
+    return count
+
+
+class ReloadManager:
+    """
+    Manager responsible for applying new code and configuration to running
+    services without dropping connections.
+
+    Nginx and Gunicorn both keep their listening sockets open across a
+    reload, so requests arriving during the switch queue in the socket
+    backlog instead of being refused. A restart closes the sockets and
+    loses them.
+    """
+
+    NGINX_SERVICE = "nginx"
+    GUNICORN_RUN_DIR = Path("/run/gunicorn")
+    GUNICORN_CONFIG_DIR = Path("/etc/gunicorn")
+    WAIT_TIMEOUT = 60.0
+    POLL_INTERVAL = 0.1
+
+    def __init__(self, os_manager: OSManager):
+        """
+        Initialize with references to other managers.
+
+        Args:
+            os_manager: OSManager instance for OS operations
+        """
+        self.os_manager = os_manager
+
+    def get_socket_path(self, project_name: str) -> Path:
+        return self.GUNICORN_RUN_DIR / f"{project_name}.sock"
+
+    def get_pid_file(self, project_name: str) -> Path:
+        return self.GUNICORN_RUN_DIR / f"{project_name}.pid"
+
+    def is_preloaded(self, project_name: str) -> bool:
+        """Whether the project's gunicorn.conf.py loads the application in the master"""
+        # The numbered instances of a project share its config
+        config_dir = self.GUNICORN_CONFIG_DIR / project_name.partition("@")[0]
+        try:
+            text = (config_dir / "gunicorn.conf.py").read_text()
+        except OSError:
+            return False
+        return bool(PRELOAD_SETTING.search(text))
+
+    def reload_nginx(self, server_name: str = "localhost", port: int = 80) -> ReloadReport:
+        """
+        Reload Nginx gracefully.
+
+        The master re-reads its configuration and starts a new generation of
+        workers; old workers stop accepting and exit once their open
+        requests finish. A stopped Nginx is started instead.
+        """
+        if not self.os_manager.check_service_status(self.NGINX_SERVICE):
+            return self._start(self.NGINX_SERVICE)
+
+        started = time.perf_counter()
+        master = self.os_manager.get_service_main_pid(self.NGINX_SERVICE)
+        old = child_pids(master)
+        probe = self._start_probe(RequestProbe(port=port, host_header=server_name))
+
+        result = self.os_manager.reload_service(self.NGINX_SERVICE)
+        if not result.success:
+            result = self.os_manager.run_command(["nginx", "-s", "reload"], sudo=True)
+        if not result.success:
+            return self._finish(
+                ReloadReport(self.NGINX_SERVICE, "reload", False, result.stderr, old, old),
+                probe,
+                started,
+            )
+
+        # Without a readable master pid there is nothing to watch; the
+        # reload command itself has already validated the configuration
+        generation = self._wait_for(lambda: set(child_pids(master)) - set(old)) if master else True
+        new = [pid for pid in child_pids(master) if pid not in old]
+        draining = len([pid for pid in old if pid_alive(pid)])
+        report = ReloadReport(
+            self.NGINX_SERVICE,
+            "reload",
+            bool(generation),
+            "" if generation else "no new worker generation appeared",
+            old,
+            new,
+        )
+        if draining and generation:
+            report.message = f"{draining} old workers still finishing requests"
+        return self._finish(report, probe, started)
+
+    def reload_gunicorn(
+        self, project_name: str, upgrade: bool = False, start: bool = False
+    ) -> ReloadReport:
+        """
+        Replace the Gunicorn workers of a project.
+
+        The default HUP makes the master re-read its configuration and
+        replace its workers with ones importing the current release, while
+        the master and its socket stay. Requests that arrive while the new
+        workers import the application wait in the socket backlog.
+
+        With `upgrade`, USR2 starts a second master from the (possibly new)
+        Gunicorn binary and virtual environment. Old workers are retired
+        with WINCH only after the new master's workers answer, and the old
+        master is then stopped; systemd follows the change through the
+        unit's PIDFile. Use it when the interpreter or Gunicorn changed.
+        A preloading master holds the application itself and would hand
+        the old code to new workers after a HUP, so it is always upgraded.
+        A socket-activated service is restarted instead: systemd keeps
+        its listening socket open, so requests queue in the backlog while
+        the new master boots.
+
+        A service that is not running is only started with `start`: a
+        project's service stays stopped once blue/green colours took over.
+        """
+        service = f"gunicorn-{project_name}"
+        if not self.os_manager.check_service_status(service):
+            if start:
+                return self._start(service)
+            return ReloadReport(service, "hup", False, "is not running")
+
+        upgrade = upgrade or self.is_preloaded(project_name)
+        started = time.perf_counter()
+        master = self.os_manager.get_service_main_pid(service)
+        old = child_pids(master)
+        socket_path = self.get_socket_path(project_name)
+        probe = self._start_probe(RequestProbe(socket_path=str(socket_path)))
+
+        if upgrade and self.os_manager.check_service_status(f"{service}.socket"):
+            report = self._restart_gunicorn(service, old, probe)
+        elif upgrade:
+            report = self._upgrade_gunicorn(service, project_name, master, old, probe)
+        else:
+            report = self._hup_gunicorn(service, master, old, probe)
+        return self._finish(report, probe, started)
+
+    def wait_for_drain(self, socket_path: Union[str, Path], timeout: float = None) -> int:
+        """
+        Wait until no connections remain queued or open on a socket Nginx
+        no longer sends new requests to.
+
+        Returns:
+            Connections still open when the wait ended, 0 when fully drained
+        """
+        if self._wait_for(lambda: count_unix_connections(socket_path) == 0, timeout):
+            return 0
+        return count_unix_connections(socket_path)
+
+    # Private methods
+
+    def _hup_gunicorn(
+        self, service: str, master: int, old: List[int], probe: Optional[RequestProbe]
+    ) -> ReloadReport:
+        result = self.os_manager.reload_service(service)
+        if not result.success:
+            return ReloadReport(service, "hup", False, result.stderr, old, old)
+
+        def replaced():
+            workers = child_pids(master)
+            return (
+                len(workers) >= len(old)
+                and not set(workers) & set(old)
+                and self._answers(probe)
+            )
+
+        if not self._wait_for(replaced):
+            return ReloadReport(
+                service, "hup", False, "workers were not replaced in time", old, child_pids(master)
+            )
+        return ReloadReport(service, "hup", True, "", old, child_pids(master))
+
+    def _upgrade_gunicorn(
+        self,
+        service: str,
+        project_name: str,
+        master: int,
+        old: List[int],
+        probe: Optional[RequestProbe],
+    ) -> ReloadReport:
+        pid_file = self.get_pid_file(project_name)
+        result = self.os_manager.send_signal(master, "USR2")
+        if not result.success:
+            return ReloadReport(service, "upgrade", False, result.stderr, old, old)
+
+        # The new master writes the pid file and renames the old one to .oldbin
+        new_master = self._wait_for(
+            lambda: (pid := self._read_pid(pid_file)) != master and pid_alive(pid) and pid
+        )
+        if not new_master:
+            return ReloadReport(
+                service, "upgrade", False, "new master did not start", old, old
+            )
+
+        ready = self._wait_for(
+            lambda: len(child_pids(new_master)) >= max(len(old), 1) and self._answers(probe)
+        )
+        if not ready:
+            # Old workers never stopped serving, so abandoning is safe
+            self.os_manager.send_signal(new_master, "QUIT")
+            return ReloadReport(
+                service, "upgrade", False, "new workers did not become ready, kept the old ones",
+                old, old,
+            )
+
+        self.os_manager.send_signal(master, "WINCH")
+        retired = self._wait_for(lambda: not any(pid_alive(pid) for pid in old))
+        self.os_manager.send_signal(master, "QUIT")
+        report = ReloadReport(service, "upgrade", True, "", old, child_pids(new_master))
+        if not retired:
+            report.message = "old workers were still finishing requests when the old master quit"
+        return report
+
+    def _restart_gunicorn(
+        self, service: str, old: List[int], probe: Optional[RequestProbe]
+    ) -> ReloadReport:
+        result = self.os_manager.restart_service(service)
+        if not result.success:
+            return ReloadReport(service, "restart", False, result.stderr, old, old)
+
+        master = self.os_manager.get_service_main_pid(service)
+        ready = self._wait_for(
+            lambda: len(child_pids(master)) >= max(len(old), 1) and self._answers(probe)
+        )
+        return ReloadReport(
+            service,
+            "restart",
+            bool(ready),
+            "" if ready else "new workers did not answer in time",
+            old,
+            child_pids(master),
+        )
+
+    def _start(self, service: str) -> ReloadReport:
+        started = time.perf_counter()
+        result = self.os_manager.start_service(service)
+        return ReloadReport(
+            service,
+            "start",
+            result.success,
+            "was not running" if result.success else result.stderr,
+            duration=time.perf_counter() - started,
+        )
+
+    def _start_probe(self, probe: RequestProbe) -> Optional[RequestProbe]:
+        """Start probing if the endpoint currently answers at all"""
+        if probe.probe_once() is not None:
+            return None
+        probe.start()
+        return probe
+
+    def _answers(self, probe: Optional[RequestProbe]) -> bool:
+        return probe is None or probe.probe_once() is None
+
+    def _finish(
+        self, report: ReloadReport, probe: Optional[RequestProbe], started: float
+    ) -> ReloadReport:
+        if probe:
+            report.probe = probe.stop()
+        report.duration = time.perf_counter() - started
+        return report
+
+    def _wait_for(self, condition: Callable, timeout: float = None):
+        """Poll until condition returns something truthy or the timeout passes"""
+        deadline = time.monotonic() + (self.WAIT_TIMEOUT if timeout is None else timeout)
+        while True:
+            value = condition()
+            if value or time.monotonic() >= deadline:
+                return value
+            time.sleep(self.POLL_INTERVAL)
+
+    @staticmethod
+    def _read_pid(path: Path) -> int:
+        try:
+            return int(path.read_text().strip())
+        except (OSError, ValueError):
+            return 0
@@ -0,0 +1,117 @@
+# djanbee/managers/reload_manager/probe.py
+
+import http.client
+import socket
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Dict, Optional
+
+# Statuses a proxy returns when no worker answered, i.e. the request was lost
+LOST_STATUSES = {502, 503, 504}
+
+
+class UnixHTTPConnection(http.client.HTTPConnection):
+    """HTTP connection over a unix domain socket, e.g. a Gunicorn bind"""
+
+    def __init__(self, socket_path: str, timeout: float = 5.0):
+        super().__init__("localhost", timeout=timeout)
+        self.socket_path = socket_path
+
+    def connect(self):
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.settimeout(self.timeout)
+        self.sock.connect(self.socket_path)
+
+
+@dataclass
+class ProbeResult:
+    """Requests sent while a reload was in progress and how many failed."""
+
+    sent: int = 0
+    lost: int = 0
+    errors: Dict[str, int] = field(default_factory=dict)
+    slowest: float = 0.0
+
+
+class RequestProbe:
+    """
+    Sends a steady stream of requests from a background thread.
+
+    Any status the application returns counts as served, including 400
+    for a disallowed host; only refused, reset or timed out connections
+    and gateway errors count as lost.
+    """
+
+    def __init__(
+        self,
+        socket_path: Optional[str] = None,
+        host: str = "127.0.0.1",
+        port: int = 80,
+        host_header: str = "localhost",
+        path: str = "/",
+        interval: float = 0.02,
+        timeout: float = 5.0,
+    ):
+        self.socket_path = socket_path
+        self.host = host
+        self.port = port
+        self.host_header = host_header
+        self.path = path
+        self.interval = interval
+        self.timeout = timeout
+        self.result = ProbeResult()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def request(self) -> int:
+        """
+        Send one request and return its status.
+
+        Raises:
+            OSError: If the connection was refused, reset or timed out
+            http.client.HTTPException: If the response was malformed
+        """
+        if self.socket_path:
+            connection = UnixHTTPConnection(self.socket_path, timeout=self.timeout)
+        else:
+            connection = http.client.HTTPConnection(self.host, self.port, timeout=self.timeout)
+        try:
+            connection.request("GET", self.path, headers={"Host": self.host_header})
+            response = connection.getresponse()
+            response.read()
+            return response.status
+        finally:
+            connection.close()
+
+    def probe_once(self) -> Optional[str]:
+        """Send one request; return None if it was served, else the reason"""
+        try:
+            status = self.request()
+        except (OSError, http.client.HTTPException) as e:
+            return type(e).__name__
+        return f"HTTP {status}" if status in LOST_STATUSES else None
+
+    def start(self) -> None:
+        self._stop.clear()
+        self.result = ProbeResult()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def stop(self) -> ProbeResult:
+        self._stop.set()
+        if self._thread:
+            self._thread.join()
+        return self.result
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            started = time.perf_counter()
+            error = self.probe_once()
+            elapsed = time.perf_counter() - started
+            self.result.sent += 1
+            self.result.slowest = max(self.result.slowest, elapsed)
+            if error:
+                self.result.lost += 1
+                self.result.errors[error] = self.result.errors.get(error, 0) + 1
+            self._stop.wait(self.interval)
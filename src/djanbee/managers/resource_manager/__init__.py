@@ -0,0 +1,29 @@
+from .main import ResourceManager
+from .limits import (
+    DEFAULT_WEIGHT,
+    LIMITS,
+    HostBudget,
+    ResourceLimits,
+    derive_budget,
+    derive_limits,
+    format_size,
+    parse_size,
+    render_slice,
+)
+from .usage import CgroupUsage, read_cgroup_usage, read_pressure
+
+__all__ = [
+    "ResourceManager",
+    "DEFAULT_WEIGHT",
+    "LIMITS",
+    "HostBudget",
+    "ResourceLimits",
+    "derive_budget",
+    "derive_limits",
+    "format_size",
+    "parse_size",
+    "render_slice",
+    "CgroupUsage",
+    "read_cgroup_usage",
+    "read_pressure",
+]
@@ -0,0 +1,206 @@
+# djanbee/managers/resource_manager/limits.py
+
+import re
+import textwrap
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+from ..sizing_manager import HostResources
+from ..sizing_manager.host import MIB
+
+# systemd's own CPUWeight= and IOWeight= default
+DEFAULT_WEIGHT = 100
+
+# Limits a project may set in .djanbee/resources.json, with their types
+LIMITS = {
+    "memory_high": "size",
+    "memory_max": "size",
+    "cpu_weight": int,
+    "cpu_quota": float,
+    "tasks_max": int,
+    "io_weight": int,
+    "limit_nofile": int,
+}
+
+SIZE = re.compile(r"^\s*(\d+(?:\.\d+)?)\s*([KMGT]?)i?B?\s*$", re.IGNORECASE)
+UNITS = {"": 1, "K": 1024, "M": 1024 ** 2, "G": 1024 ** 3, "T": 1024 ** 4}
+
+
+@dataclass
+class HostBudget:
+    """What all djanbee projects on this host may use together"""
+
+    memory: int
+    # CPUs; None leaves the projects every CPU
+    cpus: Optional[float] = None
+    tasks: int = 4096
+    # Open files per process
+    nofile: int = 65536
+    reasons: Dict[str, str] = field(default_factory=dict)
+
+
+@dataclass
+class ResourceLimits:
+    """systemd resource directives of one project"""
+
+    # Above this the kernel reclaims the project's memory and throttles it
+    memory_high: Optional[int] = None
+    # Above this the OOM killer picks a process of the project
+    memory_max: Optional[int] = None
+    cpu_weight: int = DEFAULT_WEIGHT
+    # CPUs, None for no hard cap
+    cpu_quota: Optional[float] = None
+    tasks_max: Optional[int] = None
+    io_weight: int = DEFAULT_WEIGHT
+    limit_nofile: Optional[int] = None
+    # directive -> why it has its value
+    reasons: Dict[str, str] = field(default_factory=dict)
+
+    def named_directives(self) -> List[Tuple[str, str]]:
+        """(field, [Slice] line) of every limit that is set"""
+        directives = []
+        if self.memory_high:
+            directives.append(("memory_high", f"MemoryHigh={format_size(self.memory_high)}"))
+        if self.memory_max:
+            directives.append(("memory_max", f"MemoryMax={format_size(self.memory_max)}"))
+        directives.append(("cpu_weight", f"CPUWeight={self.cpu_weight}"))
+        if self.cpu_quota:
+            directives.append(("cpu_quota", f"CPUQuota={round(self.cpu_quota * 100)}%"))
+        if self.tasks_max:
+            directives.append(("tasks_max", f"TasksMax={self.tasks_max}"))
+        directives.append(("io_weight", f"IOWeight={self.io_weight}"))
+        return directives
+
+    def slice_directives(self) -> List[str]:
+        """[Slice] lines; they cover every service of the project together"""
+        return [directive for _, directive in self.named_directives()]
+
+
+def derive_budget(
+    host: HostResources,
+    pid_max: Optional[int] = None,
+    nr_open: Optional[int] = None,
+    reserve: float = 0.15,
+    overrides: Optional[Dict[str, object]] = None,
+) -> HostBudget:
+    """
+    Budget of the djanbee projects on a host: its memory (or cgroup limit)
+    minus a reserve for Nginx, the database and the system, half the
+    process IDs and up to 65536 open files per process. `overrides` come
+    from the host's budget file.
+    """
+    memory = host.memory_total
+    if host.memory_limit is not None:
+        memory = min(memory, host.memory_limit)
+    budget = HostBudget(_round_down(memory * (1 - reserve), MIB))
+    budget.reasons["memory"] = f"{reserve:.0%} kept for Nginx, databases and the system"
+    if host.cpu_quota is not None:
+        budget.cpus = host.cpu_quota
+        budget.reasons["cpus"] = "cgroup quota around djanbee"
+    else:
+        budget.reasons["cpus"] = "every CPU; weights share them under contention"
+    if pid_max:
+        budget.tasks = max(pid_max // 2, 512)
+        budget.reasons["tasks"] = f"half of kernel.pid_max ({pid_max})"
+    if nr_open:
+        budget.nofile = min(budget.nofile, nr_open)
+
+    for name, value in (overrides or {}).items():
+        if name == "memory":
+            budget.memory = parse_size(value)
+        elif name == "cpus":
+            budget.cpus = float(value) if value else None
+        elif name in ("tasks", "nofile"):
+            setattr(budget, name, int(value))
+        else:
+            continue
+        budget.reasons[name] = "set in the host's budget file"
+    return budget
+
+
+def derive_limits(
+    budget: HostBudget,
+    weight: int = DEFAULT_WEIGHT,
+    total_weight: Optional[int] = None,
+    overrides: Optional[Dict[str, object]] = None,
+) -> ResourceLimits:
+    """
+    Limits of one project from the host budget and its weight.
+
+    Memory and tasks are split in proportion to the weights of all projects
+    on the host. The weight also goes to CPUWeight and IOWeight, which only
+    matter under contention: an idle host lets every project use all of
+    it, a busy one serves the heavier projects first, which keeps their
+    latency steady. MemoryMax leaves room for bursts above the fair share,
+    up to the whole budget.
+    """
+    total_weight = max(total_weight or weight, weight)
+    share = weight / total_weight
+    limits = ResourceLimits(cpu_weight=weight, io_weight=weight)
+    reasons = limits.reasons
+    split = f"weight {weight} of {total_weight} on this host"
+
+    limits.memory_high = _round_down(budget.memory * share, MIB)
+    reasons["memory_high"] = f"{share:.0%} of the {format_size(budget.memory)} budget ({split})"
+    limits.memory_max = min(_round_down(limits.memory_high * 1.5, MIB), budget.memory)
+    reasons["memory_max"] = "half again MemoryHigh for bursts, within the budget"
+    reasons["cpu_weight"] = f"CPU time under contention by {split}"
+    reasons["io_weight"] = f"disk time under contention by {split}"
+    reasons["cpu_quota"] = "no cap, idle CPUs stay usable"
+    limits.tasks_max = max(int(budget.tasks * share), 512)
+    reasons["tasks_max"] = f"{share:.0%} of {budget.tasks} tasks, stops fork storms"
+    limits.limit_nofile = budget.nofile
+    reasons["limit_nofile"] = "sockets of all kept-alive and proxied connections"
+
+    for name, value in (overrides or {}).items():
+        if name not in LIMITS:
+            continue
+        kind = LIMITS[name]
+        setattr(limits, name, parse_size(value) if kind == "size" else kind(value))
+        reasons[name] = "set in .djanbee/resources.json"
+    return limits
+
+
+def render_slice(description: str, directives: List[str]) -> str:
+    """A .slice unit holding the given resource directives"""
+    lines = "\n".join(directives)
+    return (
+        textwrap.dedent(
+            f"""
+            [Unit]
+            Description={description}
+            Before=slices.target
+
+            [Slice]
+            """
+        ).lstrip()
+        + lines
+        + "\n"
+    )
+
+
+def parse_size(value) -> int:
+    """
+    Bytes of a size such as '512M', '2G' or 1073741824.
+
+    Raises:
+        ValueError: For anything else
+    """
+    if isinstance(value, int):
+        return value
+    match = SIZE.match(str(value))
+    if not match:
+        raise ValueError(f"Expected a size such as 512M or 2G, not '{value}'")
+    return int(float(match.group(1)) * UNITS[match.group(2).upper()])
+
+
+def format_size(size: int) -> str:
+    """Size as systemd accepts it, in the largest whole unit"""
+    for suffix in ("T", "G", "M", "K"):
+        if size and size % UNITS[suffix] == 0:
+            return f"{size // UNITS[suffix]}{suffix}"
+    return str(size)
+
+
+def _round_down(value: float, step: int) -> int:
+    return int(value // step * step)
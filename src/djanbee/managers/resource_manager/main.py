@@ -0,0 +1,183 @@
+import json
+import os
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Union
+
+from ..os_manager import OSManager
+from ..sizing_manager import SizingManager
+from .limits import (
+    DEFAULT_WEIGHT,
+    HostBudget,
+    ResourceLimits,
+    derive_budget,
+    derive_limits,
+    format_size,
+    render_slice,
+)
+from .usage import CgroupUsage, read_cgroup_usage
+
+
+class ResourceManager:
+    """
+    Manager responsible for the cgroup limits of each project.
+
+    Every project's services run in a `djanbee-<project>.slice`, so its
+    instances and blue/green colours share one set of limits. The slices
+    sit in `djanbee.slice`, which caps all projects together at the host
+    budget.
+    """
+
+    SYSTEMD_DIR = Path("/etc/systemd/system")
+    CGROUP_ROOT = Path("/sys/fs/cgroup")
+    PARENT_SLICE = "djanbee.slice"
+    BUDGET_FILE = Path("/etc/djanbee/budget.json")
+    SETTINGS_FILE = Path(".djanbee") / "resources.json"
+    # Memory kept out of the budget for Nginx, databases and the system
+    MEMORY_RESERVE = 0.15
+
+    def __init__(self, os_manager: OSManager, sizing_manager: SizingManager):
+        """
+        Initialize with references to other managers.
+
+        Args:
+            os_manager: OSManager instance for OS operations
+            sizing_manager: SizingManager reading the host's CPUs and memory
+        """
+        self.os_manager = os_manager
+        self.sizing_manager = sizing_manager
+
+    def get_slice_id(self, project_name: str) -> str:
+        # A dash in a slice name nests it, so it cannot be part of the project's
+        return project_name.replace("-", "_")
+
+    def get_slice_name(self, project_name: str) -> str:
+        return f"djanbee-{self.get_slice_id(project_name)}.slice"
+
+    def get_slice_path(self, project_name: str) -> Path:
+        return self.SYSTEMD_DIR / self.get_slice_name(project_name)
+
+    def get_cgroup_path(self, project_name: str) -> Path:
+        return self.CGROUP_ROOT / self.PARENT_SLICE / self.get_slice_name(project_name)
+
+    def cgroup_v2(self) -> bool:
+        """Whether the unified hierarchy, which has all these controllers, is mounted"""
+        return (self.CGROUP_ROOT / "cgroup.controllers").exists()
+
+    def list_projects(self) -> List[str]:
+        """Projects with a slice on this host, named as in their slice"""
+        try:
+            names = os.listdir(self.SYSTEMD_DIR)
+        except OSError:
+            return []
+        return sorted(
+            name[len("djanbee-") : -len(".slice")]
+            for name in names
+            if name.startswith("djanbee-") and name.endswith(".slice")
+        )
+
+    def read_weight(self, project_name: str) -> int:
+        """CPUWeight in a project's slice, i.e. the weight it was deployed with"""
+        try:
+            lines = self.get_slice_path(project_name).read_text().splitlines()
+        except OSError:
+            return DEFAULT_WEIGHT
+        for line in lines:
+            key, _, value = line.partition("=")
+            if key.strip() == "CPUWeight" and value.strip().isdigit():
+                return int(value.strip())
+        return DEFAULT_WEIGHT
+
+    def load_settings(self, project_path: Union[str, Path]) -> Dict[str, object]:
+        """The project's weight and the limits it pins"""
+        try:
+            settings = json.loads(
+                (Path(project_path) / self.SETTINGS_FILE).read_text(encoding="utf-8")
+            )
+        except (OSError, ValueError):
+            return {}
+        return settings if isinstance(settings, dict) else {}
+
+    def save_settings(self, project_path: Union[str, Path], settings: Dict[str, object]) -> None:
+        path = Path(project_path) / self.SETTINGS_FILE
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(settings, indent=2, sort_keys=True), encoding="utf-8")
+
+    def load_budget(self) -> HostBudget:
+        """The host's budget, derived from its resources and its budget file"""
+        try:
+            overrides = json.loads(self.BUDGET_FILE.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            overrides = {}
+        return derive_budget(
+            self.sizing_manager.detect_host(),
+            _read_proc_int("/proc/sys/kernel/pid_max"),
+            _read_proc_int("/proc/sys/fs/nr_open"),
+            self.MEMORY_RESERVE,
+            overrides if isinstance(overrides, dict) else {},
+        )
+
+    def limits_for(
+        self, project_name: str, project_path: Union[str, Path], budget: HostBudget = None
+    ) -> ResourceLimits:
+        """Limits of a project, weighed against the other projects on the host"""
+        settings = self.load_settings(project_path)
+        weight = int(settings.get("weight", DEFAULT_WEIGHT))
+        slice_id = self.get_slice_id(project_name)
+        total = weight + sum(
+            self.read_weight(name) for name in self.list_projects() if name != slice_id
+        )
+        return derive_limits(budget or self.load_budget(), weight, total, settings)
+
+    def render_budget_slice(self, budget: HostBudget) -> Tuple[Path, str]:
+        """
+        Render djanbee.slice, which holds all projects to the budget
+
+        Returns:
+            Tuple of (slice_path, content)
+        """
+        directives = [f"MemoryMax={format_size(budget.memory)}", f"TasksMax={budget.tasks}"]
+        if budget.cpus:
+            directives.append(f"CPUQuota={round(budget.cpus * 100)}%")
+        content = render_slice("Projects deployed by djanbee", directives)
+        return self.SYSTEMD_DIR / self.PARENT_SLICE, content
+
+    def render_project_slice(
+        self, project_name: str, limits: ResourceLimits
+    ) -> Tuple[Path, str]:
+        """
+        Render the slice all services of a project run in
+
+        Returns:
+            Tuple of (slice_path, content)
+        """
+        content = render_slice(f"Services of {project_name}", limits.slice_directives())
+        return self.get_slice_path(project_name), content
+
+    def read_usage(self, project_name: str) -> Optional[CgroupUsage]:
+        """What a project's slice currently uses, None if nothing runs in it"""
+        return read_cgroup_usage(self.get_cgroup_path(project_name))
+
+    def read_budget_usage(self) -> Optional[CgroupUsage]:
+        return read_cgroup_usage(self.CGROUP_ROOT / self.PARENT_SLICE)
+
+    def read_service_usage(self, project_name: str) -> Dict[str, CgroupUsage]:
+        """Usage of each service running in a project's slice"""
+        directory = self.get_cgroup_path(project_name)
+        try:
+            names = sorted(os.listdir(directory))
+        except OSError:
+            return {}
+        services = {}
+        for name in names:
+            if name.endswith(".service"):
+                usage = read_cgroup_usage(directory / name)
+                if usage:
+                    services[name[: -len(".service")]] = usage
+        return services
+
+
+def _read_proc_int(path: str) -> Optional[int]:
+    try:
+        return int(Path(path).read_text())
+    except (OSError, ValueError):
+        return None
@@ -0,0 +1,110 @@
+# djanbee/managers/resource_manager/usage.py
+
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Optional
+
+PRESSURE_RESOURCES = ("cpu", "memory", "io")
+
+
+@dataclass
+class CgroupUsage:
+    """What a cgroup v2 directory reports about its processes"""
+
+    path: Path
+    memory_current: int = 0
+    # None when unlimited
+    memory_high: Optional[int] = None
+    memory_max: Optional[int] = None
+    # Seconds of CPU time, and of time held back by CPUQuota
+    cpu_usage: float = 0.0
+    cpu_throttled: float = 0.0
+    cpu_weight: Optional[int] = None
+    io_weight: Optional[int] = None
+    tasks_current: int = 0
+    tasks_max: Optional[int] = None
+    # Times the OOM killer ran, and times usage went over MemoryHigh
+    oom_kills: int = 0
+    high_events: int = 0
+    # resource -> share of the last 10s some task waited on it, in percent
+    pressure: Dict[str, float] = field(default_factory=dict)
+
+
+def read_cgroup_usage(path: Path) -> Optional[CgroupUsage]:
+    """
+    Usage and limits of a cgroup v2 directory under /sys/fs/cgroup.
+
+    Returns:
+        None if the cgroup does not exist, e.g. the slice has no running unit
+    """
+    path = Path(path)
+    if not (path / "cgroup.procs").exists():
+        return None
+    usage = CgroupUsage(path)
+    usage.memory_current = _read_int(path / "memory.current") or 0
+    usage.memory_high = _read_int(path / "memory.high")
+    usage.memory_max = _read_int(path / "memory.max")
+    usage.tasks_current = _read_int(path / "pids.current") or 0
+    usage.tasks_max = _read_int(path / "pids.max")
+    usage.cpu_weight = _read_int(path / "cpu.weight")
+    # io.weight reads "default 100"
+    io_weight = _read_keyed(path / "io.weight").get("default")
+    usage.io_weight = int(io_weight) if io_weight is not None else None
+
+    cpu = _read_keyed(path / "cpu.stat")
+    usage.cpu_usage = cpu.get("usage_usec", 0) / 1e6
+    usage.cpu_throttled = cpu.get("throttled_usec", 0) / 1e6
+    events = _read_keyed(path / "memory.events")
+    usage.oom_kills = events.get("oom_kill", 0)
+    usage.high_events = events.get("high", 0)
+
+    for resource in PRESSURE_RESOURCES:
+        pressure = read_pressure(path / f"{resource}.pressure")
+        if pressure is not None:
+            usage.pressure[resource] = pressure
+    return usage
+
+
+def read_pressure(path: Path) -> Optional[float]:
+    """'some avg10' of a PSI file: percent of the last 10s tasks stalled on the resource"""
+    try:
+        lines = path.read_text().splitlines()
+    except OSError:
+        return None
+    for line in lines:
+        fields = line.split()
+        if fields and fields[0] == "some":
+            for item in fields[1:]:
+                key, _, value = item.partition("=")
+                if key == "avg10":
+                    try:
+                        return float(value)
+                    except ValueError:
+                        return None
+    return None
+
+
+def _read_int(path: Path) -> Optional[int]:
+    """An integer cgroup file; 'max' and missing files read as None"""
+    try:
+        value = path.read_text().strip()
+    except OSError:
+        return None
+    try:
+        return int(value)
+    except ValueError:
+        return None
+
+
+def _read_keyed(path: Path) -> Dict[str, int]:
+    """A flat-keyed cgroup file such as cpu.stat or memory.events"""
+    values = {}
+    try:
+        lines = path.read_text().splitlines()
+    except OSError:
+        return values
+    for line in lines:
+        fields = line.split()
+        if len(fields) == 2 and fields[1].isdigit():
+            values[fields[0]] = int(fields[1])
+    return values
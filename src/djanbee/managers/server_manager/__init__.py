@@ -1,3 +1,4 @@
 from .main import ServerManager
+from .upstream import UpstreamBackend
 
-__all__ = ["ServerManager"]
+__all__ = ["ServerManager", "UpstreamBackend"]
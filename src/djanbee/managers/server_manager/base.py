@@ -1,6 +1,8 @@
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import List, Tuple, Optional
+from typing import Dict, List, Tuple, Optional
+
+from .upstream import UpstreamBackend
 
 
 class BaseServerManager(ABC):
@@ -29,6 +31,11 @@ class BaseServerManager(ABC):
         """Restarts the server"""
         pass
 
+    @abstractmethod
+    def reload_server(self) -> Tuple[bool, str]:
+        """Applies new configuration without dropping connections"""
+        pass
+
     @abstractmethod
     def enable_server(self) -> Tuple[bool, str]:
         """Enables the server to start on boot"""
@@ -63,6 +70,8 @@ class BaseServerManager(ABC):
         server_name: str = "localhost",
         socket_path: Path = None,
         use_sudo: bool = False,
+        upstream: str = None,
+        websockets: bool = False,
     ) -> Tuple[bool, str]:
         """
         Create a server configuration for the given project
@@ -73,12 +82,66 @@ class BaseServerManager(ABC):
             server_name: Server name/domain for the config
             socket_path: Path to the socket file (if applicable)
             use_sudo: Whether to use sudo for file operations
+            upstream: Proxy to this upstream block instead of a single socket
+            websockets: Pass websocket upgrades through to the application
 
         Returns:
             Tuple of (success, message or config_path)
         """
         pass
     @abstractmethod
+    def render_server_config(
+        self,
+        project_name: str,
+        server_name: str = "localhost",
+        socket_path: Path = None,
+        upstream: str = None,
+        websockets: bool = False,
+        next_upstream_tries: int = 0,
+    ) -> Tuple[Path, str]:
+        """Render a project's site configuration without writing it"""
+        pass
+
+    @abstractmethod
+    def get_enabled_path(self, project_name: str) -> Path:
+        """Path that enables the project's site"""
+        pass
+
+    @abstractmethod
+    def get_static_settings(self, project_name: str) -> Dict[str, str]:
+        """Django settings the site's static and media locations rely on"""
+        pass
+
+    @abstractmethod
+    def get_backend_variable(self, project_name: str) -> str:
+        """Variable the site proxies to when traffic goes through upstream groups"""
+        pass
+
+    @abstractmethod
+    def get_release_log_path(self, project_name: str) -> Path:
+        """Access log whose lines name the release that served each request"""
+        pass
+
+    @abstractmethod
+    def render_upstream(
+        self, project_name: str, backends: List[UpstreamBackend]
+    ) -> Tuple[Path, str]:
+        """Render the project's upstream groups without writing them"""
+        pass
+
+    @abstractmethod
+    def write_upstream(
+        self, project_name: str, backends: List[UpstreamBackend]
+    ) -> Tuple[bool, str]:
+        """Split the project's traffic between the given backends"""
+        pass
+
+    @abstractmethod
+    def get_upstream_backends(self, project_name: str) -> List[UpstreamBackend]:
+        """Backends currently configured for the project"""
+        pass
+
+    @abstractmethod
     def check_default_site_exists(self) -> bool:
         """Check if default site exists in sites-enabled."""
         pass
@@ -92,3 +155,8 @@ class BaseServerManager(ABC):
     def test_configuration(self) -> Tuple[bool, str]:
         """Test the Nginx configuration."""
         pass
+
+    @abstractmethod
+    def get_web_user(self) -> str:
+        """Return the system user the web server runs as."""
+        pass
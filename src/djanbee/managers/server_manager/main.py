@@ -1,5 +1,5 @@
 from pathlib import Path
-from typing import Optional, List, Tuple
+from typing import Dict, Optional, List, Tuple
 from collections import namedtuple
 
 from ..os_manager import OSManager
@@ -7,6 +7,7 @@ from ..file_system_manager import FileSystemManager
 from ..console_manager import ConsoleManager
 from ..django_manager import DjangoManager
 from .server_implementations import NginxServerManager
+from .upstream import UpstreamBackend
 from ..os_manager.command import CommandResult
 
 Result = namedtuple("Result", ["valid", "object"])
@@ -53,6 +54,10 @@ class ServerManager:
         """Restarts the server"""
         return self._manager.restart_server()
 
+    def reload_server(self) -> CommandResult:
+        """Reloads the server configuration without dropping connections"""
+        return self._manager.reload_server()
+
     def enable_server(self) -> CommandResult:
         """Enables the server to start on boot"""
         return self._manager.enable_server()
@@ -105,6 +110,8 @@ class ServerManager:
         server_name: str = "localhost",
         socket_path: Path = None,
         use_sudo: bool = False,
+        upstream: str = None,
+        websockets: bool = False,
     ) -> Tuple[bool, str]:
         """
         Create a server configuration for the given project
@@ -115,14 +122,71 @@ class ServerManager:
             server_name: Server name/domain for the config
             socket_path: Path to the socket file (if applicable)
             use_sudo: Whether to use sudo for file operations
+            upstream: Proxy to this upstream block instead of a single socket
+            websockets: Pass websocket upgrades through to the application
 
         Returns:
             Tuple of (success, message or config_path)
         """
         return self._manager.create_server_config(
-            project_path, project_name, server_name, socket_path, use_sudo
+            project_path, project_name, server_name, socket_path, use_sudo, upstream, websockets
+        )
+
+    def render_server_config(
+        self,
+        project_name: str,
+        server_name: str = "localhost",
+        socket_path: Path = None,
+        upstream: str = None,
+        websockets: bool = False,
+        next_upstream_tries: int = 0,
+    ) -> Tuple[Path, str]:
+        """
+        Render a project's site configuration without writing it
+
+        Returns:
+            Tuple of (config_path, content)
+        """
+        return self._manager.render_server_config(
+            project_name, server_name, socket_path, upstream, websockets, next_upstream_tries
         )
 
+    def get_enabled_path(self, project_name: str) -> Path:
+        """Path that enables the project's site"""
+        return self._manager.get_enabled_path(project_name)
+
+    def get_static_settings(self, project_name: str) -> Dict[str, str]:
+        """Django settings the site's static and media locations rely on"""
+        return self._manager.get_static_settings(project_name)
+
+    def get_backend_variable(self, project_name: str) -> str:
+        """Variable the site proxies to when traffic goes through upstream groups"""
+        return self._manager.get_backend_variable(project_name)
+
+    def get_release_log_path(self, project_name: str) -> Path:
+        """Access log whose lines name the release that served each request"""
+        return self._manager.get_release_log_path(project_name)
+
+    def render_upstream(
+        self, project_name: str, backends: List[UpstreamBackend]
+    ) -> Tuple[Path, str]:
+        """
+        Render the project's upstream groups without writing them
+
+        Returns:
+            Tuple of (upstream_path, content)
+        """
+        return self._manager.render_upstream(project_name, backends)
+
+    def write_upstream(
+        self, project_name: str, backends: List[UpstreamBackend]
+    ) -> Tuple[bool, str]:
+        """Split the project's traffic between the given backends"""
+        return self._manager.write_upstream(project_name, backends)
+
+    def get_upstream_backends(self, project_name: str) -> List[UpstreamBackend]:
+        """Backends currently configured for the project"""
+        return self._manager.get_upstream_backends(project_name)
 
     def check_default_site_exists(self) -> bool:
         """Check if default site exists in sites-enabled."""
@@ -134,4 +198,8 @@ class ServerManager:
 
     def test_configuration(self) -> CommandResult:
         """Test the Nginx configuration."""
-        return self._manager.test_configuration()
\ No newline at end of file
+        return self._manager.test_configuration()
+
+    def get_web_user(self) -> str:
+        """Return the system user the web server runs as."""
+        return self._manager.get_web_user()
\ No newline at end of file
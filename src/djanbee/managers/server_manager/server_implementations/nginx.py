@@ -1,7 +1,14 @@
 from pathlib import Path
-from typing import List, Tuple, Optional
+from typing import Dict, List, Tuple, Optional
 import textwrap
 from ..base import BaseServerManager
+from ..upstream import (
+    UpstreamBackend,
+    backend_variable,
+    parse_upstream_config,
+    render_upstream_config,
+    timing_log_format,
+)
 from ...os_manager import OSManager
 from ...file_system_manager import FileSystemManager
 from ...console_manager import ConsoleManager
@@ -48,6 +55,15 @@ class NginxServerManager(BaseServerManager):
         """Restarts the Nginx server"""
         return self.os_manager.restart_service(self.server_name)
 
+    def reload_server(self) -> CommandResult:
+        """
+        Reloads Nginx gracefully, starting it if it is not running.
+        Old workers finish their requests while new ones take over.
+        """
+        if not self.check_server_status():
+            return self.start_server()
+        return self.os_manager.reload_service(self.server_name)
+
     def enable_server(self) -> CommandResult:
         """Enables Nginx to start on boot"""
         return self.os_manager.enable_service(self.server_name)
@@ -64,6 +80,15 @@ class NginxServerManager(BaseServerManager):
         else:
             return "Unknown version"
 
+    def get_web_user(self) -> str:
+        """
+        Gets the user Nginx runs as: nginx on CentOS/RHEL,
+        www-data on Ubuntu/Debian
+        """
+        if self.os_manager.run_command(["id", "-u", "nginx"]).success:
+            return "nginx"
+        return "www-data"
+
     # Additional methods for dependency management
     def get_dependencies(self) -> List[str]:
         """Returns the list of dependencies required by this server"""
@@ -162,6 +187,8 @@ class NginxServerManager(BaseServerManager):
         server_name: str = "localhost",
         socket_path: Path = None,
         use_sudo: bool = False,
+        upstream: str = None,
+        websockets: bool = False,
     ) -> Tuple[bool, str]:
         """
         Create an Nginx server configuration for the given project
@@ -172,6 +199,8 @@ class NginxServerManager(BaseServerManager):
             server_name: Server name/domain for the Nginx config
             socket_path: Path to the Gunicorn socket file (if None, will be derived)
             use_sudo: Whether to use sudo for file operations
+            upstream: Proxy to this upstream block instead of a single socket
+            websockets: Pass websocket upgrades through to the application
 
         Returns:
             Tuple of (success, message or config_path)
@@ -181,19 +210,11 @@ class NginxServerManager(BaseServerManager):
             if not socket_path:
                 socket_path = f"/run/gunicorn/{project_name}.sock"
 
-            # Determine web root path
             web_root = Path(f"/var/www/{project_name}")
             static_path = web_root / "static"
             media_path = web_root / "media"
 
-            # Get the nginx user (typically www-data on Ubuntu/Debian or nginx on CentOS/RHEL)
-            # First check if nginx user exists
-            nginx_user_exists, _ = self.os_manager.run_command(["id", "-u", "nginx"])
-            if nginx_user_exists:
-                web_user = "nginx"
-            else:
-                # Fall back to www-data which is common on Debian/Ubuntu
-                web_user = "www-data"
+            web_user = self.get_web_user()
             # Create necessary directories if they don't exist
             user = self.os_manager.get_username()
             for path in [web_root, static_path, media_path]:
@@ -211,54 +232,29 @@ class NginxServerManager(BaseServerManager):
                     self.os_manager.run_command(chmod_command)
 
             # Also ensure socket file is accessible to Nginx
-            chmod_socket_command = ["sudo", "chmod", "660", str(socket_path)]
-            result, message = self.os_manager.run_command(chmod_socket_command)
-            chown_socket_command = [
-                "sudo",
-                "chown",
-                f"{user}:{web_user}",
-                str(socket_path),
-            ]
-            self.os_manager.run_command(chown_socket_command)
-
-            # Create config file content
-            config_content = (
-                textwrap.dedent(
-                    f"""
-            server {{
-                listen 80;
-                server_name {server_name};
-
-                location = /favicon.ico {{ access_log off; log_not_found off; }}
-                
-                location /static/ {{
-                    alias {static_path}/;
-                }}
-                
-                location /media/ {{
-                    alias {media_path}/;
-                }}
-                
-                location / {{
-                    include proxy_params;
-                    proxy_pass http://unix:{socket_path};
-                }}
-            }}
-            """
-                ).strip()
-                + "\n"
+            if not upstream:
+                chmod_socket_command = ["sudo", "chmod", "660", str(socket_path)]
+                result, message = self.os_manager.run_command(chmod_socket_command)
+                chown_socket_command = [
+                    "sudo",
+                    "chown",
+                    f"{user}:{web_user}",
+                    str(socket_path),
+                ]
+                self.os_manager.run_command(chown_socket_command)
+            config_file_path, config_content = self.render_server_config(
+                project_name, server_name, socket_path, upstream, websockets
             )
 
             # Write the config file
-            config_file_path = Path(f"/etc/nginx/sites-available/{project_name}")
             success, message = self.os_manager.write_text_file(
-                config_file_path, config_content
+                config_file_path, config_content, sudo=use_sudo
             )
             if not success:
                 return False, f"Failed to create Nginx configuration: {message}"
 
             # Create symbolic link to enable the configuration
-            enabled_path = Path(f"/etc/nginx/sites-enabled/{project_name}")
+            enabled_path = self.get_enabled_path(project_name)
             if not self.os_manager.check_file_exists(enabled_path):
                 symlink_command = [
                     "sudo",
@@ -285,7 +281,7 @@ class NginxServerManager(BaseServerManager):
                 return False, f"Nginx configuration test failed: {test_message}"
 
             # Reload Nginx to apply changes
-            reload_success, reload_message = self.restart_server()
+            reload_success, reload_message = self.reload_server()
             self.configure_django_static_settings(project_name)
             if not reload_success:
                 return False, f"Failed to reload Nginx: {reload_message}"
@@ -295,6 +291,125 @@ class NginxServerManager(BaseServerManager):
         except Exception as e:
             return False, f"Error creating Nginx server configuration: {str(e)}"
 
+    def render_server_config(
+        self,
+        project_name: str,
+        server_name: str = "localhost",
+        socket_path: Path = None,
+        upstream: str = None,
+        websockets: bool = False,
+        next_upstream_tries: int = 0,
+    ) -> Tuple[Path, str]:
+        """
+        Render the site configuration of a project without writing it
+
+        Args:
+            next_upstream_tries: Servers of the upstream group a request
+                may be tried on when one refuses or times out; 0 leaves
+                Nginx's default
+
+        Returns:
+            Tuple of (config_path, content)
+        """
+        if not socket_path:
+            socket_path = f"/run/gunicorn/{project_name}.sock"
+        web_root = Path(f"/var/www/{project_name}")
+        static_path = web_root / "static"
+        media_path = web_root / "media"
+
+        proxy_target = upstream or f"unix:{socket_path}"
+        # Through upstream groups, also log which release served each request
+        release_log = (
+            (
+                f"access_log {self.get_release_log_path(project_name)} "
+                f"{timing_log_format(project_name)};",
+                "access_log /var/log/nginx/access.log;",
+            )
+            if upstream
+            else ()
+        )
+        # An ASGI application upgrades these connections to websockets;
+        # other requests keep closing the proxied connection as before
+        upgrade_variable = f"$djanbee_{project_name}_connection_upgrade"
+        connection_map = (
+            f"map $http_upgrade {upgrade_variable} {{\n"
+            f"            default upgrade;\n"
+            f"            '' close;\n"
+            f"        }}\n\n        "
+            if websockets
+            else ""
+        )
+        # Nginx never retries a non-idempotent request once it was sent, so
+        # a POST reaching a dying instance fails rather than running twice
+        failover = (
+            (
+                "proxy_next_upstream error timeout;",
+                f"proxy_next_upstream_tries {next_upstream_tries};",
+            )
+            if upstream and next_upstream_tries
+            else ()
+        )
+        websocket_lines = (
+            (
+                "proxy_http_version 1.1;",
+                "proxy_set_header Upgrade $http_upgrade;",
+                f"proxy_set_header Connection {upgrade_variable};",
+            )
+            if websockets
+            else ()
+        )
+        location_lines = (
+            ("include proxy_params;", f"proxy_pass http://{proxy_target};")
+            + websocket_lines
+            + failover
+            + release_log
+        )
+
+        location_body = "\n                ".join(location_lines)
+
+        # Create config file content
+        config_content = (
+            textwrap.dedent(
+                f"""
+        {connection_map}server {{
+            listen 80;
+            server_name {server_name};
+
+            location = /favicon.ico {{ access_log off; log_not_found off; }}
+            
+            location /static/ {{
+                alias {static_path}/;
+            }}
+            
+            location /media/ {{
+                alias {media_path}/;
+            }}
+            
+            location / {{
+                {location_body}
+            }}
+        }}
+        """
+            ).strip()
+            + "\n"
+        )
+
+        return Path(f"/etc/nginx/sites-available/{project_name}"), config_content
+
+    def get_enabled_path(self, project_name: str) -> Path:
+        """Link in sites-enabled that makes Nginx load the project's site"""
+        return Path(f"/etc/nginx/sites-enabled/{project_name}")
+
+    def get_static_settings(self, project_name: str) -> Dict[str, str]:
+        """Django settings the site's static and media locations rely on"""
+        web_root = f"/var/www/{project_name}"
+        return {
+            "STATIC_ROOT": f"{web_root}/static",
+            "MEDIA_ROOT": f"{web_root}/media",
+            "STATIC_URL": "/static/",
+            "MEDIA_URL": "/media/",
+        }
+
     def configure_django_static_settings(self, project_name: str) -> Tuple[bool, str]:
         """
         Configure Django static and media file settings for Nginx deployment
@@ -353,6 +468,58 @@ class NginxServerManager(BaseServerManager):
         except Exception as e:
             return False, f"Error configuring static file settings: {str(e)}"
 
+    def get_backend_variable(self, project_name: str) -> str:
+        """Variable the site proxies to when traffic goes through upstream groups"""
+        return backend_variable(project_name)
+
+    def get_upstream_path(self, project_name: str) -> Path:
+        return Path(f"/etc/nginx/conf.d/djanbee-{project_name}-upstream.conf")
+
+    def get_release_log_path(self, project_name: str) -> Path:
+        """Access log whose lines name the release that served each request"""
+        return Path(f"/var/log/nginx/{project_name}-releases.log")
+
+    def render_upstream(
+        self, project_name: str, backends: List[UpstreamBackend]
+    ) -> Tuple[Path, str]:
+        """
+        Render the upstream groups of a project without writing them
+
+        Returns:
+            Tuple of (upstream_path, content)
+        """
+        return self.get_upstream_path(project_name), render_upstream_config(project_name, backends)
+
+    def write_upstream(
+        self, project_name: str, backends: List[UpstreamBackend]
+    ) -> CommandResult:
+        """
+        Write the upstream groups the project's site proxies to.
+
+        The file lives in conf.d, which Nginx includes in the http context.
+        Changing it and reloading Nginx moves traffic between sockets.
+
+        Args:
+            project_name: Name of the project
+            backends: Gunicorn sockets that should receive traffic, with
+                their release and share of traffic in percent
+
+        Returns:
+            Tuple of (success, message)
+        """
+        content = render_upstream_config(project_name, backends)
+        return self.os_manager.write_text_file(
+            self.get_upstream_path(project_name), content, sudo=True
+        )
+
+    def get_upstream_backends(self, project_name: str) -> List[UpstreamBackend]:
+        """Backends currently configured for the project"""
+        try:
+            content = self.get_upstream_path(project_name).read_text()
+        except OSError:
+            return []
+        return parse_upstream_config(content)
+
     def check_default_site_exists(self) -> bool:
         """Check if default site exists in sites-enabled."""
         default_config_path = Path("/etc/nginx/sites-enabled/default")
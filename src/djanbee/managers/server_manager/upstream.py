@@ -0,0 +1,99 @@
+# djanbee/managers/server_manager/upstream.py
+
+import json
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import List
+
+# The first line carries the backends as JSON so the file can be read back
+HEADER_PREFIX = "# djanbee: "
+
+
+@dataclass
+class UpstreamBackend:
+    """A Gunicorn socket receiving a share of a project's traffic."""
+
+    socket_path: str
+    release: str = ""
+    weight: int = 100
+    # Sockets of the Gunicorn instances sharing this backend's traffic;
+    # empty when socket_path alone serves it
+    servers: List[str] = field(default_factory=list)
+
+    @property
+    def sockets(self) -> List[str]:
+        return self.servers or [self.socket_path]
+
+
+def backend_variable(project_name: str) -> str:
+    """Variable holding the upstream group a request is sent to"""
+    return f"$djanbee_{project_name}_backend"
+
+
+def timing_log_format(project_name: str) -> str:
+    return f"djanbee_{project_name}_timing"
+
+
+def _group_name(backend: UpstreamBackend) -> str:
+    return f"djanbee_{Path(backend.socket_path).stem}"
+
+
+def render_upstream_config(project_name: str, backends: List[UpstreamBackend]) -> str:
+    """
+    Render the http-level configuration a project's site proxies through.
+
+    Each backend gets its own upstream group. A backend running several
+    Gunicorn instances balances them with `least_conn`, so a busy or stuck
+    master gets fewer new requests, and an instance that refuses
+    connections is skipped for a while. With more than one backend,
+    `split_clients` hashes the client address and user agent into weighted
+    buckets, so a client keeps hitting the same release. A `map` on
+    $upstream_addr tags every access-log line with the release that
+    served it.
+    """
+    if not backends:
+        raise ValueError("At least one backend is required")
+    variable = backend_variable(project_name)
+    lines = [HEADER_PREFIX + json.dumps([asdict(b) for b in backends])]
+
+    for backend in backends:
+        lines.append(f"upstream {_group_name(backend)} {{")
+        if backend.servers:
+            lines.append("    least_conn;")
+            lines += [
+                f"    server unix:{path} max_fails=1 fail_timeout=10s;"
+                for path in backend.servers
+            ]
+        else:
+            # fail_timeout=0 keeps Nginx retrying a socket that briefly refused
+            lines.append(f"    server unix:{backend.socket_path} fail_timeout=0;")
+        lines.append("}")
+
+    ordered = sorted(backends, key=lambda b: b.weight)
+    if len(backends) == 1:
+        lines += [f"map $host {variable} {{", f"    default {_group_name(backends[0])};", "}"]
+    else:
+        lines.append(f'split_clients "${{remote_addr}}${{http_user_agent}}" {variable} {{')
+        lines += [f"    {b.weight}% {_group_name(b)};" for b in ordered[:-1]]
+        lines += [f"    * {_group_name(ordered[-1])};", "}"]
+
+    lines.append(f"map $upstream_addr $djanbee_{project_name}_release {{")
+    lines.append('    default "-";')
+    lines += [f'    "unix:{path}" "{b.release or "-"}";' for b in backends for path in b.sockets]
+    lines.append("}")
+    lines.append(
+        f"log_format {timing_log_format(project_name)} "
+        f"'$msec $djanbee_{project_name}_release $status $request_time';"
+    )
+    return "\n".join(lines) + "\n"
+
+
+def parse_upstream_config(content: str) -> List[UpstreamBackend]:
+    """Backends recorded in the header of a rendered configuration"""
+    first_line = content.split("\n", 1)[0]
+    if not first_line.startswith(HEADER_PREFIX):
+        return []
+    try:
+        return [UpstreamBackend(**item) for item in json.loads(first_line[len(HEADER_PREFIX):])]
+    except (ValueError, TypeError):
+        return []
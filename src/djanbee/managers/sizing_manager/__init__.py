@@ -0,0 +1,17 @@
+from .main import SizingManager, WorkerPlan, plan_workers
+from .host import HostResources, detect_host, format_cpu_list, partition_cpus
+from .memory import MemoryReport, ProcessMemory, format_mib, read_smaps_rollup
+
+__all__ = [
+    "SizingManager",
+    "WorkerPlan",
+    "plan_workers",
+    "HostResources",
+    "detect_host",
+    "partition_cpus",
+    "format_cpu_list",
+    "MemoryReport",
+    "ProcessMemory",
+    "read_smaps_rollup",
+    "format_mib",
+]
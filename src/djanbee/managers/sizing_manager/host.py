@@ -0,0 +1,218 @@
+# djanbee/managers/sizing_manager/host.py
+
+import math
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Set
+
+MIB = 1024 * 1024
+
+
+@dataclass
+class HostResources:
+    """CPU and memory this host (or container) can give to the application"""
+
+    # CPUs the scheduler lets processes run on
+    cpus: int
+    memory_total: int
+    memory_available: int
+    # cgroup limits, None when unlimited
+    cpu_quota: Optional[float] = None
+    memory_limit: Optional[int] = None
+
+    @property
+    def usable_cpus(self) -> float:
+        if self.cpu_quota is None:
+            return float(self.cpus)
+        return min(float(self.cpus), self.cpu_quota)
+
+    @property
+    def usable_memory(self) -> int:
+        if self.memory_limit is None:
+            return self.memory_available
+        return min(self.memory_available, self.memory_limit)
+
+
+def detect_host(
+    proc_root: Path = Path("/proc"), cgroup_root: Path = Path("/sys/fs/cgroup")
+) -> HostResources:
+    """Read CPU affinity, /proc/meminfo and the cgroup limits of this process"""
+    try:
+        cpus = len(os.sched_getaffinity(0))
+    except (AttributeError, OSError):
+        cpus = os.cpu_count() or 1
+
+    meminfo = read_meminfo(proc_root / "meminfo")
+    total = meminfo.get("MemTotal", 0)
+    # MemAvailable exists since Linux 3.14; older kernels only report free pages
+    available = meminfo.get("MemAvailable", meminfo.get("MemFree", 0))
+
+    cgroup = _own_cgroup(proc_root / "self" / "cgroup", cgroup_root)
+    return HostResources(
+        cpus=cpus,
+        memory_total=total,
+        memory_available=available,
+        cpu_quota=read_cpu_quota(cgroup_root, cgroup),
+        memory_limit=read_memory_limit(cgroup_root, cgroup, total),
+    )
+
+
+def read_meminfo(path: Path) -> Dict[str, int]:
+    """/proc/meminfo values in bytes"""
+    values = {}
+    try:
+        lines = path.read_text().splitlines()
+    except OSError:
+        return values
+    for line in lines:
+        key, _, rest = line.partition(":")
+        fields = rest.split()
+        if fields and fields[0].isdigit():
+            values[key] = int(fields[0]) * 1024
+    return values
+
+
+def read_rss(pid: int, proc_root: Path = Path("/proc")) -> Optional[int]:
+    """Resident set size of a process in bytes, from /proc/<pid>/status"""
+    try:
+        lines = (proc_root / str(pid) / "status").read_text().splitlines()
+    except OSError:
+        return None
+    for line in lines:
+        if line.startswith("VmRSS:"):
+            return int(line.split()[1]) * 1024
+    return None
+
+
+def read_cpu_quota(cgroup_root: Path, cgroup: Optional[str]) -> Optional[float]:
+    """
+    Smallest CPU quota on the path from the process's cgroup to the root,
+    in CPUs. cgroup v2 keeps it in cpu.max, v1 in the cpu controller.
+    """
+    quotas = []
+    for directory in _cgroup_chain(cgroup_root, cgroup):
+        try:
+            quota, period = (directory / "cpu.max").read_text().split()
+            if quota != "max":
+                quotas.append(int(quota) / int(period))
+        except (OSError, ValueError):
+            continue
+
+    v1 = cgroup_root / "cpu"
+    try:
+        quota = int((v1 / "cpu.cfs_quota_us").read_text())
+        period = int((v1 / "cpu.cfs_period_us").read_text())
+        if quota > 0 and period > 0:
+            quotas.append(quota / period)
+    except (OSError, ValueError):
+        pass
+    return min(quotas) if quotas else None
+
+
+def read_memory_limit(
+    cgroup_root: Path, cgroup: Optional[str], memory_total: int = 0
+) -> Optional[int]:
+    """Smallest memory limit on the path to the root cgroup, in bytes"""
+    limits = []
+    for directory in _cgroup_chain(cgroup_root, cgroup):
+        try:
+            value = (directory / "memory.max").read_text().strip()
+            if value != "max":
+                limits.append(int(value))
+        except (OSError, ValueError):
+            continue
+
+    try:
+        value = int((cgroup_root / "memory" / "memory.limit_in_bytes").read_text())
+        # v1 reports "no limit" as a huge page-aligned number
+        if not memory_total or value < memory_total:
+            limits.append(value)
+    except (OSError, ValueError):
+        pass
+    return min(limits) if limits else None
+
+
+def partition_cpus(
+    count: int,
+    cpus: Optional[Set[int]] = None,
+    sys_root: Path = Path("/sys/devices/system/cpu"),
+) -> List[str]:
+    """
+    Split the CPUs this process may run on into `count` groups for
+    CPUAffinity=, e.g. ['0-1,4-5', '2-3,6-7'].
+
+    Groups are made of whole cores on one package where possible, so
+    hyperthread siblings, which share a core's caches, end up in the same
+    group. With fewer cores than groups, single CPUs are handed out.
+
+    Returns:
+        One CPU list per group, or an empty list with fewer CPUs than groups
+    """
+    if cpus is None:
+        try:
+            cpus = os.sched_getaffinity(0)
+        except (AttributeError, OSError):
+            cpus = set(range(os.cpu_count() or 1))
+    if count < 1 or len(cpus) < count:
+        return []
+
+    cores: Dict[tuple, List[int]] = {}
+    for cpu in sorted(cpus):
+        topology = sys_root / f"cpu{cpu}" / "topology"
+        try:
+            package = int((topology / "physical_package_id").read_text())
+            core = int((topology / "core_id").read_text())
+        except (OSError, ValueError):
+            # Without topology every CPU counts as its own core
+            package, core = 0, cpu
+        cores.setdefault((package, core), []).append(cpu)
+
+    units = [cores[key] for key in sorted(cores)]
+    if len(units) < count:
+        units = [[cpu] for cpu in sorted(cpus)]
+    # Contiguous slices keep a group's cores on one package
+    groups = []
+    for index in range(count):
+        start = index * len(units) // count
+        end = (index + 1) * len(units) // count
+        groups.append(sorted(cpu for unit in units[start:end] for cpu in unit))
+    return [format_cpu_list(group) for group in groups]
+
+
+def format_cpu_list(cpus: List[int]) -> str:
+    """CPU numbers as the ranges systemd and /proc use, e.g. '0-3,8'"""
+    ranges = []
+    for cpu in sorted(cpus):
+        if ranges and ranges[-1][1] == cpu - 1:
+            ranges[-1][1] = cpu
+        else:
+            ranges.append([cpu, cpu])
+    return ",".join(str(a) if a == b else f"{a}-{b}" for a, b in ranges)
+
+
+def round_up(value: int, step: int) -> int:
+    return int(math.ceil(value / step) * step)
+
+
+def _own_cgroup(path: Path, cgroup_root: Path) -> Optional[str]:
+    """The v2 cgroup of this process, e.g. '/system.slice/ssh.service'"""
+    try:
+        lines = path.read_text().splitlines()
+    except OSError:
+        return None
+    for line in lines:
+        if line.startswith("0::"):
+            return line[3:]
+    return None
+
+
+def _cgroup_chain(cgroup_root: Path, cgroup: Optional[str]):
+    if cgroup is None:
+        return []
+    directory = cgroup_root / cgroup.strip("/")
+    chain = [directory]
+    while directory != cgroup_root and cgroup_root in directory.parents:
+        directory = directory.parent
+        chain.append(directory)
+    return chain
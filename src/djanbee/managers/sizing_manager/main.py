@@ -0,0 +1,246 @@
+import http.client
+import math
+import signal
+import subprocess
+import tempfile
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import List, Optional, Union
+
+from ..os_manager import OSManager
+from ..reload_manager import RequestProbe
+from ..reload_manager.main import child_pids
+from .host import MIB, HostResources, detect_host, partition_cpus, read_rss, round_up
+from .memory import MemoryReport, read_smaps_rollup
+
+
+@dataclass
+class WorkerPlan:
+    """Worker count, threads and worker class a Gunicorn service runs with"""
+
+    workers: int = 3
+    threads: int = 1
+    worker_class: str = "sync"
+    reasons: List[str] = field(default_factory=list)
+
+    def arguments(self) -> List[str]:
+        """Gunicorn command line options for the plan"""
+        arguments = ["--workers", str(self.workers)]
+        if self.worker_class != "sync":
+            arguments += ["--worker-class", self.worker_class]
+        if self.threads > 1 and self.worker_class == "gthread":
+            arguments += ["--threads", str(self.threads)]
+        return arguments
+
+    def summary(self) -> str:
+        text = f"{self.workers} {self.worker_class} workers"
+        if self.threads > 1:
+            text += f" x {self.threads} threads"
+        return text
+
+
+def plan_workers(
+    host: HostResources,
+    worker_rss: Optional[int] = None,
+    headroom: float = 0.2,
+    max_threads: int = 8,
+    async_worker: Optional[str] = None,
+) -> WorkerPlan:
+    """
+    Size a Gunicorn service for a host.
+
+    CPUs allow the usual 2 x cores + 1 sync workers: one busy on the CPU
+    and one waiting on I/O per core. Memory allows as many workers as fit,
+    at their measured RSS, into the usable memory minus some headroom for
+    the page cache and request spikes. When memory is the tighter limit,
+    fewer gthread workers keep the same concurrency with threads, which
+    share one copy of the application.
+
+    An `async_worker` class (e.g. uvicorn's) serves many requests per
+    worker from its event loop, so one worker per CPU is enough.
+    """
+    reasons = []
+    cpus = host.usable_cpus
+    if async_worker:
+        cpu_workers = max(int(math.ceil(cpus)), 1)
+        formula = "one async worker per CPU"
+    else:
+        cpu_workers = 2 * max(int(math.ceil(cpus)), 1) + 1
+        formula = f"2 x {int(math.ceil(cpus))} + 1"
+    if host.cpu_quota is not None and host.cpu_quota < host.cpus:
+        reasons.append(
+            f"{cpus:g} CPUs usable (cgroup quota on {host.cpus} CPUs), "
+            f"allowing {formula} = {cpu_workers} workers"
+        )
+    else:
+        reasons.append(f"{host.cpus} CPUs, allowing {formula} = {cpu_workers} workers")
+    worker_class = async_worker or "sync"
+
+    if not worker_rss:
+        reasons.append("worker memory unknown, sizing on CPUs only")
+        return WorkerPlan(cpu_workers, worker_class=worker_class, reasons=reasons)
+
+    rss = round_up(worker_rss, 8 * MIB)
+    budget = int(host.usable_memory * (1 - headroom))
+    memory_workers = budget // rss
+    limit = " (cgroup limit)" if host.memory_limit is not None else ""
+    reasons.append(
+        f"{budget // MIB} MiB usable{limit} after {headroom:.0%} headroom fits "
+        f"{memory_workers} workers of {rss // MIB} MiB"
+    )
+
+    if async_worker:
+        workers = max(min(cpu_workers, memory_workers), 1)
+        if memory_workers < 1:
+            reasons.append("not even one worker fits; expect swapping")
+        return WorkerPlan(workers, worker_class=worker_class, reasons=reasons)
+
+    if memory_workers >= cpu_workers:
+        reasons.append("CPU bound: sync workers, one request each")
+        return WorkerPlan(cpu_workers, reasons=reasons)
+
+    workers = max(memory_workers, 1)
+    threads = min(int(math.ceil(cpu_workers / workers)), max_threads)
+    if memory_workers < 1:
+        reasons.append("not even one worker fits; expect swapping")
+    reasons.append(
+        f"memory bound: {workers} gthread workers x {threads} threads keep "
+        f"{workers * threads} requests in flight"
+    )
+    return WorkerPlan(workers, threads, "gthread", reasons)
+
+
+class SizingManager:
+    """
+    Manager responsible for choosing how many Gunicorn workers a host can run.
+
+    Reads the CPUs and memory the host (and any cgroup around it) gives
+    to the application and the resident size of one application worker,
+    measured on the running service or on a single worker booted for it.
+    """
+
+    MEASURE_TIMEOUT = 60.0
+    MEMORY_HEADROOM = 0.2
+    MAX_THREADS = 8
+
+    def __init__(self, os_manager: OSManager):
+        """
+        Initialize with references to other managers.
+
+        Args:
+            os_manager: OSManager instance for OS operations
+        """
+        self.os_manager = os_manager
+
+    def detect_host(self) -> HostResources:
+        return detect_host()
+
+    def partition_cpus(self, count: int) -> List[str]:
+        """CPU lists splitting this host's CPUs into `count` groups of whole cores"""
+        return partition_cpus(count)
+
+    def worker_rss(self, main_pid: int) -> List[int]:
+        """RSS of each worker of a running Gunicorn master, in bytes"""
+        sizes = [read_rss(pid) for pid in child_pids(main_pid)]
+        return [size for size in sizes if size]
+
+    def memory_report(self, main_pid: int) -> Optional[MemoryReport]:
+        """Shared and private memory of a running Gunicorn master and its workers"""
+        if not main_pid:
+            return None
+        master = read_smaps_rollup(main_pid)
+        if master is None:
+            return None
+        workers = [read_smaps_rollup(pid) for pid in child_pids(main_pid)]
+        return MemoryReport(master, [worker for worker in workers if worker])
+
+    def measure_worker_rss(
+        self,
+        gunicorn: List[str],
+        project_path: Union[str, Path],
+        wsgi_app: str,
+        timeout: float = None,
+    ) -> Optional[int]:
+        """
+        Boot the application with one worker on a private socket, send it
+        one request so lazily loaded code is imported too, and read the
+        worker's RSS.
+
+        Returns:
+            RSS in bytes, or None if the worker did not come up
+        """
+        timeout = self.MEASURE_TIMEOUT if timeout is None else timeout
+        with tempfile.TemporaryDirectory(prefix="djanbee-size-") as tmp:
+            socket_path = Path(tmp) / "worker.sock"
+            command = gunicorn + [
+                "--workers", "1",
+                "--bind", f"unix:{socket_path}",
+                "--chdir", str(project_path),
+                wsgi_app,
+            ]
+            try:
+                process = subprocess.Popen(
+                    command,
+                    cwd=str(project_path),
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                    start_new_session=True,
+                )
+            except OSError:
+                return None
+
+            try:
+                probe = RequestProbe(socket_path=str(socket_path))
+                deadline = time.monotonic() + timeout
+                while time.monotonic() < deadline and process.poll() is None:
+                    try:
+                        # Any status counts: the worker has loaded the application
+                        probe.request()
+                        break
+                    except (OSError, http.client.HTTPException):
+                        time.sleep(0.1)
+                else:
+                    return None
+                sizes = self.worker_rss(process.pid)
+                return max(sizes) if sizes else None
+            finally:
+                process.send_signal(signal.SIGTERM)
+                try:
+                    process.wait(10)
+                except subprocess.TimeoutExpired:
+                    process.kill()
+                    process.wait()
+
+    def plan(
+        self,
+        host: HostResources,
+        worker_rss: Optional[int] = None,
+        workers: Optional[int] = None,
+        threads: Optional[int] = None,
+        worker_class: Optional[str] = None,
+        async_worker: Optional[str] = None,
+    ) -> WorkerPlan:
+        """
+        Size the workers for a host, then apply explicit overrides.
+
+        Threads only take effect with the gthread worker class, so setting
+        threads alone switches to it, unless the service runs `async_worker`.
+        """
+        plan = plan_workers(
+            host, worker_rss, self.MEMORY_HEADROOM, self.MAX_THREADS, async_worker
+        )
+        if workers:
+            plan.workers = workers
+            plan.reasons.append(f"workers set to {workers}")
+        if threads:
+            plan.threads = threads
+            plan.reasons.append(f"threads set to {threads}")
+            if threads > 1 and not worker_class and not async_worker:
+                worker_class = "gthread"
+        if worker_class:
+            plan.worker_class = worker_class
+            plan.reasons.append(f"worker class set to {worker_class}")
+            if worker_class == "sync" and plan.threads > 1 and not threads:
+                plan.threads = 1
+        return plan
@@ -0,0 +1,96 @@
+# djanbee/managers/sizing_manager/memory.py
+
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from .host import MIB
+
+ROLLUP_FIELDS = ("Rss", "Pss", "Shared_Clean", "Shared_Dirty", "Private_Clean", "Private_Dirty", "Swap")
+
+
+@dataclass
+class ProcessMemory:
+    """How much of a process's memory it shares with others, in bytes"""
+
+    pid: int
+    rss: int = 0
+    # Proportional set size: shared pages split among the processes using them
+    pss: int = 0
+    shared: int = 0
+    private: int = 0
+    swap: int = 0
+
+
+@dataclass
+class MemoryReport:
+    """Memory of a Gunicorn master and its workers"""
+
+    master: Optional[ProcessMemory] = None
+    workers: List[ProcessMemory] = field(default_factory=list)
+
+    @property
+    def total(self) -> int:
+        """What the service costs the host, counting shared pages once"""
+        processes = ([self.master] if self.master else []) + self.workers
+        return sum(process.pss for process in processes)
+
+    @property
+    def worker_private(self) -> int:
+        """Memory each worker adds, on average"""
+        if not self.workers:
+            return 0
+        return sum(worker.private for worker in self.workers) // len(self.workers)
+
+    @property
+    def worker_shared(self) -> int:
+        if not self.workers:
+            return 0
+        return sum(worker.shared for worker in self.workers) // len(self.workers)
+
+    def workers_fitting(self, memory: int) -> int:
+        """Workers that fit in `memory` at the current private size of one"""
+        if not self.worker_private:
+            return 0
+        base = self.master.pss if self.master else 0
+        return max((memory - base) // self.worker_private, 0)
+
+
+def read_smaps_rollup(pid: int, proc_root: Path = Path("/proc")) -> Optional[ProcessMemory]:
+    """
+    Shared and private memory of a process from /proc/<pid>/smaps_rollup,
+    or by summing /proc/<pid>/smaps on kernels before 4.14.
+    """
+    for name in ("smaps_rollup", "smaps"):
+        try:
+            text = (proc_root / str(pid) / name).read_text()
+        except OSError:
+            continue
+        values = _sum_fields(text)
+        if values:
+            return ProcessMemory(
+                pid,
+                rss=values["Rss"],
+                pss=values["Pss"],
+                shared=values["Shared_Clean"] + values["Shared_Dirty"],
+                private=values["Private_Clean"] + values["Private_Dirty"],
+                swap=values["Swap"],
+            )
+    return None
+
+
+def format_mib(size: int) -> str:
+    return f"{size / MIB:.0f} MiB"
+
+
+def _sum_fields(text: str) -> Dict[str, int]:
+    values = dict.fromkeys(ROLLUP_FIELDS, 0)
+    found = False
+    for line in text.splitlines():
+        key, _, rest = line.partition(":")
+        if key in values:
+            fields = rest.split()
+            if fields and fields[0].isdigit():
+                values[key] += int(fields[0]) * 1024
+                found = True
+    return values if found else {}
@@ -1,3 +1,4 @@
 from .main import SocketManager
+from .asgi import AsgiUsage, UVICORN_WORKER, detect_asgi
 
-__all__ = ["SocketManager"]
+__all__ = ["SocketManager", "AsgiUsage", "UVICORN_WORKER", "detect_asgi"]
@@ -0,0 +1,95 @@
+# djanbee/managers/socket_manager/asgi.py
+
+import ast
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import List, Optional, Union
+
+UVICORN_WORKER = "uvicorn.workers.UvicornWorker"
+
+# Directories that never hold the project's own views
+SKIPPED_DIRS = {"node_modules", "migrations", "site-packages", "static", "media", "__pycache__"}
+# Larger files are generated or vendored, not hand-written views
+MAX_SCANNED_SIZE = 512 * 1024
+
+
+@dataclass
+class AsgiUsage:
+    """What in a project benefits from running under an ASGI server"""
+
+    # e.g. 'mysite.asgi:application', None without an asgi.py
+    asgi_app: Optional[str] = None
+    # 'relative/path.py:name' of async views and of consumers
+    async_views: List[str] = field(default_factory=list)
+    consumers: List[str] = field(default_factory=list)
+
+    @property
+    def recommended(self) -> bool:
+        return bool(self.asgi_app and (self.async_views or self.consumers))
+
+    @property
+    def websockets(self) -> bool:
+        return bool(self.consumers)
+
+
+def detect_asgi(project_path: Union[str, Path], project_name: str) -> AsgiUsage:
+    """
+    Find the project's ASGI entry point, async views and Channels consumers.
+
+    Views are `async def` functions (or methods) in views modules; consumers
+    are classes deriving from a `*Consumer` base. Files are parsed, not
+    imported, so nothing of the project runs.
+    """
+    project_path = Path(project_path)
+    usage = AsgiUsage(asgi_app=_find_asgi_app(project_path, project_name))
+
+    for current, dirs, files in os.walk(project_path):
+        dirs[:] = [
+            name
+            for name in dirs
+            if not name.startswith(".")
+            and name not in SKIPPED_DIRS
+            and not (Path(current) / name / "pyvenv.cfg").exists()
+        ]
+        for name in files:
+            if not name.endswith(".py"):
+                continue
+            path = Path(current) / name
+            relative = path.relative_to(project_path).as_posix()
+            try:
+                if path.stat().st_size > MAX_SCANNED_SIZE:
+                    continue
+                tree = ast.parse(path.read_bytes(), filename=str(path))
+            except (OSError, SyntaxError, ValueError):
+                continue
+            is_views = name == "views.py" or "views" in relative.split("/")[:-1]
+            for node in ast.walk(tree):
+                if is_views and isinstance(node, ast.AsyncFunctionDef):
+                    usage.async_views.append(f"{relative}:{node.name}")
+                elif isinstance(node, ast.ClassDef) and any(
+                    _base_name(base).endswith("Consumer") for base in node.bases
+                ):
+                    usage.consumers.append(f"{relative}:{node.name}")
+    return usage
+
+
+def _find_asgi_app(project_path: Path, project_name: str) -> Optional[str]:
+    """Module path of asgi.py, preferring the one next to the project's wsgi.py"""
+    candidates = [project_path / project_name / "asgi.py"]
+    candidates += sorted(
+        path for path in project_path.glob("*/asgi.py") if (path.parent / "wsgi.py").exists()
+    )
+    candidates += sorted(project_path.glob("*/asgi.py"))
+    for path in candidates:
+        if path.is_file():
+            return f"{path.parent.name}.asgi:application"
+    return None
+
+
+def _base_name(node: ast.expr) -> str:
+    if isinstance(node, ast.Name):
+        return node.id
+    if isinstance(node, ast.Attribute):
+        return node.attr
+    return ""
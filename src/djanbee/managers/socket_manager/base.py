@@ -1,6 +1,8 @@
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Tuple, Optional
+from typing import List, Tuple, Optional
+
+from ..sizing_manager import WorkerPlan
 
 
 class BaseSocketManager(ABC):
@@ -26,7 +28,18 @@ class BaseSocketManager(ABC):
 
     @abstractmethod
     def create_socket_service(
-        self, project_path: Path, project_name: str, wsgi_app: str = None, use_sudo: bool = False
+        self,
+        project_path: Path,
+        project_name: str,
+        wsgi_app: str = None,
+        use_sudo: bool = False,
+        colour: str = None,
+        worker_plan: WorkerPlan = None,
+        activation: str = None,
+        socket_group: str = None,
+        config_path: Path = None,
+        template: bool = False,
+        service_directives: List[str] = None,
     ) -> Tuple[bool, Path, str]:
         """
         Create a socket file for the given project
@@ -36,12 +49,81 @@ class BaseSocketManager(ABC):
             project_name: Name of the project
             wsgi_app: WSGI application path (e.g., 'myproject.wsgi:application')
             use_sudo: Whether to use sudo for file operations
+            colour: Blue/green colour of the service, if any
+            worker_plan: Workers, threads and worker class to run with
+            activation: None, 'socket' or 'lazy' (socket-activated and started
+                by the first connection)
+            socket_group: Group allowed to connect to a systemd-owned socket
+            config_path: gunicorn.conf.py to run with instead of command
+                line options
+            template: Write the template unit of the project's numbered
+                instances
+            service_directives: Extra [Service] lines, e.g. resource limits
 
         Returns:
             Tuple of (success, service_file_path, socket_file_path)
         """
         pass
         
+    @abstractmethod
+    def render_socket_service(
+        self,
+        project_path: Path,
+        project_name: str,
+        wsgi_app: str = None,
+        colour: str = None,
+        worker_plan: WorkerPlan = None,
+        activation: str = None,
+        config_path: Path = None,
+        template: bool = False,
+        service_directives: List[str] = None,
+    ) -> Tuple[Path, str]:
+        """
+        Render the service file for the given project without writing it
+
+        Returns:
+            Tuple of (service_file_path, content)
+        """
+        pass
+
+    @abstractmethod
+    def render_socket_unit(
+        self,
+        project_name: str,
+        colour: str = None,
+        socket_group: str = None,
+        template: bool = False,
+    ) -> Tuple[Path, str]:
+        """Render the unit through which the init system owns the listening socket"""
+        pass
+
+    @abstractmethod
+    def render_instance_dropin(
+        self, project_name: str, index: int, cpus: str = None
+    ) -> Tuple[Path, str]:
+        """Render the settings of one numbered instance of a project"""
+        pass
+
+    @abstractmethod
+    def get_service_instances(self, project_name: str) -> List[str]:
+        """Names of the services serving a project, one per instance"""
+        pass
+
+    @abstractmethod
+    def get_instance_affinity(self, instance: str) -> Optional[str]:
+        """CPUs a numbered instance is pinned to, if any"""
+        pass
+
+    @abstractmethod
+    def get_socket_unit_name(self, project_name: str) -> str:
+        """Name of the socket unit of a project or '<project>-<colour>'"""
+        pass
+
+    @abstractmethod
+    def get_gunicorn_command(self, project_path: Path) -> List[str]:
+        """Command that starts the application server for a project or release"""
+        pass
+
     @abstractmethod
     def verify_run_gunicorn_directory(self) -> Tuple[bool, str]:
         """
@@ -53,6 +135,30 @@ class BaseSocketManager(ABC):
         """
         pass
         
+    @abstractmethod
+    def get_socket_path(self, project_name: str, colour: str = None) -> Path:
+        """
+        Path of the socket the service of a project binds
+
+        Args:
+            project_name: Name of the project
+            colour: Blue/green colour, if the project runs one service per colour
+        """
+        pass
+
+    @abstractmethod
+    def retire_socket_service(self, project_name: str) -> Tuple[bool, str]:
+        """
+        Stops the socket service and keeps it from starting on boot
+
+        Args:
+            project_name: Name of the project (used to identify the service)
+
+        Returns:
+            Tuple of (success, message)
+        """
+        pass
+
     @abstractmethod
     def reload_daemon(self) -> Tuple[bool, str]:
         """
@@ -90,15 +196,32 @@ class BaseSocketManager(ABC):
         pass
         
     @abstractmethod
-    def launch_socket_service(self, project_name: str) -> Tuple[bool, str]:
+    def launch_socket_service(
+        self, project_name: str, activation: str = None
+    ) -> Tuple[bool, str]:
         """
         Comprehensive function to launch a socket service:
         Checks if it exists, reloads daemon, enables, and starts it
+        (after its .socket unit, when socket-activated)
         
         Args:
             project_name: Name of the project (used to identify the service)
+            activation: None, 'socket' or 'lazy'
         
         Returns:
             Tuple of (success, message)
         """
-        pass
\ No newline at end of file
+        pass
+
+    @abstractmethod
+    def reload_socket_service(self, project_name: str) -> Tuple[bool, str]:
+        """
+        Gracefully reloads the workers of a running socket service
+
+        Args:
+            project_name: Name of the project (used to identify the service)
+
+        Returns:
+            Tuple of (success, message)
+        """
+        pass
@@ -1,11 +1,13 @@
 from pathlib import Path
-from typing import Tuple, Optional
+from typing import List, Tuple, Optional
 
 from ..os_manager import OSManager
 from ..console_manager import ConsoleManager
 from ..django_manager import DjangoManager
+from ..sizing_manager import WorkerPlan
 from .socket_implementations import GunicornSocketManager
 from .base import BaseSocketManager
+from .asgi import AsgiUsage, detect_asgi
 
 
 class SocketManager:
@@ -13,6 +15,9 @@ class SocketManager:
     Factory class for creating and managing different socket implementations
     """
 
+    # Blue/green deploys run one service per colour, '<project>-<colour>'
+    COLOURS = ("blue", "green")
+
     def __init__(
         self,
         os_manager: OSManager,
@@ -57,7 +62,18 @@ class SocketManager:
         return self._manager.check_socket_service_exists(project_name)
 
     def create_socket_service(
-        self, project_path: Path, project_name: str, wsgi_app: str = None, use_sudo: bool = False
+        self,
+        project_path: Path,
+        project_name: str,
+        wsgi_app: str = None,
+        use_sudo: bool = False,
+        colour: str = None,
+        worker_plan: WorkerPlan = None,
+        activation: str = None,
+        socket_group: str = None,
+        config_path: Path = None,
+        template: bool = False,
+        service_directives: List[str] = None,
     ) -> Tuple[bool, Path, str]:
         """
         Create a socket file for the given project
@@ -67,14 +83,140 @@ class SocketManager:
             project_name: Name of the project
             wsgi_app: WSGI application path (e.g., 'myproject.wsgi:application')
             use_sudo: Whether to use sudo for file operations
+            colour: Blue/green colour of the service, if any
+            worker_plan: Workers, threads and worker class to run with
+            activation: None, 'socket' or 'lazy' (socket-activated and started
+                by the first connection)
+            socket_group: Group allowed to connect to a systemd-owned socket
+            config_path: gunicorn.conf.py to run with instead of command
+                line options
+            template: Write the template unit of the project's numbered
+                instances
+            service_directives: Extra [Service] lines, e.g. resource limits
 
         Returns:
             Tuple of (success, service_file_path, socket_file_path)
         """
         return self._manager.create_socket_service(
-            project_path, project_name, wsgi_app=wsgi_app, use_sudo=use_sudo
+            project_path,
+            project_name,
+            wsgi_app=wsgi_app,
+            use_sudo=use_sudo,
+            colour=colour,
+            worker_plan=worker_plan,
+            activation=activation,
+            socket_group=socket_group,
+            config_path=config_path,
+            template=template,
+            service_directives=service_directives,
         )
 
+    def render_socket_service(
+        self,
+        project_path: Path,
+        project_name: str,
+        wsgi_app: str = None,
+        colour: str = None,
+        worker_plan: WorkerPlan = None,
+        activation: str = None,
+        config_path: Path = None,
+        template: bool = False,
+        service_directives: List[str] = None,
+    ) -> Tuple[Path, str]:
+        """
+        Render the service file for the given project without writing it
+
+        Returns:
+            Tuple of (service_file_path, content)
+        """
+        return self._manager.render_socket_service(
+            project_path,
+            project_name,
+            wsgi_app,
+            colour,
+            worker_plan,
+            activation,
+            config_path,
+            template,
+            service_directives,
+        )
+
+    def render_socket_unit(
+        self,
+        project_name: str,
+        colour: str = None,
+        socket_group: str = None,
+        template: bool = False,
+    ) -> Tuple[Path, str]:
+        """
+        Render the unit through which systemd owns the listening socket
+
+        Returns:
+            Tuple of (socket_unit_path, content)
+        """
+        return self._manager.render_socket_unit(project_name, colour, socket_group, template)
+
+    def render_instance_dropin(
+        self, project_name: str, index: int, cpus: str = None
+    ) -> Tuple[Path, str]:
+        """
+        Render the drop-in of one numbered instance, pinned to `cpus` if given
+
+        Returns:
+            Tuple of (dropin_path, content)
+        """
+        return self._manager.render_instance_dropin(project_name, index, cpus)
+
+    def get_service_instances(self, project_name: str) -> List[str]:
+        """'<project>@<n>' for each numbered instance, else just the project name"""
+        return self._manager.get_service_instances(project_name)
+
+    def get_instance_affinity(self, instance: str) -> Optional[str]:
+        """CPUs a numbered instance is pinned to, if any"""
+        return self._manager.get_instance_affinity(instance)
+
+    def get_socket_unit_name(self, project_name: str) -> str:
+        """Name of the socket unit of a project or '<project>-<colour>'"""
+        return self._manager.get_socket_unit_name(project_name)
+
+    def get_gunicorn_command(self, project_path: Path) -> List[str]:
+        """Command that starts Gunicorn for a project or release"""
+        return self._manager.get_gunicorn_command(project_path)
+
+    def detect_asgi(self, project_path: Path, project_name: str) -> AsgiUsage:
+        """Find the project's ASGI entry point, async views and consumers"""
+        return detect_asgi(project_path, project_name)
+
+    def get_socket_path(self, project_name: str, colour: str = None) -> Path:
+        """
+        Path of the socket the service of a project binds
+
+        Args:
+            project_name: Name of the project
+            colour: Blue/green colour, if the project runs one service per colour
+        """
+        return self._manager.get_socket_path(project_name, colour)
+
+    def get_colour_services(self, project_name: str) -> List[str]:
+        """'<project>-<colour>' for each blue/green colour"""
+        return [f"{project_name}-{colour}" for colour in self.COLOURS]
+
+    def get_project_services(self, project_name: str) -> List[str]:
+        """Every service that may serve a project: its instances, then its colours"""
+        return self.get_service_instances(project_name) + self.get_colour_services(project_name)
+
+    def retire_socket_service(self, project_name: str) -> Tuple[bool, str]:
+        """
+        Stops the socket service and keeps it from starting on boot
+
+        Args:
+            project_name: Name of the project (used to identify the service)
+
+        Returns:
+            Tuple of (success, message)
+        """
+        return self._manager.retire_socket_service(project_name)
+
     def reload_daemon(self) -> Tuple[bool, str]:
         """
         Reloads the systemd daemon to recognize new or changed service files
@@ -108,19 +250,35 @@ class SocketManager:
         """
         return self._manager.start_socket_service(project_name)
         
-    def launch_socket_service(self, project_name: str) -> Tuple[bool, str]:
+    def launch_socket_service(
+        self, project_name: str, activation: str = None
+    ) -> Tuple[bool, str]:
         """
         Comprehensive function to launch a socket service:
         Checks if it exists, reloads daemon, enables, and starts it
+        (after its .socket unit, when socket-activated)
         
         Args:
             project_name: Name of the project (used to identify the service)
+            activation: None, 'socket' or 'lazy'
         
         Returns:
             Tuple of (success, message)
         """
-        return self._manager.launch_socket_service(project_name)
+        return self._manager.launch_socket_service(project_name, activation)
         
+    def reload_socket_service(self, project_name: str) -> Tuple[bool, str]:
+        """
+        Gracefully reloads the workers of a running socket service
+
+        Args:
+            project_name: Name of the project (used to identify the service)
+
+        Returns:
+            Tuple of (success, message)
+        """
+        return self._manager.reload_socket_service(project_name)
+
     def verify_run_gunicorn_directory(self) -> Tuple[bool, str]:
         """
         Verifies that the socket-related directories exist and have proper permissions.
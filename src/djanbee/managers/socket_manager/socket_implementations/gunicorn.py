@@ -1,9 +1,12 @@
+import os
 from pathlib import Path
 from typing import Tuple, List, Dict, Optional
+import re
 import textwrap
 from ...os_manager import OSManager
 from ...console_manager import ConsoleManager
 from ...django_manager import DjangoManager
+from ...sizing_manager import WorkerPlan
 from ..base import BaseSocketManager
 
 
@@ -12,6 +15,10 @@ class GunicornSocketManager(BaseSocketManager):
     Manages the Gunicorn socket configuration for Django deployments
     """
 
+    SYSTEMD_DIR = Path("/etc/systemd/system")
+    # Drop-in of each numbered instance of a project
+    DROPIN_NAME = "djanbee.conf"
+
     def __init__(
         self,
         os_manager: OSManager,
@@ -54,8 +61,10 @@ class GunicornSocketManager(BaseSocketManager):
                 if not dir_success:
                     return False, False, f"Failed to verify or create /run/gunicorn directory: {dir_message}"
                 
-                # Construct the service name based on project name
-                service_name = f"gunicorn-{project_name}.service"
+                # Construct the service name based on project name; the
+                # instances of a project share one template unit
+                base_name, at, _ = project_name.partition("@")
+                service_name = f"gunicorn-{base_name}{at}.service"
                 service_file_path = Path(f"/etc/systemd/system/{service_name}")
 
                 # Check if the service file exists
@@ -84,6 +93,13 @@ class GunicornSocketManager(BaseSocketManager):
         project_name: str,
         wsgi_app: str = None,
         use_sudo: bool = False,
+        colour: str = None,
+        worker_plan: WorkerPlan = None,
+        activation: str = None,
+        socket_group: str = None,
+        config_path: Path = None,
+        template: bool = False,
+        service_directives: List[str] = None,
     ) -> Tuple[bool, Path, str]:
         """
         Create a systemd service file for Gunicorn that will create the socket
@@ -93,6 +109,15 @@ class GunicornSocketManager(BaseSocketManager):
             project_name: Name of the project
             wsgi_app: WSGI application path (e.g., 'myproject.wsgi:application')
             use_sudo: Whether to use sudo for file operations
+            colour: Blue/green colour; gives the service, socket and pid
+                file a '-<colour>' suffix so both colours can run at once
+            worker_plan: Workers, threads and worker class to run with
+            activation: None, 'socket' or 'lazy'; see render_socket_service
+            socket_group: Group allowed to connect to a systemd-owned socket
+            config_path: gunicorn.conf.py to run with; see render_socket_service
+            template: Write the gunicorn-<project>@.service template the
+                project's numbered instances run from
+            service_directives: Extra [Service] lines; see render_socket_service
 
         Returns:
             Tuple of (success, service_file_path, socket_file_path)
@@ -106,61 +131,348 @@ class GunicornSocketManager(BaseSocketManager):
                     f"Failed to verify or create /run/gunicorn directory: {dir_message}",
                 )
 
-            # Determine socket path
-            socket_file_path = f"/run/gunicorn/{project_name}.sock"
-
-            # Determine wsgi_app if not provided
-            if not wsgi_app:
-                wsgi_app = f"{project_name}.wsgi:application"
-
-            # Get user information
-            user = self.os_manager.get_username()
-
-            # Create unique service name based on project name
-            service_name = f"gunicorn-{project_name}"
-            service_filename = f"{service_name}.service"
-
-            # Create service file content with project-specific description
-            service_content = (
-                textwrap.dedent(
-                    f"""
-                [Unit]
-                Description=Gunicorn daemon for {project_name}
-                After=network.target
-
-                [Service]
-                User={user}
-                Group={user}
-                RuntimeDirectory=gunicorn
-                WorkingDirectory={project_path}
-                ExecStart={self.django_manager.state.active_venv_path}/bin/gunicorn \\
-                        --access-logfile - \\
-                        --workers 3 \\
-                        --bind unix:{socket_file_path} \\
-                        {wsgi_app}
-
-                [Install]
-                WantedBy=multi-user.target 
-                """
-                ).strip()
-                + "\n"
+            if activation:
+                socket_unit_path, socket_content = self.render_socket_unit(
+                    project_name, colour, socket_group, template
+                )
+                result = self.os_manager.write_text_file(
+                    socket_unit_path, socket_content, sudo=use_sudo
+                )
+                if not result.success:
+                    return False, socket_unit_path, f"Failed to create socket unit: {result.stderr}"
+
+            service_file_path, service_content = self.render_socket_service(
+                project_path,
+                project_name,
+                wsgi_app,
+                colour,
+                worker_plan,
+                activation,
+                config_path,
+                template,
+                service_directives,
             )
-
-            # Write the service file with project-specific name
-            service_root = "/etc/systemd/system/"
-            service_file_path = Path(f"{service_root}{service_filename}")
             success, message = self.os_manager.write_text_file(
-                service_file_path, service_content, use_sudo=use_sudo
+                service_file_path, service_content, sudo=use_sudo
             )
 
             if not success:
                 return False, service_file_path, f"Failed to create service file: {message}"
 
-            return True, service_file_path, str(socket_file_path)
+            return True, service_file_path, str(self.get_socket_path(project_name, colour))
 
         except Exception as e:
             return False, None, f"Error creating Gunicorn socket service: {str(e)}"
 
+    def render_socket_service(
+        self,
+        project_path: Path,
+        project_name: str,
+        wsgi_app: str = None,
+        colour: str = None,
+        worker_plan: WorkerPlan = None,
+        activation: str = None,
+        config_path: Path = None,
+        template: bool = False,
+        service_directives: List[str] = None,
+    ) -> Tuple[Path, str]:
+        """
+        Render the systemd unit of a project or colour without writing it
+
+        Args:
+            activation: None for a service binding its own socket, 'socket'
+                to inherit it from the matching .socket unit, 'lazy' to
+                also leave starting the service to the first connection
+            config_path: gunicorn.conf.py holding the workers, logs and
+                tuning; without it the worker plan and logs go on the
+                command line
+            template: Render gunicorn-<project>@.service, whose instance
+                number (%i) names the socket, pid file and logs of each
+                of the project's instances
+            service_directives: Extra [Service] lines, e.g. the slice and
+                resource limits the service runs with
+
+        Returns:
+            Tuple of (service_file_path, content)
+        """
+        # Determine socket and pid file paths
+        instance = (
+            f"{project_name}@%i" if template else self.get_instance_name(project_name, colour)
+        )
+        unit_name = f"gunicorn-{project_name}@" if template else f"gunicorn-{instance}"
+        socket_file_path = self.get_socket_path(instance)
+        pid_file_path = f"/run/gunicorn/{instance}.pid"
+
+        # Determine wsgi_app if not provided
+        if not wsgi_app:
+            wsgi_app = f"{project_name}.wsgi:application"
+
+        gunicorn = " ".join(self.get_gunicorn_command(project_path))
+        options = self._gunicorn_options(instance, worker_plan, config_path)
+
+        # Get user information
+        user = self.os_manager.get_username()
+        extra = "".join(f"\n            {line}" for line in service_directives or ())
+
+        if activation:
+            content = self._render_activated_service(
+                project_path,
+                instance,
+                socket_file_path,
+                gunicorn,
+                options,
+                wsgi_app,
+                activation,
+                extra,
+            )
+            return Path(f"/etc/systemd/system/{unit_name}.service"), content
+
+        # Create service file content with project-specific description
+        service_content = (
+            textwrap.dedent(
+                f"""
+            [Unit]
+            Description=Gunicorn daemon for {instance}
+            After=network.target
+
+            [Service]
+            Type=forking
+            User={user}
+            Group={user}{extra}
+            RuntimeDirectory=gunicorn
+            RuntimeDirectoryPreserve=yes
+            LogsDirectory=gunicorn
+            PIDFile={pid_file_path}
+            WorkingDirectory={project_path}
+            ExecStart={gunicorn} \\
+                    --daemon \\
+                    --pid {pid_file_path} \\
+                    {options} \\
+                    --chdir {project_path} \\
+                    --bind unix:{socket_file_path} \\
+                    {wsgi_app}
+            ExecReload=/bin/kill -s HUP $MAINPID
+
+            [Install]
+            WantedBy=multi-user.target 
+            """
+            ).strip()
+            + "\n"
+        )
+
+        service_file_path = Path(f"/etc/systemd/system/{unit_name}.service")
+        return service_file_path, service_content
+
+    def render_socket_unit(
+        self,
+        project_name: str,
+        colour: str = None,
+        socket_group: str = None,
+        template: bool = False,
+    ) -> Tuple[Path, str]:
+        """
+        Render the .socket unit through which systemd owns the listening
+        socket of a project or colour
+
+        Args:
+            socket_group: Group that may connect, usually the web server's
+            template: Render gunicorn-<project>@.socket for numbered instances
+
+        Returns:
+            Tuple of (socket_unit_path, content)
+        """
+        instance = (
+            f"{project_name}@%i" if template else self.get_instance_name(project_name, colour)
+        )
+        unit_name = f"gunicorn-{project_name}@" if template else f"gunicorn-{instance}"
+        user = self.os_manager.get_username()
+        content = (
+            textwrap.dedent(
+                f"""
+            [Unit]
+            Description=Gunicorn socket for {instance}
+
+            [Socket]
+            ListenStream={self.get_socket_path(instance)}
+            SocketUser={user}
+            SocketGroup={socket_group or user}
+            SocketMode=0660
+            # Connections wait here while the service starts or restarts
+            Backlog=2048
+
+            [Install]
+            WantedBy=sockets.target
+            """
+            ).strip()
+            + "\n"
+        )
+        return Path(f"/etc/systemd/system/{unit_name}.socket"), content
+
+    def render_instance_dropin(
+        self, project_name: str, index: int, cpus: str = None
+    ) -> Tuple[Path, str]:
+        """
+        Render the drop-in of one numbered instance of a project. It marks
+        the instance as part of the project and pins it to `cpus`, a CPU
+        list such as '0-3', so its master and workers keep their caches.
+
+        Returns:
+            Tuple of (dropin_path, content)
+        """
+        lines = ["[Service]"]
+        if cpus:
+            lines.append(f"CPUAffinity={cpus}")
+        directory = Path(f"/etc/systemd/system/gunicorn-{project_name}@{index}.service.d")
+        return directory / self.DROPIN_NAME, "\n".join(lines) + "\n"
+
+    def get_service_instances(self, project_name: str) -> List[str]:
+        """
+        Names of the services serving a project: '<project>@<n>' for each
+        numbered instance, or the project name when it runs a single one
+        """
+        pattern = re.compile(rf"^gunicorn-{re.escape(project_name)}@(\d+)\.service\.d$")
+        try:
+            names = os.listdir(self.SYSTEMD_DIR)
+        except OSError:
+            return [project_name]
+        indexes = sorted(
+            int(match.group(1))
+            for match in map(pattern.match, names)
+            if match and (self.SYSTEMD_DIR / match.group(0) / self.DROPIN_NAME).exists()
+        )
+        return [f"{project_name}@{index}" for index in indexes] or [project_name]
+
+    def get_instance_affinity(self, instance: str) -> Optional[str]:
+        """CPUAffinity= a numbered instance is pinned to, if any"""
+        path = self.SYSTEMD_DIR / f"gunicorn-{instance}.service.d" / self.DROPIN_NAME
+        try:
+            lines = path.read_text().splitlines()
+        except OSError:
+            return None
+        for line in lines:
+            key, _, value = line.partition("=")
+            if key.strip() == "CPUAffinity" and value.strip():
+                return value.strip()
+        return None
+
+    def get_socket_unit_name(self, project_name: str) -> str:
+        """systemd name of the .socket unit of a project or '<project>-<colour>'"""
+        return f"gunicorn-{project_name}.socket"
+
+    def get_gunicorn_command(self, project_path: Path) -> List[str]:
+        """Command that starts Gunicorn for a project or release"""
+        # A release unpacked from an artifact carries its own environment.
+        # Its interpreter is started through the release link, so
+        # sys.prefix follows the link and a USR2 upgrade re-executes
+        # into whatever release the link points to by then.
+        release_venv = Path(project_path) / ".venv"
+        if (release_venv / "bin" / "gunicorn").exists():
+            return [f"{release_venv}/bin/python", f"{release_venv}/bin/gunicorn"]
+        return [f"{self.django_manager.state.active_venv_path}/bin/gunicorn"]
+
+    def _render_activated_service(
+        self,
+        project_path: Path,
+        instance: str,
+        socket_file_path: Path,
+        gunicorn: str,
+        options: str,
+        wsgi_app: str,
+        activation: str,
+        extra: str = "",
+    ) -> str:
+        """
+        Service inheriting its socket from systemd. Gunicorn cannot
+        daemonize here: the inherited descriptors belong to the started
+        process, so it runs in the foreground and reports readiness
+        through sd_notify (Gunicorn 20+).
+        """
+        user = self.os_manager.get_username()
+        socket_unit = f"gunicorn-{instance}.socket"
+        pid_file_path = f"/run/gunicorn/{instance}.pid"
+        # A lazy service has no [Install] section: nothing starts it at boot,
+        # the first connection to its socket does
+        install = (
+            ""
+            if activation == "lazy"
+            else "\n            [Install]\n            WantedBy=multi-user.target\n"
+        )
+        content = (
+            textwrap.dedent(
+                f"""
+            [Unit]
+            Description=Gunicorn daemon for {instance}
+            Requires={socket_unit}
+            After=network.target {socket_unit}
+
+            [Service]
+            Type=notify
+            NotifyAccess=main
+            User={user}
+            Group={user}{extra}
+            RuntimeDirectory=gunicorn
+            RuntimeDirectoryPreserve=yes
+            LogsDirectory=gunicorn
+            WorkingDirectory={project_path}
+            ExecStart={gunicorn} \\
+                    --pid {pid_file_path} \\
+                    {options} \\
+                    --chdir {project_path} \\
+                    --bind unix:{socket_file_path} \\
+                    {wsgi_app}
+            ExecReload=/bin/kill -s HUP $MAINPID
+            # SIGTERM to the master only, which stops its workers gracefully
+            KillMode=mixed
+            TimeoutStopSec=30
+            {install}"""
+            ).strip()
+            + "\n"
+        )
+        return content
+
+    def _gunicorn_options(
+        self, instance: str, worker_plan: WorkerPlan = None, config_path: Path = None
+    ) -> str:
+        """ExecStart options that differ between a config file and none"""
+        if config_path:
+            return f"--config {config_path}"
+        options = [
+            f"--access-logfile /var/log/gunicorn/{instance}-access.log",
+            f"--error-logfile /var/log/gunicorn/{instance}-error.log",
+            " ".join((worker_plan or WorkerPlan()).arguments()),
+        ]
+        return " \\\n                    ".join(options)
+
+    def get_instance_name(self, project_name: str, colour: str = None) -> str:
+        """Name used for the service, socket and pid file of a project or colour"""
+        return f"{project_name}-{colour}" if colour else project_name
+
+    def get_socket_path(self, project_name: str, colour: str = None) -> Path:
+        """Path of the socket the service of a project or colour binds"""
+        return Path(f"/run/gunicorn/{self.get_instance_name(project_name, colour)}.sock")
+
+    def retire_socket_service(self, project_name: str) -> Tuple[bool, str]:
+        """
+        Stops and disables the Gunicorn service of a project or colour
+
+        Args:
+            project_name: Name of the project, or '<project>-<colour>'
+
+        Returns:
+            Tuple of (success, message)
+        """
+        service_name = f"gunicorn-{project_name}"
+        socket_unit = self.get_socket_unit_name(project_name)
+        if self.os_manager.check_service_status(socket_unit):
+            # Otherwise the next connection would start the service again
+            self.os_manager.stop_service(socket_unit)
+            self.os_manager.disable_service(socket_unit)
+        result = self.os_manager.stop_service(service_name)
+        if not result.success:
+            return False, f"Failed to stop service: {result.stderr}"
+        self.os_manager.disable_service(service_name)
+        return True, f"Service '{service_name}' stopped and disabled"
+
     def reload_daemon(self) -> Tuple[bool, str]:
         """
         Reloads the systemd daemon to recognize new or changed service files
@@ -227,16 +539,41 @@ class GunicornSocketManager(BaseSocketManager):
             self.console_manager.print_error(error_msg)
             return False, error_msg
 
-    def launch_socket_service(self, project_name: str) -> Tuple[bool, str]:
+    def reload_socket_service(self, project_name: str) -> Tuple[bool, str]:
+        """
+        Reloads the Gunicorn service for the given project: the master
+        receives HUP, starts new workers from the current release and
+        retires the old ones without dropping the listening socket
+
+        Args:
+            project_name: Name of the project (used to identify the service)
+
+        Returns:
+            Tuple of (success, message)
+        """
+        service_name = f"gunicorn-{project_name}"
+        result = self.os_manager.reload_service(service_name)
+        if not result.success:
+            return False, f"Failed to reload socket service: {result.stderr}"
+        return True, f"Socket service '{service_name}' reloaded"
+
+    def launch_socket_service(
+        self, project_name: str, activation: str = None
+    ) -> Tuple[bool, str]:
         """
         Comprehensive function to launch a Gunicorn socket service:
         1. Checks if the service exists
         2. Reloads the systemd daemon
-        3. Enables the service to start on boot
-        4. Starts the service immediately
+        3. Enables and starts the .socket unit, if socket-activated
+        4. Enables the service to start on boot
+        5. Starts the service immediately
+
+        A lazy service skips the last two steps; the first connection to
+        its socket starts it.
         
         Args:
             project_name: Name of the project (used to identify the service)
+            activation: None, 'socket' or 'lazy'; see render_socket_service
         
         Returns:
             Tuple of (success, message)
@@ -254,6 +591,18 @@ class GunicornSocketManager(BaseSocketManager):
             reload_success, reload_message = self.reload_daemon()
             if not reload_success:
                 return False, reload_message
+
+            if activation:
+                socket_unit = self.get_socket_unit_name(project_name)
+                for step in (self.os_manager.enable_service, self.os_manager.start_service):
+                    success, message = step(socket_unit)
+                    if not success:
+                        return False, f"Failed to set up {socket_unit}: {message}"
+                if activation == "lazy":
+                    self.console_manager.print_step_progress(
+                        "Socket service", f"'{project_name}' starts on its first connection"
+                    )
+                    return True, f"Socket for '{project_name}' listening"
             
             # Enable the service to start on boot
             enable_success, enable_message = self.enable_socket_service(project_name)
@@ -0,0 +1,3 @@
+from .main import SyncManager, SyncReport, FileEntry, IgnoreRules
+
+__all__ = ["SyncManager", "SyncReport", "FileEntry", "IgnoreRules"]
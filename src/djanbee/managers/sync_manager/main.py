@@ -0,0 +1,407 @@
+import errno
+import fnmatch
+import hashlib
+import json
+import os
+import shutil
+import stat
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+from ..os_manager import OSManager
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+# Linux ioctl that shares extents between files on btrfs, XFS and others
+FICLONE = 0x40049409
+
+
+@dataclass
+class FileEntry:
+    """One file of a tree manifest"""
+
+    size: int
+    mtime_ns: int
+    mode: int
+    digest: str = ""
+    link: Optional[str] = None
+
+    def to_dict(self) -> dict:
+        data = {
+            "size": self.size,
+            "mtime_ns": self.mtime_ns,
+            "mode": self.mode,
+            "digest": self.digest,
+        }
+        if self.link is not None:
+            data["link"] = self.link
+        return data
+
+
+@dataclass
+class SyncReport:
+    """Outcome of a sync run"""
+
+    copied: List[str] = field(default_factory=list)
+    deleted: List[str] = field(default_factory=list)
+    unchanged: int = 0
+    bytes_copied: int = 0
+    hashed: int = 0
+    duration: float = 0.0
+    methods: Dict[str, int] = field(default_factory=dict)
+
+
+class IgnoreRules:
+    """
+    A subset of .gitignore syntax: `*`/`?` globs, a trailing `/` for
+    directories only, a leading `/` to anchor at the root and `!` to
+    re-include. Patterns without a slash match at any depth.
+    """
+
+    def __init__(self, patterns: Iterable[str] = ()):
+        self.rules: List[Tuple[str, bool, bool, bool]] = []
+        for pattern in patterns:
+            self.add(pattern)
+
+    def add(self, pattern: str) -> None:
+        pattern = pattern.strip()
+        if not pattern or pattern.startswith("#"):
+            return
+        negated = pattern.startswith("!")
+        pattern = pattern.lstrip("!")
+        directory_only = pattern.endswith("/")
+        pattern = pattern.rstrip("/")
+        anchored = "/" in pattern
+        self.rules.append((pattern.lstrip("/"), negated, directory_only, anchored))
+
+    def is_ignored(self, relative: str, is_dir: bool) -> bool:
+        ignored = False
+        name = relative.rsplit("/", 1)[-1]
+        for pattern, negated, directory_only, anchored in self.rules:
+            if directory_only and not is_dir:
+                continue
+            target = relative if anchored else name
+            if fnmatch.fnmatchcase(target, pattern):
+                ignored = not negated
+        return ignored
+
+
+class SyncManager:
+    """
+    Manager responsible for copying a project tree into its deploy location.
+
+    Both sides are described by a manifest of content hashes. Only files
+    whose hash changed are copied, files that disappeared from the source
+    are deleted, and everything else is left untouched, so a redeploy costs
+    time proportional to the change rather than to the tree.
+    """
+
+    DEFAULT_EXCLUDES = (
+        ".git/",
+        ".hg/",
+        "__pycache__/",
+        "*.pyc",
+        "*.pyo",
+        ".djanbee/",
+        "node_modules/",
+        "media/",
+        "staticfiles/",
+        ".venv/",
+        "venv/",
+        ".tox/",
+        ".pytest_cache/",
+        ".mypy_cache/",
+        "*.sqlite3",
+        "*.swp",
+        ".DS_Store",
+    )
+    IGNORE_FILE = ".djanbeeignore"
+    # Stat -> digest cache of the source tree, so unchanged files are not re-read
+    HASH_CACHE = Path(".djanbee") / "sync-cache.json"
+    # Manifest of what was last written to the destination
+    MANIFEST_NAME = ".djanbee-manifest.json"
+    CHOWN_BATCH = 500
+
+    def __init__(self, os_manager: OSManager, workers: int = None):
+        """
+        Initialize with references to other managers.
+
+        Args:
+            os_manager: OSManager instance for OS operations
+            workers: Copy threads (default: scaled to the CPU count)
+        """
+        self.os_manager = os_manager
+        self.workers = workers or min(32, (os.cpu_count() or 1) * 4)
+        self._reflink_supported = fcntl is not None
+        self._copy_range_supported = hasattr(os, "copy_file_range")
+
+    def load_ignore_rules(self, source: Path) -> IgnoreRules:
+        """Default excludes plus the project's .djanbeeignore"""
+        rules = IgnoreRules(self.DEFAULT_EXCLUDES)
+        ignore_file = source / self.IGNORE_FILE
+        if ignore_file.is_file():
+            for line in ignore_file.read_text(encoding="utf-8").splitlines():
+                rules.add(line)
+        return rules
+
+    def build_manifest(
+        self, source: Union[str, Path]
+    ) -> Tuple[Dict[str, FileEntry], int]:
+        """
+        Describe every file of the source tree that should be deployed.
+
+        Digests are reused from the hash cache when size and mtime match,
+        so only new and modified files are read.
+
+        Returns:
+            Tuple of (relative path -> FileEntry, number of files hashed)
+        """
+        source = Path(source)
+        rules = self.load_ignore_rules(source)
+        cache = self._load_hash_cache(source)
+        manifest: Dict[str, FileEntry] = {}
+        to_hash: List[str] = []
+
+        for root, dirs, files in os.walk(source):
+            root_path = Path(root)
+            relative_root = root_path.relative_to(source).as_posix()
+            prefix = "" if relative_root == "." else relative_root + "/"
+
+            kept_dirs = []
+            for name in dirs:
+                path = root_path / name
+                if rules.is_ignored(prefix + name, True) or (path / "pyvenv.cfg").exists():
+                    continue
+                if path.is_symlink():
+                    files.append(name)
+                    continue
+                kept_dirs.append(name)
+            dirs[:] = kept_dirs
+
+            for name in files:
+                relative = prefix + name
+                if rules.is_ignored(relative, False):
+                    continue
+                path = root_path / name
+                info = path.lstat()
+                if stat.S_ISLNK(info.st_mode):
+                    manifest[relative] = FileEntry(0, 0, 0o777, link=os.readlink(path))
+                    continue
+                if not stat.S_ISREG(info.st_mode):
+                    continue
+                entry = FileEntry(info.st_size, info.st_mtime_ns, stat.S_IMODE(info.st_mode))
+                cached = cache.get(relative)
+                if cached and cached[0] == entry.size and cached[1] == entry.mtime_ns:
+                    entry.digest = cached[2]
+                else:
+                    to_hash.append(relative)
+                manifest[relative] = entry
+
+        with ThreadPoolExecutor(self.workers) as executor:
+            digests = executor.map(lambda rel: self._hash_file(source / rel), to_hash)
+            for relative, digest in zip(to_hash, digests):
+                manifest[relative].digest = digest
+
+        self._save_hash_cache(source, manifest)
+        return manifest, len(to_hash)
+
+    def sync(
+        self,
+        source: Union[str, Path],
+        destination: Union[str, Path],
+        owner: Optional[str] = None,
+        delete: bool = True,
+    ) -> SyncReport:
+        """
+        Make destination an exact copy of the deployable part of source.
+
+        Args:
+            source: Project tree
+            destination: Deploy location, created if missing
+            owner: 'user:group' applied to copied files with one chown per batch
+            delete: Remove files that were deployed before but left the source
+
+        Returns:
+            SyncReport describing the changes
+        """
+        started = time.perf_counter()
+        source = Path(source).resolve()
+        destination = Path(destination)
+        destination.mkdir(parents=True, exist_ok=True)
+
+        report = SyncReport()
+        manifest, report.hashed = self.build_manifest(source)
+        previous = self._load_manifest(destination)
+
+        changed = []
+        for relative, entry in manifest.items():
+            before = previous.get(relative)
+            target = destination / relative
+            if (
+                before
+                and before.get("digest") == entry.digest
+                and before.get("link") == entry.link
+                and before.get("mode") == entry.mode
+                and (target.is_symlink() or target.exists())
+            ):
+                report.unchanged += 1
+            else:
+                changed.append(relative)
+
+        if delete:
+            for relative in sorted(set(previous) - set(manifest), reverse=True):
+                target = destination / relative
+                try:
+                    target.unlink()
+                    report.deleted.append(relative)
+                except FileNotFoundError:
+                    report.deleted.append(relative)
+                except IsADirectoryError:
+                    shutil.rmtree(target, ignore_errors=True)
+                    report.deleted.append(relative)
+            self._prune_empty_directories(destination, report.deleted)
+
+        for directory in sorted({str(Path(r).parent) for r in changed}):
+            (destination / directory).mkdir(parents=True, exist_ok=True)
+
+        with ThreadPoolExecutor(self.workers) as executor:
+            results = executor.map(
+                lambda rel: self._copy_entry(source / rel, destination / rel, manifest[rel]),
+                changed,
+            )
+            for relative, method in zip(changed, results):
+                report.copied.append(relative)
+                report.bytes_copied += manifest[relative].size
+                report.methods[method] = report.methods.get(method, 0) + 1
+
+        self._save_manifest(destination, manifest)
+        if owner and report.copied:
+            self.set_ownership(destination, report.copied, owner)
+
+        report.duration = time.perf_counter() - started
+        return report
+
+    def set_ownership(self, destination: Path, paths: List[str], owner: str) -> None:
+        """chown copied files and their directories in batches, one sudo call each"""
+        directories = {str(Path(p).parent) for p in paths} - {"."}
+        targets = sorted(directories) + paths
+        for start in range(0, len(targets), self.CHOWN_BATCH):
+            batch = [str(destination / p) for p in targets[start:start + self.CHOWN_BATCH]]
+            result = self.os_manager.run_command(["chown", "-h", owner] + batch, sudo=True)
+            if not result.success:
+                raise RuntimeError(f"Failed to set ownership: {result.stderr}")
+
+    def _copy_entry(self, source: Path, target: Path, entry: FileEntry) -> str:
+        """Copy one file next to its target and rename it into place"""
+        temporary = target.with_name(f".{target.name}.djanbee-tmp")
+        if entry.link is not None:
+            if temporary.is_symlink() or temporary.exists():
+                temporary.unlink()
+            os.symlink(entry.link, temporary)
+            os.replace(temporary, target)
+            return "symlink"
+
+        method = self._copy_file(source, temporary)
+        os.chmod(temporary, entry.mode)
+        os.utime(temporary, ns=(entry.mtime_ns, entry.mtime_ns))
+        os.replace(temporary, target)
+        return method
+
+    def _copy_file(self, source: Path, target: Path) -> str:
+        """Copy file data with the cheapest mechanism the filesystem offers"""
+        with open(source, "rb") as src, open(target, "wb") as dst:
+            if self._reflink_supported:
+                try:
+                    fcntl.ioctl(dst.fileno(), FICLONE, src.fileno())
+                    return "reflink"
+                except OSError as e:
+                    if e.errno in (errno.ENOTTY, errno.EOPNOTSUPP, errno.EINVAL):
+                        # Not a reflink-capable filesystem; stop trying
+                        self._reflink_supported = False
+                    elif e.errno != errno.EXDEV:
+                        raise
+
+            if self._copy_range_supported:
+                try:
+                    remaining = os.fstat(src.fileno()).st_size
+                    while remaining > 0:
+                        copied = os.copy_file_range(src.fileno(), dst.fileno(), remaining)
+                        if copied == 0:
+                            break
+                        remaining -= copied
+                    if remaining <= 0:
+                        return "copy_file_range"
+                except OSError as e:
+                    if e.errno not in (errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP):
+                        raise
+                    self._copy_range_supported = False
+                src.seek(0)
+                dst.seek(0)
+                dst.truncate()
+
+            shutil.copyfileobj(src, dst, 1024 * 1024)
+            return "copy"
+
+    @staticmethod
+    def _hash_file(path: Path) -> str:
+        digest = hashlib.sha256()
+        with open(path, "rb") as handle:
+            for chunk in iter(lambda: handle.read(1024 * 1024), b""):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def _prune_empty_directories(self, destination: Path, deleted: List[str]) -> None:
+        directories = {Path(r).parent for r in deleted}
+        for directory in sorted(directories, key=lambda p: len(p.parts), reverse=True):
+            current = destination / directory
+            while current != destination:
+                try:
+                    current.rmdir()
+                except OSError:
+                    break
+                current = current.parent
+
+    def _load_manifest(self, destination: Path) -> Dict[str, dict]:
+        try:
+            return json.loads((destination / self.MANIFEST_NAME).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+
+    def _save_manifest(self, destination: Path, manifest: Dict[str, FileEntry]) -> None:
+        path = destination / self.MANIFEST_NAME
+        temporary = path.with_name(path.name + ".tmp")
+        temporary.write_text(
+            json.dumps({k: v.to_dict() for k, v in sorted(manifest.items())}),
+            encoding="utf-8",
+        )
+        os.replace(temporary, path)
+
+    def _load_hash_cache(self, source: Path) -> Dict[str, list]:
+        try:
+            return json.loads((source / self.HASH_CACHE).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+
+    def _save_hash_cache(self, source: Path, manifest: Dict[str, FileEntry]) -> None:
+        path = source / self.HASH_CACHE
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(
+                json.dumps(
+                    {
+                        k: [v.size, v.mtime_ns, v.digest]
+                        for k, v in manifest.items()
+                        if v.link is None
+                    }
+                ),
+                encoding="utf-8",
+            )
+        except OSError:
+            # Without the cache the next sync simply hashes everything again
+            pass
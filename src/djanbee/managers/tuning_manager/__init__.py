@@ -0,0 +1,42 @@
+from .main import ConfigVersion, TuningManager
+from .runtime import (
+    RUNTIME_TUNABLE,
+    RuntimeEnvironment,
+    RuntimeSample,
+    derive_runtime,
+    find_allocator,
+    parse_runtime_assignment,
+    project_asserts,
+    read_environment,
+    render_environment,
+)
+from .settings import (
+    TUNABLE,
+    GunicornSettings,
+    ProjectProfile,
+    derive_settings,
+    parse_assignment,
+    read_config,
+    render_config,
+)
+
+__all__ = [
+    "TuningManager",
+    "ConfigVersion",
+    "GunicornSettings",
+    "ProjectProfile",
+    "TUNABLE",
+    "derive_settings",
+    "parse_assignment",
+    "read_config",
+    "render_config",
+    "RUNTIME_TUNABLE",
+    "RuntimeEnvironment",
+    "RuntimeSample",
+    "derive_runtime",
+    "find_allocator",
+    "parse_runtime_assignment",
+    "project_asserts",
+    "read_environment",
+    "render_environment",
+]
@@ -0,0 +1,289 @@
+import json
+import os
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Union
+
+from ..canary_manager import CanaryManager, parse_timing_lines
+from ..os_manager import OSManager
+from ..readiness_manager import ReadinessManager
+from ..sizing_manager import SizingManager, WorkerPlan
+from .runtime import (
+    RuntimeEnvironment,
+    RuntimeSample,
+    derive_runtime,
+    find_allocator,
+    measure_latency,
+    project_asserts,
+    read_environment,
+)
+from .settings import GunicornSettings, ProjectProfile, derive_settings
+
+VERSION_FILE = re.compile(r"^v(\d+)\.conf\.py$")
+
+
+@dataclass
+class ConfigVersion:
+    """A gunicorn.conf.py installed for a project or colour"""
+
+    path: Path
+    version: int
+    changed: bool
+
+
+class TuningManager:
+    """
+    Manager responsible for the gunicorn.conf.py of each project.
+
+    Every config that differs from the current one is written as a new
+    version next to the earlier ones, and the gunicorn.conf.py the unit
+    points at is a symlink to the newest. Gunicorn reads the file again on
+    HUP, so a changed setting only needs a reload.
+
+    Next to it sits the runtime.env the unit reads its environment from,
+    which only a restarted service picks up.
+    """
+
+    CONFIG_ROOT = Path("/etc/gunicorn")
+    CONFIG_NAME = "gunicorn.conf.py"
+    ENVIRONMENT_NAME = "runtime.env"
+    # Bytecode of read-only releases; systemd creates it for the service
+    CACHE_ROOT = Path("/var/cache/djanbee")
+    # Requests timed before and after a runtime change, after some warming up
+    SAMPLE_REQUESTS = 50
+    SAMPLE_WARMUP = 10
+    KEEP_VERSIONS = 5
+    OVERRIDES_FILE = Path(".djanbee") / "gunicorn.json"
+    # Tail of the release log read for request durations
+    PROFILE_BYTES = 4 * 1024 * 1024
+
+    def __init__(
+        self,
+        os_manager: OSManager,
+        readiness_manager: ReadinessManager,
+        canary_manager: CanaryManager,
+        sizing_manager: SizingManager,
+    ):
+        """
+        Initialize with references to other managers.
+
+        Args:
+            os_manager: OSManager instance for OS operations
+            readiness_manager: ReadinessManager holding the cold start history
+            canary_manager: CanaryManager reading the Nginx release log
+            sizing_manager: SizingManager reading the memory of the workers
+        """
+        self.os_manager = os_manager
+        self.readiness_manager = readiness_manager
+        self.canary_manager = canary_manager
+        self.sizing_manager = sizing_manager
+
+    def get_config_path(self, instance: str) -> Path:
+        """Path the systemd unit of a project or colour passes to --config"""
+        return self.CONFIG_ROOT / instance / self.CONFIG_NAME
+
+    def list_versions(self, instance: str) -> List[int]:
+        try:
+            names = os.listdir(self.CONFIG_ROOT / instance)
+        except OSError:
+            return []
+        return sorted(int(m.group(1)) for m in map(VERSION_FILE.match, names) if m)
+
+    def current_version(self, instance: str) -> Optional[int]:
+        try:
+            match = VERSION_FILE.match(os.readlink(self.get_config_path(instance)))
+        except OSError:
+            return None
+        return int(match.group(1)) if match else None
+
+    def read_config(self, instance: str) -> str:
+        """Current config of a project or colour, without its version line"""
+        try:
+            text = self.get_config_path(instance).read_text(encoding="utf-8")
+        except OSError:
+            return ""
+        if text.startswith("# version "):
+            text = text.split("\n", 1)[1] if "\n" in text else ""
+        return text
+
+    def install_config(self, instance: str, content: str, sudo: bool = True) -> ConfigVersion:
+        """
+        Make `content` the config of a project or colour.
+
+        Returns:
+            The installed version; unchanged content keeps the current one
+
+        Raises:
+            OSError: If a file or the link cannot be written
+        """
+        link = self.get_config_path(instance)
+        current = self.current_version(instance)
+        if current is not None and self.read_config(instance) == content:
+            return ConfigVersion(link, current, changed=False)
+
+        versions = self.list_versions(instance)
+        version = (versions[-1] if versions else 0) + 1
+        target = link.with_name(f"v{version}.conf.py")
+        self._run(["mkdir", "-p", str(link.parent)], sudo)
+        result = self.os_manager.write_text_file(
+            target, f"# version {version}\n{content}", sudo=sudo
+        )
+        if not result.success:
+            raise OSError(result.stderr)
+        self.os_manager.run_command(["chmod", "644", str(target)], sudo=sudo)
+        # Replace the link in one rename, so Gunicorn never reads a missing file
+        temporary = link.with_name(f".{self.CONFIG_NAME}.tmp")
+        self._run(["ln", "-sfn", target.name, str(temporary)], sudo)
+        self._run(["mv", "-T", str(temporary), str(link)], sudo)
+
+        for old in (versions + [version])[: -self.KEEP_VERSIONS]:
+            self.os_manager.run_command(
+                ["rm", "-f", str(link.with_name(f"v{old}.conf.py"))], sudo=sudo
+            )
+        return ConfigVersion(link, version, changed=True)
+
+    def load_overrides(self, project_path: Union[str, Path]) -> Dict[str, object]:
+        """Settings pinned with `djanbee tune`"""
+        try:
+            overrides = json.loads(
+                (Path(project_path) / self.OVERRIDES_FILE).read_text(encoding="utf-8")
+            )
+        except (OSError, ValueError):
+            return {}
+        return overrides if isinstance(overrides, dict) else {}
+
+    def save_overrides(self, project_path: Union[str, Path], overrides: Dict[str, object]) -> None:
+        path = Path(project_path) / self.OVERRIDES_FILE
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(overrides, indent=2, sort_keys=True), encoding="utf-8")
+
+    def load_profile(
+        self, project_path: Union[str, Path], release_log: Optional[Path] = None
+    ) -> ProjectProfile:
+        """Cold starts recorded by deploys and the latency of recent requests"""
+        profile = ProjectProfile(
+            cold_starts=[
+                entry["seconds"]
+                for entry in self.readiness_manager.load_history(project_path)
+                if isinstance(entry.get("seconds"), (int, float))
+            ]
+        )
+        if release_log is None:
+            return profile
+
+        offset = max(self.canary_manager.get_log_offset(release_log) - self.PROFILE_BYTES, 0)
+        lines = self.canary_manager.read_log(release_log, offset)
+        if offset:
+            # Reading started in the middle of a line
+            lines = lines[1:]
+        for stats in parse_timing_lines(lines).values():
+            profile.durations += stats.durations
+        timestamps = [float(line.split()[0]) for line in lines if _timestamp(line)]
+        if timestamps:
+            profile.span = timestamps[-1] - timestamps[0]
+        return profile
+
+    def read_somaxconn(self) -> Optional[int]:
+        try:
+            return int(Path("/proc/sys/net/core/somaxconn").read_text())
+        except (OSError, ValueError):
+            return None
+
+    def settings_for(
+        self,
+        plan: WorkerPlan,
+        profile: Optional[ProjectProfile] = None,
+        overrides: Optional[Dict[str, object]] = None,
+    ) -> GunicornSettings:
+        """Derived settings with the project's pinned ones applied on top"""
+        settings = derive_settings(plan, profile, self.read_somaxconn())
+        settings.apply(overrides or {})
+        return settings
+
+    def get_environment_path(self, instance: str) -> Path:
+        """EnvironmentFile of a project or colour"""
+        return self.CONFIG_ROOT / instance / self.ENVIRONMENT_NAME
+
+    def read_environment(self, instance: str) -> Dict[str, str]:
+        try:
+            return read_environment(self.get_environment_path(instance).read_text(encoding="utf-8"))
+        except OSError:
+            return {}
+
+    def install_environment(self, instance: str, content: str, sudo: bool = True) -> bool:
+        """
+        Make `content` the EnvironmentFile of a project or colour.
+
+        Returns:
+            Whether the file changed
+
+        Raises:
+            OSError: If the file cannot be written
+        """
+        path = self.get_environment_path(instance)
+        try:
+            if path.read_text(encoding="utf-8") == content:
+                return False
+        except OSError:
+            pass
+        self._run(["mkdir", "-p", str(path.parent)], sudo)
+        result = self.os_manager.write_text_file(path, content, sudo=sudo)
+        if not result.success:
+            raise OSError(result.stderr)
+        self.os_manager.run_command(["chmod", "644", str(path)], sudo=sudo)
+        return True
+
+    def runtime_for(
+        self,
+        plan: WorkerPlan,
+        release_path: Union[str, Path],
+        project_name: str,
+        overrides: Optional[Dict[str, object]] = None,
+    ) -> RuntimeEnvironment:
+        """Derived runtime environment with the project's pinned variables applied on top"""
+        release_path = Path(release_path)
+        # Deploys run as the user the service runs as
+        writable = os.access(release_path, os.W_OK)
+        environment = derive_runtime(
+            plan,
+            find_allocator(),
+            project_asserts(release_path),
+            None if writable else self.CACHE_ROOT / project_name,
+        )
+        environment.apply(overrides or {})
+        return environment
+
+    def runtime_directives(
+        self, project_name: str, instance: str, environment: RuntimeEnvironment
+    ) -> List[str]:
+        """[Service] lines that give a service its runtime environment"""
+        directives = [f"EnvironmentFile=-{self.get_environment_path(instance)}"]
+        cache = self.CACHE_ROOT / project_name
+        if environment.values.get("PYTHONPYCACHEPREFIX") == str(cache):
+            directives.append(f"CacheDirectory={cache.relative_to('/var/cache')}")
+        return directives
+
+    def sample_service(self, instance: str, socket_path: Path, path: str = "/") -> RuntimeSample:
+        """Latency of requests to a running service, then the memory they left it with"""
+        latencies = measure_latency(socket_path, path, self.SAMPLE_REQUESTS + self.SAMPLE_WARMUP)
+        pid = self.os_manager.get_service_main_pid(f"gunicorn-{instance}")
+        return RuntimeSample(
+            self.sizing_manager.memory_report(pid), latencies[self.SAMPLE_WARMUP :]
+        )
+
+    def _run(self, args: List[str], sudo: bool) -> None:
+        result = self.os_manager.run_command(args, sudo=sudo)
+        if not result.success:
+            raise OSError(result.stderr or f"{args[0]} failed")
+
+
+def _timestamp(line: str) -> bool:
+    fields = line.split()
+    if len(fields) != 4 or fields[1] == "-":
+        return False
+    try:
+        float(fields[0])
+    except ValueError:
+        return False
+    return True
@@ -0,0 +1,240 @@
+# djanbee/managers/tuning_manager/runtime.py
+
+import ast
+import http.client
+import os
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Union
+
+from ..reload_manager import RequestProbe
+from ..sizing_manager import MemoryReport, WorkerPlan
+from .settings import percentile
+
+# Variables `djanbee tune` may set in the runtime environment, with their types
+RUNTIME_TUNABLE = {
+    "MALLOC_ARENA_MAX": int,
+    "PYTHONHASHSEED": str,
+    "LD_PRELOAD": str,
+    "PYTHONPYCACHEPREFIX": str,
+    "PYTHONOPTIMIZE": int,
+}
+
+# Allocators preloaded when the host has one, most preferred first
+ALLOCATORS = ("libjemalloc.so.2", "libtcmalloc_minimal.so.4")
+LIBRARY_DIRS = (
+    "/usr/lib/x86_64-linux-gnu",
+    "/usr/lib/aarch64-linux-gnu",
+    "/usr/lib64",
+    "/usr/lib",
+    "/usr/local/lib",
+)
+
+# Directories and files whose asserts never run in the service
+SKIPPED_DIRECTORIES = {".git", ".venv", "venv", "env", "node_modules", "__pycache__", "tests", "test"}
+TEST_FILES = ("test_", "tests.py", "conftest.py")
+
+
+@dataclass
+class RuntimeEnvironment:
+    """Variables of the EnvironmentFile a Gunicorn service starts with"""
+
+    values: Dict[str, str] = field(default_factory=dict)
+    # variable -> why it has its value, or why it is not set
+    reasons: Dict[str, str] = field(default_factory=dict)
+
+    def apply(self, overrides: Dict[str, object]) -> None:
+        """Pinned variables; an empty value keeps a variable out of the file"""
+        for name, value in overrides.items():
+            if name not in RUNTIME_TUNABLE:
+                continue
+            if value in ("", None):
+                self.values.pop(name, None)
+                self.reasons[name] = "left out with `djanbee tune`"
+            else:
+                self.values[name] = str(value)
+                self.reasons[name] = "set with `djanbee tune`"
+
+
+@dataclass
+class RuntimeSample:
+    """Memory and latency of a running service, taken around a change"""
+
+    memory: Optional[MemoryReport] = None
+    # Seconds each answered request took
+    latencies: List[float] = field(default_factory=list)
+
+    def percentile(self, pct: float) -> Optional[float]:
+        return percentile(self.latencies, pct)
+
+
+def derive_runtime(
+    plan: WorkerPlan,
+    allocator: Optional[Path] = None,
+    asserts: Iterable[str] = (),
+    cache_dir: Optional[Path] = None,
+) -> RuntimeEnvironment:
+    """
+    Pick the runtime environment of a Gunicorn service.
+
+    `allocator` is a jemalloc or tcmalloc found on the host, `asserts` the
+    places the project's own code asserts in and `cache_dir` where bytecode
+    goes when the release cannot hold it.
+
+    PYTHONOPTIMIZE is only set when pinned with `djanbee tune`: -O also
+    skips the asserts of Django and the other dependencies, and ignores
+    the bytecode deploys compile for the venv without it.
+    """
+    environment = RuntimeEnvironment()
+    values, reasons = environment.values, environment.reasons
+    threaded = plan.threads > 1 or plan.worker_class != "sync"
+
+    if allocator:
+        values["LD_PRELOAD"] = str(allocator)
+        reasons["LD_PRELOAD"] = (
+            f"{allocator.name} fragments less and hands freed memory back to the system"
+        )
+        reasons["MALLOC_ARENA_MAX"] = f"glibc's arenas are not used with {allocator.name}"
+    else:
+        reasons["LD_PRELOAD"] = "no jemalloc or tcmalloc on the host, glibc malloc is used"
+        values["MALLOC_ARENA_MAX"] = "2"
+        if threaded:
+            reasons["MALLOC_ARENA_MAX"] = (
+                "glibc gives threads up to 8 arenas per CPU, each holding on to freed memory"
+            )
+        else:
+            reasons["MALLOC_ARENA_MAX"] = (
+                "one request per worker needs few arenas; 2 bounds those of library threads"
+            )
+
+    values["PYTHONHASHSEED"] = "random"
+    reasons["PYTHONHASHSEED"] = (
+        "workers share the seed of the master they fork from; "
+        "a fixed one would make hash flooding predictable"
+    )
+
+    if cache_dir:
+        values["PYTHONPYCACHEPREFIX"] = str(cache_dir)
+        reasons["PYTHONPYCACHEPREFIX"] = (
+            "the release is read-only; bytecode is cached here instead of compiled at every start"
+        )
+    else:
+        reasons["PYTHONPYCACHEPREFIX"] = "bytecode is written next to the code"
+
+    asserts = list(asserts)
+    if asserts:
+        more = f" and {len(asserts) - 1} more places" if len(asserts) > 1 else ""
+        reasons["PYTHONOPTIMIZE"] = f"the project asserts in {asserts[0]}{more}; -O would skip them"
+    else:
+        reasons["PYTHONOPTIMIZE"] = (
+            "opt in with `djanbee tune PYTHONOPTIMIZE=1`; -O skips the dependencies' "
+            "asserts and their bytecode compiled without it"
+        )
+    return environment
+
+
+def find_allocator(directories: Iterable[Union[str, Path]] = LIBRARY_DIRS) -> Optional[Path]:
+    """Path of the preferred malloc replacement installed on the host"""
+    for name in ALLOCATORS:
+        for directory in directories:
+            path = Path(directory) / name
+            if path.is_file():
+                return path
+    return None
+
+
+def project_asserts(project_path: Union[str, Path], limit: int = 20) -> List[str]:
+    """
+    'file:line' of the assert statements in the project's own code, leaving
+    out tests and virtual environments.
+    """
+    project_path = Path(project_path)
+    found = []
+    for root, directories, files in os.walk(project_path):
+        directories[:] = sorted(
+            d for d in directories
+            if d not in SKIPPED_DIRECTORIES and not (Path(root) / d / "pyvenv.cfg").exists()
+        )
+        for name in sorted(files):
+            if not name.endswith(".py") or name.startswith(TEST_FILES) or name.endswith("_test.py"):
+                continue
+            path = Path(root) / name
+            try:
+                tree = ast.parse(path.read_bytes())
+            except (OSError, SyntaxError, ValueError):
+                continue
+            for node in ast.walk(tree):
+                if isinstance(node, ast.Assert):
+                    found.append(f"{path.relative_to(project_path)}:{node.lineno}")
+                    if len(found) >= limit:
+                        return found
+    return found
+
+
+def render_environment(environment: RuntimeEnvironment, instance: str) -> str:
+    """EnvironmentFile of a project or colour, in systemd's KEY=value syntax"""
+    lines = [
+        f"# Runtime environment of gunicorn-{instance}, written by djanbee.",
+        "# Change it with `djanbee tune NAME=VALUE`; edits here are replaced on the next deploy.",
+    ]
+    lines += [f"{name}={value}" for name, value in sorted(environment.values.items())]
+    return "\n".join(lines) + "\n"
+
+
+def read_environment(text: str) -> Dict[str, str]:
+    """Variables of an EnvironmentFile"""
+    values = {}
+    for line in text.splitlines():
+        line = line.strip()
+        if not line or line.startswith(("#", ";")):
+            continue
+        name, separator, value = line.partition("=")
+        if separator:
+            values[name.strip()] = value.strip().strip('"')
+    return values
+
+
+def parse_runtime_assignment(text: str):
+    """
+    Parse a `NAME=VALUE` argument of `djanbee tune` setting a runtime
+    variable; an empty value keeps the variable out of the environment.
+
+    Raises:
+        ValueError: For unknown variables and values of the wrong type
+    """
+    name, separator, raw = text.partition("=")
+    name = name.strip()
+    if not separator or name not in RUNTIME_TUNABLE:
+        raise ValueError(
+            f"Expected NAME=VALUE with NAME one of: {', '.join(RUNTIME_TUNABLE)}"
+        )
+    raw = raw.strip()
+    if not raw:
+        return name, ""
+    kind = RUNTIME_TUNABLE[name]
+    try:
+        value = kind(raw)
+    except ValueError:
+        raise ValueError(f"{name} takes {kind.__name__} values, not '{raw}'")
+    if name == "MALLOC_ARENA_MAX" and value < 1:
+        raise ValueError(f"{name} cannot be {value}")
+    if name == "PYTHONOPTIMIZE" and value not in (0, 1, 2):
+        raise ValueError(f"{name} is 0, 1 or 2, not {value}")
+    return name, value
+
+
+def measure_latency(
+    socket_path: Union[str, Path], path: str = "/", requests: int = 50, timeout: float = 5.0
+) -> List[float]:
+    """Seconds each of `requests` sequential requests to a socket took; failed ones are left out"""
+    probe = RequestProbe(socket_path=str(socket_path), path=path, timeout=timeout)
+    latencies = []
+    for _ in range(requests):
+        started = time.perf_counter()
+        try:
+            probe.request()
+        except (OSError, http.client.HTTPException):
+            continue
+        latencies.append(time.perf_counter() - started)
+    return latencies
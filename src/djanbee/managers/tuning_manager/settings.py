@@ -0,0 +1,344 @@
+# djanbee/managers/tuning_manager/settings.py
+
+import ast
+import math
+import os
+from dataclasses import dataclass, field, fields
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from ..sizing_manager import WorkerPlan
+
+# Settings `djanbee tune` may override, with their types
+TUNABLE = {
+    "workers": int,
+    "threads": int,
+    "worker_class": str,
+    "worker_tmp_dir": str,
+    "max_requests": int,
+    "max_requests_jitter": int,
+    "keepalive": int,
+    "backlog": int,
+    "timeout": int,
+    "graceful_timeout": int,
+    "preload_app": bool,
+    "live_profiler": bool,
+}
+
+# Loaded into the config when preload_app is on. Python's collector writes
+# to every object it visits, which copies the pages the workers share with
+# the master; frozen objects are never visited again.
+PRELOAD_HOOKS = '''
+import gc
+
+# Collecting while the application loads leaves freed holes all over
+# the pages the workers will share
+gc.disable()
+
+
+def pre_fork(server, worker):
+    gc.freeze()
+
+
+def post_fork(server, worker):
+    gc.enable()
+'''
+
+# Loaded into the config when live_profiler is on. The worker only gets a
+# signal handler; a SIGURG from `djanbee profile-live` starts a thread that
+# samples the stacks of the other threads and writes them, collapsed, to
+# the directory named in the control file. SIGURG is ignored by default,
+# so a worker without the hook is not affected by it.
+LIVE_PROFILER_HOOKS = '''
+import json
+import os
+import signal
+import sys
+import threading
+import time
+
+_live_profile_thread = None
+
+
+def _frame_label(code, labels):
+    label = labels.get(code)
+    if label is None:
+        filename = code.co_filename.rsplit("site-packages/", 1)[-1]
+        if filename.startswith(os.getcwd() + os.sep):
+            filename = filename[len(os.getcwd()) + 1:]
+        label = labels[code] = "%s (%s:%d)" % (code.co_name, filename, code.co_firstlineno)
+    return label
+
+
+def _live_profile():
+    try:
+        with open(LIVE_PROFILE_CONTROL) as f:
+            request = json.load(f)
+        interval = 1.0 / max(float(request.get("rate", 100)), 1.0)
+        deadline = time.monotonic() + float(request.get("duration", 10))
+        output = request["output"]
+    except (OSError, ValueError, KeyError):
+        return
+    own = threading.get_ident()
+    labels, counts = {}, {}
+    while time.monotonic() < deadline:
+        for ident, frame in sys._current_frames().items():
+            if ident == own:
+                continue
+            stack = []
+            while frame is not None:
+                stack.append(_frame_label(frame.f_code, labels))
+                frame = frame.f_back
+            key = ";".join(reversed(stack))
+            counts[key] = counts.get(key, 0) + 1
+        time.sleep(interval)
+    os.makedirs(output, exist_ok=True)
+    path = os.path.join(output, "%d.folded" % os.getpid())
+    with open(path + ".tmp", "w") as f:
+        for stack, count in counts.items():
+            f.write("%s %d\\n" % (stack, count))
+    os.replace(path + ".tmp", path)
+
+
+def _start_live_profile(signum, frame):
+    global _live_profile_thread
+    if _live_profile_thread is None or not _live_profile_thread.is_alive():
+        _live_profile_thread = threading.Thread(
+            target=_live_profile, name="djanbee-live-profile", daemon=True
+        )
+        _live_profile_thread.start()
+
+
+def post_worker_init(worker):
+    signal.signal(signal.SIGURG, _start_live_profile)
+'''
+
+
+@dataclass
+class ProjectProfile:
+    """What earlier deploys and served traffic tell about a project"""
+
+    # Seconds from starting the service to the first healthy response
+    cold_starts: List[float] = field(default_factory=list)
+    # Durations of recently proxied requests, in seconds
+    durations: List[float] = field(default_factory=list)
+    # Seconds between the first and last of those requests
+    span: float = 0.0
+
+    @property
+    def request_rate(self) -> Optional[float]:
+        if len(self.durations) < 2 or self.span <= 0:
+            return None
+        return len(self.durations) / self.span
+
+    def percentile(self, pct: float) -> Optional[float]:
+        return percentile(self.durations, pct)
+
+
+@dataclass
+class GunicornSettings:
+    """Contents of a generated gunicorn.conf.py"""
+
+    workers: int = 3
+    threads: int = 1
+    worker_class: str = "sync"
+    worker_tmp_dir: Optional[str] = "/dev/shm"
+    max_requests: int = 1000
+    max_requests_jitter: int = 100
+    keepalive: int = 2
+    backlog: int = 2048
+    timeout: int = 30
+    graceful_timeout: int = 20
+    # Import the application once in the master and fork the workers from it
+    preload_app: bool = False
+    # Let `djanbee profile-live` sample the workers' stacks; not a Gunicorn
+    # setting, Gunicorn ignores it
+    live_profiler: bool = False
+    # setting -> why it has its value
+    reasons: Dict[str, str] = field(default_factory=dict)
+
+    def values(self) -> Dict[str, object]:
+        return {f.name: getattr(self, f.name) for f in fields(self) if f.name != "reasons"}
+
+    def apply(self, overrides: Dict[str, object]) -> None:
+        for name, value in overrides.items():
+            if name in TUNABLE:
+                setattr(self, name, value)
+                self.reasons[name] = "set with `djanbee tune`"
+
+
+def derive_settings(
+    plan: WorkerPlan,
+    profile: Optional[ProjectProfile] = None,
+    somaxconn: Optional[int] = None,
+    shm: Path = Path("/dev/shm"),
+) -> GunicornSettings:
+    """
+    Pick Gunicorn settings for a worker plan and what is known of the project.
+
+    Timeouts have to cover the slowest boot (a worker still importing the
+    application misses its heartbeats) and the slowest requests; workers are
+    recycled often enough to bound slow memory growth, but rarely enough
+    that the boots doing so stay a small share of their time.
+    """
+    profile = profile or ProjectProfile()
+    settings = GunicornSettings(plan.workers, plan.threads, plan.worker_class)
+    reasons = settings.reasons
+    reasons["workers"] = plan.summary()
+
+    if shm.is_dir() and os.access(shm, os.W_OK):
+        reasons["worker_tmp_dir"] = "heartbeat files in memory, a slow disk cannot stall them"
+    else:
+        settings.worker_tmp_dir = None
+        reasons["worker_tmp_dir"] = f"{shm} is not writable, heartbeats use the default"
+
+    rate = profile.request_rate
+    if rate:
+        # Recycle each worker about every 10 minutes at the observed rate
+        per_worker = rate / max(plan.workers, 1)
+        settings.max_requests = min(max(_round_significant(per_worker * 600), 1000), 50000)
+        reasons["max_requests"] = (
+            f"{rate:.1f} requests/s recycle each worker about every 10 minutes"
+        )
+    else:
+        reasons["max_requests"] = "no traffic recorded yet, recycling after 1000 requests"
+    settings.max_requests_jitter = max(settings.max_requests // 10, 1)
+    reasons["max_requests_jitter"] = "workers started together are not all recycled together"
+
+    if plan.worker_class == "sync":
+        reasons["keepalive"] = "sync workers close every connection anyway"
+    else:
+        reasons["keepalive"] = "Nginx closes upstream connections, idle ones only hold threads"
+
+    if somaxconn and somaxconn < settings.backlog:
+        settings.backlog = somaxconn
+        reasons["backlog"] = f"capped by net.core.somaxconn ({somaxconn})"
+    else:
+        reasons["backlog"] = "room to queue a burst while workers are busy"
+
+    slowest_boot = max(profile.cold_starts) if profile.cold_starts else None
+    p99 = profile.percentile(99)
+    reasons["timeout"] = "Gunicorn's default covers the recorded boots and requests"
+    if slowest_boot is not None and slowest_boot * 2 > settings.timeout:
+        settings.timeout = _round_up(slowest_boot * 2, 5)
+        reasons["timeout"] = f"twice the slowest boot ({slowest_boot:.1f}s)"
+    if p99 is not None and p99 * 4 > settings.timeout:
+        settings.timeout = _round_up(p99 * 4, 5)
+        reasons["timeout"] = f"four times the p99 latency ({p99:.2f}s)"
+
+    # In-flight requests finish within this when workers are replaced, and
+    # it stays inside systemd's 30s stop timeout
+    slowest = max(profile.durations) if profile.durations else None
+    if slowest is not None:
+        settings.graceful_timeout = min(max(_round_up(slowest * 2, 5), 10), 25)
+        reasons["graceful_timeout"] = f"twice the slowest recent request ({slowest:.2f}s)"
+    else:
+        reasons["graceful_timeout"] = "no traffic recorded yet"
+
+    reasons["preload_app"] = "opt in with `djanbee tune preload_app=true`"
+    reasons["live_profiler"] = "opt in with `djanbee tune live_profiler=true`"
+    return settings
+
+
+def render_config(settings: GunicornSettings, instance: str) -> str:
+    """
+    gunicorn.conf.py for a project or colour. The socket, pid file and
+    working directory stay on the command line in the systemd unit.
+    """
+    values = settings.values()
+    if values["worker_class"] != "gthread":
+        values.pop("threads")
+    lines = [
+        f"# Gunicorn settings for {instance}, written by djanbee.",
+        "# Change them with `djanbee tune`; edits here are replaced on the next deploy.",
+        "",
+    ]
+    # Reasons are left out: they mention measurements, and the file gets a
+    # new version only when a value changes
+    lines += [f"{name} = {value!r}" for name, value in values.items() if value is not None]
+    lines += [
+        "",
+        f"accesslog = '/var/log/gunicorn/{instance}-access.log'",
+        f"errorlog = '/var/log/gunicorn/{instance}-error.log'",
+    ]
+    if settings.preload_app:
+        lines.append(PRELOAD_HOOKS.rstrip("\n"))
+    if settings.live_profiler:
+        lines += [
+            "",
+            f"LIVE_PROFILE_CONTROL = '/run/gunicorn/{instance}.profile'",
+            LIVE_PROFILER_HOOKS.rstrip("\n"),
+        ]
+    return "\n".join(lines) + "\n"
+
+
+def read_config(text: str) -> Dict[str, object]:
+    """Literal assignments of a gunicorn.conf.py, without running it"""
+    values = {}
+    try:
+        tree = ast.parse(text)
+    except SyntaxError:
+        return values
+    for node in tree.body:
+        if (
+            isinstance(node, ast.Assign)
+            and len(node.targets) == 1
+            and isinstance(node.targets[0], ast.Name)
+        ):
+            try:
+                values[node.targets[0].id] = ast.literal_eval(node.value)
+            except ValueError:
+                continue
+    return values
+
+
+def parse_assignment(text: str):
+    """
+    Parse a `name=value` argument of `djanbee tune`.
+
+    Raises:
+        ValueError: For unknown settings and values of the wrong type
+    """
+    name, separator, raw = text.partition("=")
+    name = name.strip().replace("-", "_")
+    if not separator or name not in TUNABLE:
+        raise ValueError(
+            f"Expected NAME=VALUE with NAME one of: {', '.join(TUNABLE)}"
+        )
+    kind = TUNABLE[name]
+    try:
+        value = _parse_bool(raw) if kind is bool else kind(raw.strip())
+    except ValueError:
+        raise ValueError(f"{name} takes {kind.__name__} values, not '{raw}'")
+    if kind is int and value < (1 if name in ("workers", "threads") else 0):
+        raise ValueError(f"{name} cannot be {value}")
+    return name, value
+
+
+def percentile(values: List[float], pct: float) -> Optional[float]:
+    """Nearest-rank percentile, None for no values"""
+    if not values:
+        return None
+    ordered = sorted(values)
+    return ordered[max(math.ceil(pct / 100 * len(ordered)), 1) - 1]
+
+
+def _parse_bool(raw: str) -> bool:
+    value = raw.strip().lower()
+    if value in ("1", "true", "yes", "on"):
+        return True
+    if value in ("0", "false", "no", "off"):
+        return False
+    raise ValueError(raw)
+
+
+def _round_up(seconds: float, step: int) -> int:
+    return int(math.ceil(seconds / step) * step)
+
+
+def _round_significant(value: float) -> int:
+    """Round to one significant digit, so small changes in traffic keep the value"""
+    if value < 1:
+        return 0
+    magnitude = 10 ** int(math.floor(math.log10(value)))
+    return int(round(value / magnitude) * magnitude)
@@ -0,0 +1,3 @@
+from .main import VenvStoreManager
+
+__all__ = ["VenvStoreManager"]
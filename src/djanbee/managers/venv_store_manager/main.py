@@ -0,0 +1,244 @@
+import hashlib
+import json
+import os
+import platform
+import shutil
+import sys
+import time
+import venv
+from pathlib import Path
+from typing import Optional, Tuple, Union
+
+from ..os_manager import OSManager
+from ..pip_manager import RequirementsParser, read_installed_versions
+from ..wheelhouse_manager import WheelhouseManager
+
+
+class VenvStoreManager:
+    """
+    Manager responsible for the shared, content-addressed virtual environment store.
+
+    Each distinct (Python version, requirements) pair is built once into the
+    store. New environments are cloned from it: regular files are hardlinked,
+    and only files that embed the environment's own path (scripts in bin/,
+    pyvenv.cfg, .pth files) are copied and rewritten. Clones therefore take
+    seconds and almost no extra disk space.
+
+    pip replaces files instead of editing them in place, so installing into a
+    clone never changes the stored environment or other clones.
+    """
+
+    MANIFEST_NAME = ".djanbee-store.json"
+    # Text files that may contain the absolute path of the environment
+    RELOCATABLE_SUFFIXES = (".pth", ".cfg", ".json")
+
+    def __init__(
+        self,
+        os_manager: OSManager,
+        wheelhouse_manager: WheelhouseManager = None,
+        cache_root: Union[str, Path] = None,
+    ):
+        """
+        Initialize with references to other managers.
+
+        Args:
+            os_manager: OSManager instance for OS operations
+            wheelhouse_manager: WheelhouseManager used to build stored environments
+            cache_root: Directory holding djanbee caches (default: ~/.cache/djanbee)
+        """
+        self.os_manager = os_manager
+        self.wheelhouse_manager = wheelhouse_manager or WheelhouseManager(
+            os_manager, cache_root
+        )
+        cache_root = Path(cache_root) if cache_root else Path.home() / ".cache" / "djanbee"
+        self.root = cache_root / "venvs"
+
+    def compute_key(self, requirements_path: Union[str, Path]) -> str:
+        """Hash the interpreter version and the parsed requirements"""
+        digest = hashlib.sha256()
+        digest.update(
+            f"{platform.python_implementation()}-{platform.python_version()}-"
+            f"{sys.platform}-{platform.machine()}".encode("utf-8")
+        )
+        for line in RequirementsParser().parse(requirements_path).canonical_lines():
+            digest.update(b"\n" + line.encode("utf-8"))
+        return digest.hexdigest()[:32]
+
+    def get_stored_venv(self, requirements_path: Union[str, Path]) -> Optional[Path]:
+        """Return the stored environment for the requirements, if it was built"""
+        path = self.root / self.compute_key(requirements_path)
+        return path if (path / self.MANIFEST_NAME).is_file() else None
+
+    def build_stored_venv(
+        self, requirements_path: Union[str, Path]
+    ) -> Tuple[bool, Union[Path, str]]:
+        """
+        Build the stored environment for a requirements file.
+
+        Returns:
+            Tuple of (success, stored venv path or error message)
+        """
+        requirements_path = Path(requirements_path)
+        key = self.compute_key(requirements_path)
+        target = self.root / key
+        if (target / self.MANIFEST_NAME).is_file():
+            return True, target
+
+        staging = self.root / f".{key}.{os.getpid()}.partial"
+        shutil.rmtree(staging, ignore_errors=True)
+        staging.parent.mkdir(parents=True, exist_ok=True)
+
+        try:
+            venv.create(staging, with_pip=True)
+        except Exception as e:
+            shutil.rmtree(staging, ignore_errors=True)
+            return False, f"Failed to create stored environment: {e}"
+
+        success, wheelhouse = self.wheelhouse_manager.ensure_wheelhouse(
+            staging, requirements_path
+        )
+        if success:
+            result = self.wheelhouse_manager.install_from_wheelhouse(
+                staging, requirements_path, wheelhouse
+            )
+        else:
+            result = self.os_manager.run_pip_command(
+                staging, ["install", "-r", str(requirements_path)]
+            )
+        if not result.success:
+            shutil.rmtree(staging, ignore_errors=True)
+            return False, f"Failed to install requirements: {result.stderr}"
+
+        # Everything that names the prefix is final before the rename, so a
+        # stored environment is complete the moment it appears
+        self._relocate_in_place(staging, staging, target)
+        manifest = {
+            "key": key,
+            "prefix": str(target),
+            "python": platform.python_version(),
+            "requirements": str(requirements_path.resolve()),
+            "installed": read_installed_versions(staging),
+            "created": time.time(),
+        }
+        (staging / self.MANIFEST_NAME).write_text(
+            json.dumps(manifest, indent=2), encoding="utf-8"
+        )
+
+        if target.exists() and not (target / self.MANIFEST_NAME).is_file():
+            # Left behind by an interrupted build
+            shutil.rmtree(target, ignore_errors=True)
+        try:
+            os.replace(staging, target)
+        except OSError:
+            # Built concurrently by another process; use theirs
+            shutil.rmtree(staging, ignore_errors=True)
+            if (target / self.MANIFEST_NAME).is_file():
+                return True, target
+            return False, f"Failed to store environment at {target}"
+        return True, target
+
+    def create_from_store(
+        self, venv_path: Union[str, Path], requirements_path: Union[str, Path]
+    ) -> Tuple[bool, str]:
+        """
+        Create a virtual environment at venv_path as a clone of the stored one.
+
+        The stored environment is built first when it does not exist yet.
+
+        Returns:
+            Tuple of (success, message)
+        """
+        venv_path = Path(venv_path).absolute()
+        if venv_path.exists() and any(venv_path.iterdir()):
+            return False, f"{venv_path} already exists and is not empty"
+
+        stored = self.get_stored_venv(requirements_path)
+        if not stored:
+            success, stored = self.build_stored_venv(requirements_path)
+            if not success:
+                return False, stored
+
+        try:
+            linked, copied = self.clone(stored, venv_path)
+        except OSError as e:
+            shutil.rmtree(venv_path, ignore_errors=True)
+            return False, f"Failed to clone stored environment: {e}"
+
+        return True, (
+            f"Virtual environment cloned from {stored} "
+            f"({linked} files linked, {copied} copied)"
+        )
+
+    def clone(self, source: Path, destination: Path) -> Tuple[int, int]:
+        """
+        Clone a stored environment, hardlinking everything that is path independent.
+
+        Returns:
+            Tuple of (linked file count, copied file count)
+        """
+        old_prefix = str(source).encode("utf-8")
+        new_prefix = str(destination).encode("utf-8")
+        linked = copied = 0
+
+        for current, dirs, files in os.walk(source):
+            current = Path(current)
+            relative = current.relative_to(source)
+            target_dir = destination / relative
+            target_dir.mkdir(parents=True, exist_ok=True)
+
+            # os.walk lists symlinked directories (lib64 -> lib) as dirs
+            for name in list(dirs):
+                if (current / name).is_symlink():
+                    dirs.remove(name)
+                    files.append(name)
+
+            for name in files:
+                src = current / name
+                dst = target_dir / name
+                if relative == Path(".") and name == self.MANIFEST_NAME:
+                    continue
+
+                if src.is_symlink():
+                    link = os.readlink(src)
+                    os.symlink(link.replace(str(source), str(destination)), dst)
+                    continue
+
+                if self._needs_relocation(relative, name):
+                    content = src.read_bytes()
+                    if old_prefix in content:
+                        dst.write_bytes(content.replace(old_prefix, new_prefix))
+                        shutil.copymode(src, dst)
+                        copied += 1
+                        continue
+
+                try:
+                    os.link(src, dst)
+                    linked += 1
+                except OSError:
+                    # Different filesystem or links not permitted
+                    shutil.copy2(src, dst)
+                    copied += 1
+
+        return linked, copied
+
+    def _needs_relocation(self, relative: Path, name: str) -> bool:
+        """Whether a file may embed the environment prefix and must be rewritten"""
+        if relative.parts[:1] in (("bin",), ("Scripts",)):
+            return True
+        if relative == Path(".") and name == "pyvenv.cfg":
+            return True
+        return name.endswith(self.RELOCATABLE_SUFFIXES) and "site-packages" in relative.parts
+
+    def _relocate_in_place(self, venv_path: Path, old: Path, new: Path) -> None:
+        """Rewrite the environment prefix of a freshly built venv before moving it"""
+        old_prefix = str(old).encode("utf-8")
+        new_prefix = str(new).encode("utf-8")
+        for current, _, files in os.walk(venv_path):
+            relative = Path(current).relative_to(venv_path)
+            for name in files:
+                path = Path(current) / name
+                if path.is_symlink() or not self._needs_relocation(relative, name):
+                    continue
+                content = path.read_bytes()
+                if old_prefix in content:
+                    path.write_bytes(content.replace(old_prefix, new_prefix))
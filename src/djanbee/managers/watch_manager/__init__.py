@@ -0,0 +1,3 @@
+from .main import WatchManager, TreeWatcher, ChangeSet
+
+__all__ = ["WatchManager", "TreeWatcher", "ChangeSet"]
@@ -0,0 +1,113 @@
+# djanbee/managers/watch_manager/inotify.py
+
+import ctypes
+import ctypes.util
+import errno
+import os
+import select
+import struct
+from dataclasses import dataclass
+from typing import List, Optional
+
+# Event masks from <sys/inotify.h>
+IN_MODIFY = 0x00000002
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ONLYDIR = 0x01000000
+IN_ISDIR = 0x40000000
+
+IN_CLOEXEC = 0o2000000
+IN_NONBLOCK = 0o4000
+
+# struct inotify_event { int wd; uint32_t mask, cookie, len; char name[]; }
+EVENT_HEADER = struct.Struct("iIII")
+
+
+@dataclass
+class InotifyEvent:
+    wd: int
+    mask: int
+    cookie: int
+    name: str
+
+    @property
+    def is_dir(self) -> bool:
+        return bool(self.mask & IN_ISDIR)
+
+
+class Inotify:
+    """
+    Thin ctypes binding to the Linux inotify API.
+
+    The kernel queues events on a file descriptor, so a process waiting in
+    select() costs nothing until something in a watched directory changes.
+    """
+
+    READ_SIZE = 64 * 1024
+
+    def __init__(self):
+        libc_name = ctypes.util.find_library("c")
+        libc = ctypes.CDLL(libc_name, use_errno=True)
+        if not hasattr(libc, "inotify_init1"):
+            raise OSError(errno.ENOSYS, "inotify is only available on Linux")
+        self._add_watch = libc.inotify_add_watch
+        self._add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        self._rm_watch = libc.inotify_rm_watch
+        self._rm_watch.argtypes = [ctypes.c_int, ctypes.c_int]
+        self.fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self.fd < 0:
+            self._raise()
+
+    def add_watch(self, path: str, mask: int) -> int:
+        """Watch a directory; returns the watch descriptor"""
+        wd = self._add_watch(self.fd, os.fsencode(path), mask)
+        if wd < 0:
+            self._raise(path)
+        return wd
+
+    def rm_watch(self, wd: int) -> None:
+        self._rm_watch(self.fd, wd)
+
+    def read(self, timeout: Optional[float] = None) -> List[InotifyEvent]:
+        """Events queued so far, waiting up to `timeout` seconds for the first"""
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if not ready:
+            return []
+        try:
+            data = os.read(self.fd, self.READ_SIZE)
+        except BlockingIOError:
+            return []
+
+        events = []
+        offset = 0
+        while offset + EVENT_HEADER.size <= len(data):
+            wd, mask, cookie, length = EVENT_HEADER.unpack_from(data, offset)
+            offset += EVENT_HEADER.size
+            name = data[offset:offset + length].rstrip(b"\0")
+            offset += length
+            events.append(InotifyEvent(wd, mask, cookie, os.fsdecode(name)))
+        return events
+
+    def close(self) -> None:
+        if self.fd >= 0:
+            os.close(self.fd)
+            self.fd = -1
+
+    def __enter__(self) -> "Inotify":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    @staticmethod
+    def _raise(path: str = None):
+        code = ctypes.get_errno()
+        raise OSError(code, os.strerror(code), path)
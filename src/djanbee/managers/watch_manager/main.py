@@ -0,0 +1,211 @@
+import fnmatch
+import os
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Union
+
+from ..os_manager import OSManager
+from ..sync_manager import IgnoreRules, SyncManager
+from .inotify import (
+    IN_CLOSE_WRITE,
+    IN_CREATE,
+    IN_DELETE,
+    IN_DELETE_SELF,
+    IN_IGNORED,
+    IN_MOVED_FROM,
+    IN_MOVED_TO,
+    IN_ONLYDIR,
+    IN_Q_OVERFLOW,
+    Inotify,
+)
+
+WATCH_MASK = (
+    IN_CLOSE_WRITE | IN_CREATE | IN_DELETE | IN_MOVED_FROM | IN_MOVED_TO | IN_DELETE_SELF
+)
+
+
+@dataclass
+class ChangeSet:
+    """Files that changed during one burst of edits, relative to the watched root"""
+
+    paths: List[str] = field(default_factory=list)
+    # The kernel dropped events, so anything may have changed
+    overflow: bool = False
+
+    @property
+    def migrations(self) -> bool:
+        return self.overflow or any(is_migration(path) for path in self.paths)
+
+    @property
+    def static(self) -> bool:
+        return self.overflow or any("static" in path.split("/")[:-1] for path in self.paths)
+
+    @property
+    def code(self) -> bool:
+        """Changes running workers only pick up when they are replaced"""
+        return self.overflow or any(
+            (path.endswith(".py") and not is_migration(path))
+            # Django caches compiled templates per worker when DEBUG is off
+            or "templates" in path.split("/")[:-1]
+            for path in self.paths
+        )
+
+
+def is_migration(path: str) -> bool:
+    return path.endswith(".py") and "migrations" in path.split("/")[:-1]
+
+
+class TreeWatcher:
+    """
+    Watches every deployable directory of a tree with inotify.
+
+    inotify watches single directories, so a watch is added per directory,
+    including ones created later. Files appearing in a new directory before
+    its watch exists are found by scanning it once.
+    """
+
+    def __init__(self, root: Path, rules: IgnoreRules, ignored_names: Iterable[str] = ()):
+        self.root = root
+        self.rules = rules
+        self.ignored_names = tuple(ignored_names)
+        self.inotify = Inotify()
+        self.directories: Dict[int, str] = {}
+        self._add_tree("")
+
+    def wait(
+        self, debounce: float = 0.5, max_delay: float = 10.0, timeout: Optional[float] = None
+    ) -> Optional[ChangeSet]:
+        """
+        Block until files change, then keep collecting until the tree has
+        been quiet for `debounce` seconds (or `max_delay` passed).
+
+        Returns:
+            The changes, or None if nothing changed within `timeout`
+        """
+        changes = ChangeSet()
+        seen = set()
+        deadline = None if timeout is None else time.monotonic() + timeout
+        first = None
+
+        while True:
+            if first is None:
+                wait = None if deadline is None else max(deadline - time.monotonic(), 0)
+            else:
+                wait = min(debounce, max(first + max_delay - time.monotonic(), 0))
+            events = self.inotify.read(wait)
+
+            if not events:
+                if first is not None:
+                    break
+                if deadline is not None and time.monotonic() >= deadline:
+                    return None
+                continue
+
+            before = len(seen)
+            for event in events:
+                self._handle(event, changes, seen)
+            if first is None and (len(seen) > before or changes.overflow):
+                first = time.monotonic()
+            if first is not None and time.monotonic() - first >= max_delay:
+                break
+
+        changes.paths = sorted(seen)
+        return changes
+
+    def close(self) -> None:
+        self.inotify.close()
+
+    # Private methods
+
+    def _handle(self, event, changes: ChangeSet, seen: set) -> None:
+        if event.mask & IN_Q_OVERFLOW:
+            changes.overflow = True
+            return
+        if event.mask & IN_IGNORED:
+            self.directories.pop(event.wd, None)
+            return
+        directory = self.directories.get(event.wd)
+        if directory is None or not event.name:
+            return
+
+        relative = f"{directory}/{event.name}" if directory else event.name
+        if self._is_ignored(relative, event.is_dir):
+            return
+        if event.is_dir:
+            if event.mask & (IN_CREATE | IN_MOVED_TO):
+                seen.update(self._add_tree(relative))
+            elif event.mask & IN_MOVED_FROM:
+                # Its files are gone from the tree; the sync finds out which
+                seen.add(relative + "/")
+            return
+        seen.add(relative)
+
+    def _add_tree(self, relative: str) -> List[str]:
+        """Watch a directory and its subdirectories; returns the files found in them"""
+        files = []
+        for current, dirs, names in os.walk(self.root / relative):
+            current_relative = Path(current).relative_to(self.root).as_posix()
+            current_relative = "" if current_relative == "." else current_relative
+            prefix = f"{current_relative}/" if current_relative else ""
+            try:
+                wd = self.inotify.add_watch(current, WATCH_MASK | IN_ONLYDIR)
+            except OSError:
+                # Removed again, or not readable
+                dirs[:] = []
+                continue
+            self.directories[wd] = current_relative
+            dirs[:] = [
+                name
+                for name in dirs
+                if not self._is_ignored(prefix + name, True)
+                and not (Path(current) / name).is_symlink()
+                and not (Path(current) / name / "pyvenv.cfg").exists()
+            ]
+            files += [
+                prefix + name for name in names if not self._is_ignored(prefix + name, False)
+            ]
+        return files
+
+    def _is_ignored(self, relative: str, is_dir: bool) -> bool:
+        name = relative.rsplit("/", 1)[-1]
+        if not is_dir and any(fnmatch.fnmatchcase(name, p) for p in self.ignored_names):
+            return True
+        return self.rules.is_ignored(relative, is_dir)
+
+
+class WatchManager:
+    """
+    Manager responsible for noticing changes to a project tree.
+
+    Uses Linux inotify through ctypes, so no extra dependency is needed and
+    an idle watcher wakes up only when a file actually changes.
+    """
+
+    # Files editors write next to the ones being edited; vim probes a
+    # directory's writability with a file named 4913
+    EDITOR_TEMPORARY_FILES = ("*~", ".#*", "#*#", "*.tmp", "*.swx", "4913")
+
+    def __init__(self, os_manager: OSManager, sync_manager: SyncManager):
+        """
+        Initialize with references to other managers.
+
+        Args:
+            os_manager: OSManager instance for OS operations
+            sync_manager: SyncManager whose ignore rules decide what is watched
+        """
+        self.os_manager = os_manager
+        self.sync_manager = sync_manager
+
+    def watch(self, root: Union[str, Path]) -> TreeWatcher:
+        """
+        Start watching the deployable part of a tree.
+
+        Raises:
+            OSError: If inotify is unavailable or the watch limit is reached
+                (raise fs.inotify.max_user_watches)
+        """
+        root = Path(root).resolve()
+        return TreeWatcher(
+            root, self.sync_manager.load_ignore_rules(root), self.EDITOR_TEMPORARY_FILES
+        )
@@ -0,0 +1,3 @@
+from .main import WheelhouseManager, WheelhouseInfo
+
+__all__ = ["WheelhouseManager", "WheelhouseInfo"]
@@ -0,0 +1,206 @@
+import hashlib
+import json
+import os
+import re
+import shutil
+import time
+from dataclasses import dataclass, field, asdict
+from pathlib import Path
+from typing import List, Optional, Tuple, Union
+
+from ..os_manager import OSManager
+from ..os_manager.command import CommandResult
+from ..pip_manager import RequirementsParser
+
+
+@dataclass
+class WheelhouseInfo:
+    """Description of a built wheelhouse, as stored in its manifest"""
+
+    key: str
+    path: Path
+    python_tag: str
+    requirements: str
+    wheels: List[str] = field(default_factory=list)
+    built_from_sdist: List[str] = field(default_factory=list)
+    created: float = 0.0
+
+
+class WheelhouseManager:
+    """
+    Manager responsible for building and reusing local wheelhouses.
+
+    A wheelhouse is a directory of wheels built for one requirements file
+    and one interpreter. It is keyed by a hash of both, so identical
+    requirements share a wheelhouse and any change produces a new one.
+    Installing from it needs no network access and never rebuilds sdists.
+    """
+
+    MANIFEST_NAME = "manifest.json"
+    CREATED_WHEEL_PATTERN = re.compile(r"Created wheel for ([^:\s]+):")
+
+    def __init__(self, os_manager: OSManager, cache_root: Union[str, Path] = None):
+        """
+        Initialize with references to other managers.
+
+        Args:
+            os_manager: OSManager instance for OS operations
+            cache_root: Directory holding djanbee caches (default: ~/.cache/djanbee)
+        """
+        self.os_manager = os_manager
+        cache_root = Path(cache_root) if cache_root else Path.home() / ".cache" / "djanbee"
+        self.root = cache_root / "wheelhouse"
+
+    def get_python_tag(self, venv_path: Union[str, Path]) -> Optional[str]:
+        """
+        Get the interpreter tag of a virtual environment, e.g. 'cpython-311-linux-x86_64'.
+
+        Wheels are only compatible with the interpreter they were built for,
+        so the tag is part of the wheelhouse key.
+        """
+        python_path = self.os_manager.get_python_path(Path(venv_path))
+        result = self.os_manager.run_command(
+            [
+                str(python_path),
+                "-c",
+                "import sys, sysconfig; "
+                "print(sys.implementation.cache_tag + '-' + sysconfig.get_platform())",
+            ]
+        )
+        if not result.success or not result.stdout:
+            return None
+        return result.stdout.splitlines()[-1].strip()
+
+    def compute_key(self, requirements_path: Union[str, Path], python_tag: str) -> str:
+        """Hash the requirements file, its includes and the interpreter tag"""
+        digest = hashlib.sha256()
+        digest.update(python_tag.encode("utf-8"))
+        for path in RequirementsParser().collect_files(requirements_path):
+            digest.update(b"\0")
+            digest.update(path.read_bytes())
+        return digest.hexdigest()[:32]
+
+    def get_wheelhouse(
+        self, venv_path: Union[str, Path], requirements_path: Union[str, Path]
+    ) -> Optional[WheelhouseInfo]:
+        """
+        Return the wheelhouse for the given requirements, if one was already built.
+
+        Returns:
+            WheelhouseInfo or None if no complete wheelhouse exists
+        """
+        python_tag = self.get_python_tag(venv_path)
+        if not python_tag:
+            return None
+        key = self.compute_key(requirements_path, python_tag)
+        return self._read_manifest(self.root / key)
+
+    def build_wheelhouse(
+        self, venv_path: Union[str, Path], requirements_path: Union[str, Path]
+    ) -> Tuple[bool, Union[WheelhouseInfo, str]]:
+        """
+        Build wheels for every requirement into a new wheelhouse.
+
+        Binary wheels are downloaded, packages that only ship sdists are
+        built once here so later installs never compile them again.
+
+        Returns:
+            Tuple of (success, WheelhouseInfo or error message)
+        """
+        requirements_path = Path(requirements_path)
+        if not requirements_path.exists():
+            return False, f"Requirements file not found: {requirements_path}"
+
+        python_tag = self.get_python_tag(venv_path)
+        if not python_tag:
+            return False, f"Could not determine Python version of {venv_path}"
+
+        key = self.compute_key(requirements_path, python_tag)
+        target = self.root / key
+        existing = self._read_manifest(target)
+        if existing:
+            return True, existing
+
+        # Build into a private directory and move it into place at the end,
+        # so an interrupted build never leaves a half-filled wheelhouse behind
+        staging = self.root / f".{key}.{os.getpid()}.partial"
+        shutil.rmtree(staging, ignore_errors=True)
+        staging.mkdir(parents=True, exist_ok=True)
+
+        result = self.os_manager.run_pip_command(
+            Path(venv_path),
+            ["wheel", "-r", str(requirements_path), "-w", str(staging)],
+        )
+        if not result.success:
+            shutil.rmtree(staging, ignore_errors=True)
+            return False, f"Failed to build wheelhouse: {result.stderr or result.stdout}"
+
+        info = WheelhouseInfo(
+            key=key,
+            path=target,
+            python_tag=python_tag,
+            requirements=str(requirements_path.resolve()),
+            wheels=sorted(p.name for p in staging.glob("*.whl")),
+            built_from_sdist=sorted(
+                set(self.CREATED_WHEEL_PATTERN.findall(result.stdout))
+            ),
+            created=time.time(),
+        )
+        self._write_manifest(staging, info)
+
+        try:
+            os.replace(staging, target)
+        except OSError:
+            # Another build finished first; keep the existing wheelhouse
+            shutil.rmtree(staging, ignore_errors=True)
+            existing = self._read_manifest(target)
+            if not existing:
+                return False, f"Failed to store wheelhouse at {target}"
+            return True, existing
+
+        return True, info
+
+    def ensure_wheelhouse(
+        self, venv_path: Union[str, Path], requirements_path: Union[str, Path]
+    ) -> Tuple[bool, Union[WheelhouseInfo, str]]:
+        """Return the existing wheelhouse for the requirements or build it"""
+        existing = self.get_wheelhouse(venv_path, requirements_path)
+        if existing:
+            return True, existing
+        return self.build_wheelhouse(venv_path, requirements_path)
+
+    def get_install_args(self, wheelhouse: WheelhouseInfo) -> List[str]:
+        """pip arguments that restrict installation to the wheelhouse"""
+        return ["--no-index", "--find-links", str(wheelhouse.path)]
+
+    def install_from_wheelhouse(
+        self,
+        venv_path: Union[str, Path],
+        requirements_path: Union[str, Path],
+        wheelhouse: WheelhouseInfo,
+    ) -> CommandResult:
+        """Install a requirements file using only the wheels in the wheelhouse"""
+        return self.os_manager.run_pip_command(
+            Path(venv_path),
+            ["install"]
+            + self.get_install_args(wheelhouse)
+            + ["-r", str(requirements_path)],
+        )
+
+    def _read_manifest(self, path: Path) -> Optional[WheelhouseInfo]:
+        manifest = path / self.MANIFEST_NAME
+        if not manifest.is_file():
+            return None
+        try:
+            data = json.loads(manifest.read_text(encoding="utf-8"))
+            data["path"] = path
+            return WheelhouseInfo(**data)
+        except (ValueError, TypeError):
+            return None
+
+    def _write_manifest(self, path: Path, info: WheelhouseInfo) -> None:
+        data = asdict(info)
+        data.pop("path")
+        (path / self.MANIFEST_NAME).write_text(
+            json.dumps(data, indent=2), encoding="utf-8"
+        )
@@ -0,0 +1,101 @@
+import unittest
+import tempfile
+import venv
+from pathlib import Path
+import sys
+import os
+
+# Add the src directory to the Python path
+sys.path.insert(
+    0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../../../src"))
+)
+
+from djanbee.managers.artifact_manager import ArtifactManager
+from djanbee.managers.bytecode_manager import BytecodeManager
+from djanbee.managers.os_manager import OSManager
+from djanbee.managers.release_manager import ReleaseManager
+from djanbee.managers.sync_manager import SyncManager
+
+
+class TestArtifacts(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        root = Path(self.tmp.name)
+        self.project = root / "shop"
+        self.venv = root / "env"
+        self.base = root / "www" / "shop"
+        self.write("manage.py", "# django\n")
+        self.write("shop/views.py", "VERSION = 1\n")
+        venv.create(self.venv, with_pip=False, symlinks=True)
+        script = self.venv / "bin" / "gunicorn"
+        script.write_text(f"#!{self.venv}/bin/python\nprint('gunicorn')\n")
+        script.chmod(0o755)
+
+        os_manager = OSManager()
+        sync_manager = SyncManager(os_manager, workers=2)
+        self.artifacts = ArtifactManager(
+            os_manager, sync_manager, BytecodeManager(os_manager), root / "cache", workers=2
+        )
+        self.releases = ReleaseManager(os_manager, sync_manager)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def write(self, relative, content):
+        path = self.project / relative
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content)
+
+    def deploy(self, reference=""):
+        manifest = self.artifacts.load(reference, "shop")
+
+        def populate(staging, final, active):
+            return self.artifacts.extract(
+                manifest, staging, venv_prefix=final / ".venv", previous=active
+            )
+
+        release, report = self.releases.build_release(self.base, populate)
+        self.releases.activate(self.base, release.name)
+        return release, report
+
+    def test_build_is_content_addressed(self):
+        first = self.artifacts.build(self.project, self.venv, collect_static=False)
+        again = self.artifacts.build(self.project, self.venv, collect_static=False)
+        self.assertEqual(first.artifact_id, again.artifact_id)
+        self.assertEqual(again.new_chunks, 0)
+
+        self.write("shop/views.py", "VERSION = 2\n")
+        changed = self.artifacts.build(self.project, self.venv, collect_static=False)
+        self.assertNotEqual(changed.artifact_id, first.artifact_id)
+        # The source file and its bytecode
+        self.assertEqual(changed.new_chunks, 2)
+        manifest = self.artifacts.load(changed.artifact_id[:10])
+        self.assertIn("shop/__pycache__", " ".join(manifest["sections"]["app"]))
+
+    def test_extract_relocates_venv_and_links_unchanged_files(self):
+        self.artifacts.build(self.project, self.venv, collect_static=False)
+        first, report = self.deploy()
+        self.assertEqual(report.linked, 0)
+        script = first.path / ".venv" / "bin" / "gunicorn"
+        self.assertEqual(
+            script.read_text().splitlines()[0], f"#!{first.path / '.venv'}/bin/python"
+        )
+        self.assertTrue(os.access(script, os.X_OK))
+        self.assertEqual((first.path / "shop" / "views.py").read_text(), "VERSION = 1\n")
+
+        self.write("shop/views.py", "VERSION = 2\n")
+        self.artifacts.build(self.project, self.venv, collect_static=False)
+        second, report = self.deploy("latest")
+        self.assertEqual(report.changed_sections, ["app"])
+        self.assertGreater(report.linked, 0)
+        self.assertEqual(
+            (first.path / "manage.py").stat().st_ino, (second.path / "manage.py").stat().st_ino
+        )
+        self.assertEqual((second.path / "shop" / "views.py").read_text(), "VERSION = 2\n")
+        self.assertEqual((first.path / "shop" / "views.py").read_text(), "VERSION = 1\n")
+        # Relocated files are rewritten for each release, never shared
+        self.assertIn(str(second.path), (second.path / ".venv" / "bin" / "gunicorn").read_text())
+
+
+if __name__ == "__main__":
+    unittest.main()
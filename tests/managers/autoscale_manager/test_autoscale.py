@@ -0,0 +1,91 @@
+import unittest
+import tempfile
+from pathlib import Path
+import sys
+import os
+
+# Add the src directory to the Python path
+sys.path.insert(
+    0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../../../src"))
+)
+
+from djanbee.managers.autoscale_manager import (
+    AutoscalePolicy,
+    LoadSample,
+    decide,
+    parse_listen_backlog,
+    read_cpu_seconds,
+)
+
+
+def samples(count, workers=4, queued=0, busy=0.5, room=8, start=100.0, capacity=None):
+    return [
+        LoadSample(start + i * 2, 1000, workers, capacity or workers, queued, busy, room)
+        for i in range(count)
+    ]
+
+
+class TestDecide(unittest.TestCase):
+    def setUp(self):
+        self.policy = AutoscalePolicy(min_workers=2, max_workers=8, up_samples=2, down_samples=5)
+
+    def test_queueing_adds_workers(self):
+        decision = decide(self.policy, samples(2, queued=3))
+        self.assertEqual(decision.delta, 3)
+        # One sample is not enough to act on
+        self.assertEqual(decide(self.policy, samples(1, queued=3)).delta, 0)
+
+    def test_bounded_by_max_and_memory(self):
+        self.assertEqual(decide(self.policy, samples(2, workers=7, queued=10)).delta, 1)
+        self.assertEqual(decide(self.policy, samples(2, queued=10, room=0)).delta, 0)
+        self.assertEqual(decide(self.policy, samples(2, workers=8, busy=1.0)).delta, 0)
+
+    def test_threads_absorb_queued_connections(self):
+        decision = decide(self.policy, samples(2, queued=8, capacity=16))
+        self.assertEqual(decision.delta, 2)
+
+    def test_idle_removes_one_worker_at_a_time(self):
+        self.assertEqual(decide(self.policy, samples(5, busy=0.1)).delta, -1)
+        self.assertEqual(decide(self.policy, samples(4, busy=0.1)).delta, 0)
+        self.assertEqual(decide(self.policy, samples(5, workers=2, busy=0.0)).delta, 0)
+
+    def test_hysteresis_between_thresholds(self):
+        self.assertEqual(decide(self.policy, samples(10, busy=0.6)).delta, 0)
+
+    def test_cooldown_after_a_change(self):
+        recent = samples(5, busy=0.1)
+        self.assertEqual(decide(self.policy, recent, last_change=recent[-1].at - 30).delta, 0)
+        recent = samples(2, queued=3)
+        self.assertEqual(decide(self.policy, recent, last_change=recent[-1].at - 5).delta, 0)
+
+    def test_bounds_are_restored(self):
+        self.assertEqual(decide(self.policy, samples(1, workers=1)).delta, 1)
+        self.assertEqual(decide(self.policy, samples(1, workers=11)).delta, -3)
+
+    def test_validate(self):
+        with self.assertRaises(ValueError):
+            AutoscalePolicy(min_workers=4, max_workers=2).validate()
+
+
+class TestSampling(unittest.TestCase):
+    def test_parse_listen_backlog(self):
+        output = (
+            "u_str LISTEN 0   128  /run/other.sock 1 * 0\n"
+            "u_str LISTEN 17  2048 /run/gunicorn/shop.sock 2 * 0\n"
+            "u_str ESTAB  0   0    /run/gunicorn/shop.sock 3 * 4\n"
+        )
+        self.assertEqual(parse_listen_backlog(output, "/run/gunicorn/shop.sock"), 17)
+        self.assertIsNone(parse_listen_backlog(output, "/run/gunicorn/blog.sock"))
+
+    def test_read_cpu_seconds(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            (Path(tmp) / "42").mkdir()
+            ticks = os.sysconf("SC_CLK_TCK")
+            fields = ["S"] + ["0"] * 10 + [str(ticks * 3), str(ticks)] + ["0"] * 10
+            (Path(tmp) / "42" / "stat").write_text(f"42 (gunicorn: worker) {' '.join(fields)}\n")
+            self.assertEqual(read_cpu_seconds(42, Path(tmp)), 4.0)
+            self.assertEqual(read_cpu_seconds(43, Path(tmp)), 0.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
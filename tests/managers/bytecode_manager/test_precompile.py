@@ -0,0 +1,64 @@
+import unittest
+import tempfile
+from pathlib import Path
+import sys
+import os
+
+# Add the src directory to the Python path
+sys.path.insert(
+    0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../../../src"))
+)
+
+from djanbee.managers.os_manager import OSManager
+from djanbee.managers.bytecode_manager import BytecodeManager
+
+
+class TestPrecompile(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.project = Path(self.tmp.name).resolve()
+        self.manager = BytecodeManager(OSManager())
+
+        # Minimal venv inside the project that runs the current interpreter
+        self.venv = self.project / ".venv"
+        python = self.manager.os_manager.get_python_path(self.venv)
+        python.parent.mkdir(parents=True)
+        python.symlink_to(sys.executable)
+        site_packages = self.venv / "lib" / "python3" / "site-packages"
+        site_packages.mkdir(parents=True)
+        (site_packages / "library.py").write_text("VALUE = 1\n")
+
+        (self.project / "app").mkdir()
+        (self.project / "app" / "views.py").write_text("def index():\n    return 1\n")
+        (self.project / ".git").mkdir()
+        (self.project / ".git" / "hook.py").write_text("pass\n")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    @unittest.skipIf(sys.platform == "win32", "symlinked interpreter")
+    def test_compiles_project_and_site_packages_once(self):
+        report = self.manager.precompile(self.venv, self.project, workers=2)
+        self.assertEqual(report.total, 2)
+        self.assertEqual(report.compiled, 2)
+        self.assertEqual(report.failed, 0)
+        self.assertTrue((self.project / "app" / "__pycache__").is_dir())
+        self.assertFalse((self.project / ".git" / "__pycache__").exists())
+
+        report = self.manager.precompile(self.venv, self.project, workers=2)
+        self.assertEqual(report.compiled, 0)
+
+    @unittest.skipIf(sys.platform == "win32", "symlinked interpreter")
+    def test_recompiles_changed_source(self):
+        self.manager.precompile(self.venv, self.project, workers=1)
+        (self.project / "app" / "views.py").write_text("def index():\n    return 2\n")
+        report = self.manager.precompile(self.venv, self.project, workers=1)
+        self.assertEqual(report.compiled, 1)
+
+    def test_rejects_unknown_invalidation_mode(self):
+        with self.assertRaises(ValueError):
+            self.manager.precompile(self.venv, self.project, invalidation_mode="never")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,93 @@
+import unittest
+import sys
+import os
+
+# Add the src directory to the Python path
+sys.path.insert(
+    0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../../../src"))
+)
+
+from djanbee.managers.canary_manager import (
+    CanaryThresholds,
+    ReleaseStats,
+    compare_releases,
+    parse_timing_lines,
+)
+from djanbee.managers.server_manager.upstream import (
+    UpstreamBackend,
+    parse_upstream_config,
+    render_upstream_config,
+)
+
+
+def stats(release, durations, errors=0):
+    return ReleaseStats(release, list(durations), errors)
+
+
+class TestCanary(unittest.TestCase):
+    def setUp(self):
+        self.thresholds = CanaryThresholds(min_requests=10)
+
+    def test_parse_timing_lines(self):
+        lines = [
+            "1700000000.100 r1 200 0.010",
+            "1700000001.200 r2 502 0.300",
+            "1700000001.300 r2 200 0.020",
+            "1700000001.400 - 404 0.001",
+            "1699999999.000 r1 200 9.999",
+            "garbage",
+        ]
+        result = parse_timing_lines(lines, since=1700000000.0)
+        self.assertEqual(sorted(result), ["r1", "r2"])
+        self.assertEqual(result["r1"].durations, [0.010])
+        self.assertEqual((result["r2"].requests, result["r2"].errors), (2, 1))
+
+    def test_percentile_nearest_rank(self):
+        release = stats("r1", [i / 100 for i in range(1, 101)])
+        self.assertEqual(release.percentile(50), 0.50)
+        self.assertEqual(release.percentile(99), 0.99)
+        self.assertEqual(stats("r2", []).percentile(95), 0.0)
+
+    def test_compare_releases(self):
+        baseline = stats("r1", [0.05] * 50)
+
+        verdict = compare_releases(baseline, stats("r2", [0.05] * 5), self.thresholds)
+        self.assertFalse(verdict.decided)
+
+        verdict = compare_releases(baseline, stats("r2", [0.051] * 50), self.thresholds, final=True)
+        self.assertTrue(verdict.promote)
+
+        verdict = compare_releases(baseline, stats("r2", [0.05] * 45 + [0.4] * 5), self.thresholds)
+        self.assertTrue(verdict.decided)
+        self.assertFalse(verdict.promote)
+        self.assertTrue(any(reason.startswith("p99") for reason in verdict.reasons))
+
+        verdict = compare_releases(baseline, stats("r2", [0.05] * 50, errors=5), self.thresholds)
+        self.assertIn("error rate", verdict.reasons[0])
+
+        verdict = compare_releases(baseline, stats("r2", [0.05] * 5), self.thresholds, final=True)
+        self.assertEqual((verdict.decided, verdict.promote), (True, False))
+
+    def test_upstream_config_round_trip(self):
+        backends = [
+            UpstreamBackend("/run/gunicorn/shop-blue.sock", "r1", 90),
+            UpstreamBackend("/run/gunicorn/shop-green.sock", "r2", 10),
+        ]
+        content = render_upstream_config("shop", backends)
+        self.assertIn("10% djanbee_shop-green;", content)
+        self.assertIn("* djanbee_shop-blue;", content)
+        self.assertIn('"unix:/run/gunicorn/shop-green.sock" "r2";', content)
+        self.assertEqual(parse_upstream_config(content), backends)
+
+
+    def test_instances_balanced_with_least_conn(self):
+        sockets = ["/run/gunicorn/shop@1.sock", "/run/gunicorn/shop@2.sock"]
+        backend = UpstreamBackend("/run/gunicorn/shop.sock", "r3", servers=sockets)
+        content = render_upstream_config("shop", [backend])
+        self.assertIn("upstream djanbee_shop {\n    least_conn;", content)
+        self.assertIn("server unix:/run/gunicorn/shop@2.sock max_fails=1", content)
+        self.assertIn('"unix:/run/gunicorn/shop@1.sock" "r3";', content)
+        self.assertEqual(parse_upstream_config(content), [backend])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,76 @@
+import unittest
+import tempfile
+from pathlib import Path
+import sys
+import os
+
+# Add the src directory to the Python path
+sys.path.insert(
+    0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../../../src"))
+)
+
+from djanbee.managers.os_manager import OSManager
+from djanbee.managers.convergence_manager import (
+    ConvergenceManager,
+    DirectoryResource,
+    FileResource,
+    SymlinkResource,
+    ValueResource,
+)
+
+
+class TestConvergenceManager(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp.name)
+        self.manager = ConvergenceManager(OSManager())
+        self.values = {"STATIC_ROOT": "/srv/static"}
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _resources(self, content="[Service]\nExecStart=/bin/true\n"):
+        unit = self.root / "app.service"
+        return [
+            DirectoryResource(str(self.root / "static"), mode=0o750),
+            FileResource(str(unit), content, triggers=("daemon-reload", "restart")),
+            SymlinkResource(str(self.root / "enabled"), str(unit), triggers=("nginx-reload",)),
+            ValueResource(
+                "STATIC_ROOT",
+                "/var/www/app/static",
+                read=lambda: self.values["STATIC_ROOT"],
+                write=lambda: self.values.update(STATIC_ROOT="/var/www/app/static") or True,
+            ),
+        ]
+
+    def test_converges_then_changes_nothing(self):
+        report = self.manager.converge(self._resources())
+        self.assertTrue(report.success)
+        self.assertEqual(len(report.changed), 4)
+        self.assertEqual(report.triggers, ["daemon-reload", "restart", "nginx-reload"])
+        self.assertEqual((self.root / "static").stat().st_mode & 0o777, 0o750)
+        self.assertEqual(os.readlink(self.root / "enabled"), str(self.root / "app.service"))
+        self.assertEqual(self.values["STATIC_ROOT"], "/var/www/app/static")
+
+        mtime = (self.root / "app.service").stat().st_mtime_ns
+        again = self.manager.converge(self._resources())
+        self.assertEqual(again.changed, [])
+        self.assertEqual(again.triggers, [])
+        self.assertEqual(len(again.unchanged), 4)
+        self.assertEqual((self.root / "app.service").stat().st_mtime_ns, mtime)
+
+    def test_only_changed_resources_trigger(self):
+        self.manager.converge(self._resources())
+        report = self.manager.converge(self._resources("[Service]\nExecStart=/bin/false\n"))
+        self.assertEqual(report.changed, [(str(self.root / "app.service"), "content differs (+1 -1 lines)")])
+        self.assertEqual(report.triggers, ["daemon-reload", "restart"])
+
+    def test_diff_does_not_apply(self):
+        report = self.manager.diff(self._resources())
+        self.assertEqual(len(report.changed), 4)
+        self.assertFalse((self.root / "app.service").exists())
+        self.assertEqual(self.values["STATIC_ROOT"], "/srv/static")
+
+
+if __name__ == "__main__":
+    unittest.main()
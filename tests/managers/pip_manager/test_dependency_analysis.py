@@ -0,0 +1,95 @@
+import unittest
+import tempfile
+from pathlib import Path
+import sys
+import os
+
+# Add the src directory to the Python path
+sys.path.insert(
+    0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../../../src"))
+)
+
+from djanbee.managers.pip_manager import (
+    InstalledDistribution,
+    RequirementsParser,
+    find_unused_requirements,
+    scan_imports,
+    write_slim_requirements,
+)
+
+
+def dist(name, requires=(), top_level=None):
+    return InstalledDistribution(
+        name=name,
+        version="1.0",
+        path=Path(name),
+        requires=list(requires),
+        top_level=top_level if top_level is not None else [name.lower().replace("-", "_")],
+    )
+
+
+class TestDependencyAnalysis(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp.name)
+        (self.root / "shop").mkdir()
+        (self.root / "shop" / "views.py").write_text(
+            "from django.http import HttpResponse\nimport requests\nfrom . import models\n"
+        )
+        (self.root / "settings.py").write_text(
+            "INSTALLED_APPS = ['django.contrib.admin', 'rest_framework']\n"
+            "DATABASES = {'default': {'ENGINE': 'django.db.backends.postgresql'}}\n"
+        )
+        (self.root / "requirements.txt").write_text(
+            "Django==5.0\nrequests[socks]==2.31\ndjangorestframework==3.15\n"
+            "psycopg2-binary==2.9\npytest==8.0\nblack==24.1\n"
+        )
+        self.distributions = {
+            "django": dist("Django", ["asgiref>=3.7", "sqlparse>=0.3"]),
+            "asgiref": dist("asgiref"),
+            "sqlparse": dist("sqlparse"),
+            "requests": dist(
+                "requests",
+                ["urllib3 (<3,>=1.21)", "PySocks!=1.5.7,>=1.5.6 ; extra == 'socks'"],
+            ),
+            "urllib3": dist("urllib3"),
+            "pysocks": dist("PySocks", top_level=["socks"]),
+            "djangorestframework": dist("djangorestframework", ["django>=4.2"], ["rest_framework"]),
+            "psycopg2-binary": dist("psycopg2-binary", top_level=["psycopg2"]),
+            "pytest": dist("pytest", ["pluggy<2,>=1.3"]),
+            "pluggy": dist("pluggy"),
+            "black": dist("black"),
+        }
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def analyze(self, keep=()):
+        parsed = RequirementsParser().parse(self.root / "requirements.txt")
+        return find_unused_requirements(
+            parsed, self.distributions, scan_imports(self.root), keep
+        )
+
+    def test_reports_unreachable_requirements(self):
+        report = self.analyze()
+        self.assertEqual(report.unused_names, {"pytest", "black"})
+        self.assertIn("pysocks", report.reachable)
+        self.assertIn("asgiref", report.reachable)
+        self.assertNotIn("pluggy", report.reachable)
+
+    def test_keep_overrides_analysis(self):
+        self.assertEqual(self.analyze(keep=["black"]).unused_names, {"pytest"})
+
+    def test_writes_slim_requirements(self):
+        report = self.analyze()
+        output = write_slim_requirements(
+            self.root / "requirements.txt", report.unused_names, self.root / "requirements-prod.txt"
+        )
+        slim = RequirementsParser().parse(output)
+        self.assertEqual(
+            slim.names(), {"django", "requests", "djangorestframework", "psycopg2-binary"}
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
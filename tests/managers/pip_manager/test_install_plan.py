@@ -0,0 +1,103 @@
+import unittest
+import tempfile
+from pathlib import Path
+import sys
+import os
+
+# Add the src directory to the Python path
+sys.path.insert(
+    0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../../../src"))
+)
+
+from djanbee.managers.pip_manager import (
+    RequirementsParser,
+    build_install_plan,
+    version_satisfies,
+)
+
+
+class TestRequirementsParser(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp.name)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def write(self, name, content):
+        path = self.root / name
+        path.write_text(content)
+        return path
+
+    def test_follows_includes_and_keeps_markers(self):
+        """Test that -r/-c includes are followed and markers/pins are kept"""
+        self.write("base.txt", "Django==4.2.1  # web framework\nrequests[socks]>=2.0\n")
+        self.write("constraints.txt", "urllib3<2\n")
+        main = self.write(
+            "requirements.txt",
+            "-r base.txt\n-c constraints.txt\n"
+            "pywin32==306; sys_platform == 'win32'\n"
+            "gunicorn \\\n    ==21.2.0\n",
+        )
+
+        parsed = RequirementsParser().parse(main)
+
+        self.assertEqual(
+            parsed.names(), {"django", "requests", "pywin32", "gunicorn"}
+        )
+        self.assertEqual([c.key for c in parsed.constraints], ["urllib3"])
+        self.assertEqual(len(parsed.files), 3)
+
+        by_name = {r.key: r for r in parsed.requirements}
+        self.assertEqual(by_name["django"].pinned_version, "4.2.1")
+        self.assertEqual(by_name["requests"].extras, ["socks"])
+        self.assertEqual(by_name["pywin32"].marker, "sys_platform == 'win32'")
+        self.assertEqual(by_name["gunicorn"].specifier, "==21.2.0")
+
+    def test_include_cycles_are_ignored(self):
+        """Test that files including each other are parsed once"""
+        self.write("a.txt", "-r b.txt\nsix\n")
+        self.write("b.txt", "-r a.txt\nidna\n")
+
+        parsed = RequirementsParser().parse(self.root / "a.txt")
+
+        self.assertEqual(parsed.names(), {"six", "idna"})
+
+
+class TestInstallPlan(unittest.TestCase):
+    def parse(self, content):
+        tmp = tempfile.NamedTemporaryFile("w", suffix=".txt", delete=False)
+        tmp.write(content)
+        tmp.close()
+        self.addCleanup(os.unlink, tmp.name)
+        return RequirementsParser().parse(tmp.name)
+
+    def test_delta_contains_only_changes(self):
+        """Test that satisfied requirements are skipped and the rest is classified"""
+        parsed = self.parse("django==4.2.1\nrequests>=2.31\nwhitenoise\n")
+        installed = {"django": "4.1", "requests": "2.31.0", "celery": "5.3.0"}
+
+        plan = build_install_plan(parsed, installed, previously_required=["celery"])
+
+        self.assertEqual([r.key for r in plan.to_install], ["whitenoise"])
+        self.assertEqual([(r.key, v) for r, v in plan.to_upgrade], [("django", "4.1")])
+        self.assertEqual(plan.to_remove, ["celery"])
+
+    def test_unchanged_environment_gives_empty_plan(self):
+        """Test that a fully satisfied venv produces no work"""
+        parsed = self.parse("django~=4.2.0\n")
+
+        plan = build_install_plan(parsed, {"django": "4.2.7", "sqlparse": "0.4.4"})
+
+        self.assertTrue(plan.is_empty)
+
+    def test_version_satisfies(self):
+        self.assertTrue(version_satisfies("2.0.0", "==2.0"))
+        self.assertTrue(version_satisfies("1.4.2", "==1.4.*"))
+        self.assertFalse(version_satisfies("2.0rc1", ">=2.0"))
+        self.assertFalse(version_satisfies("4.3", "~=4.2.0"))
+        self.assertTrue(version_satisfies("4.3", ">=4,<5,!=4.2"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,56 @@
+import unittest
+import sys
+import os
+
+# Add the src directory to the Python path
+sys.path.insert(
+    0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../../../src"))
+)
+
+from djanbee.managers.profile_manager import ProfileManager, parse_importtime
+
+OUTPUT = """\
+import time: self [us] | cumulative | imported package
+import time:       171 |        171 |   _io
+import time:       347 |        518 | _frozen_importlib_external
+import time:        40 |         40 |     django.utils.version
+import time:       300 |        340 |   django.utils
+import time:      1200 |       1540 | django
+Some unrelated warning on stderr
+import time:        80 |         80 |     shop.models
+import time:       900 |        980 |   shop.apps
+import time:       100 |       1080 | shop
+"""
+
+
+class TestImportTimeParser(unittest.TestCase):
+    def setUp(self):
+        self.profile = parse_importtime(OUTPUT)
+
+    def test_builds_tree_from_post_order_output(self):
+        self.assertEqual(
+            [root.module for root in self.profile.roots],
+            ["_frozen_importlib_external", "django", "shop"],
+        )
+        django = self.profile.roots[1]
+        self.assertEqual([c.module for c in django.children], ["django.utils"])
+        self.assertEqual(django.children[0].children[0].module, "django.utils.version")
+        self.assertEqual(self.profile.total_us, 518 + 1540 + 1080)
+
+    def test_groups_by_package_and_app(self):
+        packages = {g.name: g.self_us for g in self.profile.by_package()}
+        self.assertEqual(packages["django"], 1540)
+        self.assertEqual(packages["shop"], 1080)
+
+        apps = {g.name: g.self_us for g in self.profile.by_app(["shop.apps.ShopConfig"])}
+        self.assertEqual(apps, {"shop.apps.ShopConfig": 1080})
+
+    def test_flags_regressions_against_baseline(self):
+        baseline = {"total_us": 3138, "packages": {"django": 1540, "shop": 1000}}
+        slower = parse_importtime(OUTPUT.replace("1200 |       1540", "9200 |       9540"))
+        regressions = ProfileManager(None).find_regressions(slower, baseline)
+        self.assertCountEqual([r.name for r in regressions], ["django", "total"])
+
+
+if __name__ == "__main__":
+    unittest.main()
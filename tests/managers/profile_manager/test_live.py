@@ -0,0 +1,57 @@
+import unittest
+import sys
+import os
+
+# Add the src directory to the Python path
+sys.path.insert(
+    0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../../../src"))
+)
+
+from djanbee.managers.profile_manager import (
+    LiveProfile,
+    merge_collapsed,
+    parse_collapsed,
+    render_collapsed,
+)
+
+MAIN = "run (gunicorn/arbiter.py:10)"
+VIEW = "get (shop/views.py:12)"
+
+WORKER_1 = f"""\
+{MAIN};wait (gunicorn/workers/sync.py:30) 50
+{MAIN};handle (gunicorn/workers/sync.py:120);{VIEW};render (django/template/base.py:80) 30
+{MAIN};handle (gunicorn/workers/sync.py:120);{VIEW} 10
+not a stack line
+"""
+
+WORKER_2 = f"""\
+{MAIN};handle (gunicorn/workers/sync.py:120);{VIEW};render (django/template/base.py:80) 10
+"""
+
+
+class TestLiveProfile(unittest.TestCase):
+    def setUp(self):
+        stacks = merge_collapsed([parse_collapsed(WORKER_1), parse_collapsed(WORKER_2)])
+        self.profile = LiveProfile(stacks, 2)
+
+    def test_merges_workers(self):
+        self.assertEqual(self.profile.samples, 100)
+        self.assertEqual(len(self.profile.stacks), 3)
+        # Rendered stacks parse back to the same counts, most sampled first
+        rendered = render_collapsed(self.profile.stacks)
+        self.assertEqual(parse_collapsed(rendered), self.profile.stacks)
+        self.assertTrue(rendered.endswith(" 10\n"))
+
+    def test_top_functions_leave_out_idle_waits(self):
+        self.assertEqual(self.profile.idle_samples, 50)
+        top = self.profile.top_functions(3)
+        # Ties on the stack go to the function running itself more often
+        self.assertEqual(top[0].frame, VIEW)
+        self.assertEqual([f.total_samples for f in top], [50, 50, 50])
+        view = {f.frame: f for f in self.profile.top_functions()}[VIEW]
+        self.assertEqual((view.self_samples, view.total_samples), (10, 50))
+        self.assertEqual((view.function, view.location), ("get", "shop/views.py:12"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,114 @@
+import unittest
+import tempfile
+import socketserver
+import threading
+import time
+from http.server import BaseHTTPRequestHandler
+from pathlib import Path
+import sys
+import os
+
+# Add the src directory to the Python path
+sys.path.insert(
+    0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../../../src"))
+)
+
+from djanbee.managers.os_manager import OSManager
+from djanbee.managers.readiness_manager import ReadinessManager
+
+
+ALLOWED_HOSTS = ("shop.example.com",)
+
+
+class Handler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path == "/broken":
+            status = 500
+        elif self.headers.get("Host") not in ALLOWED_HOSTS:
+            # What Django answers for DisallowedHost
+            status = 400
+        else:
+            status = 200 if self.path == "/healthz" else 404
+        self.send_response(status)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, *args):
+        pass
+
+
+class UnixHTTPServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+    def get_request(self):
+        request, _ = super().get_request()
+        return request, ("local", 0)
+
+
+@unittest.skipUnless(sys.platform.startswith("linux"), "needs unix sockets")
+class TestReadiness(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.socket_path = str(Path(self.tmp.name) / "app.sock")
+        self.manager = ReadinessManager(OSManager())
+        self.server = None
+
+    def tearDown(self):
+        if self.server:
+            self.server.shutdown()
+            self.server.server_close()
+        self.tmp.cleanup()
+
+    def start_server(self):
+        self.server = UnixHTTPServer(self.socket_path, Handler)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def test_waits_for_late_server_and_times_cold_start(self):
+        started_at = time.monotonic()
+        timer = threading.Timer(0.3, self.start_server)
+        timer.start()
+        result = self.manager.wait_until_ready(
+            self.socket_path, "/healthz", "shop.example.com", started_at=started_at, timeout=5
+        )
+        timer.join()
+
+        self.assertTrue(result.ready)
+        self.assertEqual(result.status, 200)
+        self.assertGreater(result.attempts, 1)
+        self.assertGreaterEqual(result.cold_start, 0.3)
+
+    def test_server_error_times_out(self):
+        self.start_server()
+        result = self.manager.wait_until_ready(self.socket_path, "/broken", timeout=0.3)
+        self.assertFalse(result.ready)
+        self.assertEqual(result.status, 500)
+        self.assertIn("500", result.error)
+
+    def test_rejected_host_counts_as_loaded(self):
+        self.start_server()
+        result = self.manager.wait_until_ready(self.socket_path, "/", timeout=2)
+        self.assertTrue(result.ready)
+        self.assertEqual(result.status, 400)
+
+        host = self.manager.probe_host([".example.com", "*"])
+        self.assertEqual(host, "example.com")
+        self.assertEqual(self.manager.probe_host(["*"]), "localhost")
+        result = self.manager.wait_until_ready(
+            self.socket_path, "/", self.manager.probe_host(ALLOWED_HOSTS), timeout=2
+        )
+        self.assertEqual(result.status, 404)
+        self.assertTrue(result.ready)
+
+    def test_history_and_regression(self):
+        for seconds in (1.0, 1.1, 0.9):
+            history = self.manager.record_cold_start(self.tmp.name, seconds, "r1")
+        self.assertIsNone(self.manager.find_regression(history))
+
+        history = self.manager.record_cold_start(self.tmp.name, 2.0, "r2")
+        regression = self.manager.find_regression(history)
+        self.assertEqual((regression.seconds, regression.median), (2.0, 1.0))
+        self.assertEqual(len(self.manager.load_history(self.tmp.name)), 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,99 @@
+import unittest
+import tempfile
+from pathlib import Path
+import sys
+import os
+
+# Add the src directory to the Python path
+sys.path.insert(
+    0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../../../src"))
+)
+
+from djanbee.managers.os_manager import OSManager
+from djanbee.managers.release_manager import ReleaseManager
+from djanbee.managers.sync_manager import SyncManager
+
+
+class TestReleases(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.source = Path(self.tmp.name) / "project"
+        self.base = Path(self.tmp.name) / "www" / "shop"
+        self.write("manage.py", "# django\n")
+        self.write("shop/views.py", "VERSION = 1\n")
+        os_manager = OSManager()
+        self.manager = ReleaseManager(os_manager, SyncManager(os_manager, workers=2))
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def write(self, relative, content):
+        path = self.source / relative
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content)
+
+    def deploy(self, suffix=""):
+        release, _ = self.manager.create_release(self.source, self.base, suffix=suffix)
+        self.manager.activate(self.base, release.name)
+        return release
+
+    def test_new_release_shares_unchanged_files(self):
+        first = self.deploy()
+        self.write("shop/views.py", "VERSION = 2\n")
+        second = self.deploy()
+
+        current = self.manager.get_current_path(self.base)
+        self.assertEqual((current / "shop" / "views.py").read_text(), "VERSION = 2\n")
+        self.assertEqual((first.path / "shop" / "views.py").read_text(), "VERSION = 1\n")
+        self.assertEqual(
+            (first.path / "manage.py").stat().st_ino,
+            (second.path / "manage.py").stat().st_ino,
+        )
+        self.assertEqual(self.manager.get_active_release(self.base), second.name)
+
+    def test_rollback_and_prune(self):
+        first = self.deploy()
+        self.write("shop/views.py", "VERSION = 2\n")
+        second = self.deploy()
+
+        self.assertEqual(self.manager.rollback(self.base).name, first.name)
+        with self.assertRaises(ValueError):
+            self.manager.rollback(self.base)
+        self.manager.activate(self.base, second.name)
+
+        # A blue/green colour link keeps its release from being pruned
+        self.manager.activate(self.base, first.name, link_name="blue")
+        self.assertEqual(self.manager.prune(self.base, keep=1), [])
+        os.unlink(self.base / "blue")
+
+        self.assertEqual(self.manager.prune(self.base, keep=1), [first.name])
+        self.assertEqual([r.name for r in self.manager.list_releases(self.base)], [second.name])
+
+    def test_watch_releases_do_not_push_out_deploys(self):
+        deployed = self.deploy()
+        watched = []
+        for version in range(3):
+            self.write("shop/views.py", f"VERSION = {version}\n")
+            watched.append(self.deploy(suffix=self.manager.WATCH_SUFFIX))
+            self.assertEqual(
+                self.manager.prune(self.base, keep=1), [r.name for r in watched[-2:-1]]
+            )
+
+        names = [r.name for r in self.manager.list_releases(self.base)]
+        self.assertEqual(names, [deployed.name, watched[-1].name])
+        self.assertEqual(self.manager.rollback(self.base).name, deployed.name)
+        self.assertEqual(self.manager.prune(self.base, keep=1), [watched[-1].name])
+
+    def test_rollback_a_colour_link(self):
+        first = self.deploy()
+        self.write("shop/views.py", "VERSION = 2\n")
+        second = self.deploy()
+        self.manager.activate(self.base, second.name, link_name="green")
+
+        self.assertEqual(self.manager.rollback(self.base, link_name="green").name, first.name)
+        self.assertEqual(self.manager.get_active_release(self.base, "green"), first.name)
+        self.assertEqual(self.manager.get_active_release(self.base), second.name)
+
+
+if __name__ == "__main__":
+    unittest.main()
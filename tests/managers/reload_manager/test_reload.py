@@ -0,0 +1,141 @@
+import unittest
+import tempfile
+import socket
+import socketserver
+import subprocess
+import threading
+import time
+from http.server import BaseHTTPRequestHandler
+from pathlib import Path
+from unittest.mock import MagicMock
+import sys
+import os
+
+# Add the src directory to the Python path
+sys.path.insert(
+    0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../../../src"))
+)
+
+from djanbee.managers.reload_manager import ReloadManager, RequestProbe
+from djanbee.managers.reload_manager.main import (
+    UNIX_ACCEPTED,
+    UNIX_QUEUED,
+    child_pids,
+    count_unix_connections,
+    pid_alive,
+)
+
+
+class Handler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        status = 400 if self.headers["Host"] != "localhost" else 200
+        self.send_response(status)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, *args):
+        pass
+
+
+class UnixHTTPServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+    def get_request(self):
+        request, _ = super().get_request()
+        return request, ("local", 0)
+
+
+@unittest.skipUnless(sys.platform.startswith("linux"), "needs /proc and unix sockets")
+class TestReload(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.socket_path = str(Path(self.tmp.name) / "app.sock")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_probe_counts_lost_requests(self):
+        server = UnixHTTPServer(self.socket_path, Handler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+
+        probe = RequestProbe(socket_path=self.socket_path, interval=0.005)
+        self.assertIsNone(probe.probe_once())
+        self.assertIsNone(RequestProbe(socket_path=self.socket_path, host_header="other").probe_once())
+
+        probe.start()
+        time.sleep(0.1)
+        server.shutdown()
+        server.server_close()
+        os.unlink(self.socket_path)
+        time.sleep(0.1)
+        result = probe.stop()
+
+        self.assertGreater(result.sent, result.lost)
+        self.assertGreater(result.lost, 0)
+        self.assertIn("FileNotFoundError", result.errors)
+
+    def test_count_unix_connections(self):
+        listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        listener.bind(self.socket_path)
+        listener.listen()
+        clients, accepted = [], []
+        try:
+            self.assertEqual(count_unix_connections(self.socket_path), 0)
+            for _ in range(2):
+                client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+                client.connect(self.socket_path)
+                clients.append(client)
+                accepted.append(listener.accept()[0])
+            self.assertEqual(count_unix_connections(self.socket_path), 2)
+
+            accepted.pop().close()
+            self.assertEqual(count_unix_connections(self.socket_path), 1)
+
+            # Connected but not yet accepted: waiting in the accept queue
+            client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            client.connect(self.socket_path)
+            clients.append(client)
+            self.assertEqual(count_unix_connections(self.socket_path), 2)
+            self.assertEqual(count_unix_connections(self.socket_path, (UNIX_QUEUED,)), 1)
+            self.assertEqual(count_unix_connections(self.socket_path, (UNIX_ACCEPTED,)), 1)
+        finally:
+            for sock in clients + accepted + [listener]:
+                sock.close()
+
+    def test_stopped_service_is_only_started_on_request(self):
+        os_manager = MagicMock()
+        os_manager.check_service_status.return_value = False
+        manager = ReloadManager(os_manager)
+
+        report = manager.reload_gunicorn("shop")
+        self.assertFalse(report.success)
+        os_manager.start_service.assert_not_called()
+
+        os_manager.start_service.return_value = MagicMock(success=True)
+        self.assertTrue(manager.reload_gunicorn("shop", start=True).success)
+        os_manager.start_service.assert_called_once_with("gunicorn-shop")
+
+    def test_child_pids(self):
+        parent = subprocess.Popen(
+            [sys.executable, "-c",
+             "import subprocess, sys, time;"
+             "children = [subprocess.Popen([sys.executable, '-c', 'import time; time.sleep(30)']) for _ in range(2)];"
+             "print(' '.join(str(c.pid) for c in children), flush=True);"
+             "time.sleep(30)"],
+            stdout=subprocess.PIPE,
+            text=True,
+        )
+        try:
+            expected = sorted(int(pid) for pid in parent.stdout.readline().split())
+            self.assertEqual(child_pids(parent.pid), expected)
+            self.assertTrue(pid_alive(expected[0]))
+        finally:
+            for pid in child_pids(parent.pid):
+                os.kill(pid, 9)
+            parent.kill()
+            parent.wait()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,96 @@
+import unittest
+import tempfile
+from pathlib import Path
+import sys
+import os
+
+# Add the src directory to the Python path
+sys.path.insert(
+    0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../../../src"))
+)
+
+from djanbee.managers.resource_manager import (
+    HostBudget,
+    derive_budget,
+    derive_limits,
+    format_size,
+    parse_size,
+    read_cgroup_usage,
+)
+from djanbee.managers.sizing_manager import HostResources
+
+GIB = 1024 ** 3
+MIB = 1024 ** 2
+
+
+class TestLimits(unittest.TestCase):
+    def test_budget_keeps_a_reserve(self):
+        budget = derive_budget(HostResources(4, 8 * GIB, 6 * GIB), pid_max=32768, nr_open=1048576)
+        self.assertEqual(budget.memory, 6963 * MIB)
+        self.assertEqual((budget.tasks, budget.nofile), (16384, 65536))
+
+        budget = derive_budget(HostResources(4, 8 * GIB, 6 * GIB), overrides={"memory": "4G", "cpus": 2})
+        self.assertEqual((budget.memory, budget.cpus), (4 * GIB, 2.0))
+
+    def test_weights_share_the_budget(self):
+        budget = HostBudget(8 * GIB, tasks=4096)
+        limits = derive_limits(budget, weight=300, total_weight=400)
+        self.assertEqual(limits.memory_high, 6 * GIB)
+        # Bursts above the share stay within the budget
+        self.assertEqual(limits.memory_max, 8 * GIB)
+        self.assertEqual(limits.tasks_max, 3072)
+        self.assertEqual(
+            limits.slice_directives(),
+            ["MemoryHigh=6G", "MemoryMax=8G", "CPUWeight=300", "TasksMax=3072", "IOWeight=300"],
+        )
+
+    def test_project_overrides(self):
+        limits = derive_limits(HostBudget(8 * GIB), overrides={"memory_high": "1G", "cpu_quota": 1.5})
+        self.assertEqual(limits.memory_high, GIB)
+        self.assertIn("CPUQuota=150%", limits.slice_directives())
+        self.assertEqual(limits.reasons["memory_high"], "set in .djanbee/resources.json")
+
+    def test_sizes(self):
+        self.assertEqual(parse_size("512M"), 512 * MIB)
+        self.assertEqual(parse_size("1.5GiB"), 1536 * MIB)
+        self.assertEqual(format_size(1536 * MIB), "1536M")
+        self.assertEqual(format_size(2 * GIB), "2G")
+        with self.assertRaises(ValueError):
+            parse_size("lots")
+
+
+class TestCgroupUsage(unittest.TestCase):
+    def test_reads_a_cgroup_directory(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp)
+            files = {
+                "cgroup.procs": "123\n",
+                "memory.current": f"{300 * MIB}\n",
+                "memory.high": f"{512 * MIB}\n",
+                "memory.max": "max\n",
+                "pids.current": "14\n",
+                "cpu.weight": "200\n",
+                "io.weight": "default 200\n",
+                "cpu.stat": "usage_usec 2500000\nthrottled_usec 500000\n",
+                "memory.events": "low 0\nhigh 3\nmax 0\noom 0\noom_kill 1\n",
+                "cpu.pressure": "some avg10=1.50 avg60=0.80 avg300=0.20 total=1234\n"
+                "full avg10=0.00 avg60=0.00 avg300=0.00 total=0\n",
+            }
+            for name, content in files.items():
+                (path / name).write_text(content)
+
+            usage = read_cgroup_usage(path)
+            self.assertEqual((usage.memory_current, usage.memory_high), (300 * MIB, 512 * MIB))
+            self.assertIsNone(usage.memory_max)
+            self.assertEqual((usage.cpu_weight, usage.io_weight), (200, 200))
+            self.assertEqual((usage.cpu_usage, usage.cpu_throttled), (2.5, 0.5))
+            self.assertEqual((usage.oom_kills, usage.high_events), (1, 3))
+            self.assertEqual(usage.pressure, {"cpu": 1.5})
+
+    def test_missing_cgroup(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            self.assertIsNone(read_cgroup_usage(Path(tmp) / "djanbee-shop.slice"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,45 @@
+import unittest
+from unittest.mock import MagicMock
+import sys
+import os
+
+# Add the src directory to the Python path
+sys.path.insert(
+    0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../../../src"))
+)
+
+from djanbee.managers.server_manager.server_implementations.nginx import NginxServerManager
+
+
+class TestNginxSite(unittest.TestCase):
+    def setUp(self):
+        self.nginx = NginxServerManager(MagicMock(), MagicMock(), MagicMock(), MagicMock())
+
+    def location(self, content):
+        lines = content.splitlines()
+        start = lines.index("    location / {")
+        return lines[start + 1 : lines.index("    }", start)]
+
+    def test_plain_site_location(self):
+        _, content = self.nginx.render_server_config("shop")
+        self.assertEqual(
+            self.location(content),
+            [
+                "        include proxy_params;",
+                "        proxy_pass http://unix:/run/gunicorn/shop.sock;",
+            ],
+        )
+
+    def test_upstream_site_location_is_evenly_indented(self):
+        _, content = self.nginx.render_server_config(
+            "shop", upstream="djanbee_shop", websockets=True, next_upstream_tries=2
+        )
+        lines = self.location(content)
+        self.assertEqual(len(lines), 9)
+        self.assertIn("        access_log /var/log/nginx/access.log;", lines)
+        for line in lines:
+            self.assertRegex(line, r"^        \S")
+
+
+if __name__ == "__main__":
+    unittest.main()
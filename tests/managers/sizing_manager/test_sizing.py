@@ -0,0 +1,126 @@
+import unittest
+import tempfile
+from pathlib import Path
+import sys
+import os
+
+# Add the src directory to the Python path
+sys.path.insert(
+    0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../../../src"))
+)
+
+from djanbee.managers.os_manager import OSManager
+from djanbee.managers.sizing_manager import (
+    HostResources,
+    MemoryReport,
+    SizingManager,
+    detect_host,
+    partition_cpus,
+    plan_workers,
+    read_smaps_rollup,
+)
+
+GIB = 1024 ** 3
+MIB = 1024 ** 2
+
+
+class TestPlanWorkers(unittest.TestCase):
+    def test_cpu_bound(self):
+        plan = plan_workers(HostResources(4, 16 * GIB, 12 * GIB), 120 * MIB)
+        self.assertEqual((plan.workers, plan.threads, plan.worker_class), (9, 1, "sync"))
+        self.assertEqual(plan.arguments(), ["--workers", "9"])
+
+    def test_memory_bound_uses_threads(self):
+        plan = plan_workers(HostResources(8, 2 * GIB, GIB), 200 * MIB)
+        # 819 MiB usable fits 4 workers of 200 MiB; 17 wanted by the CPUs
+        self.assertEqual((plan.workers, plan.threads, plan.worker_class), (4, 5, "gthread"))
+        self.assertIn("--threads", plan.arguments())
+
+    def test_cgroup_quota_limits_cpus(self):
+        plan = plan_workers(HostResources(64, 64 * GIB, 60 * GIB, cpu_quota=1.5), 100 * MIB)
+        self.assertEqual(plan.workers, 5)
+
+    def test_overrides(self):
+        manager = SizingManager(OSManager())
+        plan = manager.plan(HostResources(2, 4 * GIB, 3 * GIB), threads=4)
+        self.assertEqual((plan.workers, plan.threads, plan.worker_class), (5, 4, "gthread"))
+        self.assertIn("threads set to 4", plan.reasons)
+
+
+class TestDetectHost(unittest.TestCase):
+    def test_reads_meminfo_and_cgroup_v2(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            proc, cgroup = Path(tmp) / "proc", Path(tmp) / "cgroup"
+            (proc / "self").mkdir(parents=True)
+            (proc / "meminfo").write_text(
+                "MemTotal:       8000000 kB\nMemFree:         100000 kB\nMemAvailable:   4000000 kB\n"
+            )
+            (proc / "self" / "cgroup").write_text("0::/app.slice/web.service\n")
+            service = cgroup / "app.slice" / "web.service"
+            service.mkdir(parents=True)
+            (service / "cpu.max").write_text("max 100000\n")
+            (service.parent / "cpu.max").write_text("200000 100000\n")
+            (service / "memory.max").write_text(f"{GIB}\n")
+
+            host = detect_host(proc, cgroup)
+            self.assertEqual(host.memory_total, 8000000 * 1024)
+            self.assertEqual(host.memory_available, 4000000 * 1024)
+            self.assertEqual(host.cpu_quota, 2.0)
+            self.assertEqual(host.memory_limit, GIB)
+            self.assertEqual(host.usable_memory, GIB)
+
+
+class TestPartitionCpus(unittest.TestCase):
+    def test_hyperthread_siblings_stay_together(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            # 4 cores with 2 threads each; cpu4-7 are the siblings of cpu0-3
+            for cpu in range(8):
+                topology = root / f"cpu{cpu}" / "topology"
+                topology.mkdir(parents=True)
+                (topology / "physical_package_id").write_text("0\n")
+                (topology / "core_id").write_text(f"{cpu % 4}\n")
+
+            self.assertEqual(
+                partition_cpus(2, set(range(8)), root), ["0-1,4-5", "2-3,6-7"]
+            )
+            # Fewer cores than groups: single CPUs are handed out
+            self.assertEqual(partition_cpus(3, {0, 4, 1}, root), ["0", "1", "4"])
+            self.assertEqual(partition_cpus(3, {0, 1}, root), [])
+
+
+class TestMemoryReport(unittest.TestCase):
+    def test_preloaded_workers_add_only_private_memory(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            proc = Path(tmp)
+            rollups = {
+                1: (120, 120, 0, 0, 40, 80),
+                2: (130, 50, 100, 0, 0, 30),
+                3: (126, 48, 100, 0, 0, 26),
+            }
+            for pid, (rss, pss, shared_clean, shared_dirty, private_clean, private_dirty) in rollups.items():
+                (proc / str(pid)).mkdir()
+                (proc / str(pid) / "smaps_rollup").write_text(
+                    "55d0c0000000-7ffc00000000 ---p 00000000 00:00 0    [rollup]\n"
+                    f"Rss:            {rss * 1024} kB\n"
+                    f"Pss:            {pss * 1024} kB\n"
+                    f"Shared_Clean:   {shared_clean * 1024} kB\n"
+                    f"Shared_Dirty:   {shared_dirty * 1024} kB\n"
+                    f"Private_Clean:  {private_clean * 1024} kB\n"
+                    f"Private_Dirty:  {private_dirty * 1024} kB\n"
+                    "Swap:                  0 kB\n"
+                )
+
+            master = read_smaps_rollup(1, proc)
+            self.assertEqual(master.private, 120 * MIB)
+            report = MemoryReport(master, [read_smaps_rollup(pid, proc) for pid in (2, 3)])
+            self.assertEqual(report.worker_shared, 100 * MIB)
+            self.assertEqual(report.worker_private, 28 * MIB)
+            self.assertEqual(report.total, 218 * MIB)
+            # 1 GiB less the master, at 28 MiB per worker
+            self.assertEqual(report.workers_fitting(GIB), 32)
+            self.assertIsNone(read_smaps_rollup(4, proc))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,51 @@
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock
+import sys
+import os
+
+# Add the src directory to the Python path
+sys.path.insert(
+    0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../../../src"))
+)
+
+from djanbee.managers.sizing_manager import WorkerPlan
+from djanbee.managers.socket_manager.socket_implementations.gunicorn import (
+    GunicornSocketManager,
+)
+
+
+class TestSocketActivation(unittest.TestCase):
+    def setUp(self):
+        os_manager = MagicMock()
+        os_manager.get_username.return_value = "deploy"
+        django_manager = MagicMock()
+        django_manager.state.active_venv_path = Path("/srv/shop/.venv")
+        self.sockets = GunicornSocketManager(os_manager, MagicMock(), django_manager)
+        self.release = Path("/var/www/shop/current")
+
+    def test_activated_service_inherits_the_socket(self):
+        _, content = self.sockets.render_socket_service(
+            self.release, "shop", worker_plan=WorkerPlan(), activation="socket"
+        )
+        self.assertIn("Requires=gunicorn-shop.socket", content)
+        self.assertIn("Type=notify", content)
+        self.assertNotIn("--daemon", content)
+        self.assertIn("[Install]", content)
+
+        _, lazy = self.sockets.render_socket_service(
+            self.release, "shop", worker_plan=WorkerPlan(), activation="lazy"
+        )
+        # Started by its socket only, never at boot
+        self.assertNotIn("[Install]", lazy)
+
+    def test_socket_unit_listens_on_the_service_socket(self):
+        path, content = self.sockets.render_socket_unit("shop", socket_group="www-data")
+        self.assertEqual(path.name, "gunicorn-shop.socket")
+        self.assertIn(f"ListenStream={self.sockets.get_socket_path('shop')}", content)
+        self.assertIn("SocketGroup=www-data", content)
+        self.assertIn("SocketMode=0660", content)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,55 @@
+import unittest
+import tempfile
+from pathlib import Path
+import sys
+import os
+
+# Add the src directory to the Python path
+sys.path.insert(
+    0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../../../src"))
+)
+
+from djanbee.managers.socket_manager import detect_asgi
+
+
+class TestDetectAsgi(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp.name)
+        (self.root / "shop").mkdir()
+        (self.root / "shop" / "wsgi.py").write_text("application = None\n")
+        (self.root / "orders" / "views").mkdir(parents=True)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_finds_async_views_and_consumers(self):
+        (self.root / "shop" / "asgi.py").write_text("application = None\n")
+        (self.root / "orders" / "views" / "api.py").write_text(
+            "async def poll(request):\n    pass\n\ndef index(request):\n    pass\n"
+        )
+        (self.root / "orders" / "consumers.py").write_text(
+            "from channels.generic.websocket import AsyncWebsocketConsumer\n\n"
+            "class Updates(AsyncWebsocketConsumer):\n    pass\n"
+        )
+        # Async helpers outside views are not views
+        (self.root / "orders" / "tasks.py").write_text("async def fetch():\n    pass\n")
+
+        usage = detect_asgi(self.root, "shop")
+        self.assertEqual(usage.asgi_app, "shop.asgi:application")
+        self.assertEqual(usage.async_views, ["orders/views/api.py:poll"])
+        self.assertEqual(usage.consumers, ["orders/consumers.py:Updates"])
+        self.assertTrue(usage.recommended and usage.websockets)
+
+    def test_sync_project_is_not_recommended(self):
+        (self.root / "shop" / "asgi.py").write_text("application = None\n")
+        (self.root / "orders" / "views.py").write_text("def index(request):\n    pass\n")
+        usage = detect_asgi(self.root, "shop")
+        self.assertFalse(usage.recommended)
+
+        (self.root / "shop" / "asgi.py").unlink()
+        self.assertIsNone(detect_asgi(self.root, "shop").asgi_app)
+
+
+if __name__ == "__main__":
+    unittest.main()
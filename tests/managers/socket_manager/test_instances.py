@@ -0,0 +1,71 @@
+import unittest
+import tempfile
+from pathlib import Path
+from unittest.mock import MagicMock
+import sys
+import os
+
+# Add the src directory to the Python path
+sys.path.insert(
+    0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../../../src"))
+)
+
+from djanbee.managers.socket_manager import SocketManager
+from djanbee.managers.socket_manager.socket_implementations.gunicorn import (
+    GunicornSocketManager,
+)
+
+
+class TestInstances(unittest.TestCase):
+    def setUp(self):
+        os_manager = MagicMock()
+        os_manager.get_username.return_value = "deploy"
+        django_manager = MagicMock()
+        django_manager.state.active_venv_path = Path("/srv/shop/.venv")
+        self.sockets = GunicornSocketManager(os_manager, MagicMock(), django_manager)
+
+    def test_template_units_name_everything_after_the_instance(self):
+        path, content = self.sockets.render_socket_service(
+            Path("/var/www/shop/current"),
+            "shop",
+            activation="socket",
+            config_path=Path("/etc/gunicorn/shop/gunicorn.conf.py"),
+            template=True,
+        )
+        self.assertEqual(path.name, "gunicorn-shop@.service")
+        self.assertIn("Requires=gunicorn-shop@%i.socket", content)
+        self.assertIn("--bind unix:/run/gunicorn/shop@%i.sock", content)
+        self.assertIn("--pid /run/gunicorn/shop@%i.pid", content)
+
+        path, content = self.sockets.render_socket_unit("shop", template=True)
+        self.assertEqual(path.name, "gunicorn-shop@.socket")
+        self.assertIn("ListenStream=/run/gunicorn/shop@%i.sock", content)
+
+    def test_instances_are_found_by_their_dropins(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            self.sockets.SYSTEMD_DIR = Path(tmp)
+            self.assertEqual(self.sockets.get_service_instances("shop"), ["shop"])
+
+            for index, cpus in ((2, "2-3"), (1, "0-1"), (10, None)):
+                path, content = self.sockets.render_instance_dropin("shop", index, cpus)
+                target = Path(tmp) / path.parent.name / path.name
+                target.parent.mkdir()
+                target.write_text(content)
+
+            self.assertEqual(
+                self.sockets.get_service_instances("shop"), ["shop@1", "shop@2", "shop@10"]
+            )
+            self.assertEqual(self.sockets.get_instance_affinity("shop@2"), "2-3")
+            self.assertIsNone(self.sockets.get_instance_affinity("shop@10"))
+
+    def test_project_services_include_the_colours(self):
+        sockets = SocketManager(MagicMock(), MagicMock(), MagicMock())
+        with tempfile.TemporaryDirectory() as tmp:
+            sockets._manager.SYSTEMD_DIR = Path(tmp)
+            self.assertEqual(
+                sockets.get_project_services("shop"), ["shop", "shop-blue", "shop-green"]
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
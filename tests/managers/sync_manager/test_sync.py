@@ -0,0 +1,78 @@
+import unittest
+import tempfile
+from pathlib import Path
+import sys
+import os
+
+# Add the src directory to the Python path
+sys.path.insert(
+    0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../../../src"))
+)
+
+from djanbee.managers.os_manager import OSManager
+from djanbee.managers.sync_manager import IgnoreRules, SyncManager
+
+
+class TestSync(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.source = Path(self.tmp.name) / "project"
+        self.destination = Path(self.tmp.name) / "www" / "application"
+        self.write("manage.py", "# django\n")
+        self.write("shop/views.py", "def index():\n    pass\n")
+        self.write("shop/__pycache__/views.cpython-311.pyc", "")
+        self.write(".git/HEAD", "ref: refs/heads/main\n")
+        self.write("media/upload.png", "png")
+        self.write(".venv/pyvenv.cfg", "home = /usr/bin\n")
+        self.write(".venv/lib/site.py", "")
+        self.manager = SyncManager(OSManager(), workers=4)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def write(self, relative, content):
+        path = self.source / relative
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content)
+
+    def test_copies_only_deployable_files(self):
+        report = self.manager.sync(self.source, self.destination)
+        self.assertEqual(sorted(report.copied), ["manage.py", "shop/views.py"])
+        self.assertEqual((self.destination / "shop" / "views.py").read_text(), "def index():\n    pass\n")
+        self.assertFalse((self.destination / ".git").exists())
+        self.assertFalse((self.destination / "media").exists())
+
+    def test_resync_copies_changes_and_deletes_stale_files(self):
+        self.manager.sync(self.source, self.destination)
+
+        report = self.manager.sync(self.source, self.destination)
+        self.assertEqual((report.copied, report.deleted, report.hashed), ([], [], 0))
+
+        self.write("shop/views.py", "def index():\n    return 1\n")
+        (self.source / "manage.py").unlink()
+        report = self.manager.sync(self.source, self.destination)
+        self.assertEqual(report.copied, ["shop/views.py"])
+        self.assertEqual(report.deleted, ["manage.py"])
+        self.assertFalse((self.destination / "manage.py").exists())
+
+    def test_ignore_file_and_symlinks(self):
+        self.write(".djanbeeignore", "*.log\n/docs/\n")
+        self.write("server.log", "")
+        self.write("docs/index.md", "")
+        self.write("shop/docs/readme.md", "")
+        os.symlink("views.py", self.source / "shop" / "alias.py")
+
+        report = self.manager.sync(self.source, self.destination)
+        self.assertNotIn("server.log", report.copied)
+        self.assertNotIn("docs/index.md", report.copied)
+        self.assertIn("shop/docs/readme.md", report.copied)
+        self.assertEqual(os.readlink(self.destination / "shop" / "alias.py"), "views.py")
+
+    def test_ignore_rules_negation(self):
+        rules = IgnoreRules(["*.txt", "!requirements.txt"])
+        self.assertTrue(rules.is_ignored("notes.txt", False))
+        self.assertFalse(rules.is_ignored("requirements.txt", False))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,189 @@
+import json
+import threading
+import unittest
+import tempfile
+from pathlib import Path
+import sys
+import os
+
+# Add the src directory to the Python path
+sys.path.insert(
+    0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../../../src"))
+)
+
+from djanbee.managers.os_manager import OSManager
+from djanbee.managers.sizing_manager import WorkerPlan
+from djanbee.managers.tuning_manager import (
+    ProjectProfile,
+    TuningManager,
+    derive_runtime,
+    derive_settings,
+    find_allocator,
+    parse_assignment,
+    parse_runtime_assignment,
+    project_asserts,
+    read_config,
+    read_environment,
+    render_config,
+    render_environment,
+)
+
+
+class TestDeriveSettings(unittest.TestCase):
+    def test_profile_raises_timeouts_and_recycling(self):
+        profile = ProjectProfile(
+            cold_starts=[4.0, 21.0],
+            durations=[0.1] * 98 + [3.0, 9.0],
+            span=10.0,
+        )
+        settings = derive_settings(WorkerPlan(4), profile, somaxconn=1024)
+        # The slowest boot needs 42s before a worker is declared stuck
+        self.assertEqual(settings.timeout, 45)
+        self.assertEqual(settings.graceful_timeout, 20)
+        # 10 requests/s over 4 workers, each recycled about every 10 minutes
+        self.assertEqual(settings.max_requests, 2000)
+        self.assertEqual(settings.max_requests_jitter, 200)
+        self.assertEqual(settings.backlog, 1024)
+
+    def test_config_round_trip(self):
+        settings = derive_settings(WorkerPlan(2, 4, "gthread"))
+        settings.apply({"keepalive": 5})
+        values = read_config(render_config(settings, "shop"))
+        self.assertEqual(values["threads"], 4)
+        self.assertEqual(values["keepalive"], 5)
+        self.assertEqual(values["accesslog"], "/var/log/gunicorn/shop-access.log")
+
+        # Threads are meaningless for sync workers and left out
+        self.assertNotIn("threads", read_config(render_config(derive_settings(WorkerPlan()), "shop")))
+
+    def test_preload_adds_gc_freeze_hooks(self):
+        settings = derive_settings(WorkerPlan())
+        self.assertNotIn("gc.freeze", render_config(settings, "shop"))
+        settings.apply({"preload_app": True})
+        config = render_config(settings, "shop")
+        self.assertTrue(read_config(config)["preload_app"])
+        namespace = {}
+        exec(compile(config, "gunicorn.conf.py", "exec"), namespace)
+        self.assertTrue(callable(namespace["pre_fork"]))
+        self.assertTrue(callable(namespace["post_fork"]))
+        namespace["post_fork"](None, None)
+
+    def test_live_profiler_hook_writes_collapsed_stacks(self):
+        settings = derive_settings(WorkerPlan())
+        self.assertNotIn("post_worker_init", render_config(settings, "shop"))
+        settings.apply({"live_profiler": True})
+        config = render_config(settings, "shop")
+        self.assertEqual(read_config(config)["LIVE_PROFILE_CONTROL"], "/run/gunicorn/shop.profile")
+        namespace = {}
+        exec(compile(config, "gunicorn.conf.py", "exec"), namespace)
+        self.assertTrue(callable(namespace["post_worker_init"]))
+
+        stop = threading.Event()
+
+        def handle_request():
+            while not stop.is_set():
+                sum(range(1000))
+
+        with tempfile.TemporaryDirectory() as tmp:
+            control = Path(tmp) / "shop.profile"
+            output = Path(tmp) / "stacks"
+            control.write_text(json.dumps({"rate": 200, "duration": 0.2, "output": str(output)}))
+            namespace["LIVE_PROFILE_CONTROL"] = str(control)
+            worker = threading.Thread(target=handle_request)
+            worker.start()
+            try:
+                namespace["_live_profile"]()
+            finally:
+                stop.set()
+                worker.join()
+            stacks = (output / f"{os.getpid()}.folded").read_text()
+        self.assertIn(";handle_request (", stacks)
+
+    def test_parse_assignment(self):
+        self.assertEqual(parse_assignment("max-requests=500"), ("max_requests", 500))
+        self.assertEqual(parse_assignment("preload_app=yes"), ("preload_app", True))
+        with self.assertRaises(ValueError):
+            parse_assignment("timeout=soon")
+        with self.assertRaises(ValueError):
+            parse_assignment("bind=0.0.0.0:80")
+
+
+class TestRuntimeEnvironment(unittest.TestCase):
+    def test_glibc_threads_get_few_arenas(self):
+        environment = derive_runtime(WorkerPlan(2, 4, "gthread"))
+        self.assertEqual(environment.values["MALLOC_ARENA_MAX"], "2")
+        self.assertEqual(environment.values["PYTHONHASHSEED"], "random")
+        self.assertNotIn("LD_PRELOAD", environment.values)
+
+    def test_allocator_read_only_release_and_asserts(self):
+        environment = derive_runtime(
+            WorkerPlan(),
+            allocator=Path("/usr/lib/libjemalloc.so.2"),
+            asserts=["shop/views.py:12"],
+            cache_dir=Path("/var/cache/djanbee/shop"),
+        )
+        self.assertEqual(environment.values["LD_PRELOAD"], "/usr/lib/libjemalloc.so.2")
+        self.assertNotIn("MALLOC_ARENA_MAX", environment.values)
+        self.assertEqual(environment.values["PYTHONPYCACHEPREFIX"], "/var/cache/djanbee/shop")
+        self.assertNotIn("PYTHONOPTIMIZE", environment.values)
+        self.assertIn("shop/views.py:12", environment.reasons["PYTHONOPTIMIZE"])
+
+    def test_optimization_is_opt_in(self):
+        environment = derive_runtime(WorkerPlan())
+        self.assertNotIn("PYTHONOPTIMIZE", environment.values)
+        environment.apply({"PYTHONOPTIMIZE": 1})
+        self.assertEqual(environment.values["PYTHONOPTIMIZE"], "1")
+
+    def test_pins_and_file_round_trip(self):
+        environment = derive_runtime(WorkerPlan())
+        environment.apply({"MALLOC_ARENA_MAX": 4, "PYTHONOPTIMIZE": "", "timeout": 60})
+        values = read_environment(render_environment(environment, "shop"))
+        self.assertEqual(values["MALLOC_ARENA_MAX"], "4")
+        self.assertNotIn("PYTHONOPTIMIZE", values)
+        self.assertEqual(parse_runtime_assignment("LD_PRELOAD="), ("LD_PRELOAD", ""))
+        with self.assertRaises(ValueError):
+            parse_runtime_assignment("PYTHONOPTIMIZE=3")
+
+    def test_asserts_outside_tests(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            (root / "shop").mkdir()
+            (root / "shop" / "views.py").write_text("def view():\n    assert True\n")
+            (root / "shop" / "tests.py").write_text("assert True\n")
+            (root / "tests").mkdir()
+            (root / "tests" / "checks.py").write_text("assert True\n")
+            self.assertEqual(project_asserts(root), [os.path.join("shop", "views.py") + ":2"])
+
+    def test_find_allocator(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            self.assertIsNone(find_allocator([tmp]))
+            (Path(tmp) / "libtcmalloc_minimal.so.4").write_text("")
+            (Path(tmp) / "libjemalloc.so.2").write_text("")
+            self.assertEqual(find_allocator([tmp]).name, "libjemalloc.so.2")
+
+
+class TestInstallConfig(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.tuning = TuningManager(OSManager(), None, None, None)
+        self.tuning.CONFIG_ROOT = Path(self.tmp.name)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_new_content_gets_a_new_version(self):
+        first = self.tuning.install_config("shop", "workers = 3\n", sudo=False)
+        same = self.tuning.install_config("shop", "workers = 3\n", sudo=False)
+        self.assertTrue(first.changed)
+        self.assertFalse(same.changed)
+        self.assertEqual(same.version, 1)
+
+        for workers in range(4, 10):
+            latest = self.tuning.install_config("shop", f"workers = {workers}\n", sudo=False)
+        self.assertEqual(latest.version, 7)
+        self.assertEqual(self.tuning.read_config("shop"), "workers = 9\n")
+        self.assertEqual(self.tuning.list_versions("shop"), [3, 4, 5, 6, 7])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,97 @@
+import unittest
+import tempfile
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+import sys
+import os
+
+# Add the src directory to the Python path
+sys.path.insert(
+    0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../../../src"))
+)
+
+from djanbee.managers.venv_store_manager import VenvStoreManager
+
+SITE_PACKAGES = Path("lib") / "python3.11" / "site-packages"
+
+
+def make_venv(prefix: Path) -> None:
+    """A virtual environment's layout, with the files that name its prefix"""
+    (prefix / "bin").mkdir(parents=True)
+    (prefix / "bin" / "pip").write_text(f"#!{prefix}/bin/python\nimport pip\n")
+    os.chmod(prefix / "bin" / "pip", 0o755)
+    os.symlink("/usr/bin/python3", prefix / "bin" / "python")
+    (prefix / "pyvenv.cfg").write_text(f"home = /usr/bin\ncommand = python3 -m venv {prefix}\n")
+    site_packages = prefix / SITE_PACKAGES
+    (site_packages / "shop").mkdir(parents=True)
+    (site_packages / "shop" / "__init__.py").write_text("VERSION = 1\n")
+    (site_packages / "shop.pth").write_text(f"{prefix}/src\n")
+    (site_packages / "Django-5.0.dist-info").mkdir()
+
+
+class TestVenvStore(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp.name)
+        self.wheelhouse = MagicMock()
+        self.store = VenvStoreManager(MagicMock(), self.wheelhouse, self.root / "cache")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def write_requirements(self, name: str, text: str) -> Path:
+        path = self.root / name
+        path.write_text(text)
+        return path
+
+    def test_compute_key_follows_the_requirements(self):
+        first = self.write_requirements("a.txt", "django==5.0\nrequests>=2\n")
+        reordered = self.write_requirements("b.txt", "# web\nrequests>=2\ndjango==5.0\n")
+        changed = self.write_requirements("c.txt", "django==5.1\nrequests>=2\n")
+        self.assertEqual(self.store.compute_key(first), self.store.compute_key(reordered))
+        self.assertNotEqual(self.store.compute_key(first), self.store.compute_key(changed))
+
+    def test_clone_links_files_and_rewrites_the_prefix(self):
+        source = self.root / "store"
+        make_venv(source)
+        (source / self.store.MANIFEST_NAME).write_text("{}")
+        destination = self.root / "project" / ".venv"
+
+        linked, copied = self.store.clone(source, destination)
+
+        module = SITE_PACKAGES / "shop" / "__init__.py"
+        self.assertTrue((destination / module).samefile(source / module))
+        self.assertEqual(copied, 3)
+        self.assertEqual(linked, 1)
+        pip = (destination / "bin" / "pip").read_text()
+        self.assertTrue(pip.startswith(f"#!{destination}/bin/python\n"))
+        self.assertTrue(os.access(destination / "bin" / "pip", os.X_OK))
+        self.assertIn(str(destination), (destination / "pyvenv.cfg").read_text())
+        self.assertEqual((destination / SITE_PACKAGES / "shop.pth").read_text(), f"{destination}/src\n")
+        self.assertEqual(os.readlink(destination / "bin" / "python"), "/usr/bin/python3")
+        self.assertFalse((destination / self.store.MANIFEST_NAME).exists())
+        # The stored environment itself is untouched
+        self.assertIn(str(source), (source / "pyvenv.cfg").read_text())
+
+    def test_build_replaces_an_interrupted_one(self):
+        requirements = self.write_requirements("requirements.txt", "django==5.0\n")
+        target = self.store.root / self.store.compute_key(requirements)
+        # An earlier build stopped before its manifest was written
+        (target / "bin").mkdir(parents=True)
+        self.wheelhouse.ensure_wheelhouse.return_value = (True, self.root / "wheels")
+        self.wheelhouse.install_from_wheelhouse.return_value = MagicMock(success=True)
+
+        create = lambda path, with_pip: make_venv(Path(path))
+        with patch("djanbee.managers.venv_store_manager.main.venv.create", side_effect=create):
+            success, stored = self.store.build_stored_venv(requirements)
+
+        self.assertTrue(success)
+        self.assertEqual(stored, target)
+        self.assertEqual(self.store.get_stored_venv(requirements), target)
+        self.assertIn(str(target), (target / "bin" / "pip").read_text())
+        self.assertNotIn(".partial", (target / "pyvenv.cfg").read_text())
+        self.assertEqual(list(self.store.root.glob(".*.partial")), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,64 @@
+import unittest
+import tempfile
+from pathlib import Path
+import sys
+import os
+
+# Add the src directory to the Python path
+sys.path.insert(
+    0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../../../src"))
+)
+
+from djanbee.managers.os_manager import OSManager
+from djanbee.managers.sync_manager import SyncManager
+from djanbee.managers.watch_manager import ChangeSet, WatchManager
+
+
+class TestChangeSet(unittest.TestCase):
+    def test_classification(self):
+        changes = ChangeSet(["shop/migrations/0002_price.py", "shop/static/shop/app.css"])
+        self.assertTrue(changes.migrations)
+        self.assertTrue(changes.static)
+        self.assertFalse(changes.code)
+
+        changes = ChangeSet(["shop/views.py", "shop/templates/shop/index.html"])
+        self.assertTrue(changes.code)
+        self.assertFalse(changes.migrations or changes.static)
+
+        everything = ChangeSet(overflow=True)
+        self.assertTrue(everything.code and everything.static and everything.migrations)
+
+
+@unittest.skipUnless(sys.platform.startswith("linux"), "inotify is Linux only")
+class TestTreeWatcher(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp.name)
+        (self.root / "shop").mkdir()
+        (self.root / ".git").mkdir()
+        os_manager = OSManager()
+        self.watcher = WatchManager(os_manager, SyncManager(os_manager)).watch(self.root)
+
+    def tearDown(self):
+        self.watcher.close()
+        self.tmp.cleanup()
+
+    def test_collects_a_burst_and_skips_ignored_files(self):
+        (self.root / "shop" / "views.py").write_text("VERSION = 1\n")
+        (self.root / "shop" / "views.py~").write_text("backup\n")
+        (self.root / ".git" / "index").write_text("ignored\n")
+        (self.root / "shop" / "static" / "shop").mkdir(parents=True)
+        (self.root / "shop" / "static" / "shop" / "app.css").write_text("body {}\n")
+
+        changes = self.watcher.wait(debounce=0.2, timeout=5)
+        self.assertIn("shop/views.py", changes.paths)
+        self.assertIn("shop/static/shop/app.css", changes.paths)
+        self.assertNotIn("shop/views.py~", changes.paths)
+        self.assertFalse(any(path.startswith(".git") for path in changes.paths))
+        self.assertTrue(changes.code and changes.static)
+
+        self.assertIsNone(self.watcher.wait(debounce=0.1, timeout=0.2))
+
+
+if __name__ == "__main__":
+    unittest.main()
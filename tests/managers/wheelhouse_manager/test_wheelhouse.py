@@ -0,0 +1,75 @@
+import unittest
+import tempfile
+from pathlib import Path
+from unittest.mock import MagicMock
+import sys
+import os
+
+# Add the src directory to the Python path
+sys.path.insert(
+    0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../../../src"))
+)
+
+from djanbee.managers.os_manager.command import CommandResult
+from djanbee.managers.wheelhouse_manager import WheelhouseManager
+
+PIP_WHEEL_OUTPUT = """\
+Collecting Django==5.0
+  Using cached Django-5.0-py3-none-any.whl
+Building wheels for collected packages: PyYAML
+  Created wheel for PyYAML: filename=PyYAML-6.0-cp311-cp311-linux_x86_64.whl size=1
+Successfully built PyYAML
+"""
+
+
+def pip_wheel(venv_path, args):
+    """Fill the -w directory like `pip wheel` does"""
+    directory = Path(args[args.index("-w") + 1])
+    for name in ("Django-5.0-py3-none-any.whl", "PyYAML-6.0-cp311-cp311-linux_x86_64.whl"):
+        (directory / name).write_bytes(b"")
+    return CommandResult(True, PIP_WHEEL_OUTPUT, "")
+
+
+class TestWheelhouse(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp.name)
+        self.os_manager = MagicMock()
+        self.os_manager.run_command.return_value = CommandResult(
+            True, "cpython-311-linux-x86_64\n", ""
+        )
+        self.os_manager.run_pip_command.side_effect = pip_wheel
+        self.manager = WheelhouseManager(self.os_manager, self.root / "cache")
+        (self.root / "base.txt").write_text("Django==5.0\n")
+        self.requirements = self.root / "requirements.txt"
+        self.requirements.write_text("-r base.txt\nPyYAML==6.0\n")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_key_covers_includes_and_interpreter(self):
+        key = self.manager.compute_key(self.requirements, "cpython-311-linux-x86_64")
+        self.assertNotEqual(key, self.manager.compute_key(self.requirements, "cpython-312-linux-x86_64"))
+        (self.root / "base.txt").write_text("Django==5.1\n")
+        self.assertNotEqual(key, self.manager.compute_key(self.requirements, "cpython-311-linux-x86_64"))
+
+    def test_build_records_wheels_built_from_sdists(self):
+        success, wheelhouse = self.manager.build_wheelhouse(self.root / "venv", self.requirements)
+        self.assertTrue(success)
+        self.assertEqual(wheelhouse.path, self.manager.root / wheelhouse.key)
+        self.assertEqual(wheelhouse.built_from_sdist, ["PyYAML"])
+        self.assertEqual(len(wheelhouse.wheels), 2)
+        self.assertEqual(list(self.manager.root.glob(".*.partial")), [])
+
+    def test_ensure_reuses_the_built_wheelhouse(self):
+        success, built = self.manager.ensure_wheelhouse(self.root / "venv", self.requirements)
+        self.assertTrue(success)
+        success, reused = self.manager.ensure_wheelhouse(self.root / "other-venv", self.requirements)
+        self.assertTrue(success)
+        self.assertEqual(reused.key, built.key)
+        self.assertEqual(reused.built_from_sdist, ["PyYAML"])
+        self.assertEqual(self.os_manager.run_pip_command.call_count, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()